@@ -23,14 +23,13 @@ from fastapi import APIRouter, Path
 from sqlalchemy import delete, desc, select
 
 from app import config, log
-from app.contracts import AsyncContract
+from app.contracts import AsyncContract, BulkBalanceReader
 from app.database import DBAsyncSession
 from app.errors import (
     AppError,
     DataConflictError,
     DataNotExistsError,
     InvalidParameterError,
-    ServiceUnavailable,
 )
 from app.model.blockchain import BondToken, CouponToken, MembershipToken, ShareToken
 from app.model.db import (
@@ -51,7 +50,6 @@ from app.model.schema import (
     UpdateAdminTokenRequest,
 )
 from app.model.schema.base import GenericSuccessResponse, SuccessResponse, TokenType
-from app.utils.asyncio_utils import SemaphoreTaskGroup
 from app.utils.docs_utils import get_routers_responses
 from app.utils.fastapi_utils import json_response
 
@@ -159,7 +157,7 @@ async def register_admin_token(
 
     if conflict_err is False:
         # Register token cache
-        await async_session.merge(token_obj.to_model())
+        await token_obj.merge_cache(async_session, token_obj.to_model())
 
         # Register the issuer balance
         (
@@ -377,56 +375,24 @@ async def get_account_balance_all(
     token_contract = AsyncContract.get_contract(
         contract_name=token_template, address=token_address
     )
-    balance = await AsyncContract.call_function(
-        contract=token_contract,
-        function_name="balanceOf",
-        args=(account_address,),
-        default_returns=0,
-    )
-    pending_transfer = 0
-    if token_template in [TokenType.IbetStraightBond, TokenType.IbetShare]:
-        # if security token, amount of pending transfer is needed
-        pending_transfer = await AsyncContract.call_function(
-            contract=token_contract,
-            function_name="pendingTransfer",
-            args=(account_address,),
-            default_returns=0,
-        )
-    exchange_balance = 0
-    exchange_commitment = 0
     tradable_exchange_address = await AsyncContract.call_function(
         contract=token_contract,
         function_name="tradableExchange",
         args=(),
         default_returns=config.ZERO_ADDRESS,
     )
-    if tradable_exchange_address != config.ZERO_ADDRESS:
-        exchange_contract = AsyncContract.get_contract(
-            "IbetExchangeInterface", tradable_exchange_address
-        )
-        try:
-            tasks = await SemaphoreTaskGroup.run(
-                AsyncContract.call_function(
-                    contract=exchange_contract,
-                    function_name="balanceOf",
-                    args=(
-                        account_address,
-                        token_contract.address,
-                    ),
-                    default_returns=0,
-                ),
-                AsyncContract.call_function(
-                    contract=exchange_contract,
-                    function_name="commitmentOf",
-                    args=(
-                        account_address,
-                        token_contract.address,
-                    ),
-                    default_returns=0,
-                ),
-                max_concurrency=3,
-            )
-            exchange_balance, exchange_commitment = [task.result() for task in tasks]
-        except ExceptionGroup:
-            raise ServiceUnavailable from None
-    return balance, pending_transfer, exchange_balance, exchange_commitment
+    # NOTE: If security token, amount of pending transfer is needed
+    (account_balance,) = await BulkBalanceReader.get_token_balances(
+        token_contract=token_contract,
+        account_addresses=[account_address],
+        exchange_address=tradable_exchange_address,
+        pending_transfer=token_template
+        in [TokenType.IbetStraightBond, TokenType.IbetShare],
+        exchange_commitment=True,
+    )
+    return (
+        account_balance.balance,
+        account_balance.pending_transfer,
+        account_balance.exchange_balance,
+        account_balance.exchange_commitment,
+    )
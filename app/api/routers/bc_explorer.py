@@ -46,6 +46,7 @@ from app.model.schema import (
 from app.model.schema.base import GenericSuccessResponse, SuccessResponse
 from app.utils.docs_utils import get_routers_responses
 from app.utils.fastapi_utils import json_response
+from app.utils.http_cache_utils import http_cache
 
 LOG = log.get_logger()
 BLOCK_RESPONSE_LIMIT = 1000
@@ -186,6 +187,7 @@ async def list_block_data(
     operation_id="GetBlockData",
     response_model=GenericSuccessResponse[BlockDataResponse],
     responses=get_routers_responses(NotSupportedError, DataNotExistsError),
+    dependencies=[http_cache(max_age=86400)],
 )
 async def get_block_data(
     async_session: DBAsyncSession,
@@ -327,6 +329,8 @@ async def list_tx_data(
     operation_id="GetTxData",
     response_model=GenericSuccessResponse[TxDataResponse],
     responses=get_routers_responses(NotSupportedError, DataNotExistsError),
+    # NOTE: Contract information is filled in later by the TokenList indexer.
+    dependencies=[http_cache(max_age=60, etag_ttl=60)],
 )
 async def get_tx_data(
     async_session: DBAsyncSession,
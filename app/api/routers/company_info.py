@@ -27,7 +27,7 @@ from sqlalchemy.orm import aliased
 from app import config, log
 from app.contracts import AsyncContract
 from app.database import DBAsyncSession
-from app.errors import DataNotExistsError, InvalidParameterError
+from app.errors import DataNotExistsError, InvalidParameterError, ServiceUnavailable
 from app.model.blockchain import BondToken, CouponToken, MembershipToken, ShareToken
 from app.model.db import (
     IDXBondToken,
@@ -52,6 +52,7 @@ from app.model.type import EthereumAddress
 from app.utils.company_list import Company, CompanyList
 from app.utils.docs_utils import get_routers_responses
 from app.utils.fastapi_utils import json_response
+from app.utils.http_cache_utils import http_cache
 
 LOG = log.get_logger()
 
@@ -67,6 +68,7 @@ router = APIRouter(prefix="/Companies", tags=["company_info"])
     operation_id="ListAllCompanies",
     response_model=GenericSuccessResponse[ListAllCompaniesResponse],
     responses=get_routers_responses(),
+    dependencies=[http_cache(max_age=60, etag_ttl=60)],
 )
 async def list_all_companies(
     async_session: DBAsyncSession,
@@ -265,7 +267,7 @@ async def list_all_company_tokens(
         ).all()
 
     # Get token attributes
-    token_list = []
+    target_token_list: list[tuple[str, str]] = []
     for available_token in available_list:
         token_address = to_checksum_address(available_token.token_address)
         token_info = await AsyncContract.call_function(
@@ -279,14 +281,27 @@ async def list_all_company_tokens(
             token_template = token_info[1]
             # Filter only the token types used in the system
             if available_token_template(token_template):
-                token_model = get_token_model(token_template)
-                token = await token_model.get(
-                    async_session=async_session, token_address=token_address
-                )
-                token_list.append(token.__dict__)
+                target_token_list.append((token_template, token_address))
             else:
                 continue
 
+    # Get token details of each token type at once
+    token_details = {}
+    for token_template in dict.fromkeys(t for t, _ in target_token_list):
+        token_model = get_token_model(token_template)
+        token_details.update(
+            await token_model.get_many(
+                async_session,
+                [a for t, a in target_token_list if t == token_template],
+            )
+        )
+    token_list = []
+    for _, token_address in target_token_list:
+        token = token_details.get(token_address)
+        if token is None:
+            raise ServiceUnavailable(f"Failed to get token: {token_address}")
+        token_list.append(token.__dict__)
+
     return json_response({**SuccessResponse.default(), "data": token_list})
 
 
@@ -17,20 +17,20 @@ limitations under the License.
 SPDX-License-Identifier: Apache-2.0
 """
 
-import json
-
 from fastapi import APIRouter, Request
 
 from app import config, log
+from app.contracts import ContractRegistry
 from app.errors import NotSupportedError
 from app.model.schema import ABI
 from app.model.schema.base import GenericSuccessResponse, SuccessResponse
 from app.utils.docs_utils import get_routers_responses
-from app.utils.fastapi_utils import json_response
+from app.utils.fastapi_utils import cached_json_response
+from app.utils.http_cache_utils import http_cache
 
 LOG = log.get_logger()
 
-router = APIRouter(prefix="/ABI", tags=["abi"])
+router = APIRouter(prefix="/ABI", tags=["abi"], dependencies=[http_cache(max_age=3600)])
 
 
 # ------------------------------
@@ -50,11 +50,13 @@ async def get_straight_bond_abi(req: Request):
     if config.BOND_TOKEN_ENABLED is False:
         raise NotSupportedError(method="GET", url=req.url.path)
 
-    ibet_straightbond_json = json.load(
-        open("app/contracts/json/IbetStraightBond.json", "r")
+    return cached_json_response(
+        key=("ABI", "IbetStraightBond"),
+        content=lambda: {
+            **SuccessResponse.default(),
+            "data": ContractRegistry.get("IbetStraightBond").abi,
+        },
     )
-    abi = ibet_straightbond_json["abi"]
-    return json_response({**SuccessResponse.default(), "data": abi})
 
 
 # ------------------------------
@@ -74,9 +76,13 @@ async def get_share_abi(req: Request):
     if config.SHARE_TOKEN_ENABLED is False:
         raise NotSupportedError(method="GET", url=req.url.path)
 
-    ibet_share_json = json.load(open("app/contracts/json/IbetShare.json", "r"))
-    abi = ibet_share_json["abi"]
-    return json_response({**SuccessResponse.default(), "data": abi})
+    return cached_json_response(
+        key=("ABI", "IbetShare"),
+        content=lambda: {
+            **SuccessResponse.default(),
+            "data": ContractRegistry.get("IbetShare").abi,
+        },
+    )
 
 
 # ------------------------------
@@ -96,11 +102,13 @@ async def get_membership_abi(req: Request):
     if config.MEMBERSHIP_TOKEN_ENABLED is False:
         raise NotSupportedError(method="GET", url=req.url.path)
 
-    ibet_membership_json = json.load(
-        open("app/contracts/json/IbetMembership.json", "r")
+    return cached_json_response(
+        key=("ABI", "IbetMembership"),
+        content=lambda: {
+            **SuccessResponse.default(),
+            "data": ContractRegistry.get("IbetMembership").abi,
+        },
     )
-    abi = ibet_membership_json["abi"]
-    return json_response({**SuccessResponse.default(), "data": abi})
 
 
 # ------------------------------
@@ -120,6 +128,10 @@ async def get_coupon_abi(req: Request):
     if config.COUPON_TOKEN_ENABLED is False:
         raise NotSupportedError(method="GET", url=req.url.path)
 
-    ibet_coupon_json = json.load(open("app/contracts/json/IbetCoupon.json", "r"))
-    abi = ibet_coupon_json["abi"]
-    return json_response({**SuccessResponse.default(), "data": abi})
+    return cached_json_response(
+        key=("ABI", "IbetCoupon"),
+        content=lambda: {
+            **SuccessResponse.default(),
+            "data": ContractRegistry.get("IbetCoupon").abi,
+        },
+    )
@@ -17,7 +17,7 @@ limitations under the License.
 SPDX-License-Identifier: Apache-2.0
 """
 
-from typing import Annotated
+from typing import Annotated, Any, Coroutine
 
 from eth_utils import to_checksum_address
 from fastapi import APIRouter, Depends, Path, Query, Request
@@ -52,6 +52,32 @@ router = APIRouter(prefix="/DEX/OrderList", tags=["dex"])
 
 
 class BaseOrderList(object):
+    @staticmethod
+    async def call_functions(*coros: Coroutine[Any, Any, Any]) -> list[Any]:
+        """Call contract functions concurrently"""
+        try:
+            tasks = await SemaphoreTaskGroup.run(
+                *coros, max_concurrency=config.DEX_ORDER_LIST_CALL_CONCURRENCY
+            )
+        except ExceptionGroup:
+            raise ServiceUnavailable from None
+        return [task.result() for task in tasks]
+
+    @staticmethod
+    async def set_token_details(
+        async_session: AsyncSession,
+        token_model,
+        items: list[dict],
+        token_addresses: list[str],
+    ):
+        """Set token details of all items at once"""
+        token_details = await token_model.get_many(async_session, token_addresses)
+        for item, token_address in zip(items, token_addresses):
+            token_detail = token_details.get(token_address)
+            if token_detail is None:
+                raise ServiceUnavailable(f"Failed to get token: {token_address}")
+            item["token"] = token_detail.__dict__
+
     @staticmethod
     async def get_order_list(
         async_session: AsyncSession,
@@ -80,12 +106,20 @@ class BaseOrderList(object):
             ).all()
 
         order_list = []
-        for id, order_id, order_timestamp in _order_events:
-            order_book = await AsyncContract.call_function(
-                contract=exchange_contract,
-                function_name="getOrder",
-                args=(order_id,),
-            )
+        token_addresses: list[str] = []
+        order_books = await BaseOrderList.call_functions(
+            *[
+                AsyncContract.call_function(
+                    contract=exchange_contract,
+                    function_name="getOrder",
+                    args=(order_id,),
+                )
+                for _, order_id, _ in _order_events
+            ]
+        )
+        for (id, order_id, order_timestamp), order_book in zip(
+            _order_events, order_books
+        ):
             # If there are no remaining orders, skip this process
             if order_book[2] != 0:
                 _order = {
@@ -107,14 +141,13 @@ class BaseOrderList(object):
                     },
                     "sort_id": id,
                 }
-                if token_model is not None:
-                    token_detail = await token_model.get(
-                        async_session=async_session,
-                        token_address=to_checksum_address(order_book[1]),
-                    )
-                    _order["token"] = token_detail.__dict__
-
                 order_list.append(_order)
+                token_addresses.append(to_checksum_address(order_book[1]))
+
+        if token_model is not None:
+            await BaseOrderList.set_token_details(
+                async_session, token_model, order_list, token_addresses
+            )
 
         return order_list
 
@@ -152,15 +185,12 @@ class BaseOrderList(object):
         ).all()
 
         settlement_list = []
-        for (
-            id,
-            order_id,
-            agreement_id,
-            agreement_timestamp,
-            buyer_address,
-        ) in _agreement_events:
-            try:
-                tasks = await SemaphoreTaskGroup.run(
+        token_addresses: list[str] = []
+        results = await BaseOrderList.call_functions(
+            *[
+                coro
+                for _, order_id, agreement_id, *_ in _agreement_events
+                for coro in (
                     AsyncContract.call_function(
                         contract=exchange_contract,
                         function_name="getOrder",
@@ -174,11 +204,17 @@ class BaseOrderList(object):
                             agreement_id,
                         ),
                     ),
-                    max_concurrency=3,
                 )
-                order_book, agreement = [task.result() for task in tasks]
-            except ExceptionGroup:
-                raise ServiceUnavailable from None
+            ]
+        )
+        for i, (
+            id,
+            order_id,
+            agreement_id,
+            agreement_timestamp,
+            buyer_address,
+        ) in enumerate(_agreement_events):
+            order_book, agreement = results[2 * i], results[2 * i + 1]
             _settlement = {
                 "agreement": {
                     "exchange_address": exchange_contract_address,
@@ -199,14 +235,13 @@ class BaseOrderList(object):
                 },
                 "sort_id": id,
             }
-            if token_model is not None:
-                token_detail = await token_model.get(
-                    async_session=async_session,
-                    token_address=to_checksum_address(order_book[1]),
-                )
-                _settlement["token"] = token_detail.__dict__
-
             settlement_list.append(_settlement)
+            token_addresses.append(to_checksum_address(order_book[1]))
+
+        if token_model is not None:
+            await BaseOrderList.set_token_details(
+                async_session, token_model, settlement_list, token_addresses
+            )
 
         return settlement_list
 
@@ -261,14 +296,37 @@ class BaseOrderList(object):
             ).all()
 
         complete_list = []
-        for (
+        token_addresses: list[str] = []
+        results = await BaseOrderList.call_functions(
+            *[
+                coro
+                for _, order_id, agreement_id, *_ in _agreement_events
+                for coro in (
+                    AsyncContract.call_function(
+                        contract=exchange_contract,
+                        function_name="getOrder",
+                        args=(order_id,),
+                    ),
+                    AsyncContract.call_function(
+                        contract=exchange_contract,
+                        function_name="getAgreement",
+                        args=(
+                            order_id,
+                            agreement_id,
+                        ),
+                    ),
+                )
+            ]
+        )
+        for i, (
             id,
             order_id,
             agreement_id,
             agreement_timestamp,
             settlement_timestamp,
             buyer_address,
-        ) in _agreement_events:
+        ) in enumerate(_agreement_events):
+            order_book, agreement = results[2 * i], results[2 * i + 1]
             if settlement_timestamp is not None:
                 settlement_timestamp_jp = (
                     "{}/{:02d}/{:02d} {:02d}:{:02d}:{:02d}".format(
@@ -282,26 +340,6 @@ class BaseOrderList(object):
                 )
             else:
                 settlement_timestamp_jp = ""
-            try:
-                tasks = await SemaphoreTaskGroup.run(
-                    AsyncContract.call_function(
-                        contract=exchange_contract,
-                        function_name="getOrder",
-                        args=(order_id,),
-                    ),
-                    AsyncContract.call_function(
-                        contract=exchange_contract,
-                        function_name="getAgreement",
-                        args=(
-                            order_id,
-                            agreement_id,
-                        ),
-                    ),
-                    max_concurrency=3,
-                )
-                order_book, agreement = [task.result() for task in tasks]
-            except ExceptionGroup:
-                raise ServiceUnavailable from None
             _complete = {
                 "agreement": {
                     "exchange_address": exchange_contract_address,
@@ -323,14 +361,13 @@ class BaseOrderList(object):
                 "settlement_timestamp": settlement_timestamp_jp,
                 "sort_id": id,
             }
-            if token_model is not None:
-                token_detail = await token_model.get(
-                    async_session=async_session,
-                    token_address=to_checksum_address(order_book[1]),
-                )
-                _complete["token"] = token_detail.__dict__
-
             complete_list.append(_complete)
+            token_addresses.append(to_checksum_address(order_book[1]))
+
+        if token_model is not None:
+            await BaseOrderList.set_token_details(
+                async_session, token_model, complete_list, token_addresses
+            )
 
         return complete_list
 
@@ -359,16 +396,25 @@ class BaseOrderList(object):
                 await async_session.execute(stmt.where(Order.is_cancelled == False))
             ).all()
 
+        order_books = await BaseOrderList.call_functions(
+            *[
+                AsyncContract.call_function(
+                    contract=AsyncContract.get_contract(
+                        contract_name="IbetExchange", address=exchange_contract_address
+                    ),
+                    function_name="getOrder",
+                    args=(order_id,),
+                )
+                for _, exchange_contract_address, order_id, _ in _order_events
+            ]
+        )
         order_list = []
-        for id, exchange_contract_address, order_id, order_timestamp in _order_events:
-            exchange_contract = AsyncContract.get_contract(
-                contract_name="IbetExchange", address=exchange_contract_address
-            )
-            order_book = await AsyncContract.call_function(
-                contract=exchange_contract,
-                function_name="getOrder",
-                args=(order_id,),
-            )
+        for (
+            id,
+            exchange_contract_address,
+            order_id,
+            order_timestamp,
+        ), order_book in zip(_order_events, order_books):
             # If there are no remaining orders, skip this process
             if order_book[2] != 0:
                 _order = {
@@ -424,6 +470,23 @@ class BaseOrderList(object):
             )
         ).all()
 
+        agreements = await BaseOrderList.call_functions(
+            *[
+                AsyncContract.call_function(
+                    contract=AsyncContract.get_contract(
+                        contract_name="IbetExchange", address=exchange_contract_address
+                    ),
+                    function_name="getAgreement",
+                    args=(
+                        order_id,
+                        agreement_id,
+                    ),
+                )
+                for _, exchange_contract_address, order_id, agreement_id, *_ in (
+                    _agreement_events
+                )
+            ]
+        )
         settlement_list = []
         for (
             id,
@@ -432,18 +495,7 @@ class BaseOrderList(object):
             agreement_id,
             agreement_timestamp,
             buyer_address,
-        ) in _agreement_events:
-            exchange_contract = AsyncContract.get_contract(
-                contract_name="IbetExchange", address=exchange_contract_address
-            )
-            agreement = await AsyncContract.call_function(
-                contract=exchange_contract,
-                function_name="getAgreement",
-                args=(
-                    order_id,
-                    agreement_id,
-                ),
-            )
+        ), agreement in zip(_agreement_events, agreements):
             _settlement = {
                 "token": {"token_address": token_address},
                 "agreement": {
@@ -517,6 +569,23 @@ class BaseOrderList(object):
                 )
             ).all()
 
+        agreements = await BaseOrderList.call_functions(
+            *[
+                AsyncContract.call_function(
+                    contract=AsyncContract.get_contract(
+                        contract_name="IbetExchange", address=exchange_contract_address
+                    ),
+                    function_name="getAgreement",
+                    args=(
+                        order_id,
+                        agreement_id,
+                    ),
+                )
+                for _, exchange_contract_address, order_id, agreement_id, *_ in (
+                    _agreement_events
+                )
+            ]
+        )
         complete_list = []
         for (
             id,
@@ -526,7 +595,7 @@ class BaseOrderList(object):
             agreement_timestamp,
             settlement_timestamp,
             buyer_address,
-        ) in _agreement_events:
+        ), agreement in zip(_agreement_events, agreements):
             if settlement_timestamp is not None:
                 settlement_timestamp_jp = (
                     "{}/{:02d}/{:02d} {:02d}:{:02d}:{:02d}".format(
@@ -540,17 +609,6 @@ class BaseOrderList(object):
                 )
             else:
                 settlement_timestamp_jp = ""
-            exchange_contract = AsyncContract.get_contract(
-                contract_name="IbetExchange", address=exchange_contract_address
-            )
-            agreement = await AsyncContract.call_function(
-                contract=exchange_contract,
-                function_name="getAgreement",
-                args=(
-                    order_id,
-                    agreement_id,
-                ),
-            )
             _complete = {
                 "token": {"token_address": token_address},
                 "agreement": {
@@ -20,11 +20,12 @@ SPDX-License-Identifier: Apache-2.0
 import asyncio
 from typing import Annotated, Any
 
-import httpx
 from eth_account import Account
 from eth_utils import to_checksum_address
-from fastapi import APIRouter, Path, Query
+from fastapi import APIRouter, Body, Depends, Path, Query
+from fastapi.exceptions import RequestValidationError
 from hexbytes import HexBytes
+from pydantic import ValidationError
 from rlp import decode
 from sqlalchemy import select
 from web3.exceptions import ContractLogicError, TimeExhausted, Web3RPCError
@@ -39,9 +40,10 @@ from app.errors import (
     ServiceUnavailable,
     SuspendedTokenError,
 )
-from app.model.db import ExecutableContract, Listing, Node
+from app.model.db import ExecutableContract, Listing
 from app.model.schema import (
     GetTransactionCountQuery,
+    JsonRPCBatchRequest,
     JsonRPCRequest,
     SendRawTransactionRequest,
     SendRawTransactionsNoWaitResponse,
@@ -58,6 +60,7 @@ from app.model.type import EthereumAddress
 from app.utils.contract_error_code import error_code_msg
 from app.utils.docs_utils import get_routers_responses
 from app.utils.fastapi_utils import json_response
+from app.utils.json_rpc_proxy import json_rpc_proxy
 from app.utils.web3_utils import AsyncWeb3Wrapper
 
 LOG = log.get_logger()
@@ -69,41 +72,93 @@ router = APIRouter(prefix="/Eth", tags=["eth_rpc"])
 # ------------------------------
 # JSON-RPC
 # ------------------------------
+def _parse_json_rpc_request(
+    body: Annotated[Any, Body()],
+) -> JsonRPCRequest | JsonRPCBatchRequest:
+    """Validate a single JSON-RPC request or a batch request (array of requests)"""
+    try:
+        if isinstance(body, list):
+            return JsonRPCBatchRequest.model_validate(body)
+        return JsonRPCRequest.model_validate(body)
+    except ValidationError as err:
+        raise RequestValidationError(
+            [{**error, "loc": ("body", *error["loc"])} for error in err.errors()]
+        )
+
+
+_json_rpc_request_schema = JsonRPCRequest.model_json_schema()
+
+
 @router.post(
     "/RPC",
     summary="Raw JSON-RPC endpoint",
     operation_id="EthereumJsonRpc",
     response_model=GenericSuccessResponse[Any],
     responses=get_routers_responses(InvalidParameterError, ServiceUnavailable),
+    openapi_extra={
+        "requestBody": {
+            "content": {
+                "application/json": {
+                    "schema": {
+                        "anyOf": [
+                            _json_rpc_request_schema,
+                            {
+                                "type": "array",
+                                "items": _json_rpc_request_schema,
+                                "minItems": 1,
+                            },
+                        ]
+                    }
+                }
+            },
+            "required": True,
+        }
+    },
 )
-async def ethereum_json_rpc(async_session: DBAsyncSession, data: JsonRPCRequest):
+async def ethereum_json_rpc(
+    async_session: DBAsyncSession,
+    data: Annotated[
+        JsonRPCRequest | JsonRPCBatchRequest, Depends(_parse_json_rpc_request)
+    ],
+):
     """
     Executes ethereum JSON-RPC with given request body.
+    A batch request (array of requests) is also available.
     """
-    node: Node | None = (
-        await async_session.scalars(
-            select(Node).where(Node.is_synced == True).order_by(Node.priority).limit(1)
+    if isinstance(data, JsonRPCBatchRequest):
+        if len(data.root) > config.ETH_RPC_PROXY_BATCH_MAX_SIZE:
+            raise InvalidParameterError(
+                description=f"batch request must not exceed {config.ETH_RPC_PROXY_BATCH_MAX_SIZE} calls"
+            )
+        res_data = await json_rpc_proxy.request(
+            async_session,
+            [
+                {
+                    "id": i + 1,
+                    "jsonrpc": "2.0",
+                    "method": request.method,
+                    "params": request.params,
+                }
+                for i, request in enumerate(data.root)
+            ],
         )
-    ).first()
-
-    if node is not None:
-        try:
-            async with httpx.AsyncClient() as client:
-                res_data = await client.post(
-                    node.endpoint_uri,
-                    json={
-                        "id": 1,
-                        "jsonrpc": "2.0",
-                        "method": data.method,
-                        "params": data.params,
-                    },
-                )
-        except Exception:
-            raise ServiceUnavailable("Unable to connect to web3 provider")
+        if isinstance(res_data, list):
+            # NOTE: Responses to a batch request can be returned in any order.
+            res_data.sort(
+                key=lambda res: (res.get("id") or 0) if isinstance(res, dict) else 0
+            )
     else:
-        raise ServiceUnavailable("No web3 providers available")
+        res_data = await json_rpc_proxy.request(
+            async_session,
+            {
+                "id": 1,
+                "jsonrpc": "2.0",
+                "method": data.method,
+                "params": data.params,
+            },
+        )
 
-    return json_response({**SuccessResponse.default(), "data": res_data.json()})
+    return json_response({**SuccessResponse.default(), "data": res_data})
 
 
 # ------------------------------
@@ -47,12 +47,11 @@ from app.model.schema.base import (
     SuccessResponse,
 )
 from app.model.type import EthereumAddress
+from app.utils.block_utils import block_timestamp_cache
 from app.utils.docs_utils import get_routers_responses
 from app.utils.fastapi_utils import json_response
-from app.utils.web3_utils import AsyncWeb3Wrapper
 
 LOG = log.get_logger()
-async_web3 = AsyncWeb3Wrapper()
 REQUEST_BLOCK_RANGE_LIMIT = 10000
 
 router = APIRouter(prefix="/Events", tags=["contract_log"])
@@ -111,11 +110,12 @@ async def list_all_e2e_messaging_event_logs(
             )
         except Web3ValidationError:
             events = []
+        block_timestamps = await block_timestamp_cache.get_many(
+            event["blockNumber"] for event in events
+        )
         for event in events:
             block_number = event["blockNumber"]
-            block_timestamp = (await async_web3.eth.get_block(block_number))[
-                "timestamp"
-            ]
+            block_timestamp = block_timestamps[block_number]
             tmp_list.append(
                 {
                     "event": event["event"],
@@ -196,11 +196,12 @@ async def list_all_ibet_escrow_event_logs(
             )
         except Web3ValidationError:
             events = []
+        block_timestamps = await block_timestamp_cache.get_many(
+            event["blockNumber"] for event in events
+        )
         for event in events:
             block_number = event["blockNumber"]
-            block_timestamp = (await async_web3.eth.get_block(block_number))[
-                "timestamp"
-            ]
+            block_timestamp = block_timestamps[block_number]
             tmp_list.append(
                 {
                     "event": event["event"],
@@ -291,11 +292,12 @@ async def list_all_ibet_security_token_escrow_event_logs(
             )
         except Web3ValidationError:
             events = []
+        block_timestamps = await block_timestamp_cache.get_many(
+            event["blockNumber"] for event in events
+        )
         for event in events:
             block_number = event["blockNumber"]
-            block_timestamp = (await async_web3.eth.get_block(block_number))[
-                "timestamp"
-            ]
+            block_timestamp = block_timestamps[block_number]
             tmp_list.append(
                 {
                     "event": event["event"],
@@ -387,11 +389,12 @@ async def list_all_ibet_security_token_dvp_event_logs(
             )
         except Web3ValidationError:
             events = []
+        block_timestamps = await block_timestamp_cache.get_many(
+            event["blockNumber"] for event in events
+        )
         for event in events:
             block_number = event["blockNumber"]
-            block_timestamp = (await async_web3.eth.get_block(block_number))[
-                "timestamp"
-            ]
+            block_timestamp = block_timestamps[block_number]
             tmp_list.append(
                 {
                     "event": event["event"],
@@ -459,11 +462,12 @@ async def list_all_ibet_security_token_interface_event_logs(
             )
         except Web3ValidationError:
             events = []
+        block_timestamps = await block_timestamp_cache.get_many(
+            event["blockNumber"] for event in events
+        )
         for event in events:
             block_number = event["blockNumber"]
-            block_timestamp = (await async_web3.eth.get_block(block_number))[
-                "timestamp"
-            ]
+            block_timestamp = block_timestamps[block_number]
             tmp_list.append(
                 {
                     "event": event["event"],
@@ -17,20 +17,20 @@ limitations under the License.
 SPDX-License-Identifier: Apache-2.0
 """
 
-import json
-
 import requests
 from fastapi import APIRouter
 from sqlalchemy import select
 
 from app import config, log
+from app.contracts import ContractRegistry
 from app.database import DBAsyncSession
 from app.errors import ServiceUnavailable
 from app.model.db import Node
 from app.model.schema import GetBlockSyncStatusResponse, GetNodeInfoResponse
 from app.model.schema.base import GenericSuccessResponse, SuccessResponse
 from app.utils.docs_utils import get_routers_responses
-from app.utils.fastapi_utils import json_response
+from app.utils.fastapi_utils import cached_json_response, json_response
+from app.utils.http_cache_utils import http_cache
 from app.utils.web3_utils import AsyncWeb3Wrapper
 
 LOG = log.get_logger()
@@ -47,44 +47,50 @@ router = APIRouter(prefix="/NodeInfo", tags=["node_info"])
     summary="Blockchain node information",
     operation_id="NodeInfo",
     response_model=GenericSuccessResponse[GetNodeInfoResponse],
+    dependencies=[http_cache(max_age=3600)],
 )
 async def get_node_info():
     """
     Returns node information.
     """
-    payment_gateway_json = json.load(
-        open("app/contracts/json/PaymentGateway.json", "r")
-    )
-    personal_info_json = json.load(open("app/contracts/json/PersonalInfo.json", "r"))
-    ibet_exchange_json = json.load(open("app/contracts/json/IbetExchange.json", "r"))
-    ibet_escrow_json = json.load(open("app/contracts/json/IbetEscrow.json", "r"))
-    ibet_security_token_escrow_json = json.load(
-        open("app/contracts/json/IbetSecurityTokenEscrow.json", "r")
-    )
-    ibet_security_token_dvp_json = json.load(
-        open("app/contracts/json/IbetSecurityTokenDVP.json", "r")
+    addresses = (
+        config.PAYMENT_GATEWAY_CONTRACT_ADDRESS,
+        config.PERSONAL_INFO_CONTRACT_ADDRESS,
+        config.IBET_MEMBERSHIP_EXCHANGE_CONTRACT_ADDRESS,
+        config.IBET_COUPON_EXCHANGE_CONTRACT_ADDRESS,
+        config.IBET_ESCROW_CONTRACT_ADDRESS,
+        config.IBET_SECURITY_TOKEN_ESCROW_CONTRACT_ADDRESS,
+        config.IBET_SECURITY_TOKEN_DVP_CONTRACT_ADDRESS,
+        config.E2E_MESSAGING_CONTRACT_ADDRESS,
     )
-    e2e_messaging_json = json.load(open("app/contracts/json/E2EMessaging.json", "r"))
-
-    nodeInfo = {
-        "payment_gateway_address": config.PAYMENT_GATEWAY_CONTRACT_ADDRESS,
-        "payment_gateway_abi": payment_gateway_json["abi"],
-        "personal_info_address": config.PERSONAL_INFO_CONTRACT_ADDRESS,
-        "personal_info_abi": personal_info_json["abi"],
-        "ibet_membership_exchange_address": config.IBET_MEMBERSHIP_EXCHANGE_CONTRACT_ADDRESS,
-        "ibet_membership_exchange_abi": ibet_exchange_json["abi"],
-        "ibet_coupon_exchange_address": config.IBET_COUPON_EXCHANGE_CONTRACT_ADDRESS,
-        "ibet_coupon_exchange_abi": ibet_exchange_json["abi"],
-        "ibet_escrow_address": config.IBET_ESCROW_CONTRACT_ADDRESS,
-        "ibet_escrow_abi": ibet_escrow_json["abi"],
-        "ibet_security_token_escrow_address": config.IBET_SECURITY_TOKEN_ESCROW_CONTRACT_ADDRESS,
-        "ibet_security_token_escrow_abi": ibet_security_token_escrow_json["abi"],
-        "ibet_security_token_dvp_address": config.IBET_SECURITY_TOKEN_DVP_CONTRACT_ADDRESS,
-        "ibet_security_token_dvp_abi": ibet_security_token_dvp_json["abi"],
-        "e2e_messaging_address": config.E2E_MESSAGING_CONTRACT_ADDRESS,
-        "e2e_messaging_abi": e2e_messaging_json["abi"],
-    }
-    return json_response({**SuccessResponse.default(), "data": nodeInfo})
+
+    def content():
+        nodeInfo = {
+            "payment_gateway_address": config.PAYMENT_GATEWAY_CONTRACT_ADDRESS,
+            "payment_gateway_abi": ContractRegistry.get("PaymentGateway").abi,
+            "personal_info_address": config.PERSONAL_INFO_CONTRACT_ADDRESS,
+            "personal_info_abi": ContractRegistry.get("PersonalInfo").abi,
+            "ibet_membership_exchange_address": config.IBET_MEMBERSHIP_EXCHANGE_CONTRACT_ADDRESS,
+            "ibet_membership_exchange_abi": ContractRegistry.get("IbetExchange").abi,
+            "ibet_coupon_exchange_address": config.IBET_COUPON_EXCHANGE_CONTRACT_ADDRESS,
+            "ibet_coupon_exchange_abi": ContractRegistry.get("IbetExchange").abi,
+            "ibet_escrow_address": config.IBET_ESCROW_CONTRACT_ADDRESS,
+            "ibet_escrow_abi": ContractRegistry.get("IbetEscrow").abi,
+            "ibet_security_token_escrow_address": config.IBET_SECURITY_TOKEN_ESCROW_CONTRACT_ADDRESS,
+            "ibet_security_token_escrow_abi": ContractRegistry.get(
+                "IbetSecurityTokenEscrow"
+            ).abi,
+            "ibet_security_token_dvp_address": config.IBET_SECURITY_TOKEN_DVP_CONTRACT_ADDRESS,
+            "ibet_security_token_dvp_abi": ContractRegistry.get(
+                "IbetSecurityTokenDVP"
+            ).abi,
+            "e2e_messaging_address": config.E2E_MESSAGING_CONTRACT_ADDRESS,
+            "e2e_messaging_abi": ContractRegistry.get("E2EMessaging").abi,
+        }
+        return {**SuccessResponse.default(), "data": nodeInfo}
+
+    # NOTE: The response changes only if the contract addresses are changed
+    return cached_json_response(key=("NodeInfo", addresses), content=content)
 
 
 # ------------------------------
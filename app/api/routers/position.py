@@ -250,52 +250,104 @@ class BasePosition:
         offset = request_query.offset
         limit = request_query.limit
         include_token_details = request_query.include_token_details
-        # Get TokenList Contract
-        _list_contract = AsyncContract.get_contract(
-            contract_name="TokenList", address=str(config.TOKEN_LIST_CONTRACT_ADDRESS)
+        # Get listed tokens of the token type
+        # NOTE: The token template is pre-filtered with the index of TokenList.
+        #       Tokens not indexed yet are checked on the TokenList contract.
+        _token_list: Sequence[tuple[str, str | None]] = (
+            (
+                await async_session.execute(
+                    select(Listing.token_address, IDXTokenListRegister.token_template)
+                    .outerjoin(
+                        IDXTokenListRegister,
+                        IDXTokenListRegister.token_address == Listing.token_address,
+                    )
+                    .where(
+                        or_(
+                            IDXTokenListRegister.token_template == self.token_type,
+                            IDXTokenListRegister.token_template == None,
+                        )
+                    )
+                    .order_by(Listing.id)
+                )
+            )
+            .tuples()
+            .all()
         )
-
-        # Get Listing Tokens
-        _token_list: Sequence[Listing] = (
-            await async_session.scalars(select(Listing).order_by(Listing.id))
-        ).all()
-
-        position_list = []
-        limit_count = 0
-        count = 0
-        for _token in _token_list:
-            token_info = await AsyncContract.call_function(
-                contract=_list_contract,
-                function_name="getTokenByAddress",
-                args=(_token.token_address,),
+        _not_indexed_list = [
+            token_address
+            for token_address, token_template in _token_list
+            if token_template is None
+        ]
+        _not_indexed_templates: dict[str, str] = {}
+        if len(_not_indexed_list) > 0:
+            _list_contract = AsyncContract.get_contract(
+                contract_name="TokenList",
+                address=str(config.TOKEN_LIST_CONTRACT_ADDRESS),
+            )
+            token_info_list = await AsyncContract.call_functions(
+                [
+                    (_list_contract, "getTokenByAddress", (token_address,))
+                    for token_address in _not_indexed_list
+                ],
                 default_returns=(config.ZERO_ADDRESS, "", config.ZERO_ADDRESS),
             )
-            token_address = token_info[0]
-            token_template = token_info[1]
-            if token_template == self.token_type:
-                # Get Position
-                position = await self._get_position(
+            _not_indexed_templates = {
+                token_address: token_info[1]
+                for token_address, token_info in zip(_not_indexed_list, token_info_list)
+            }
+        _candidate_list = [
+            token_address
+            for token_address, token_template in _token_list
+            if (token_template or _not_indexed_templates.get(token_address))
+            == self.token_type
+        ]
+
+        # Get positions of the candidate tokens concurrently
+        # until the positions of the requested page are found
+        # NOTE: A position whose token details cannot be fetched fails the request,
+        #       so that positions after it do not move onto the requested page.
+        required_count = (offset or 0) + limit if limit is not None else None
+        concurrency = config.POSITION_LIST_CALL_CONCURRENCY
+        _position_list = []
+        scanned_all = True
+        for i in range(0, len(_candidate_list), concurrency):
+            if required_count is not None and len(_position_list) >= required_count:
+                scanned_all = False
+                break
+            positions = [
+                position
+                for position in await self._get_positions(
                     account_address,
-                    token_address,
+                    _candidate_list[i : i + concurrency],
                     async_session,
-                    is_detail=include_token_details,
                 )
+                if position is not None
+            ]
 
-                # Filter
-                if position is None:
-                    continue
+            # Get token details of the positions at once
+            if include_token_details is True:
+                token_details = await self.token_model.get_many(
+                    async_session,
+                    [position["token_address"] for position in positions],
+                )
+                for position in positions:
+                    token_address = position.pop("token_address")
+                    token_detail = token_details.get(token_address)
+                    if token_detail is None:
+                        raise ServiceUnavailable(
+                            f"Failed to get token: {token_address}"
+                        )
+                    position["token"] = token_detail.__dict__
 
-                # Pagination
-                if offset is not None and offset > count:
-                    count += 1
-                    continue
-                if limit is not None and limit_count >= limit:
-                    count += 1
-                    continue
+            _position_list.extend(positions)
 
-                position_list.append(position)
-                count += 1
-                limit_count += 1
+        # Pagination
+        # NOTE: If the scan stopped at the requested page,
+        #       the number of all positions is unknown.
+        start = offset or 0
+        end = start + limit if limit is not None else None
+        position_list = _position_list[start:end]
+        count = len(_position_list) if scanned_all else None
 
         return {
             "result_set": {
@@ -449,6 +501,36 @@ class BasePosition:
 
         return position
 
+    async def _get_positions(
+        self,
+        account_address: str,
+        token_addresses: Sequence[str],
+        async_session: AsyncSession,
+    ) -> list[dict | None]:
+        """Get positions of tokens without token details
+
+        Contract calls of the tokens are sent concurrently.
+        NOTE: The DB session must not be used by the concurrent tasks.
+
+        :param account_address: Account address
+        :param token_addresses: Token addresses
+        :param async_session: DB session
+        :return: Positions in the order of tokens (None if no position)
+        """
+        try:
+            tasks = await SemaphoreTaskGroup.run(
+                *[
+                    self._get_position(
+                        account_address, token_address, async_session, is_detail=False
+                    )
+                    for token_address in token_addresses
+                ],
+                max_concurrency=config.POSITION_LIST_CALL_CONCURRENCY,
+            )
+        except ExceptionGroup:
+            raise ServiceUnavailable from None
+        return [task.result() for task in tasks]
+
     async def _get_position(
         self,
         account_address: str,
@@ -503,15 +585,15 @@ class BasePosition:
             if balance == 0 and _exchange_balance == 0 and _exchange_commitment == 0:
                 return None
             else:
-                token = await self.token_model.get(
-                    async_session=async_session, token_address=token_address
-                )
                 position = {
                     "balance": balance,
                     "exchange_balance": _exchange_balance,
                     "exchange_commitment": _exchange_commitment,
                 }
                 if is_detail is True:
+                    token = await self.token_model.get(
+                        async_session=async_session, token_address=token_address
+                    )
                     position["token"] = token.__dict__
                 else:
                     position["token_address"] = token_address
@@ -624,9 +706,6 @@ class BasePositionShare(BasePosition):
             ):
                 return None
             else:
-                token = await ShareToken.get(
-                    async_session=async_session, token_address=token_address
-                )
                 position = {
                     "balance": balance,
                     "pending_transfer": pending_transfer,
@@ -635,6 +714,9 @@ class BasePositionShare(BasePosition):
                     "locked": None,
                 }
                 if is_detail is True:
+                    token = await ShareToken.get(
+                        async_session=async_session, token_address=token_address
+                    )
                     position["token"] = token.__dict__
                 else:
                     position["token_address"] = token_address
@@ -729,9 +811,6 @@ class BasePositionStraightBond(BasePosition):
             ):
                 return None
             else:
-                token = await BondToken.get(
-                    async_session=async_session, token_address=token_address
-                )
                 position = {
                     "balance": balance,
                     "pending_transfer": pending_transfer,
@@ -740,6 +819,9 @@ class BasePositionStraightBond(BasePosition):
                     "locked": None,
                 }
                 if is_detail is True:
+                    token = await BondToken.get(
+                        async_session=async_session, token_address=token_address
+                    )
                     position["token"] = token.__dict__
                 else:
                     position["token_address"] = token_address
@@ -954,9 +1036,54 @@ class BasePositionCoupon(BasePosition):
             "positions": position_list,
         }
 
+    async def _get_positions(
+        self,
+        account_address: str,
+        token_addresses: Sequence[str],
+        async_session: AsyncSession,
+    ) -> list[dict | None]:
+        # Retrieve token receipt history of all tokens at once
+        # so that the concurrent tasks do not use the DB session.
+        received_token_addresses = set(
+            (
+                await async_session.scalars(
+                    select(IDXTransfer.token_address)
+                    .where(IDXTransfer.token_address.in_(token_addresses))
+                    .where(IDXTransfer.to_address == account_address)
+                    .distinct()
+                )
+            ).all()
+        )
+        try:
+            tasks = await SemaphoreTaskGroup.run(
+                *[
+                    self._get_position(
+                        account_address,
+                        token_address,
+                        async_session,
+                        is_detail=False,
+                        received=token_address in received_token_addresses,
+                    )
+                    for token_address in token_addresses
+                ],
+                max_concurrency=config.POSITION_LIST_CALL_CONCURRENCY,
+            )
+        except ExceptionGroup:
+            raise ServiceUnavailable from None
+        return [task.result() for task in tasks]
+
     async def _get_position(
-        self, account_address, token_address, async_session, is_detail=False
+        self,
+        account_address,
+        token_address,
+        async_session,
+        is_detail=False,
+        received: bool | None = None,
     ):
+        """
+        :param received: Whether the account has received the token
+                         (None: retrieved from the DB session)
+        """
         # Get Contract
         _token_contract, _exchange_contract = await self._get_contract(token_address)
 
@@ -1015,14 +1142,15 @@ class BasePositionCoupon(BasePosition):
 
             # Retrieving token receipt history from IDXTransfer
             # NOTE: Index data has a lag from the most recent transfer state.
-            received_history = (
-                await async_session.scalars(
-                    select(IDXTransfer)
-                    .where(IDXTransfer.token_address == token_address)
-                    .where(IDXTransfer.to_address == account_address)
-                    .limit(1)
-                )
-            ).first()
+            if received is None:
+                received = (
+                    await async_session.scalars(
+                        select(IDXTransfer)
+                        .where(IDXTransfer.token_address == token_address)
+                        .where(IDXTransfer.to_address == account_address)
+                        .limit(1)
+                    )
+                ).first() is not None
             # If balance, commitment, and used are non-zero, and exist received history,
             # get the token information from TokenContract.
             if (
@@ -1030,13 +1158,10 @@ class BasePositionCoupon(BasePosition):
                 and _exchange_balance == 0
                 and _exchange_commitment == 0
                 and used == 0
-                and received_history is None
+                and received is False
             ):
                 return None
             else:
-                token = await CouponToken.get(
-                    async_session=async_session, token_address=token_address
-                )
                 position = {
                     "balance": balance,
                     "exchange_balance": _exchange_balance,
@@ -1044,6 +1169,9 @@ class BasePositionCoupon(BasePosition):
                     "used": used,
                 }
                 if is_detail is True:
+                    token = await CouponToken.get(
+                        async_session=async_session, token_address=token_address
+                    )
                     position["token"] = token.__dict__
                 else:
                     position["token_address"] = token_address
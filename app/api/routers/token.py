@@ -17,12 +17,12 @@ limitations under the License.
 SPDX-License-Identifier: Apache-2.0
 """
 
-from datetime import timezone
+from datetime import datetime, timezone
 from typing import Annotated, Optional, Sequence
 
 from fastapi import APIRouter, Path, Query
 from pydantic import UUID4
-from sqlalchemy import String, and_, asc, case, cast, desc, func, or_, select
+from sqlalchemy import String, asc, case, cast, desc, func, or_, select, tuple_
 from sqlalchemy.orm import aliased
 
 from app import config, log
@@ -31,8 +31,8 @@ from app.database import DBAsyncSession
 from app.errors import DataNotExistsError, InvalidParameterError, ServiceUnavailable
 from app.model.db import (
     AccountTag,
-    IDXLockedPosition,
-    IDXPosition,
+    IDXTokenHolderCount,
+    IDXTokenHolderSummary,
     IDXTransfer,
     IDXTransferApproval,
     Listing,
@@ -67,6 +67,7 @@ from app.model.type import EthereumAddress
 from app.utils.asyncio_utils import SemaphoreTaskGroup
 from app.utils.docs_utils import get_routers_responses
 from app.utils.fastapi_utils import json_response
+from app.utils.pagination_utils import decode_cursor, keyset_page
 from app.utils.web3_utils import AsyncWeb3Wrapper
 
 LOG = log.get_logger()
@@ -141,6 +142,7 @@ async def get_token_status(
     summary="Token holders",
     operation_id="TokenHolders",
     response_model=GenericSuccessResponse[TokenHoldersResponse],
+    response_model_exclude_unset=True,
     responses=get_routers_responses(DataNotExistsError, InvalidParameterError),
 )
 async def get_token_holders(
@@ -162,66 +164,41 @@ async def get_token_holders(
 
     limit = request_query.limit
     offset = request_query.offset
+    cursor = request_query.cursor
+    include_count = (
+        request_query.include_count
+        if request_query.include_count is not None
+        else cursor is None
+    )
 
     # Retrieve Token Holders List
-    position_account = aliased(AccountTag)
-    lock_position_account = aliased(AccountTag)
     stmt = (
-        select(IDXPosition, func.sum(IDXLockedPosition.value))
-        .outerjoin(
-            IDXLockedPosition,
-            and_(
-                IDXLockedPosition.token_address == token_address,
-                IDXLockedPosition.account_address == IDXPosition.account_address,
-            ),
-        )
-        .outerjoin(
-            position_account,
-            IDXPosition.account_address == position_account.account_address,
-        )
-        .outerjoin(
-            lock_position_account,
-            IDXLockedPosition.account_address == lock_position_account.account_address,
-        )
-        .where(IDXPosition.token_address == token_address)
-        .where(
-            or_(
-                IDXPosition.balance > 0,
-                IDXPosition.pending_transfer > 0,
-                IDXPosition.exchange_balance > 0,
-                IDXPosition.exchange_commitment > 0,
-                IDXLockedPosition.value > 0,
-            )
-        )
-        .group_by(
-            IDXPosition.token_address,
-            IDXPosition.account_address,
-            IDXLockedPosition.account_address,
-        )
+        select(IDXTokenHolderSummary)
+        .where(IDXTokenHolderSummary.token_address == token_address)
+        .where(IDXTokenHolderSummary.is_holder())
     )
     if request_query.account_tag is not None:
         stmt = stmt.where(
-            or_(
-                position_account.account_tag == request_query.account_tag,
-                lock_position_account.account_tag == request_query.account_tag,
-            )
-        )
-    total = await async_session.scalar(
-        select(func.count()).select_from(
-            stmt.with_only_columns(1).order_by(None).subquery()
+            IDXTokenHolderSummary.account_tag == request_query.account_tag
         )
+    total = (
+        await async_session.scalar(stmt.with_only_columns(func.count()).order_by(None))
+        if include_count
+        else None
     )
 
     if request_query.exclude_owner is True:
-        stmt = stmt.where(IDXPosition.account_address != listed_token.owner_address)
+        stmt = stmt.where(
+            IDXTokenHolderSummary.account_address != listed_token.owner_address
+        )
     if request_query.amount is not None and request_query.amount_operator is not None:
         match request_query.amount_operator:
             case ValueOperator.EQUAL:
-                stmt = stmt.where(IDXPosition.balance == request_query.amount)
+                stmt = stmt.where(IDXTokenHolderSummary.balance == request_query.amount)
             case ValueOperator.GTE:
-                stmt = stmt.where(IDXPosition.balance >= request_query.amount)
+                stmt = stmt.where(IDXTokenHolderSummary.balance >= request_query.amount)
             case ValueOperator.LTE:
-                stmt = stmt.where(IDXPosition.balance <= request_query.amount)
+                stmt = stmt.where(IDXTokenHolderSummary.balance <= request_query.amount)
     if (
         request_query.pending_transfer is not None
         and request_query.pending_transfer_operator is not None
@@ -229,15 +206,18 @@ async def get_token_holders(
         match request_query.pending_transfer_operator:
             case ValueOperator.EQUAL:
                 stmt = stmt.where(
-                    IDXPosition.pending_transfer == request_query.pending_transfer
+                    IDXTokenHolderSummary.pending_transfer
+                    == request_query.pending_transfer
                 )
             case ValueOperator.GTE:
                 stmt = stmt.where(
-                    IDXPosition.pending_transfer >= request_query.pending_transfer
+                    IDXTokenHolderSummary.pending_transfer
+                    >= request_query.pending_transfer
                 )
             case ValueOperator.LTE:
                 stmt = stmt.where(
-                    IDXPosition.pending_transfer <= request_query.pending_transfer
+                    IDXTokenHolderSummary.pending_transfer
+                    <= request_query.pending_transfer
                 )
     if (
         request_query.exchange_balance is not None
@@ -246,15 +226,18 @@ async def get_token_holders(
         match request_query.exchange_balance_operator:
             case ValueOperator.EQUAL:
                 stmt = stmt.where(
-                    IDXPosition.exchange_balance == request_query.exchange_balance
+                    IDXTokenHolderSummary.exchange_balance
+                    == request_query.exchange_balance
                 )
             case ValueOperator.GTE:
                 stmt = stmt.where(
-                    IDXPosition.exchange_balance >= request_query.exchange_balance
+                    IDXTokenHolderSummary.exchange_balance
+                    >= request_query.exchange_balance
                 )
             case ValueOperator.LTE:
                 stmt = stmt.where(
-                    IDXPosition.exchange_balance <= request_query.exchange_balance
+                    IDXTokenHolderSummary.exchange_balance
+                    <= request_query.exchange_balance
                 )
     if (
         request_query.exchange_commitment is not None
@@ -263,65 +246,98 @@ async def get_token_holders(
         match request_query.exchange_commitment_operator:
             case ValueOperator.EQUAL:
                 stmt = stmt.where(
-                    IDXPosition.exchange_commitment == request_query.exchange_commitment
+                    IDXTokenHolderSummary.exchange_commitment
+                    == request_query.exchange_commitment
                 )
             case ValueOperator.GTE:
                 stmt = stmt.where(
-                    IDXPosition.exchange_commitment >= request_query.exchange_commitment
+                    IDXTokenHolderSummary.exchange_commitment
+                    >= request_query.exchange_commitment
                 )
             case ValueOperator.LTE:
                 stmt = stmt.where(
-                    IDXPosition.exchange_commitment <= request_query.exchange_commitment
+                    IDXTokenHolderSummary.exchange_commitment
+                    <= request_query.exchange_commitment
                 )
     if request_query.locked is not None and request_query.locked_operator is not None:
         match request_query.locked_operator:
             case ValueOperator.EQUAL:
-                stmt = stmt.where(IDXLockedPosition.value == request_query.locked)
+                stmt = stmt.where(IDXTokenHolderSummary.locked == request_query.locked)
             case ValueOperator.GTE:
-                stmt = stmt.where(IDXLockedPosition.value >= request_query.locked)
+                stmt = stmt.where(IDXTokenHolderSummary.locked >= request_query.locked)
             case ValueOperator.LTE:
-                stmt = stmt.where(IDXLockedPosition.value <= request_query.locked)
+                stmt = stmt.where(IDXTokenHolderSummary.locked <= request_query.locked)
 
-    count = await async_session.scalar(
-        select(func.count()).select_from(
-            stmt.with_only_columns(1).order_by(None).subquery()
-        )
+    count = (
+        await async_session.scalar(stmt.with_only_columns(func.count()).order_by(None))
+        if include_count
+        else None
     )
 
-    # Pagination
-    if limit is not None:
-        stmt = stmt.limit(limit)
-    if offset is not None:
-        stmt = stmt.offset(offset)
-
-    holders: Sequence[tuple[IDXPosition, int | None]] = (
-        await async_session.execute(stmt.order_by(desc(IDXPosition.created)))
-    ).all()
-
-    resp_body = {
-        "result_set": {
+    holders: Sequence[IDXTokenHolderSummary]
+    result_set: dict[str, int | str | None]
+    if cursor is not None:
+        # Keyset pagination: (created, account_address) in descending order
+        last = decode_cursor(cursor, datetime, str)
+        if last is not None:
+            stmt = stmt.where(
+                tuple_(
+                    IDXTokenHolderSummary.created, IDXTokenHolderSummary.account_address
+                )
+                < tuple_(*last)
+            )
+        if limit is not None:
+            stmt = stmt.limit(limit + 1)
+        rows = (
+            await async_session.scalars(
+                stmt.order_by(
+                    desc(IDXTokenHolderSummary.created),
+                    desc(IDXTokenHolderSummary.account_address),
+                )
+            )
+        ).all()
+        holders, next_cursor = keyset_page(
+            rows,
+            limit,
+            lambda holder: (holder.created, holder.account_address),
+        )
+        result_set = {
+            "count": count,
+            "offset": None,
+            "limit": limit,
+            "total": total,
+            "next_cursor": next_cursor,
+        }
+    else:
+        # Pagination
+        if limit is not None:
+            stmt = stmt.limit(limit)
+        if offset is not None:
+            stmt = stmt.offset(offset)
+
+        holders = (
+            await async_session.scalars(
+                stmt.order_by(desc(IDXTokenHolderSummary.created))
+            )
+        ).all()
+        result_set = {
             "count": count,
             "offset": offset,
             "limit": limit,
             "total": total,
-        },
+        }
+
+    resp_body = {
+        "result_set": result_set,
         "token_holder_list": [
             {
-                "token_address": holder[0].token_address,
-                "account_address": holder[0].account_address,
-                "amount": holder[0].balance if holder[0].balance else 0,
-                "pending_transfer": (
-                    holder[0].pending_transfer if holder[0].pending_transfer else 0
-                ),
-                "exchange_balance": (
-                    holder[0].exchange_balance if holder[0].exchange_balance else 0
-                ),
-                "exchange_commitment": (
-                    holder[0].exchange_commitment
-                    if holder[0].exchange_commitment
-                    else 0
-                ),
-                "locked": holder[1] if holder[1] else 0,
+                "token_address": holder.token_address,
+                "account_address": holder.account_address,
+                "amount": holder.balance,
+                "pending_transfer": holder.pending_transfer,
+                "exchange_balance": holder.exchange_balance,
+                "exchange_commitment": holder.exchange_commitment,
+                "locked": holder.locked,
             }
             for holder in holders
         ],
@@ -335,6 +351,7 @@ async def get_token_holders(
     summary="Search Token holders",
     operation_id="SearchTokenHolders",
     response_model=GenericSuccessResponse[TokenHoldersResponse],
+    response_model_exclude_unset=True,
     responses=get_routers_responses(DataNotExistsError, InvalidParameterError),
 )
 async def search_token_holders(
@@ -357,71 +374,59 @@ async def search_token_holders(
     limit = data.limit
     offset = data.offset
     # Get token holders
-    # add order_by id to bridge the difference between postgres and mysql
     stmt = (
-        select(IDXPosition, func.sum(IDXLockedPosition.value))
-        .outerjoin(
-            IDXLockedPosition,
-            and_(
-                IDXLockedPosition.token_address == token_address,
-                IDXLockedPosition.account_address == IDXPosition.account_address,
-            ),
-        )
-        .where(IDXPosition.token_address == token_address)
-        .where(
-            or_(
-                IDXPosition.balance > 0,
-                IDXPosition.pending_transfer > 0,
-                IDXPosition.exchange_balance > 0,
-                IDXPosition.exchange_commitment > 0,
-                IDXLockedPosition.value > 0,
-            )
-        )
-        .group_by(
-            IDXPosition.token_address,
-            IDXPosition.account_address,
-            IDXLockedPosition.account_address,
-        )
+        select(IDXTokenHolderSummary)
+        .where(IDXTokenHolderSummary.token_address == token_address)
+        .where(IDXTokenHolderSummary.is_holder())
     )
     if len(data.account_address_list) > 0:
         stmt = stmt.where(
-            or_(
-                IDXPosition.account_address.in_(data.account_address_list),
-                IDXLockedPosition.account_address.in_(data.account_address_list),
-            )
+            IDXTokenHolderSummary.account_address.in_(data.account_address_list)
         )
     total = await async_session.scalar(
-        select(func.count()).select_from(
-            stmt.with_only_columns(1).order_by(None).subquery()
-        )
+        stmt.with_only_columns(func.count()).order_by(None)
     )
 
     if data.exclude_owner is True:
-        stmt = stmt.where(IDXPosition.account_address != listed_token.owner_address)
+        stmt = stmt.where(
+            IDXTokenHolderSummary.account_address != listed_token.owner_address
+        )
     if data.amount is not None and data.amount_operator is not None:
         match data.amount_operator:
             case ValueOperator.EQUAL:
-                stmt = stmt.where(IDXPosition.balance == data.amount)
+                stmt = stmt.where(IDXTokenHolderSummary.balance == data.amount)
             case ValueOperator.GTE:
-                stmt = stmt.where(IDXPosition.balance >= data.amount)
+                stmt = stmt.where(IDXTokenHolderSummary.balance >= data.amount)
             case ValueOperator.LTE:
-                stmt = stmt.where(IDXPosition.balance <= data.amount)
+                stmt = stmt.where(IDXTokenHolderSummary.balance <= data.amount)
     if data.pending_transfer is not None and data.pending_transfer_operator is not None:
         match data.pending_transfer_operator:
             case ValueOperator.EQUAL:
-                stmt = stmt.where(IDXPosition.pending_transfer == data.pending_transfer)
+                stmt = stmt.where(
+                    IDXTokenHolderSummary.pending_transfer == data.pending_transfer
+                )
             case ValueOperator.GTE:
-                stmt = stmt.where(IDXPosition.pending_transfer >= data.pending_transfer)
+                stmt = stmt.where(
+                    IDXTokenHolderSummary.pending_transfer >= data.pending_transfer
+                )
             case ValueOperator.LTE:
-                stmt = stmt.where(IDXPosition.pending_transfer <= data.pending_transfer)
+                stmt = stmt.where(
+                    IDXTokenHolderSummary.pending_transfer <= data.pending_transfer
+                )
     if data.exchange_balance is not None and data.exchange_balance_operator is not None:
         match data.exchange_balance_operator:
             case ValueOperator.EQUAL:
-                stmt = stmt.where(IDXPosition.exchange_balance == data.exchange_balance)
+                stmt = stmt.where(
+                    IDXTokenHolderSummary.exchange_balance == data.exchange_balance
+                )
             case ValueOperator.GTE:
-                stmt = stmt.where(IDXPosition.exchange_balance >= data.exchange_balance)
+                stmt = stmt.where(
+                    IDXTokenHolderSummary.exchange_balance >= data.exchange_balance
+                )
             case ValueOperator.LTE:
-                stmt = stmt.where(IDXPosition.exchange_balance <= data.exchange_balance)
+                stmt = stmt.where(
+                    IDXTokenHolderSummary.exchange_balance <= data.exchange_balance
+                )
     if (
         data.exchange_commitment is not None
         and data.exchange_commitment_operator is not None
@@ -429,29 +434,30 @@ async def search_token_holders(
         match data.exchange_commitment_operator:
             case ValueOperator.EQUAL:
                 stmt = stmt.where(
-                    IDXPosition.exchange_commitment == data.exchange_commitment
+                    IDXTokenHolderSummary.exchange_commitment
+                    == data.exchange_commitment
                 )
             case ValueOperator.GTE:
                 stmt = stmt.where(
-                    IDXPosition.exchange_commitment >= data.exchange_commitment
+                    IDXTokenHolderSummary.exchange_commitment
+                    >= data.exchange_commitment
                 )
             case ValueOperator.LTE:
                 stmt = stmt.where(
-                    IDXPosition.exchange_commitment <= data.exchange_commitment
+                    IDXTokenHolderSummary.exchange_commitment
+                    <= data.exchange_commitment
                 )
     if data.locked is not None and data.locked_operator is not None:
         match data.locked_operator:
             case ValueOperator.EQUAL:
-                stmt = stmt.where(IDXLockedPosition.value == data.locked)
+                stmt = stmt.where(IDXTokenHolderSummary.locked == data.locked)
             case ValueOperator.GTE:
-                stmt = stmt.where(IDXLockedPosition.value >= data.locked)
+                stmt = stmt.where(IDXTokenHolderSummary.locked >= data.locked)
             case ValueOperator.LTE:
-                stmt = stmt.where(IDXLockedPosition.value <= data.locked)
+                stmt = stmt.where(IDXTokenHolderSummary.locked <= data.locked)
 
     count = await async_session.scalar(
-        select(func.count()).select_from(
-            stmt.with_only_columns(1).order_by(None).subquery()
-        )
+        stmt.with_only_columns(func.count()).order_by(None)
     )
 
     # Sort
@@ -469,22 +475,22 @@ async def search_token_holders(
                         account_address: i
                         for i, account_address in enumerate(data.account_address_list)
                     },
-                    value=IDXPosition.account_address,
+                    value=IDXTokenHolderSummary.account_address,
                 )
             )
         )
     elif data.sort_item == "locked":
-        stmt = stmt.order_by(_order(data.sort_order)(func.sum(IDXLockedPosition.value)))
+        stmt = stmt.order_by(_order(data.sort_order)(IDXTokenHolderSummary.locked))
     elif data.sort_item == "amount":
-        sort_attr = getattr(IDXPosition, "balance", None)
+        sort_attr = getattr(IDXTokenHolderSummary, "balance", None)
         stmt = stmt.order_by(_order(data.sort_order)(sort_attr))
     else:
-        sort_attr = getattr(IDXPosition, data.sort_item, None)
+        sort_attr = getattr(IDXTokenHolderSummary, data.sort_item, None)
         stmt = stmt.order_by(_order(data.sort_order)(sort_attr))
 
     # NOTE: Set secondary sort for consistent results
     if data.sort_item != "created":
-        stmt = stmt.order_by(desc(IDXPosition.created))
+        stmt = stmt.order_by(desc(IDXTokenHolderSummary.created))
 
     # Pagination
     if limit is not None:
@@ -492,9 +498,7 @@ async def search_token_holders(
     if offset is not None:
         stmt = stmt.offset(offset)
 
-    holders: Sequence[tuple[IDXPosition, int | None]] = (
-        await async_session.execute(stmt)
-    ).all()
+    holders: Sequence[IDXTokenHolderSummary] = (await async_session.scalars(stmt)).all()
 
     resp_body = {
         "result_set": {
@@ -505,21 +509,13 @@ async def search_token_holders(
         },
         "token_holder_list": [
             {
-                "token_address": holder[0].token_address,
-                "account_address": holder[0].account_address,
-                "amount": holder[0].balance if holder[0].balance else 0,
-                "pending_transfer": (
-                    holder[0].pending_transfer if holder[0].pending_transfer else 0
-                ),
-                "exchange_balance": (
-                    holder[0].exchange_balance if holder[0].exchange_balance else 0
-                ),
-                "exchange_commitment": (
-                    holder[0].exchange_commitment
-                    if holder[0].exchange_commitment
-                    else 0
-                ),
-                "locked": holder[1] if holder[1] else 0,
+                "token_address": holder.token_address,
+                "account_address": holder.account_address,
+                "amount": holder.balance,
+                "pending_transfer": holder.pending_transfer,
+                "exchange_balance": holder.exchange_balance,
+                "exchange_commitment": holder.exchange_commitment,
+                "locked": holder.locked,
             }
             for holder in holders
         ],
@@ -553,56 +549,40 @@ async def get_token_holders_count(
         raise DataNotExistsError("token_address: %s" % token_address)
 
     # Retrieve Token Holders
-    position_account = aliased(AccountTag)
-    lock_position_account = aliased(AccountTag)
-    stmt = (
-        select(IDXPosition, func.sum(IDXLockedPosition.value))
-        .outerjoin(
-            IDXLockedPosition,
-            and_(
-                IDXLockedPosition.token_address == token_address,
-                IDXLockedPosition.account_address == IDXPosition.account_address,
-            ),
-        )
-        .outerjoin(
-            position_account,
-            IDXPosition.account_address == position_account.account_address,
-        )
-        .outerjoin(
-            lock_position_account,
-            IDXLockedPosition.account_address == lock_position_account.account_address,
-        )
-        .where(IDXPosition.token_address == token_address)
-        .where(
-            or_(
-                IDXPosition.balance > 0,
-                IDXPosition.pending_transfer > 0,
-                IDXPosition.exchange_balance > 0,
-                IDXPosition.exchange_commitment > 0,
-                IDXLockedPosition.value > 0,
-            )
-        )
-        .group_by(
-            IDXPosition.token_address,
-            IDXPosition.account_address,
-            IDXLockedPosition.account_address,
-        )
-    )
     if request_query.account_tag is not None:
-        stmt = stmt.where(
-            or_(
-                position_account.account_tag == request_query.account_tag,
-                lock_position_account.account_tag == request_query.account_tag,
+        stmt = (
+            select(func.count())
+            .select_from(IDXTokenHolderSummary)
+            .where(IDXTokenHolderSummary.token_address == token_address)
+            .where(IDXTokenHolderSummary.account_tag == request_query.account_tag)
+            .where(IDXTokenHolderSummary.is_holder())
+        )
+        if request_query.exclude_owner is True:
+            stmt = stmt.where(
+                IDXTokenHolderSummary.account_address != listed_token.owner_address
             )
-        )
-    if request_query.exclude_owner is True:
-        stmt = stmt.where(IDXPosition.account_address != listed_token.owner_address)
-
-    _count = await async_session.scalar(
-        select(func.count()).select_from(
-            stmt.with_only_columns(1).order_by(None).subquery()
-        )
-    )
+        _count = await async_session.scalar(stmt) or 0
+    else:
+        # Read the counter maintained by the position indexers
+        _count = (
+            await async_session.scalar(
+                select(IDXTokenHolderCount.holder_count).where(
+                    IDXTokenHolderCount.token_address == token_address
+                )
+            )
+            or 0
+        )
+        if request_query.exclude_owner is True:
+            owner_is_holder = await async_session.scalar(
+                select(IDXTokenHolderSummary.account_address)
+                .where(IDXTokenHolderSummary.token_address == token_address)
+                .where(
+                    IDXTokenHolderSummary.account_address == listed_token.owner_address
+                )
+                .where(IDXTokenHolderSummary.is_holder())
+            )
+            if owner_is_holder is not None:
+                _count -= 1
 
     resp_body = {"count": _count}
 
@@ -765,6 +745,7 @@ async def get_token_holders_collection(
     summary="List all transfer history",
     operation_id="ListAllTransferHistory",
     response_model=GenericSuccessResponse[TransferHistoriesResponse],
+    response_model_exclude_unset=True,
     responses=get_routers_responses(DataNotExistsError, InvalidParameterError),
 )
 async def list_all_transfer_histories(
@@ -873,6 +854,7 @@ async def list_all_transfer_histories(
     summary="List token transfer history",
     operation_id="ListTokenTransferHistory",
     response_model=GenericSuccessResponse[TransferHistoriesResponse],
+    response_model_exclude_unset=True,
     responses=get_routers_responses(DataNotExistsError, InvalidParameterError),
 )
 async def list_token_transfer_histories(
@@ -892,6 +874,13 @@ async def list_token_transfer_histories(
     if listed_token is None:
         raise DataNotExistsError("token_address: %s" % token_address)
 
+    cursor = request_query.cursor
+    include_count = (
+        request_query.include_count
+        if request_query.include_count is not None
+        else cursor is None
+    )
+
     # Base query
     from_address_tag = aliased(AccountTag)
     to_address_tag = aliased(AccountTag)
@@ -917,8 +906,10 @@ async def list_token_transfer_histories(
             )
         )
 
-    total = await async_session.scalar(
-        stmt.with_only_columns(func.count()).order_by(None)
+    total = (
+        await async_session.scalar(stmt.with_only_columns(func.count()).order_by(None))
+        if include_count
+        else None
     )
 
     if request_query.source_event is not None:
@@ -954,29 +945,54 @@ async def list_token_transfer_histories(
             case ValueOperator.LTE:
                 stmt = stmt.where(IDXTransfer.value <= request_query.value)
 
-    count = await async_session.scalar(
-        stmt.with_only_columns(func.count()).order_by(None)
+    count = (
+        await async_session.scalar(stmt.with_only_columns(func.count()).order_by(None))
+        if include_count
+        else None
     )
 
     # Sort
     stmt = stmt.order_by(IDXTransfer.id)
 
-    # Pagination
-    if request_query.offset is not None:
-        stmt = stmt.offset(request_query.offset)
-    if request_query.limit is not None:
-        stmt = stmt.limit(request_query.limit)
-
-    transfer_history: Sequence[IDXTransfer] = (await async_session.scalars(stmt)).all()
-
-    resp_data = [transfer_event.json() for transfer_event in transfer_history]
-    data = {
-        "result_set": {
+    transfer_history: Sequence[IDXTransfer]
+    result_set: dict[str, int | str | None]
+    if cursor is not None:
+        # Keyset pagination: id in ascending order
+        last = decode_cursor(cursor, int)
+        if last is not None:
+            stmt = stmt.where(IDXTransfer.id > last[0])
+        if request_query.limit is not None:
+            stmt = stmt.limit(request_query.limit + 1)
+        transfer_history, next_cursor = keyset_page(
+            (await async_session.scalars(stmt)).all(),
+            request_query.limit,
+            lambda transfer: (transfer.id,),
+        )
+        result_set = {
+            "count": count,
+            "offset": None,
+            "limit": request_query.limit,
+            "total": total,
+            "next_cursor": next_cursor,
+        }
+    else:
+        # Pagination
+        if request_query.offset is not None:
+            stmt = stmt.offset(request_query.offset)
+        if request_query.limit is not None:
+            stmt = stmt.limit(request_query.limit)
+
+        transfer_history = (await async_session.scalars(stmt)).all()
+        result_set = {
             "count": count,
             "offset": request_query.offset,
             "limit": request_query.limit,
             "total": total,
-        },
+        }
+
+    resp_data = [transfer_event.json() for transfer_event in transfer_history]
+    data = {
+        "result_set": result_set,
         "transfer_history": resp_data,
     }
 
@@ -988,6 +1004,7 @@ async def list_token_transfer_histories(
     summary="Search Token Transfer History",
     operation_id="SearchTokenTransferHistory",
     response_model=GenericSuccessResponse[TransferHistoriesResponse],
+    response_model_exclude_unset=True,
     responses=get_routers_responses(DataNotExistsError, InvalidParameterError),
 )
 async def search_transfer_histories(
@@ -1007,6 +1024,15 @@ async def search_transfer_histories(
     if listed_token is None:
         raise DataNotExistsError("token_address: %s" % token_address)
 
+    cursor = data.cursor
+    if cursor is not None and data.sort_item not in ("id", "created"):
+        raise InvalidParameterError(
+            description="cursor is available only if sort_item is id or created"
+        )
+    include_count = (
+        data.include_count if data.include_count is not None else cursor is None
+    )
+
     # 移転履歴取得
     stmt = select(IDXTransfer).where(IDXTransfer.token_address == token_address)
     if len(data.account_address_list) > 0:
@@ -1016,8 +1042,10 @@ async def search_transfer_histories(
                 IDXTransfer.to_address.in_(data.account_address_list),
             )
         )
-    total = await async_session.scalar(
-        stmt.with_only_columns(func.count()).order_by(None)
+    total = (
+        await async_session.scalar(stmt.with_only_columns(func.count()).order_by(None))
+        if include_count
+        else None
     )
 
     if data.source_event is not None:
@@ -1049,8 +1077,10 @@ async def search_transfer_histories(
             case ValueOperator.LTE:
                 stmt = stmt.where(IDXTransfer.value <= data.value)
 
-    count = await async_session.scalar(
-        stmt.with_only_columns(func.count()).order_by(None)
+    count = (
+        await async_session.scalar(stmt.with_only_columns(func.count()).order_by(None))
+        if include_count
+        else None
     )
 
     def _order(_order):
@@ -1059,6 +1089,45 @@ async def search_transfer_histories(
         else:
             return desc
 
+    if cursor is not None:
+        # Keyset pagination: (created, id) or id in the specified order
+        if data.sort_item == "created":
+            sort_columns = (IDXTransfer.created, IDXTransfer.id)
+            last = decode_cursor(cursor, datetime, int)
+        else:
+            sort_columns = (IDXTransfer.id,)
+            last = decode_cursor(cursor, int)
+        if last is not None:
+            if data.sort_order == 0:
+                stmt = stmt.where(tuple_(*sort_columns) > tuple_(*last))
+            else:
+                stmt = stmt.where(tuple_(*sort_columns) < tuple_(*last))
+        stmt = stmt.order_by(*[_order(data.sort_order)(c) for c in sort_columns])
+        if data.limit is not None:
+            stmt = stmt.limit(data.limit + 1)
+        transfer_history, next_cursor = keyset_page(
+            (await async_session.scalars(stmt)).all(),
+            data.limit,
+            lambda transfer: tuple(getattr(transfer, c.key) for c in sort_columns),
+        )
+        return json_response(
+            {
+                **SuccessResponse.default(),
+                "data": {
+                    "result_set": {
+                        "count": count,
+                        "offset": None,
+                        "limit": data.limit,
+                        "total": total,
+                        "next_cursor": next_cursor,
+                    },
+                    "transfer_history": [
+                        transfer_event.json() for transfer_event in transfer_history
+                    ],
+                },
+            }
+        )
+
     if (
         data.sort_item == "from_account_address_list"
         and len(data.account_address_list) > 0
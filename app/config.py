@@ -109,6 +109,22 @@ BATCH_PROCESS_INTERVAL = int(os.environ.get("BATCH_PROCESS_INTERVAL") or 3)
 NOTIFICATION_PROCESS_INTERVAL = int(
     os.environ.get("NOTIFICATION_PROCESS_INTERVAL") or 60
 )
+# Number of event log requests sent concurrently in a notification cycle
+NOTIFICATION_LOG_FETCH_CONCURRENCY = int(
+    os.environ.get("NOTIFICATION_LOG_FETCH_CONCURRENCY") or 10
+)
+# Number of token holder collection jobs processed concurrently
+TOKEN_HOLDERS_WORKER_COUNT = int(os.environ.get("TOKEN_HOLDERS_WORKER_COUNT") or 1)
+# Number of token holders written in a single INSERT statement
+TOKEN_HOLDERS_SAVE_CHUNK_SIZE = int(
+    os.environ.get("TOKEN_HOLDERS_SAVE_CHUNK_SIZE") or 1000
+)
+# Number of positions written in a single INSERT statement by the position indexers
+POSITION_SINK_CHUNK_SIZE = int(os.environ.get("POSITION_SINK_CHUNK_SIZE") or 1000)
+# Number of tokens whose balances are read concurrently by the position indexers
+POSITION_SYNC_TOKEN_CONCURRENCY = int(
+    os.environ.get("POSITION_SYNC_TOKEN_CONCURRENCY") or 5
+)
 
 # Database
 if UNIT_TEST_MODE:
@@ -196,6 +212,69 @@ WEB3_REQUEST_RETRY_COUNT = int(os.environ.get("WEB3_REQUEST_RETRY_COUNT") or 3)
 WEB3_REQUEST_WAIT_TIME = int(
     os.environ.get("WEB3_REQUEST_WAIT_TIME") or BLOCK_SYNC_STATUS_SLEEP_INTERVAL
 )  # Same batch interval
+# TTL of the node selection cache [sec]
+# NOTE: Node status is updated at the interval of block sync status monitoring
+WEB3_NODE_CACHE_TTL = float(
+    os.environ.get("WEB3_NODE_CACHE_TTL") or BLOCK_SYNC_STATUS_SLEEP_INTERVAL
+)
+
+# JSON-RPC batch request settings for contract calls
+# - Concurrent contract calls are coalesced into a single batch request
+WEB3_CALL_BATCH_ENABLED = (
+    False if os.environ.get("WEB3_CALL_BATCH_ENABLED") == "0" else True
+)
+# Maximum number of calls in a single batch request
+WEB3_CALL_BATCH_MAX_SIZE = int(os.environ.get("WEB3_CALL_BATCH_MAX_SIZE") or 50)
+# Time window to collect calls [msec]
+# NOTE: If 0, calls issued in the same event loop iteration are batched
+WEB3_CALL_BATCH_WINDOW_MSEC = int(os.environ.get("WEB3_CALL_BATCH_WINDOW_MSEC") or 0)
+# Maximum number of calls in a single batch request of bulk contract reads
+# NOTE: Used to read the balances of many accounts (e.g. position indexers)
+WEB3_BULK_CALL_BATCH_SIZE = int(os.environ.get("WEB3_BULK_CALL_BATCH_SIZE") or 300)
+
+# Raw JSON-RPC proxy (/Eth/RPC) settings
+# - Requests are sent through a connection pool kept in each worker process
+ETH_RPC_PROXY_MAX_CONNECTIONS = int(
+    os.environ.get("ETH_RPC_PROXY_MAX_CONNECTIONS") or 100
+)
+ETH_RPC_PROXY_MAX_KEEPALIVE_CONNECTIONS = int(
+    os.environ.get("ETH_RPC_PROXY_MAX_KEEPALIVE_CONNECTIONS") or 20
+)
+# Idle time before a keep-alive connection is closed [sec]
+ETH_RPC_PROXY_KEEPALIVE_EXPIRY = float(
+    os.environ.get("ETH_RPC_PROXY_KEEPALIVE_EXPIRY") or 30
+)
+# Timeouts [sec]
+ETH_RPC_PROXY_CONNECT_TIMEOUT = float(
+    os.environ.get("ETH_RPC_PROXY_CONNECT_TIMEOUT") or REQUEST_TIMEOUT[0]
+)
+ETH_RPC_PROXY_READ_TIMEOUT = float(
+    os.environ.get("ETH_RPC_PROXY_READ_TIMEOUT") or REQUEST_TIMEOUT[1]
+)
+# Use HTTP/2 if the "h2" package is installed
+ETH_RPC_PROXY_HTTP2_ENABLED = (
+    True if os.environ.get("ETH_RPC_PROXY_HTTP2_ENABLED") == "1" else False
+)
+# Maximum number of calls in a single batch request
+ETH_RPC_PROXY_BATCH_MAX_SIZE = int(
+    os.environ.get("ETH_RPC_PROXY_BATCH_MAX_SIZE") or 100
+)
+
+# Maximum number of block timestamps cached in process
+BLOCK_TIMESTAMP_CACHE_SIZE = int(os.environ.get("BLOCK_TIMESTAMP_CACHE_SIZE") or 10000)
+
+# Block range of eth_getLogs
+# NOTE: The range is adjusted between MIN and MAX according to the log density and the response time.
+BLOCK_RANGE_MIN_SIZE = int(os.environ.get("BLOCK_RANGE_MIN_SIZE") or 1000)
+BLOCK_RANGE_MAX_SIZE = int(os.environ.get("BLOCK_RANGE_MAX_SIZE") or 1000000)
+# Target number of logs in a single range
+BLOCK_RANGE_TARGET_LOG_COUNT = int(
+    os.environ.get("BLOCK_RANGE_TARGET_LOG_COUNT") or 5000
+)
+# Target processing time of a single range [sec]
+BLOCK_RANGE_TARGET_ELAPSED_SEC = float(
+    os.environ.get("BLOCK_RANGE_TARGET_ELAPSED_SEC") or 10
+)
 
 ####################################################
 # Token settings
@@ -242,6 +321,21 @@ EXCHANGE_NOTIFICATION_ENABLED = (
     False if os.environ.get("EXCHANGE_NOTIFICATION_ENABLED") == "0" else True
 )
 
+# Maximum number of concurrent contract calls when listing DEX orders
+DEX_ORDER_LIST_CALL_CONCURRENCY = int(
+    os.environ.get("DEX_ORDER_LIST_CALL_CONCURRENCY") or 50
+)
+
+# Number of tokens whose positions are read concurrently
+# when listing positions from contracts
+POSITION_LIST_CALL_CONCURRENCY = int(
+    os.environ.get("POSITION_LIST_CALL_CONCURRENCY") or 10
+)
+
+# Maximum number of ETags of cacheable responses kept in process
+# NOTE: If 0, conditional requests are always processed by the handler
+HTTP_ETAG_CACHE_MAX_SIZE = int(os.environ.get("HTTP_ETAG_CACHE_MAX_SIZE") or 10000)
+
 # Others
 E2E_MESSAGING_CONTRACT_ADDRESS = os.environ.get("E2E_MESSAGING_CONTRACT_ADDRESS")
 CONTRACT_REGISTRY_ADDRESS = os.environ.get("CONTRACT_REGISTRY_ADDRESS")
@@ -273,11 +367,22 @@ TOKEN_FETCH_INTERVAL = int(os.environ.get("TOKEN_FETCH_INTERVAL") or 3)
 TOKEN_SHORT_TERM_FETCH_INTERVAL_MSEC = int(
     os.environ.get("TOKEN_SHORT_TERM_FETCH_INTERVAL_MSEC") or 100
 )
+# Maximum number of token objects cached in process (in front of the DB cache)
+# NOTE: If 0, in-process cache is disabled
+TOKEN_L1_CACHE_MAX_SIZE = int(os.environ.get("TOKEN_L1_CACHE_MAX_SIZE") or 1000)
+# Number of tokens fetched concurrently when listing tokens
+TOKEN_FETCH_CONCURRENCY = int(os.environ.get("TOKEN_FETCH_CONCURRENCY") or 5)
 
 ####################################################
 # Blockchain explorer settings
 ####################################################
 BC_EXPLORER_ENABLED = True if os.environ.get("BC_EXPLORER_ENABLED") == "1" else False
+# Number of blocks indexed in one transaction
+BLOCK_TX_DATA_CHUNK_SIZE = int(os.environ.get("BLOCK_TX_DATA_CHUNK_SIZE") or 100)
+# Number of blocks fetched concurrently
+BLOCK_TX_DATA_FETCH_CONCURRENCY = int(
+    os.environ.get("BLOCK_TX_DATA_FETCH_CONCURRENCY") or 10
+)
 
 ####################################################
 # Email settings
@@ -19,6 +19,8 @@ SPDX-License-Identifier: Apache-2.0
 """
 
 from .abi import create_abi_event_argument_models
+from .balance import AccountBalance, BulkBalanceReader
 from .contract import AsyncContract
+from .registry import ContractInterface, ContractRegistry
 
 contract_version = "v25.6.0"
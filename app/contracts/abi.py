@@ -17,8 +17,6 @@ limitations under the License.
 SPDX-License-Identifier: Apache-2.0
 """
 
-import json
-import os
 from enum import StrEnum
 from functools import lru_cache
 from typing import Any, List, Literal, Optional, Type, Union
@@ -28,6 +26,8 @@ from hexbytes import HexBytes
 from pydantic import BaseModel, ConfigDict, RootModel, create_model
 from web3 import Web3
 
+from app.contracts.registry import ContractRegistry
+
 
 class ABIInputType(StrEnum):
     address = "address"
@@ -120,34 +120,28 @@ class ABI(RootModel[List[ABIDescription]]):
 
 @lru_cache(None)
 def create_abi_event_argument_models(contract_name: str) -> Any:
-    contract_file = (
-        f"{os.path.dirname(os.path.abspath(__file__))}/json/{contract_name}.json"
-    )
-
-    with open(contract_file, "r") as file:
-        contract_json = json.load(file)
-        abi_list = ABI.model_validate(contract_json.get("abi"))
-
-        models: list[Type[BaseModel]] = []
-        for abi in abi_list.root:
-            if abi.type != ABIDescriptionType.event:
-                continue
-
-            fields: dict[str, Any] = {}
-            for i in abi.inputs:
-                if i.indexed is True:
-                    fields[i.name] = (Optional[i.type.to_python_type()], None)
-
-            if not fields:
-                continue
-
-            model: Type[BaseModel] = create_model(
-                f"{abi.name.capitalize()}{abi.type.capitalize()}Argument",
-                **fields,
-                __config__=ConfigDict(extra="forbid"),
-            )
+    abi_list = ABI.model_validate(ContractRegistry.get(contract_name).abi)
+
+    models: list[Type[BaseModel]] = []
+    for abi in abi_list.root:
+        if abi.type != ABIDescriptionType.event:
+            continue
+
+        fields: dict[str, Any] = {}
+        for i in abi.inputs:
+            if i.indexed is True:
+                fields[i.name] = (Optional[i.type.to_python_type()], None)
+
+        if not fields:
+            continue
+
+        model: Type[BaseModel] = create_model(
+            f"{abi.name.capitalize()}{abi.type.capitalize()}Argument",
+            **fields,
+            __config__=ConfigDict(extra="forbid"),
+        )
 
-            models.append(model)
+        models.append(model)
 
-        parent_model = Union[tuple(models)]
+    parent_model = Union[tuple(models)]
     return parent_model
@@ -0,0 +1,142 @@
+"""
+Copyright BOOSTRY Co., Ltd.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+
+You may obtain a copy of the License at
+http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing,
+software distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+
+See the License for the specific language governing permissions and
+limitations under the License.
+
+SPDX-License-Identifier: Apache-2.0
+"""
+
+from dataclasses import dataclass
+from typing import Any, Sequence
+
+from web3.contract import AsyncContract as Web3AsyncContract
+
+from app.config import ZERO_ADDRESS
+from app.contracts.contract import AsyncContract
+from app.errors import ServiceUnavailable
+
+
+@dataclass
+class AccountBalance:
+    account_address: str
+    token_address: str
+    balance: int = 0
+    pending_transfer: int = 0
+    exchange_balance: int = 0
+    exchange_commitment: int = 0
+
+
+class BulkBalanceReader:
+    """Read balances of many accounts at once
+
+    The `balanceOf`, `pendingTransfer` of the token and the `balanceOf`,
+    `commitmentOf` of the exchange for all accounts are sent together
+    as JSON-RPC batch requests instead of several calls per account.
+    Reverted calls are read as 0.
+    """
+
+    @staticmethod
+    async def get_token_balances(
+        token_contract: Web3AsyncContract,
+        account_addresses: Sequence[str],
+        exchange_address: str = ZERO_ADDRESS,
+        pending_transfer: bool = True,
+        exchange_commitment: bool = False,
+    ) -> list[AccountBalance]:
+        """Get balances of accounts on a token
+
+        :param token_contract: Token contract
+        :param account_addresses: Account addresses
+        :param exchange_address: Exchange to read the balances on (ZERO_ADDRESS: none)
+        :param pending_transfer: Whether to read the amount of pending transfer
+        :param exchange_commitment: Whether to read the commitment on the exchange
+        :return: Balances in the order of accounts
+        :raises ServiceUnavailable: if the node is not available
+        """
+        balances = [
+            AccountBalance(
+                account_address=account_address,
+                token_address=token_contract.address,
+            )
+            for account_address in account_addresses
+        ]
+        exchange_contract = (
+            AsyncContract.get_contract("IbetExchangeInterface", exchange_address)
+            if exchange_address != ZERO_ADDRESS
+            else None
+        )
+
+        calls: list[tuple[Web3AsyncContract, str, tuple[Any, ...]]] = []
+        fields: list[tuple[AccountBalance, str]] = []
+        for b in balances:
+            calls.append((token_contract, "balanceOf", (b.account_address,)))
+            fields.append((b, "balance"))
+            if pending_transfer:
+                calls.append((token_contract, "pendingTransfer", (b.account_address,)))
+                fields.append((b, "pending_transfer"))
+            if exchange_contract is not None:
+                args = (b.account_address, b.token_address)
+                calls.append((exchange_contract, "balanceOf", args))
+                fields.append((b, "exchange_balance"))
+                if exchange_commitment:
+                    calls.append((exchange_contract, "commitmentOf", args))
+                    fields.append((b, "exchange_commitment"))
+
+        await BulkBalanceReader.__read(calls, fields)
+        return balances
+
+    @staticmethod
+    async def get_exchange_balances(
+        exchange_address: str, positions: Sequence[tuple[str, str]]
+    ) -> list[AccountBalance]:
+        """Get balances and commitments of accounts on an exchange
+
+        :param exchange_address: Exchange address
+        :param positions: List of (token address, account address)
+        :return: Balances in the order of positions
+        :raises ServiceUnavailable: if the node is not available
+        """
+        balances = [
+            AccountBalance(account_address=account_address, token_address=token_address)
+            for token_address, account_address in positions
+        ]
+        exchange_contract = AsyncContract.get_contract(
+            "IbetExchangeInterface", exchange_address
+        )
+
+        calls: list[tuple[Web3AsyncContract, str, tuple[Any, ...]]] = []
+        fields: list[tuple[AccountBalance, str]] = []
+        for b in balances:
+            args = (b.account_address, b.token_address)
+            calls.append((exchange_contract, "balanceOf", args))
+            fields.append((b, "exchange_balance"))
+            calls.append((exchange_contract, "commitmentOf", args))
+            fields.append((b, "exchange_commitment"))
+
+        await BulkBalanceReader.__read(calls, fields)
+        return balances
+
+    @staticmethod
+    async def __read(
+        calls: list[tuple[Web3AsyncContract, str, tuple[Any, ...]]],
+        fields: list[tuple[AccountBalance, str]],
+    ):
+        try:
+            results = await AsyncContract.call_functions(calls, default_returns=0)
+        except ServiceUnavailable:
+            raise
+        except Exception:
+            raise ServiceUnavailable from None
+        for (balance, field), value in zip(fields, results):
+            setattr(balance, field, value)
@@ -0,0 +1,234 @@
+"""
+Copyright BOOSTRY Co., Ltd.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+
+You may obtain a copy of the License at
+http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing,
+software distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+
+See the License for the specific language governing permissions and
+limitations under the License.
+
+SPDX-License-Identifier: Apache-2.0
+"""
+
+import asyncio
+import time
+import weakref
+from dataclasses import dataclass
+from typing import Any, Sequence
+
+from eth_utils.abi import get_abi_output_types
+from hexbytes import HexBytes
+from web3._utils.error_formatters_utils import raise_contract_logic_error_on_revert
+from web3.contract.async_contract import AsyncContractFunction
+from web3.contract.utils import format_contract_call_return_data_curried
+from web3.exceptions import Web3RPCError
+from web3.types import RPCEndpoint, RPCResponse
+
+from app import log
+from app.errors import ServiceUnavailable
+from app.utils.asyncio_utils import SemaphoreTaskGroup
+from app.utils.web3_utils import AsyncWeb3Wrapper
+
+LOG = log.get_logger()
+
+
+@dataclass
+class BatchStats:
+    batch_count: int = 0  # Number of executed batch requests
+    call_count: int = 0  # Number of contract calls sent in batch requests
+    fallback_count: int = 0  # Number of batches resent as individual calls
+    total_elapsed: float = 0.0  # Total latency of batch requests [sec]
+    last_batch_size: int = 0
+    last_elapsed: float = 0.0
+
+
+class _PendingCall:
+    def __init__(
+        self, function: AsyncContractFunction, future: asyncio.Future[Any]
+    ) -> None:
+        self.function = function
+        self.future = future
+        self.params = [
+            {"to": function.address, "data": function._encode_transaction_data()},
+            "latest",
+        ]
+
+
+class _LoopQueue:
+    def __init__(self) -> None:
+        self.pending: list[_PendingCall] = []
+        self.flush_handle: asyncio.Handle | None = None
+        self.tasks: set[asyncio.Task[None]] = set()
+
+
+class AsyncContractCallBatcher:
+    """Coalesce concurrent contract calls into JSON-RPC batch requests
+
+    Calls issued while a batch is being collected are sent together as
+    a single JSON-RPC batch of `eth_call` requests. Each caller receives
+    its own result or exception as if the call was sent individually.
+    """
+
+    def __init__(
+        self, web3: AsyncWeb3Wrapper, max_batch_size: int, window_msec: int
+    ) -> None:
+        """
+        :param web3: Web3 wrapper used to send requests
+        :param max_batch_size: Maximum number of calls in a single batch
+        :param window_msec: Time window to collect calls (0: next loop iteration)
+        """
+        self.web3 = web3
+        self.max_batch_size = max(max_batch_size, 1)
+        self.window = window_msec / 1000
+        self.stats = BatchStats()
+        self._queues: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, _LoopQueue
+        ] = weakref.WeakKeyDictionary()
+
+    async def call(self, function: AsyncContractFunction) -> Any:
+        """Call contract function as a part of batch request
+
+        :param function: Contract function bound to its arguments
+        :return: Return from function
+        """
+        loop = asyncio.get_running_loop()
+        queue = self._queues.get(loop)
+        if queue is None:
+            queue = _LoopQueue()
+            self._queues[loop] = queue
+
+        pending_call = _PendingCall(function=function, future=loop.create_future())
+        queue.pending.append(pending_call)
+        if len(queue.pending) >= self.max_batch_size:
+            self._flush(queue)
+        elif queue.flush_handle is None:
+            if self.window > 0:
+                queue.flush_handle = loop.call_later(self.window, self._flush, queue)
+            else:
+                queue.flush_handle = loop.call_soon(self._flush, queue)
+
+        return await pending_call.future
+
+    async def call_many(
+        self, functions: Sequence[AsyncContractFunction], batch_size: int
+    ) -> list[Any | BaseException]:
+        """Call many contract functions with batch requests of a given size
+
+        Unlike `call`, the calls are not coalesced with concurrent callers
+        but split into batches of `batch_size` calls in order.
+
+        :param functions: Contract functions bound to their arguments
+        :param batch_size: Maximum number of calls in a single batch
+        :return: Return from each function, or the exception raised by it
+        """
+        loop = asyncio.get_running_loop()
+        pending_calls = [
+            _PendingCall(function=function, future=loop.create_future())
+            for function in functions
+        ]
+        batch_size = max(batch_size, 1)
+        for i in range(0, len(pending_calls), batch_size):
+            batch = pending_calls[i : i + batch_size]
+            await self._execute(batch)
+            exc = batch[0].future.exception()
+            if isinstance(exc, ServiceUnavailable):
+                # Do not send the remaining batches to the unavailable node
+                for pending_call in pending_calls[i + batch_size :]:
+                    pending_call.future.set_exception(exc)
+                break
+        return await asyncio.gather(
+            *[pending_call.future for pending_call in pending_calls],
+            return_exceptions=True,
+        )
+
+    def _flush(self, queue: _LoopQueue) -> None:
+        if queue.flush_handle is not None:
+            queue.flush_handle.cancel()
+            queue.flush_handle = None
+
+        batch, queue.pending = queue.pending, []
+        if not batch:
+            return
+
+        task = asyncio.create_task(self._execute(batch))
+        queue.tasks.add(task)
+        task.add_done_callback(queue.tasks.discard)
+
+    async def _execute(self, batch: list[_PendingCall]) -> None:
+        started = time.monotonic()
+        try:
+            responses = await self.web3.provider.make_batch_request(
+                [(RPCEndpoint("eth_call"), c.params) for c in batch]
+            )
+        except ServiceUnavailable as exc:
+            for pending_call in batch:
+                if not pending_call.future.done():
+                    pending_call.future.set_exception(exc)
+            return
+        except Exception as exc:
+            LOG.notice(f"Failed to send batch request: {exc!r}")
+            responses = None
+
+        if not isinstance(responses, list) or len(responses) != len(batch):
+            # Some nodes reject batch requests as a whole.
+            # Resend each call individually in that case,
+            # limiting concurrent calls to the max batch size.
+            self.stats.fallback_count += 1
+            await SemaphoreTaskGroup.run(
+                *[self._execute_single(c) for c in batch],
+                max_concurrency=self.max_batch_size,
+            )
+            return
+
+        for pending_call, response in zip(batch, responses):
+            if pending_call.future.done():
+                continue
+            try:
+                pending_call.future.set_result(
+                    self._decode(pending_call.function, response)
+                )
+            except Exception as exc:
+                pending_call.future.set_exception(exc)
+
+        elapsed = time.monotonic() - started
+        self.stats.batch_count += 1
+        self.stats.call_count += len(batch)
+        self.stats.total_elapsed += elapsed
+        self.stats.last_batch_size = len(batch)
+        self.stats.last_elapsed = elapsed
+        LOG.debug(f"Executed batch request: size={len(batch)}, elapsed={elapsed:.3f}s")
+
+    @staticmethod
+    async def _execute_single(pending_call: _PendingCall) -> None:
+        try:
+            result = await pending_call.function.call()
+        except Exception as exc:
+            if not pending_call.future.done():
+                pending_call.future.set_exception(exc)
+            return
+        if not pending_call.future.done():
+            pending_call.future.set_result(result)
+
+    def _decode(self, function: AsyncContractFunction, response: RPCResponse) -> Any:
+        if "error" in response:
+            # Raise ContractLogicError if the call has been reverted
+            raise_contract_logic_error_on_revert(response)
+            raise Web3RPCError(str(response["error"]), rpc_response=response)
+
+        return_data = HexBytes(response.get("result") or b"")
+        return format_contract_call_return_data_curried(
+            self.web3,  # type: ignore  # Only the ABI codec is used
+            function.decode_tuples,
+            function.abi,
+            function.fn_name,
+            function._return_data_normalizers,
+            get_abi_output_types(function.abi),
+            return_data,
+        )
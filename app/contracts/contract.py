@@ -17,13 +17,13 @@ limitations under the License.
 SPDX-License-Identifier: Apache-2.0
 """
 
-import json
-from typing import Any, Type, TypeVar
+import asyncio
+from typing import Any, Sequence, Type, TypeVar
 
 from eth_utils.address import to_checksum_address
 from hexbytes import HexBytes
 from web3.contract import AsyncContract as Web3AsyncContract
-from web3.contract.async_contract import AsyncContractEvents
+from web3.contract.async_contract import AsyncContractEvents, AsyncContractFunction
 from web3.exceptions import (
     BadFunctionCallOutput,
     ContractLogicError,
@@ -31,9 +31,22 @@ from web3.exceptions import (
 )
 from web3.types import BlockIdentifier, TxData
 
+from app.config import (
+    WEB3_BULK_CALL_BATCH_SIZE,
+    WEB3_CALL_BATCH_ENABLED,
+    WEB3_CALL_BATCH_MAX_SIZE,
+    WEB3_CALL_BATCH_WINDOW_MSEC,
+)
+from app.contracts.batch import AsyncContractCallBatcher
+from app.contracts.registry import ContractRegistry
 from app.utils.web3_utils import AsyncWeb3Wrapper
 
 async_web3 = AsyncWeb3Wrapper()
+call_batcher = AsyncContractCallBatcher(
+    web3=async_web3,
+    max_batch_size=WEB3_CALL_BATCH_MAX_SIZE,
+    window_msec=WEB3_CALL_BATCH_WINDOW_MSEC,
+)
 
 
 class AsyncContractEventsView:
@@ -51,7 +64,6 @@ class AsyncContractEventsView:
 
 
 class AsyncContract:
-    cache: dict[str, dict[str, Any]] = {}  # コントラクト情報のキャッシュ
     factory_map: dict[str, Type[Web3AsyncContract]] = {}
 
     @classmethod
@@ -63,21 +75,28 @@ class AsyncContract:
         :param address: コントラクトアドレス
         :return: コントラクト
         """
-        if contract_name in AsyncContract.cache:
-            contract_json: dict[str, Any] = AsyncContract.cache[contract_name]
-        else:
-            contract_file = f"app/contracts/json/{contract_name}.json"
-            contract_json = json.load(open(contract_file, "r"))
-            AsyncContract.cache[contract_name] = contract_json
-
         contract_factory = cls.factory_map.get(contract_name)
         if contract_factory is not None:
             return contract_factory(address=to_checksum_address(address))
 
-        contract_factory = async_web3.eth.contract(abi=contract_json["abi"])
+        interface = ContractRegistry.get(contract_name)
+        contract_factory = async_web3.eth.contract(abi=interface.abi)
         cls.factory_map[contract_name] = contract_factory
         return contract_factory(address=to_checksum_address(address))
 
+    @classmethod
+    def get_contract_name(cls, contract: Web3AsyncContract) -> str | None:
+        """
+        コントラクト名取得
+
+        :param contract: get_contract で取得したコントラクト
+        :return: コントラクト名（get_contract 以外で生成されたコントラクトの場合は None）
+        """
+        for contract_name, contract_factory in cls.factory_map.items():
+            if type(contract) is contract_factory:
+                return contract_name
+        return None
+
     @staticmethod
     async def deploy_contract(
         contract_name: str, args: list[Any], deployer: str
@@ -90,17 +109,11 @@ class AsyncContract:
         :param deployer: デプロイ実行者のアドレス
         :return: コントラクト情報
         """
-        if contract_name in AsyncContract.cache:
-            contract_json: dict[str, Any] = AsyncContract.cache[contract_name]
-        else:
-            contract_file = f"app/contracts/json/{contract_name}.json"
-            contract_json = json.load(open(contract_file, "r"))
-            AsyncContract.cache[contract_name] = contract_json
-
+        interface = ContractRegistry.get(contract_name)
         async_contract: type[Web3AsyncContract] = async_web3.eth.contract(
-            abi=contract_json["abi"],
-            bytecode=contract_json["bytecode"],
-            bytecode_runtime=contract_json["deployedBytecode"],
+            abi=interface.abi,
+            bytecode=interface.bytecode,
+            bytecode_runtime=interface.deployed_bytecode,
         )
 
         tx_hash = await async_contract.constructor(*args).transact(
@@ -113,7 +126,7 @@ class AsyncContract:
         if "contractAddress" in tx.keys():
             contract_address = tx["contractAddress"]
 
-        return contract_address, contract_json["abi"]
+        return contract_address, interface.abi
 
     T = TypeVar("T")
 
@@ -135,7 +148,11 @@ class AsyncContract:
         _function = getattr(contract.functions, function_name)
 
         try:
-            result = await _function(*args).call()
+            if WEB3_CALL_BATCH_ENABLED:
+                # Coalesce concurrent calls into a single batch request
+                result = await call_batcher.call(_function(*args))
+            else:
+                result = await _function(*args).call()
         except (BadFunctionCallOutput, ContractLogicError) as exc:
             if default_returns is not None:
                 return default_returns
@@ -144,6 +161,55 @@ class AsyncContract:
 
         return result
 
+    @staticmethod
+    async def call_functions(
+        calls: Sequence[tuple[Web3AsyncContract, str, tuple[Any, ...]]],
+        default_returns: T = None,
+    ) -> list[T]:
+        """Call many contract functions
+
+        The calls are sent with JSON-RPC batch requests
+        of up to WEB3_BULK_CALL_BATCH_SIZE calls.
+
+        :param calls: List of (contract, function name, function args)
+        :param default_returns: Default return when exception is raised
+        :return: Returns from functions in the order of calls
+        """
+        functions: list[AsyncContractFunction] = [
+            getattr(contract.functions, function_name)(*args)
+            for contract, function_name, args in calls
+        ]
+        if len(functions) == 0:
+            return []
+
+        if WEB3_CALL_BATCH_ENABLED:
+            results = await call_batcher.call_many(
+                functions, batch_size=WEB3_BULK_CALL_BATCH_SIZE
+            )
+        else:
+            # Limit concurrent requests to the size of a batch
+            semaphore = asyncio.Semaphore(WEB3_CALL_BATCH_MAX_SIZE)
+
+            async def _call(function: AsyncContractFunction) -> Any:
+                async with semaphore:
+                    return await function.call()
+
+            results = await asyncio.gather(
+                *[_call(function) for function in functions], return_exceptions=True
+            )
+
+        returns: list[Any] = []
+        for result in results:
+            if isinstance(result, (BadFunctionCallOutput, ContractLogicError)):
+                if default_returns is None:
+                    raise result
+                returns.append(default_returns)
+            elif isinstance(result, BaseException):
+                raise result
+            else:
+                returns.append(result)
+        return returns
+
     @staticmethod
     async def get_transaction(
         transaction_hash: HexBytes, block_number: BlockIdentifier
@@ -0,0 +1,97 @@
+"""
+Copyright BOOSTRY Co., Ltd.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+
+You may obtain a copy of the License at
+http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing,
+software distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+
+See the License for the specific language governing permissions and
+limitations under the License.
+
+SPDX-License-Identifier: Apache-2.0
+"""
+
+import json
+import os
+from typing import Any
+
+from eth_utils.abi import (
+    abi_to_signature,
+    event_abi_to_log_topic,
+    function_abi_to_4byte_selector,
+)
+
+CONTRACT_JSON_DIR = f"{os.path.dirname(os.path.abspath(__file__))}/json"
+
+
+class ContractInterface:
+    """ABI of a contract with precomputed event topics and function selectors"""
+
+    abi: list[dict[str, Any]]
+    bytecode: str | None
+    deployed_bytecode: str | None
+
+    # event name -> (topic0, event ABI)
+    events: dict[str, tuple[bytes, dict[str, Any]]]
+    # topic0 -> event ABI
+    event_topics: dict[bytes, dict[str, Any]]
+    # function signature -> function selector
+    function_selectors: dict[str, bytes]
+
+    def __init__(
+        self,
+        abi: list[dict[str, Any]],
+        bytecode: str | None = None,
+        deployed_bytecode: str | None = None,
+    ):
+        self.abi = abi
+        self.bytecode = bytecode
+        self.deployed_bytecode = deployed_bytecode
+        self.events = {}
+        self.event_topics = {}
+        self.function_selectors = {}
+        for item in abi:
+            if item.get("type") == "event":
+                topic = event_abi_to_log_topic(item)  # type: ignore
+                self.events.setdefault(item["name"], (topic, item))
+                self.event_topics.setdefault(topic, item)
+            elif item.get("type") == "function":
+                self.function_selectors[abi_to_signature(item)] = (  # type: ignore
+                    function_abi_to_4byte_selector(item)  # type: ignore
+                )
+
+
+class ContractRegistry:
+    """Per-process registry of contract interfaces
+
+    Each contract JSON under app/contracts/json is loaded once on first use.
+    """
+
+    _interfaces: dict[str, ContractInterface] = {}
+
+    @classmethod
+    def get(cls, contract_name: str) -> ContractInterface:
+        """
+        Get contract interface
+
+        :param contract_name: contract name
+        :return: contract interface
+        :raises FileNotFoundError: if the contract JSON does not exist
+        """
+        interface = cls._interfaces.get(contract_name)
+        if interface is None:
+            with open(f"{CONTRACT_JSON_DIR}/{contract_name}.json", "r") as file:
+                contract_json = json.load(file)
+            interface = ContractInterface(
+                abi=contract_json["abi"],
+                bytecode=contract_json.get("bytecode"),
+                deployed_bytecode=contract_json.get("deployedBytecode"),
+            )
+            cls._interfaces[contract_name] = interface
+        return interface
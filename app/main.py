@@ -25,7 +25,7 @@ from typing import AsyncIterator
 from fastapi import FastAPI, Request, status
 from fastapi.encoders import jsonable_encoder
 from fastapi.exceptions import RequestValidationError
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 from pydantic import ValidationError
 from pydantic_core import ArgsKwargs, ErrorDetails
 from sqlalchemy.exc import OperationalError
@@ -74,6 +74,8 @@ from app.middleware import (
 )
 from app.utils import o11y
 from app.utils.docs_utils import custom_openapi
+from app.utils.http_cache_utils import NotModified
+from app.utils.json_rpc_proxy import json_rpc_proxy
 
 LOG = log.get_logger()
 
@@ -110,7 +112,7 @@ def on_startup() -> None:
 
 
 async def on_shutdown() -> None:
-    pass
+    await json_rpc_proxy.aclose()
 
 
 @asynccontextmanager
@@ -197,6 +199,12 @@ if PROFILING_MODE is True:
 ###############################################################
 
 
+# 304:NotModified
+@app.exception_handler(NotModified)
+async def not_modified_handler(request: Request, exc: NotModified) -> Response:
+    return exc.response()
+
+
 # 500:InternalServerError
 @app.exception_handler(Exception)
 async def internal_server_error_handler(
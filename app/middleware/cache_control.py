@@ -22,6 +22,14 @@ from starlette.requests import Request
 from starlette.responses import Response
 from starlette.types import ASGIApp
 
+from app.utils.http_cache_utils import (
+    HTTPCachePolicy,
+    compute_etag,
+    etag_matches,
+    etag_store,
+    not_modified_response,
+)
+
 
 class CacheControlMiddleware(BaseHTTPMiddleware):
     """
@@ -32,6 +40,9 @@ class CacheControlMiddleware(BaseHTTPMiddleware):
     The whitelist of status codes is selected based on RFC7231 semantics
     for cacheable responses in typical scenarios:
       200, 203, 204, 206, 300, 301, 404, 405, 410, 414, 501.
+
+    For routes declaring their own policy with `http_cache`,
+    the ETag computed from the response body and the route's max-age are set instead.
     """
 
     # Default whitelist: enable cache only for these status codes
@@ -65,6 +76,14 @@ class CacheControlMiddleware(BaseHTTPMiddleware):
         self, request: Request, call_next: RequestResponseEndpoint
     ) -> Response:
         response = await call_next(request)
+
+        # Routes declaring their own cache policy
+        policy: HTTPCachePolicy | None = getattr(
+            request.state, "http_cache_policy", None
+        )
+        if policy is not None and response.status_code in (200, 304):
+            return await self.__apply_cache_policy(request, response, policy)
+
         try:
             status_code = response.status_code
             cache_enabled = status_code in self.cache_enabled_statuses
@@ -88,3 +107,29 @@ class CacheControlMiddleware(BaseHTTPMiddleware):
             # Do not break the response flow even if header manipulation fails
             pass
         return response
+
+    @staticmethod
+    async def __apply_cache_policy(
+        request: Request, response: Response, policy: HTTPCachePolicy
+    ) -> Response:
+        if response.status_code == 304:
+            # Already answered with the cached ETag
+            return response
+
+        # NOTE: The body is always hashed so that the ETag matches what is returned,
+        #       even for immutable resources whose ETag is already cached.
+        body = b"".join([chunk async for chunk in response.body_iterator])  # type: ignore
+        etag = compute_etag(body)
+        etag_store.put(policy.key, etag, policy.etag_ttl)
+        if etag_matches(request, etag):
+            return not_modified_response(etag, policy)
+
+        headers = dict(response.headers)
+        headers["ETag"] = etag
+        headers["Cache-Control"] = policy.cache_control
+        return Response(
+            content=body,
+            status_code=response.status_code,
+            headers=headers,
+            media_type=response.media_type,
+        )
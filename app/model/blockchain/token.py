@@ -19,14 +19,26 @@ SPDX-License-Identifier: Apache-2.0
 
 from __future__ import annotations
 
+import copy
 import functools
 import json
+from collections import OrderedDict
 from datetime import UTC, datetime, timedelta
 from decimal import Decimal
-from typing import Awaitable, Callable, Self, Type, TypeVar, Union
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Self,
+    Sequence,
+    Type,
+    TypeVar,
+    Union,
+    cast,
+)
 
 from eth_utils import to_checksum_address
-from sqlalchemy import select
+from sqlalchemy import inspect, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app import log
@@ -34,21 +46,27 @@ from app.config import (
     DEFAULT_CURRENCY,
     TOKEN_CACHE,
     TOKEN_CACHE_TTL,
+    TOKEN_FETCH_CONCURRENCY,
+    TOKEN_L1_CACHE_MAX_SIZE,
     TOKEN_SHORT_TERM_CACHE_TTL,
+    WEB3_CALL_BATCH_ENABLED,
+    WEB3_CALL_BATCH_MAX_SIZE,
     ZERO_ADDRESS,
 )
 from app.contracts import AsyncContract
+from app.database import async_engine
 from app.errors import ServiceUnavailable
 from app.model.db import (
     IDXBondToken as BondTokenModel,
     IDXCouponToken as CouponTokenModel,
     IDXMembershipToken as MembershipTokenModel,
     IDXShareToken as ShareTokenModel,
+    IDXTokenAttributeChangeLog,
     Listing,
 )
 from app.model.db.idx_token import IDXTokenInstance, IDXTokenModel
 from app.model.schema.base import TokenType
-from app.utils.asyncio_utils import SemaphoreTaskGroup
+from app.utils.asyncio_utils import SemaphoreTaskGroup, SingleFlight
 from app.utils.company_list import CompanyList
 
 LOG = log.get_logger()
@@ -61,6 +79,84 @@ TokenInstanceTypes = Union["BondToken", "ShareToken", "MembershipToken", "Coupon
 
 TToken = TypeVar("TToken", bound="TokenBase")
 
+# Number of concurrent contract calls when fetching token attributes
+# NOTE: When batch requests are enabled, all calls are sent in one batch.
+CALL_CONCURRENCY = WEB3_CALL_BATCH_MAX_SIZE if WEB3_CALL_BATCH_ENABLED else 3
+
+# Concurrent cache misses for the same token share one fetch from chain
+# NOTE: `token_fetch_single_flight.coalesced_count` is the number of shared fetches.
+token_fetch_single_flight: SingleFlight[Any] = SingleFlight()
+
+# Cache columns that are not token attributes
+CACHE_METADATA_COLUMNS = ("created", "modified", "short_term_cache_created")
+
+
+class TokenL1Cache:
+    """
+    In-process LRU cache of token objects built from the DB cache
+
+    Entries are keyed on the token address and validated against
+    `created` / `short_term_cache_created` of the DB cache row,
+    so they are invalidated as soon as the row is updated.
+    """
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self.hit_count = 0
+        self.miss_count = 0
+        self._cache: OrderedDict[
+            tuple[str, str], tuple[datetime, datetime | None, TokenBase]
+        ] = OrderedDict()
+
+    def get(
+        self,
+        key: tuple[str, str],
+        created: datetime,
+        short_term_cache_created: datetime | None,
+    ) -> TokenBase | None:
+        """
+        @param key: (DB model name, token address)
+        @param created: created of the DB cache row
+        @param short_term_cache_created: short_term_cache_created of the DB cache row
+        @return: copy of the cached token object (None if not cached or outdated)
+        """
+        entry = self._cache.get(key)
+        if entry is None or entry[:2] != (created, short_term_cache_created):
+            self.miss_count += 1
+            return None
+        self._cache.move_to_end(key)
+        self.hit_count += 1
+        return copy.copy(entry[2])
+
+    def put(
+        self,
+        key: tuple[str, str],
+        created: datetime,
+        short_term_cache_created: datetime | None,
+        token: TokenBase,
+    ) -> None:
+        """
+        @param key: (DB model name, token address)
+        @param created: created of the DB cache row
+        @param short_term_cache_created: short_term_cache_created of the DB cache row
+        @param token: token object
+        """
+        if self.max_size <= 0:
+            return
+        self._cache[key] = (created, short_term_cache_created, copy.copy(token))
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.max_size:
+            self._cache.popitem(last=False)
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+    def __len__(self):
+        return len(self._cache)
+
+
+token_l1_cache = TokenL1Cache(max_size=TOKEN_L1_CACHE_MAX_SIZE)
+
 
 def token_db_cache(TargetModel: IDXTokenModel):
     """
@@ -89,29 +185,72 @@ def token_db_cache(TargetModel: IDXTokenModel):
                 # If token cache is not enabled, use raw data from chain
                 return await func(cls, async_session, token_address)
 
-            # Get data from cache
-            cached_token: IDXTokenInstance | None = (
-                await async_session.scalars(
-                    select(TargetModel)
+            # Get cached time from DB cache
+            cached_time = (
+                await async_session.execute(
+                    select(TargetModel.created, TargetModel.short_term_cache_created)
                     .where(TargetModel.token_address == token_address)
                     .limit(1)
                 )
             ).first()
-            if cached_token and cached_token.created + timedelta(
+            if cached_time and cached_time.created + timedelta(
                 seconds=TOKEN_CACHE_TTL
             ) >= datetime.now(UTC).replace(tzinfo=None):
                 # If cached data exists and doesn't expire, use cached data
-                cached_data = cls.from_model(cached_token)
-                if cached_token.short_term_cache_created + timedelta(
+                l1_cache_key = (TargetModel.__name__, token_address)
+                cached_data = cast(
+                    TToken | None,
+                    token_l1_cache.get(
+                        l1_cache_key,
+                        cached_time.created,
+                        cached_time.short_term_cache_created,
+                    ),
+                )
+                if cached_data is None:
+                    # Build token object from DB cache
+                    cached_token: IDXTokenInstance | None = (
+                        await async_session.scalars(
+                            select(TargetModel)
+                            .where(TargetModel.token_address == token_address)
+                            .limit(1)
+                        )
+                    ).first()
+                    if cached_token is None:
+                        return await func(cls, async_session, token_address)
+                    cached_data = cls.from_model(cached_token)
+                    token_l1_cache.put(
+                        l1_cache_key,
+                        cached_token.created,
+                        cached_token.short_term_cache_created,
+                        cached_data,
+                    )
+                if cached_time.short_term_cache_created + timedelta(
                     seconds=TOKEN_SHORT_TERM_CACHE_TTL
                 ) < datetime.now(UTC).replace(tzinfo=None):
                     # If short term cache expires, fetch raw data from chain
-                    await cached_data.fetch_expiry_short()
-                    await async_session.merge(cached_data.to_model())
+                    async def refresh_short_term_cache() -> TToken:
+                        await cached_data.fetch_expiry_short()
+                        token_model = cached_data.to_model()
+                        await cls.merge_cache(async_session, token_model)
+                        token_l1_cache.put(
+                            l1_cache_key,
+                            cached_time.created,
+                            token_model.short_term_cache_created,
+                            cached_data,
+                        )
+                        return cached_data
+
+                    return await token_fetch_single_flight.do(
+                        (cls.__name__, "short_term", token_address),
+                        refresh_short_term_cache,
+                    )
                 return cached_data
 
             # Get data from chain
-            return await func(cls, async_session, token_address)
+            return await token_fetch_single_flight.do(
+                (cls.__name__, "all", token_address),
+                lambda: func(cls, async_session, token_address),
+            )
 
         return wrapper
 
@@ -119,6 +258,9 @@ def token_db_cache(TargetModel: IDXTokenModel):
 
 
 class TokenBase:
+    # DB model for cache
+    db_model: IDXTokenModel
+
     token_address: str
     token_template: str
     owner_address: str
@@ -141,8 +283,161 @@ class TokenBase:
     def to_model(self) -> IDXTokenInstance:
         raise NotImplementedError("Subclasses should implement this")
 
+    async def fetch_expiry_short(self) -> None:
+        raise NotImplementedError("Subclasses should implement this")
+
+    @staticmethod
+    async def fetch(async_session: AsyncSession, token_address: str) -> TokenBase:
+        raise NotImplementedError("Subclasses should implement this")
+
+    @staticmethod
+    async def merge_cache(
+        async_session: AsyncSession, token_model: IDXTokenInstance
+    ) -> None:
+        """
+        Save token attributes to DB cache
+
+        A change log is recorded when the cache is created or its attributes change,
+        so that attribute watchers only need to diff the changed tokens.
+        """
+        cached_token = await async_session.get(
+            type(token_model), token_model.token_address
+        )
+        if cached_token is None or TokenBase.__is_changed(cached_token, token_model):
+            change_log = IDXTokenAttributeChangeLog()
+            change_log.token_address = token_model.token_address
+            change_log.token_template = token_model.token_template
+            async_session.add(change_log)
+        await async_session.merge(token_model)
+
+    @staticmethod
+    def __is_changed(before: IDXTokenInstance, after: IDXTokenInstance) -> bool:
+        for column in inspect(type(after)).column_attrs:
+            if column.key in CACHE_METADATA_COLUMNS:
+                continue
+            before_value = getattr(before, column.key)
+            after_value = getattr(after, column.key)
+            # NOTE: Numeric columns are read as Decimal
+            if isinstance(before_value, Decimal):
+                before_value = float(before_value)
+            if isinstance(after_value, Decimal):
+                after_value = float(after_value)
+            if before_value != after_value:
+                return True
+        return False
+
+    @classmethod
+    async def get_many(
+        cls, async_session: AsyncSession, token_addresses: Sequence[str]
+    ) -> dict[str, Self]:
+        """
+        Get token details of multiple tokens
+
+        Cached data is read with a single query, and tokens that are not cached
+        or whose short-term cache has expired are fetched from chain concurrently.
+        Tokens that could not be fetched are not included in the result.
+
+        @param async_session: ORM async session
+        @param token_addresses: token addresses
+        @return: token address -> token detail
+        """
+        addresses = list(dict.fromkeys(token_addresses))
+        if len(addresses) == 0:
+            return {}
+
+        tokens: dict[str, Self] = {}
+        short_term_expired: list[Self] = []
+        if TOKEN_CACHE:
+            now = datetime.now(UTC).replace(tzinfo=None)
+            cached_tokens: Sequence[IDXTokenInstance] = (
+                await async_session.scalars(
+                    select(cls.db_model).where(
+                        cls.db_model.token_address.in_(addresses)
+                    )
+                )
+            ).all()
+            for cached_token in cached_tokens:
+                if cached_token.created + timedelta(seconds=TOKEN_CACHE_TTL) < now:
+                    continue
+                l1_cache_key = (cls.db_model.__name__, cached_token.token_address)
+                token = cast(
+                    Self | None,
+                    token_l1_cache.get(
+                        l1_cache_key,
+                        cached_token.created,
+                        cached_token.short_term_cache_created,
+                    ),
+                )
+                if token is None:
+                    token = cls.from_model(cached_token)
+                    token_l1_cache.put(
+                        l1_cache_key,
+                        cached_token.created,
+                        cached_token.short_term_cache_created,
+                        token,
+                    )
+                tokens[cached_token.token_address] = token
+                if (
+                    cached_token.short_term_cache_created
+                    + timedelta(seconds=TOKEN_SHORT_TERM_CACHE_TTL)
+                    < now
+                ):
+                    short_term_expired.append(token)
+
+        async def fetch(token_address: str) -> Self | None:
+            # NOTE: A session cannot be shared between concurrent tasks
+            db_session = AsyncSession(
+                autocommit=False, autoflush=True, bind=async_engine
+            )
+            try:
+                return await token_fetch_single_flight.do(
+                    (cls.__name__, "all", token_address),
+                    lambda: cls.fetch(db_session, token_address),
+                )
+            except Exception as err:
+                LOG.notice(f"Failed to fetch token: {token_address}, {err!r}")
+                return None
+            finally:
+                await db_session.close()
+
+        async def refresh_short_term_cache(token: Self) -> Self | None:
+            async def _refresh() -> Self:
+                await token.fetch_expiry_short()
+                return token
+
+            try:
+                return copy.copy(
+                    await token_fetch_single_flight.do(
+                        (cls.__name__, "short_term", token.token_address), _refresh
+                    )
+                )
+            except Exception as err:
+                LOG.notice(f"Failed to fetch token: {token.token_address}, {err!r}")
+                return None
+
+        missing = [address for address in addresses if address not in tokens]
+        tasks = await SemaphoreTaskGroup.run(
+            *[fetch(address) for address in missing],
+            *[refresh_short_term_cache(token) for token in short_term_expired],
+            max_concurrency=TOKEN_FETCH_CONCURRENCY,
+        )
+        fetched = [task.result() for task in tasks]
+        for address, token in zip(missing, fetched[: len(missing)]):
+            if token is not None:
+                tokens[address] = token
+        for expired, token in zip(short_term_expired, fetched[len(missing) :]):
+            if token is None:
+                del tokens[expired.token_address]
+                continue
+            tokens[expired.token_address] = token
+            await cls.merge_cache(async_session, token.to_model())
+
+        return {address: tokens[address] for address in addresses if address in tokens}
+
 
 class BondToken(TokenBase):
+    db_model = BondTokenModel
+
     personal_info_address: str
     require_personal_info_registered: bool
     transferable: bool
@@ -229,7 +524,7 @@ class BondToken(TokenBase):
                 AsyncContract.call_function(
                     token_contract, "requirePersonalInfoRegistered", (), True
                 ),
-                max_concurrency=3,
+                max_concurrency=CALL_CONCURRENCY,
             )
             (
                 owner_address,
@@ -325,7 +620,7 @@ class BondToken(TokenBase):
                     token_contract, "transferApprovalRequired", (), False
                 ),
                 AsyncContract.call_function(token_contract, "isRedeemed", (), False),
-                max_concurrency=3,
+                max_concurrency=CALL_CONCURRENCY,
             )
             (
                 owner_address,
@@ -514,6 +809,8 @@ class BondToken(TokenBase):
 
 
 class ShareToken(TokenBase):
+    db_model = ShareTokenModel
+
     personal_info_address: str
     require_personal_info_registered: bool
     transferable: bool
@@ -572,7 +869,7 @@ class ShareToken(TokenBase):
                 AsyncContract.call_function(
                     token_contract, "requirePersonalInfoRegistered", (), True
                 ),
-                max_concurrency=3,
+                max_concurrency=CALL_CONCURRENCY,
             )
             (
                 owner_address,
@@ -662,7 +959,7 @@ class ShareToken(TokenBase):
                     token_contract, "requirePersonalInfoRegistered", (), True
                 ),
                 AsyncContract.call_function(token_contract, "isCanceled", (), False),
-                max_concurrency=3,
+                max_concurrency=CALL_CONCURRENCY,
             )
             (
                 owner_address,
@@ -750,6 +1047,8 @@ class ShareToken(TokenBase):
 
 
 class MembershipToken(TokenBase):
+    db_model = MembershipTokenModel
+
     details: str
     return_details: str
     expiration_date: str
@@ -795,7 +1094,7 @@ class MembershipToken(TokenBase):
                     token_contract, "initialOfferingStatus", (), False
                 ),
                 AsyncContract.call_function(token_contract, "memo", (), ""),
-                max_concurrency=3,
+                max_concurrency=CALL_CONCURRENCY,
             )
             (
                 owner_address,
@@ -863,7 +1162,7 @@ class MembershipToken(TokenBase):
                 AsyncContract.call_function(
                     token_contract, "tradableExchange", (), ZERO_ADDRESS
                 ),
-                max_concurrency=3,
+                max_concurrency=CALL_CONCURRENCY,
             )
             (
                 owner_address,
@@ -945,6 +1244,8 @@ class MembershipToken(TokenBase):
 
 
 class CouponToken(TokenBase):
+    db_model = CouponTokenModel
+
     details: str
     return_details: str
     expiration_date: str
@@ -990,7 +1291,7 @@ class CouponToken(TokenBase):
                     token_contract, "initialOfferingStatus", (), False
                 ),
                 AsyncContract.call_function(token_contract, "memo", (), ""),
-                max_concurrency=3,
+                max_concurrency=CALL_CONCURRENCY,
             )
             (
                 owner_address,
@@ -1056,7 +1357,7 @@ class CouponToken(TokenBase):
                 AsyncContract.call_function(
                     token_contract, "tradableExchange", (), ZERO_ADDRESS
                 ),
-                max_concurrency=3,
+                max_concurrency=CALL_CONCURRENCY,
             )
             (
                 owner_address,
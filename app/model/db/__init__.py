@@ -22,6 +22,12 @@ from .executable_contract import ExecutableContract
 from .idx_agreement import AgreementStatus, IDXAgreement
 from .idx_block_data import IDXBlockData, IDXBlockDataBlockNumber
 from .idx_consume_coupon import IDXConsumeCoupon
+from .idx_holder_summary import (
+    IDXTokenHolderCount,
+    IDXTokenHolderSummary,
+    refresh_token_holder_summaries,
+    refresh_token_holder_summary,
+)
 from .idx_lock_unlock import IDXLock, IDXUnlock, LockDataMessage, UnlockDataMessage
 from .idx_order import IDXOrder
 from .idx_position import (
@@ -37,6 +43,7 @@ from .idx_token import (
     IDXCouponToken,
     IDXMembershipToken,
     IDXShareToken,
+    IDXTokenAttributeChangeLog,
     IDXTokenInstance,
     IDXTokenModel,
 )
@@ -54,10 +61,17 @@ from .messaging import ChatWebhook, Mail
 from .node import Node
 from .notification import (
     Notification,
+    NotificationAttributeChangeCursor,
     NotificationAttributeValue,
     NotificationBlockNumber,
     NotificationType,
 )
 from .public_info import PublicAccountList, TokenList
-from .tokenholders import TokenHolder, TokenHolderBatchStatus, TokenHoldersList
+from .tokenholders import (
+    TokenHolder,
+    TokenHolderBalanceDelta,
+    TokenHolderBalanceDeltaBlockNumber,
+    TokenHolderBatchStatus,
+    TokenHoldersList,
+)
 from .user_info import AccountTag
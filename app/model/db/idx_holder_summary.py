@@ -0,0 +1,322 @@
+"""
+Copyright BOOSTRY Co., Ltd.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+
+You may obtain a copy of the License at
+http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing,
+software distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+
+See the License for the specific language governing permissions and
+limitations under the License.
+
+SPDX-License-Identifier: Apache-2.0
+"""
+
+from typing import Any, Iterable
+
+from sqlalchemy import (
+    BigInteger,
+    ColumnElement,
+    Connection,
+    Index,
+    String,
+    delete,
+    event,
+    func,
+    insert,
+    or_,
+    select,
+    tuple_,
+    update,
+)
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Mapped, Mapper, mapped_column
+
+from app.model.db.base import Base, naive_utcnow
+from app.model.db.idx_position import IDXLockedPosition, IDXPosition
+from app.model.db.user_info import AccountTag
+
+
+class IDXTokenHolderSummary(Base):
+    """Token Holder Summary (INDEX)
+
+    Position and locked total of each account with the account tag,
+    maintained on every change of the position, the locked position
+    and the account tag.
+    Only accounts with a position have a summary.
+    """
+
+    __tablename__ = "token_holder_summary"
+
+    # Token Address
+    token_address: Mapped[str] = mapped_column(String(42), primary_key=True)
+    # Account Address
+    account_address: Mapped[str] = mapped_column(String(42), primary_key=True)
+    # Balance
+    balance: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    # Pending Transfer
+    pending_transfer: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    # Exchange Balance
+    exchange_balance: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    # Commitment Volume on Exchange
+    exchange_commitment: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    # Total Locked Amount
+    locked: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    # Account Tag
+    account_tag: Mapped[str | None] = mapped_column(String(50), nullable=True)
+    # NOTE: "created" is the creation datetime of the position
+
+    @classmethod
+    def is_holder(cls) -> ColumnElement[bool]:
+        """Condition for accounts holding the token"""
+        return or_(
+            cls.balance > 0,
+            cls.pending_transfer > 0,
+            cls.exchange_balance > 0,
+            cls.exchange_commitment > 0,
+            cls.locked > 0,
+        )
+
+
+# Used for listing the holders of a token in created order
+Index(
+    "token_holder_summary_index_1",
+    IDXTokenHolderSummary.token_address,
+    IDXTokenHolderSummary.created,
+    IDXTokenHolderSummary.account_address,
+)
+# Used for filtering the holders of a token by account tag
+Index(
+    "token_holder_summary_index_2",
+    IDXTokenHolderSummary.token_address,
+    IDXTokenHolderSummary.account_tag,
+)
+
+
+class IDXTokenHolderCount(Base):
+    """Number of Token Holders (INDEX)"""
+
+    __tablename__ = "token_holder_count"
+
+    # Token Address
+    token_address: Mapped[str] = mapped_column(String(42), primary_key=True)
+    # Number of accounts holding the token
+    holder_count: Mapped[int] = mapped_column(BigInteger, nullable=False)
+
+
+_HOLDING_COLUMNS = [
+    "balance",
+    "pending_transfer",
+    "exchange_balance",
+    "exchange_commitment",
+    "locked",
+]
+
+
+def refresh_token_holder_summary(
+    connection: Connection, token_address: str, account_address: str
+):
+    """Recalculate the holder summary of an account and the holder count
+
+    :param connection: connection in the transaction that updated the positions
+    :param token_address: token address
+    :param account_address: account address
+    :return: None
+    """
+    refresh_token_holder_summaries(connection, [(token_address, account_address)])
+
+
+def refresh_token_holder_summaries(
+    connection: Connection, keys: Iterable[tuple[str, str]]
+):
+    """Recalculate the holder summaries of accounts and the holder counts at once
+
+    Positions written with bulk statements do not emit mapper events,
+    so the writer should call this with the written keys.
+
+    :param connection: connection in the transaction that updated the positions
+    :param keys: list of (token address, account address)
+    :return: None
+    """
+    key_list = list(set(keys))
+    if len(key_list) == 0:
+        return
+
+    summary_key = tuple_(
+        IDXTokenHolderSummary.token_address, IDXTokenHolderSummary.account_address
+    )
+    was_holder: dict[tuple[str, str], bool] = {
+        (row.token_address, row.account_address): any(
+            getattr(row, column) > 0 for column in _HOLDING_COLUMNS
+        )
+        for row in connection.execute(
+            select(
+                IDXTokenHolderSummary.token_address,
+                IDXTokenHolderSummary.account_address,
+                *[getattr(IDXTokenHolderSummary, c) for c in _HOLDING_COLUMNS],
+            ).where(summary_key.in_(key_list))
+        )
+    }
+    positions = {
+        (row.token_address, row.account_address): row
+        for row in connection.execute(
+            select(
+                IDXPosition.token_address,
+                IDXPosition.account_address,
+                IDXPosition.balance,
+                IDXPosition.pending_transfer,
+                IDXPosition.exchange_balance,
+                IDXPosition.exchange_commitment,
+                IDXPosition.created,
+            ).where(
+                tuple_(IDXPosition.token_address, IDXPosition.account_address).in_(
+                    key_list
+                )
+            )
+        )
+    }
+    locked: dict[tuple[str, str], int] = {
+        (row.token_address, row.account_address): int(row.locked or 0)
+        for row in connection.execute(
+            select(
+                IDXLockedPosition.token_address,
+                IDXLockedPosition.account_address,
+                func.sum(IDXLockedPosition.value).label("locked"),
+            )
+            .where(
+                tuple_(
+                    IDXLockedPosition.token_address, IDXLockedPosition.account_address
+                ).in_(key_list)
+            )
+            .group_by(
+                IDXLockedPosition.token_address, IDXLockedPosition.account_address
+            )
+        )
+    }
+    # Account tags are copied only when the summary is created
+    new_accounts = {
+        account_address
+        for (token_address, account_address) in positions
+        if (token_address, account_address) not in was_holder
+    }
+    account_tags: dict[str, str | None] = (
+        {
+            row.account_address: row.account_tag
+            for row in connection.execute(
+                select(AccountTag.account_address, AccountTag.account_tag).where(
+                    AccountTag.account_address.in_(new_accounts)
+                )
+            )
+        }
+        if len(new_accounts) > 0
+        else {}
+    )
+
+    # Positions are never deleted by the indexers, but keep the summary consistent
+    deleted_keys = [key for key in was_holder if key not in positions]
+    if len(deleted_keys) > 0:
+        connection.execute(
+            delete(IDXTokenHolderSummary).where(summary_key.in_(deleted_keys))
+        )
+
+    now = naive_utcnow()
+    rows: list[dict[str, Any]] = [
+        {
+            "token_address": token_address,
+            "account_address": account_address,
+            "balance": position.balance or 0,
+            "pending_transfer": position.pending_transfer or 0,
+            "exchange_balance": position.exchange_balance or 0,
+            "exchange_commitment": position.exchange_commitment or 0,
+            "locked": locked.get((token_address, account_address), 0),
+            "account_tag": account_tags.get(account_address),
+            "created": position.created,
+            "modified": now,
+        }
+        for (token_address, account_address), position in positions.items()
+    ]
+    if len(rows) > 0:
+        update_columns = [*_HOLDING_COLUMNS, "created", "modified"]
+        if connection.dialect.name == "mysql":
+            mysql_stmt = mysql_insert(IDXTokenHolderSummary).values(rows)
+            connection.execute(
+                mysql_stmt.on_duplicate_key_update(
+                    {column: mysql_stmt.inserted[column] for column in update_columns}
+                )
+            )
+        else:
+            pg_stmt = pg_insert(IDXTokenHolderSummary).values(rows)
+            connection.execute(
+                pg_stmt.on_conflict_do_update(
+                    index_elements=[
+                        IDXTokenHolderSummary.token_address,
+                        IDXTokenHolderSummary.account_address,
+                    ],
+                    set_={
+                        column: pg_stmt.excluded[column] for column in update_columns
+                    },
+                )
+            )
+
+    # Apply the changes of the number of holders
+    count_delta: dict[str, int] = {}
+    now_holder: dict[tuple[str, str], bool] = {
+        (row["token_address"], row["account_address"]): any(
+            row[column] > 0 for column in _HOLDING_COLUMNS
+        )
+        for row in rows
+    }
+    for key in key_list:
+        token_address = key[0]
+        if now_holder.get(key, False) != was_holder.get(key, False):
+            count_delta[token_address] = count_delta.get(token_address, 0) + (
+                1 if now_holder.get(key, False) else -1
+            )
+    for token_address, delta in count_delta.items():
+        if delta == 0:
+            continue
+        result = connection.execute(
+            update(IDXTokenHolderCount)
+            .where(IDXTokenHolderCount.token_address == token_address)
+            .values(holder_count=IDXTokenHolderCount.holder_count + delta)
+        )
+        if result.rowcount == 0:
+            connection.execute(
+                insert(IDXTokenHolderCount).values(
+                    token_address=token_address, holder_count=max(delta, 0)
+                )
+            )
+
+
+@event.listens_for(IDXPosition, "after_insert")
+@event.listens_for(IDXPosition, "after_update")
+@event.listens_for(IDXPosition, "after_delete")
+@event.listens_for(IDXLockedPosition, "after_insert")
+@event.listens_for(IDXLockedPosition, "after_update")
+@event.listens_for(IDXLockedPosition, "after_delete")
+def _on_position_changed(
+    mapper: Mapper[Any],
+    connection: Connection,
+    target: IDXPosition | IDXLockedPosition,
+):
+    refresh_token_holder_summary(
+        connection, target.token_address, target.account_address
+    )
+
+
+@event.listens_for(AccountTag, "after_insert")
+@event.listens_for(AccountTag, "after_update")
+def _on_account_tag_changed(
+    mapper: Mapper[Any], connection: Connection, target: AccountTag
+):
+    connection.execute(
+        update(IDXTokenHolderSummary)
+        .where(IDXTokenHolderSummary.account_address == target.account_address)
+        .values(account_tag=target.account_tag)
+    )
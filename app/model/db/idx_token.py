@@ -288,6 +288,19 @@ class IDXCouponToken(TokenBase):
         }
 
 
+class IDXTokenAttributeChangeLog(Base):
+    """Change log of cached token attributes (INDEX)"""
+
+    __tablename__ = "token_attribute_change_log"
+
+    # Sequence Id
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
+    # Token Address
+    token_address: Mapped[str] = mapped_column(String(42), nullable=False)
+    # Token Template
+    token_template: Mapped[str | None] = mapped_column(String(40))
+
+
 IDXTokenModel = Union[
     Type[IDXShareToken],
     Type[IDXBondToken],
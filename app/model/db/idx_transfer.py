@@ -23,7 +23,7 @@ from typing import Literal
 from zoneinfo import ZoneInfo
 
 from pydantic import BaseModel
-from sqlalchemy import JSON, BigInteger, String
+from sqlalchemy import JSON, BigInteger, Index, String
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.config import TZ
@@ -119,6 +119,14 @@ class IDXTransfer(Base):
         }
 
 
+# Used for keyset pagination of the transfer history of a token in id order
+Index("transfer_index_1", IDXTransfer.token_address, IDXTransfer.id)
+# Used for keyset pagination of the transfer history of a token in created order
+Index(
+    "transfer_index_2", IDXTransfer.token_address, IDXTransfer.created, IDXTransfer.id
+)
+
+
 class IDXTransferBlockNumber(Base):
     """Synchronized blockNumber of IDXTransfer"""
 
@@ -227,6 +227,17 @@ class NotificationBlockNumber(Base):
     latest_block_number = mapped_column(BigInteger)
 
 
+class NotificationAttributeChangeCursor(Base):
+    """Processed change log of token attributes for Notification"""
+
+    __tablename__ = "notification_attribute_change_cursor"
+
+    # notification type: NotificationType
+    notification_type = mapped_column(String(256), primary_key=True)
+    # latest processed id of token_attribute_change_log
+    latest_change_log_id = mapped_column(BigInteger, nullable=False)
+
+
 class NotificationAttributeValue(Base):
     """Synchronized attribute value for Notification"""
 
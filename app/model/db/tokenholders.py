@@ -67,3 +67,33 @@ class TokenHolder(Base):
             "hold_balance": self.hold_balance,
             "locked_balance": self.locked_balance,
         }
+
+
+class TokenHolderBalanceDelta(Base):
+    """Balance changes of token holders aggregated per block"""
+
+    __tablename__ = "token_holder_balance_delta"
+
+    # Token Address
+    token_address: Mapped[str] = mapped_column(String(42), primary_key=True)
+    # Block Number
+    block_number: Mapped[int] = mapped_column(BigInteger, primary_key=True)
+    # Account Address
+    account_address: Mapped[str] = mapped_column(String(42), primary_key=True)
+    # Change of hold balance
+    hold_balance: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    # Change of locked balance
+    locked_balance: Mapped[int] = mapped_column(BigInteger, nullable=False)
+
+
+class TokenHolderBalanceDeltaBlockNumber(Base):
+    """Block range of TokenHolderBalanceDelta"""
+
+    __tablename__ = "token_holder_balance_delta_block_number"
+
+    # Token Address
+    token_address: Mapped[str] = mapped_column(String(42), primary_key=True)
+    # First block of the recorded range
+    start_block_number: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    # Last block of the recorded range
+    latest_block_number: Mapped[int] = mapped_column(BigInteger, nullable=False)
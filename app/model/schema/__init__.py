@@ -61,6 +61,7 @@ from .dex_order_list import (
 from .e2e_message import E2EMessageEncryptionKeyResponse
 from .eth import (
     GetTransactionCountQuery,
+    JsonRPCBatchRequest,
     JsonRPCRequest,
     SendRawTransactionRequest,
     SendRawTransactionsNoWaitResponse,
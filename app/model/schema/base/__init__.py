@@ -18,9 +18,11 @@ SPDX-License-Identifier: Apache-2.0
 """
 
 from .base import (
+    BaseCursorPaginationQuery,
     BasePaginationQuery,
     BondToken,
     CouponToken,
+    CursorResultSet,
     EmailStr,
     GenericSuccessResponse,
     MembershipToken,
@@ -226,6 +226,20 @@ class BasePaginationQuery(BaseModel):
     limit: Optional[NonNegativeInt] = Field(None, description="Limit for pagination")
 
 
+class BaseCursorPaginationQuery(BasePaginationQuery):
+    cursor: Optional[str] = Field(
+        None,
+        description="Cursor for keyset pagination (offset is ignored). "
+        "Specify an empty string for the first page "
+        "and `next_cursor` of the previous page for the following pages.",
+    )
+    include_count: Optional[bool] = Field(
+        None,
+        description="Calculate count and total "
+        "(default: true, false if cursor is specified)",
+    )
+
+
 ############################
 # RESPONSE
 ############################
@@ -238,6 +252,15 @@ class ResultSet(BaseModel):
     total: Optional[int] = None
 
 
+class CursorResultSet(ResultSet):
+    """result set for pagination with keyset pagination support"""
+
+    next_cursor: Optional[str] = Field(
+        None,
+        description="cursor of the next page (only if cursor is specified, null on the last page)",
+    )
+
+
 class Success200MetaModel(BaseModel):
     code: int = Field(..., examples=[200])
     message: str = Field(..., examples=["OK"])
@@ -52,6 +52,12 @@ class JsonRPCRequest(BaseModel):
         return v
 
 
+class JsonRPCBatchRequest(RootModel[list[JsonRPCRequest]]):
+    root: list[JsonRPCRequest] = Field(
+        description="JSON-RPC batch request", min_length=1
+    )
+
+
 class BlockIdentifier(StrEnum):
     latest = "latest"
     earliest = "earliest"
@@ -24,7 +24,9 @@ from typing import Literal, Optional
 from pydantic import UUID4, BaseModel, Field, StrictStr
 
 from app.model.schema.base import (
+    BaseCursorPaginationQuery,
     BasePaginationQuery,
+    CursorResultSet,
     ResultSet,
     SortOrder,
     TokenType,
@@ -57,7 +59,7 @@ class CreateTokenHoldersCollectionRequest(BaseModel):
     block_number: int = Field(description="block number")
 
 
-class ListAllTokenHoldersQuery(BasePaginationQuery):
+class ListAllTokenHoldersQuery(BaseCursorPaginationQuery):
     account_tag: Optional[str] = Field(
         None, description="account tag (**this affects total number**)"
     )
@@ -179,7 +181,7 @@ class ListAllTransferHistoryQuery(BasePaginationQuery):
     )
 
 
-class ListTokenTransferHistoryQuery(BasePaginationQuery):
+class ListTokenTransferHistoryQuery(BaseCursorPaginationQuery):
     account_tag: Optional[str] = Field(
         None, description="account tag (**this affects total number**)"
     )
@@ -221,6 +223,18 @@ class SearchTransferHistoryRequest(BaseModel):
     )
     offset: Optional[int] = Field(default=None, description="start position", ge=0)
     limit: Optional[int] = Field(default=None, description="number of set", ge=0)
+    cursor: Optional[str] = Field(
+        default=None,
+        description="Cursor for keyset pagination (offset is ignored). "
+        "Specify an empty string for the first page "
+        "and `next_cursor` of the previous page for the following pages. "
+        "Available only if sort_item is id or created.",
+    )
+    include_count: Optional[bool] = Field(
+        default=None,
+        description="Calculate count and total "
+        "(default: true, false if cursor is specified)",
+    )
     source_event: Optional[TransferSourceEvent] = Field(
         default=None, description="source event of transfer"
     )
@@ -350,7 +364,7 @@ class TokenHolder(BaseModel):
 
 
 class TokenHoldersResponse(BaseModel):
-    result_set: ResultSet
+    result_set: CursorResultSet
     token_holder_list: list[TokenHolder]
 
 
@@ -444,7 +458,7 @@ class TransferWithMessage(TransferHistoryBase):
 
 
 class TransferHistoriesResponse(BaseModel):
-    result_set: ResultSet
+    result_set: CursorResultSet
     transfer_history: list[TransferHistory | TransferWithMessage] = Field(
         description="Transfer history"
     )
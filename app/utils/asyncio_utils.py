@@ -17,8 +17,9 @@ limitations under the License.
 SPDX-License-Identifier: Apache-2.0
 """
 
-from asyncio import Semaphore, Task, TaskGroup
-from typing import Any, Coroutine, TypeVar
+import asyncio
+from asyncio import Future, Semaphore, Task, TaskGroup
+from typing import Any, Awaitable, Callable, Coroutine, Generic, Hashable, TypeVar
 
 T = TypeVar("T")
 
@@ -68,3 +69,52 @@ class SemaphoreTaskGroup(TaskGroup):
             coro = _wrapped_coro(self._semaphore, coro)
 
         return super().create_task(coro, *args, **kwargs)
+
+
+class SingleFlight(Generic[T]):
+    """Deduplicate concurrent calls with the same key
+
+    While a call for a key is in flight, later calls for the same key wait for
+    and share its result instead of running the function again.
+    """
+
+    def __init__(self):
+        self._in_flight: dict[Hashable, Future[T]] = {}
+        # Number of calls that shared the result of an in-flight call
+        self.coalesced_count = 0
+
+    async def do(self, key: Hashable, func: Callable[[], Awaitable[T]]) -> T:
+        """
+        @param key: key to deduplicate calls
+        @param func: function to run if no call for the key is in flight
+        @return: result of func
+        """
+        while (future := self._in_flight.get(key)) is not None:
+            self.coalesced_count += 1
+            try:
+                return await asyncio.shield(future)
+            except asyncio.CancelledError:
+                current_task = asyncio.current_task()
+                if not future.cancelled() or (
+                    current_task is not None and current_task.cancelling() > 0
+                ):
+                    raise
+                # The leading call has been cancelled: run the function again
+
+        future = asyncio.get_running_loop().create_future()
+        self._in_flight[key] = future
+        try:
+            result = await func()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as err:
+            future.set_exception(err)
+            # Mark the exception as retrieved even if no one is waiting
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            del self._in_flight[key]
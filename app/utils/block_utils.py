@@ -0,0 +1,165 @@
+"""
+Copyright BOOSTRY Co., Ltd.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+
+You may obtain a copy of the License at
+http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing,
+software distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+
+See the License for the specific language governing permissions and
+limitations under the License.
+
+SPDX-License-Identifier: Apache-2.0
+"""
+
+import asyncio
+from collections import OrderedDict
+from typing import Iterable
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from web3.types import RPCEndpoint
+
+from app import config, log
+from app.database import async_engine
+from app.errors import ServiceUnavailable
+from app.model.db import IDXBlockData
+from app.utils.web3_utils import AsyncWeb3Wrapper
+
+LOG = log.get_logger()
+
+async_web3 = AsyncWeb3Wrapper()
+
+
+class BlockTimestampCache:
+    """
+    In-process LRU cache of block timestamps
+
+    Block timestamps never change once the block is generated,
+    so they are cached instead of calling `eth_getBlockByNumber` for each event.
+    Cache misses are resolved from IDXBlockData if the blockchain explorer is enabled,
+    and the rest are fetched from the node in a single batch request.
+    """
+
+    # Number of block numbers in a single query to IDXBlockData
+    DB_QUERY_CHUNK_SIZE = 1000
+
+    def __init__(self, max_size: int):
+        self.max_size = max(max_size, 1)
+        self.hit_count = 0
+        self.miss_count = 0
+        self._cache: OrderedDict[int, int] = OrderedDict()
+
+    async def get(self, block_number: int) -> int:
+        """Get block timestamp
+
+        :param block_number: block number
+        :return: block timestamp (unix time)
+        """
+        return (await self.get_many([block_number]))[block_number]
+
+    async def get_many(self, block_numbers: Iterable[int]) -> dict[int, int]:
+        """Get block timestamps of multiple blocks
+
+        :param block_numbers: block numbers
+        :return: block number -> block timestamp (unix time)
+        """
+        timestamps: dict[int, int] = {}
+        missing: list[int] = []
+        for block_number in dict.fromkeys(block_numbers):
+            timestamp = self._cache.get(block_number)
+            if timestamp is not None:
+                self._cache.move_to_end(block_number)
+                timestamps[block_number] = timestamp
+            else:
+                missing.append(block_number)
+        self.hit_count += len(timestamps)
+        if len(missing) == 0:
+            return timestamps
+
+        self.miss_count += len(missing)
+        fetched: dict[int, int] = {}
+        if config.BC_EXPLORER_ENABLED:
+            fetched.update(await self.__fetch_from_db(missing))
+        remaining = [n for n in missing if n not in fetched]
+        if len(remaining) > 0:
+            fetched.update(await self.__fetch_from_node(remaining))
+
+        for block_number, timestamp in fetched.items():
+            self.__put(block_number, timestamp)
+            timestamps[block_number] = timestamp
+        return timestamps
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+    def __len__(self):
+        return len(self._cache)
+
+    def __put(self, block_number: int, timestamp: int) -> None:
+        self._cache[block_number] = timestamp
+        self._cache.move_to_end(block_number)
+        while len(self._cache) > self.max_size:
+            self._cache.popitem(last=False)
+
+    async def __fetch_from_db(self, block_numbers: list[int]) -> dict[int, int]:
+        db_session = AsyncSession(autocommit=False, autoflush=True, bind=async_engine)
+        try:
+            fetched: dict[int, int] = {}
+            for i in range(0, len(block_numbers), self.DB_QUERY_CHUNK_SIZE):
+                rows = (
+                    await db_session.execute(
+                        select(IDXBlockData.number, IDXBlockData.timestamp).where(
+                            IDXBlockData.number.in_(
+                                block_numbers[i : i + self.DB_QUERY_CHUNK_SIZE]
+                            )
+                        )
+                    )
+                ).all()
+                fetched.update({number: timestamp for number, timestamp in rows})
+            return fetched
+        finally:
+            await db_session.close()
+
+    @staticmethod
+    async def __fetch_from_node(block_numbers: list[int]) -> dict[int, int]:
+        fetched: dict[int, int] = {}
+        chunk_size = max(config.WEB3_CALL_BATCH_MAX_SIZE, 1)
+        for i in range(0, len(block_numbers), chunk_size):
+            chunk = block_numbers[i : i + chunk_size]
+            try:
+                responses = await async_web3.provider.make_batch_request(
+                    [
+                        (RPCEndpoint("eth_getBlockByNumber"), [hex(n), False])
+                        for n in chunk
+                    ]
+                )
+            except ServiceUnavailable:
+                raise
+            except Exception as exc:
+                LOG.notice(f"Failed to send batch request: {exc!r}")
+                responses = None
+
+            if isinstance(responses, list) and len(responses) == len(chunk):
+                for block_number, response in zip(chunk, responses):
+                    result = response.get("result")
+                    if isinstance(result, dict) and "timestamp" in result:
+                        fetched[block_number] = int(str(result["timestamp"]), 16)
+
+            # Fetch blocks individually if the batch request has failed
+            not_fetched = [n for n in chunk if n not in fetched]
+            if len(not_fetched) > 0:
+                blocks = await asyncio.gather(
+                    *[async_web3.eth.get_block(n) for n in not_fetched]
+                )
+                for block_number, block in zip(not_fetched, blocks):
+                    fetched[block_number] = block["timestamp"]
+        return fetched
+
+
+block_timestamp_cache = BlockTimestampCache(max_size=config.BLOCK_TIMESTAMP_CACHE_SIZE)
@@ -18,10 +18,10 @@ SPDX-License-Identifier: Apache-2.0
 """
 
 import decimal
-from typing import Any
+from typing import Any, Callable, Hashable
 
 import orjson
-from fastapi.responses import ORJSONResponse
+from fastapi.responses import ORJSONResponse, Response
 
 from app.config import RESPONSE_VALIDATION_MODE
 
@@ -48,3 +48,23 @@ def json_response(content: dict[str, Any]):
         return content
     else:
         return CustomORJSONResponse(content=content)
+
+
+# Rendered response bodies of constant content
+_rendered_body_cache: dict[Hashable, bytes] = {}
+
+
+def cached_json_response(key: Hashable, content: Callable[[], dict[str, Any]]):
+    """
+    JSON response for content that does not change in the process
+
+    The content is rendered only once per key, and later responses are served
+    from the rendered bytes.
+    """
+    if RESPONSE_VALIDATION_MODE:
+        return content()
+    body = _rendered_body_cache.get(key)
+    if body is None:
+        body = CustomORJSONResponse(content=content()).body
+        _rendered_body_cache[key] = body
+    return Response(content=body, media_type=CustomORJSONResponse.media_type)
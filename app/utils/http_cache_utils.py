@@ -0,0 +1,151 @@
+"""
+Copyright BOOSTRY Co., Ltd.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+
+You may obtain a copy of the License at
+http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing,
+software distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+
+See the License for the specific language governing permissions and
+limitations under the License.
+
+SPDX-License-Identifier: Apache-2.0
+"""
+
+import hashlib
+import time
+from collections import OrderedDict
+from typing import Any, Hashable
+
+from fastapi import Depends, Request
+from fastapi.responses import Response
+
+from app.config import HTTP_ETAG_CACHE_MAX_SIZE
+
+
+class HTTPCachePolicy:
+    """HTTP cache policy declared by a route"""
+
+    def __init__(self, key: Hashable, max_age: int, etag_ttl: int | None):
+        """
+        :param key: resource key of the request
+        :param max_age: max-age of the response [sec]
+        :param etag_ttl: TTL of the cached ETag [sec] (None: immutable resource)
+        """
+        self.key = key
+        self.max_age = max_age
+        self.etag_ttl = etag_ttl
+
+    @property
+    def cache_control(self) -> str:
+        if self.etag_ttl is None:
+            return f"public, max-age={self.max_age}, immutable"
+        return f"public, max-age={self.max_age}"
+
+
+class ETagStore:
+    """Per-process LRU store of the ETags of resources"""
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        # resource key -> (ETag, expiry in monotonic time)
+        self.__entries: OrderedDict[Hashable, tuple[str, float | None]] = OrderedDict()
+
+    def get(self, key: Hashable) -> str | None:
+        entry = self.__entries.get(key)
+        if entry is None:
+            return None
+        etag, expires_at = entry
+        if expires_at is not None and expires_at <= time.monotonic():
+            del self.__entries[key]
+            return None
+        self.__entries.move_to_end(key)
+        return etag
+
+    def put(self, key: Hashable, etag: str, ttl: int | None):
+        if self.max_size <= 0:
+            return
+        expires_at = time.monotonic() + ttl if ttl is not None else None
+        self.__entries[key] = (etag, expires_at)
+        self.__entries.move_to_end(key)
+        while len(self.__entries) > self.max_size:
+            self.__entries.popitem(last=False)
+
+    def clear(self):
+        self.__entries.clear()
+
+
+etag_store = ETagStore(max_size=HTTP_ETAG_CACHE_MAX_SIZE)
+
+
+class NotModified(Exception):
+    """Exception to answer a conditional request with 304 Not Modified"""
+
+    def __init__(self, etag: str, policy: HTTPCachePolicy):
+        self.etag = etag
+        self.policy = policy
+
+    def response(self) -> Response:
+        return not_modified_response(self.etag, self.policy)
+
+
+def compute_etag(body: bytes) -> str:
+    """Strong ETag from the hash of the response body"""
+    return f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """Check if the ETag matches the If-None-Match header of the request"""
+    if_none_match = request.headers.get("If-None-Match")
+    if if_none_match is None:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*":
+            return True
+        # Weak comparison (RFC9110 13.1.2)
+        if candidate.removeprefix("W/") == etag.removeprefix("W/"):
+            return True
+    return False
+
+
+def not_modified_response(etag: str, policy: HTTPCachePolicy) -> Response:
+    return Response(
+        status_code=304,
+        headers={"ETag": etag, "Cache-Control": policy.cache_control},
+    )
+
+
+def http_cache(max_age: int, etag_ttl: int | None = None) -> Any:
+    """
+    Dependency to declare the HTTP cache policy of routes
+
+    - The ETag of a resource (path and query string) is computed from each response
+      body by CacheControlMiddleware, and cached in the process.
+    - A conditional request whose If-None-Match matches the cached ETag is answered
+      with 304 here, before the handler does any DB or RPC work.
+
+    Add this to `dependencies` of the route or the router
+    so that it is resolved before the other dependencies.
+
+    :param max_age: max-age of the response [sec]
+    :param etag_ttl: TTL of the cached ETag [sec]. None if the resource is immutable.
+    """
+
+    async def dependency(request: Request):
+        policy = HTTPCachePolicy(
+            key=(request.url.path, str(request.query_params)),
+            max_age=max_age,
+            etag_ttl=etag_ttl,
+        )
+        request.state.http_cache_policy = policy
+        etag = etag_store.get(policy.key)
+        if etag is not None and etag_matches(request, etag):
+            raise NotModified(etag=etag, policy=policy)
+
+    return Depends(dependency)
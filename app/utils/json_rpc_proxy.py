@@ -0,0 +1,156 @@
+"""
+Copyright BOOSTRY Co., Ltd.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+
+You may obtain a copy of the License at
+http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing,
+software distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+
+See the License for the specific language governing permissions and
+limitations under the License.
+
+SPDX-License-Identifier: Apache-2.0
+"""
+
+import asyncio
+import concurrent.futures
+import importlib.util
+from typing import Any
+
+import httpx
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app import config, log
+from app.errors import ServiceUnavailable
+from app.model.db import Node
+from app.utils.web3_utils import NodeSelectionCache
+
+LOG = log.get_logger()
+
+
+class JsonRPCProxy:
+    """
+    Per-process HTTP client proxying raw JSON-RPC requests to the synced node
+
+    - Connections to the node are pooled and kept alive across requests.
+    - The selected node is cached for a short TTL in the same way as web3 requests.
+    """
+
+    def __init__(self):
+        self.node_cache = NodeSelectionCache(ttl=config.WEB3_NODE_CACHE_TTL)
+        self.__client: httpx.AsyncClient | None = None
+        self.__loop: asyncio.AbstractEventLoop | None = None
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        # NOTE: Connections of a client cannot be shared between event loops,
+        #       so the client is recreated if the running loop is changed.
+        loop = asyncio.get_running_loop()
+        if self.__client is None or self.__client.is_closed or self.__loop is not loop:
+            if self.__client is not None and self.__loop is not loop:
+                self.__discard_client(self.__client, self.__loop)
+            self.__client = httpx.AsyncClient(
+                http2=self.http2_enabled(),
+                limits=httpx.Limits(
+                    max_connections=config.ETH_RPC_PROXY_MAX_CONNECTIONS,
+                    max_keepalive_connections=config.ETH_RPC_PROXY_MAX_KEEPALIVE_CONNECTIONS,
+                    keepalive_expiry=config.ETH_RPC_PROXY_KEEPALIVE_EXPIRY,
+                ),
+                timeout=httpx.Timeout(
+                    config.ETH_RPC_PROXY_READ_TIMEOUT,
+                    connect=config.ETH_RPC_PROXY_CONNECT_TIMEOUT,
+                ),
+            )
+            self.__loop = loop
+        return self.__client
+
+    @staticmethod
+    def __discard_client(
+        client: httpx.AsyncClient, loop: asyncio.AbstractEventLoop | None
+    ):
+        """Close a client created on another event loop
+
+        The pooled connections are closed on the event loop they belong to.
+        If that loop has already been closed, its selector has been released and
+        the sockets are closed when the dropped connections are garbage collected.
+        """
+        if client.is_closed or loop is None or loop.is_closed():
+            return
+
+        def _log_error(future: concurrent.futures.Future[None]):
+            if not future.cancelled() and future.exception() is not None:
+                LOG.warning(f"Failed to close HTTP client: {future.exception()!r}")
+
+        asyncio.run_coroutine_threadsafe(client.aclose(), loop).add_done_callback(
+            _log_error
+        )
+
+    @staticmethod
+    def http2_enabled() -> bool:
+        if config.ETH_RPC_PROXY_HTTP2_ENABLED is False:
+            return False
+        if importlib.util.find_spec("h2") is None:
+            LOG.warning("HTTP/2 is disabled because the h2 package is not installed")
+            return False
+        return True
+
+    async def select_endpoint(self, async_session: AsyncSession) -> str | None:
+        """Select the endpoint of the synced node with the highest priority
+
+        :param async_session: DB session of the request
+        :return: endpoint URI (None if no node is synced)
+        """
+        cache = self.node_cache
+        if cache.is_fresh():
+            return cache.endpoint_uri
+
+        node = (
+            await async_session.scalars(
+                select(Node)
+                .where(Node.is_synced == True)
+                .order_by(Node.priority)
+                .limit(1)
+            )
+        ).first()
+        if node is None:
+            # Not cached so that a node synced again is selected immediately
+            return None
+        cache.update(node_exists=True, endpoint_uri=node.endpoint_uri)
+        return node.endpoint_uri
+
+    async def request(
+        self, async_session: AsyncSession, payload: dict[str, Any] | list[Any]
+    ) -> Any:
+        """Send a JSON-RPC request (or batch request) to the node
+
+        :param async_session: DB session of the request
+        :param payload: JSON-RPC request body
+        :return: JSON-RPC response body
+        :raises ServiceUnavailable: if the node is not available
+        """
+        endpoint_uri = await self.select_endpoint(async_session)
+        if endpoint_uri is None:
+            raise ServiceUnavailable("No web3 providers available")
+
+        try:
+            res = await self.client.post(endpoint_uri, json=payload)
+            return res.json()
+        except Exception:
+            # Drop the cached node to select an alive node again.
+            self.node_cache.invalidate()
+            raise ServiceUnavailable("Unable to connect to web3 provider")
+
+    async def aclose(self):
+        if self.__client is not None:
+            await self.__client.aclose()
+            self.__client = None
+            self.__loop = None
+
+
+json_rpc_proxy = JsonRPCProxy()
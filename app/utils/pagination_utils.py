@@ -0,0 +1,87 @@
+"""
+Copyright BOOSTRY Co., Ltd.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+
+You may obtain a copy of the License at
+http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing,
+software distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+
+See the License for the specific language governing permissions and
+limitations under the License.
+
+SPDX-License-Identifier: Apache-2.0
+"""
+
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import Any, Callable, Sequence, TypeVar
+
+from app.errors import InvalidParameterError
+
+CursorValue = int | str | datetime
+
+Row = TypeVar("Row")
+
+
+def encode_cursor(*values: CursorValue) -> str:
+    """Encode the sort key values of the last row into an opaque cursor"""
+    raw = json.dumps(
+        [v.isoformat() if isinstance(v, datetime) else v for v in values],
+        separators=(",", ":"),
+    )
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, *types: type[CursorValue]) -> tuple[Any, ...] | None:
+    """Decode a cursor into the sort key values
+
+    :param cursor: cursor returned as `next_cursor`
+    :param types: types of the sort key values
+    :return: sort key values (None for the first page)
+    :raises InvalidParameterError: if the cursor is malformed
+    """
+    if cursor == "":
+        return None
+    try:
+        padding = "=" * (-len(cursor) % 4)
+        raw = json.loads(base64.urlsafe_b64decode(cursor + padding))
+        if not isinstance(raw, list) or len(raw) != len(types):  # type: ignore
+            raise ValueError
+        values: list[Any] = []
+        for value, value_type in zip(raw, types):  # type: ignore
+            if value_type is datetime:
+                values.append(datetime.fromisoformat(value))  # type: ignore
+            elif isinstance(value, value_type) and not isinstance(value, bool):
+                values.append(value)
+            else:
+                raise ValueError
+        return tuple(values)
+    except (ValueError, TypeError, binascii.Error, UnicodeDecodeError):
+        raise InvalidParameterError(description="invalid cursor")
+
+
+def keyset_page(
+    rows: Sequence[Row],
+    limit: int | None,
+    sort_key: Callable[[Row], tuple[CursorValue, ...]],
+) -> tuple[Sequence[Row], str | None]:
+    """Trim the rows fetched with `limit + 1` to a page
+
+    :param rows: rows fetched with `limit + 1`
+    :param limit: number of rows in a page
+    :param sort_key: function returning the sort key values of a row
+    :return: rows of the page, and the cursor of the next page (None on the last page)
+    """
+    if limit is None:
+        return rows, None
+    if limit == 0 or len(rows) <= limit:
+        return rows[:limit], None
+    page = rows[:limit]
+    return page, encode_cursor(*sort_key(page[-1]))
@@ -21,9 +21,10 @@ import asyncio
 import threading
 import time
 from json.decoder import JSONDecodeError
-from typing import Any
+from typing import Any, Awaitable, Callable, TypeVar
 
 from aiohttp import ClientError
+from eth_abi.codec import ABICodec
 from eth_typing import URI
 from requests.exceptions import ConnectionError, HTTPError
 from sqlalchemy import select
@@ -40,11 +41,14 @@ from app import config, log
 from app.database import async_engine, engine
 from app.errors import ServiceUnavailable
 from app.model.db import Node
+from app.utils.asyncio_utils import SingleFlight
 
 LOG = log.get_logger()
 
 thread_local = threading.local()
 
+T = TypeVar("T")
+
 
 class Web3Wrapper:
     DEFAULT_TIMEOUT = 5
@@ -107,6 +111,16 @@ class AsyncWeb3Wrapper:
         web3 = self._get_web3(self.request_timeout)
         return web3.net
 
+    @property
+    def provider(self) -> "AsyncFailOverHTTPProvider":
+        web3 = self._get_web3(self.request_timeout)
+        return web3.provider  # type: ignore
+
+    @property
+    def codec(self) -> ABICodec:
+        web3 = self._get_web3(self.request_timeout)
+        return web3.codec
+
     @staticmethod
     def _get_web3(request_timeout: int) -> AsyncWeb3:
         # Get web3 for each thread because make to FailOverHTTPProvider thread-safe
@@ -122,60 +136,130 @@ class AsyncWeb3Wrapper:
         return async_web3
 
 
+class NodeSelectionCache:
+    """
+    In-process cache of the node used for web3 requests
+
+    Node status is updated by processor_Block_Sync_Status periodically,
+    so the selected node is cached for a short TTL instead of querying
+    the node table on every JSON-RPC request.
+    """
+
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+        self.lock = threading.Lock()
+        # Concurrent refreshes on the same event loop share one DB query
+        self.single_flight: SingleFlight[None] = SingleFlight()
+        self.node_exists = False  # Whether node status has ever been registered
+        self.endpoint_uri: str | None = None  # Endpoint of the alive node
+        self.loaded = False
+        self.refreshing = False
+        self._expires_at = 0.0
+
+    def is_fresh(self) -> bool:
+        return self.loaded and time.monotonic() < self._expires_at
+
+    def is_available(self) -> bool:
+        # While another request is refreshing the cache, the stale selection is used
+        return self.is_fresh() or (self.loaded and self.refreshing)
+
+    def update(self, node_exists: bool, endpoint_uri: str | None) -> None:
+        self.node_exists = node_exists
+        self.endpoint_uri = endpoint_uri
+        self.loaded = True
+        self._expires_at = time.monotonic() + self.ttl
+
+    def invalidate(self) -> None:
+        self.loaded = False
+        self._expires_at = 0.0
+
+
+def _select_node_stmt():
+    return (
+        select(Node)
+        .where(Node.is_synced == True)
+        .order_by(Node.priority)
+        .order_by(Node.id)
+        .limit(1)
+    )
+
+
 class FailOverHTTPProvider(HTTPProvider):
     fail_over_mode = False  # If False, use only the default(primary) provider
+    node_cache = NodeSelectionCache(ttl=config.WEB3_NODE_CACHE_TTL)
 
     def __init__(self, *args: Any, **kwargs: Any):
         super().__init__(*args, **kwargs)
         self.endpoint_uri: URI | None = None
 
     def make_request(self, method: RPCEndpoint, params: Any) -> RPCResponse:
-        db_session = Session(autocommit=False, autoflush=True, bind=engine)
-        try:
-            if FailOverHTTPProvider.fail_over_mode is True:
-                # If never running the block monitoring processor,
-                # use default(primary) node.
-                if db_session.scalars(select(Node).limit(1)).first() is None:
+        if FailOverHTTPProvider.fail_over_mode is True:
+            counter = 0
+            while counter <= config.WEB3_REQUEST_RETRY_COUNT:
+                node_exists, endpoint_uri = self._select_node()
+                if node_exists is False:
+                    # If never running the block monitoring processor,
+                    # use default(primary) node.
                     self.endpoint_uri = URI(config.WEB3_HTTP_PROVIDER)
                     return super().make_request(method, params)
-                else:
-                    counter = 0
-                    while counter <= config.WEB3_REQUEST_RETRY_COUNT:
-                        # Switch alive node
-                        _node = db_session.scalars(
-                            select(Node)
-                            .where(Node.is_synced == True)
-                            .order_by(Node.priority)
-                            .order_by(Node.id)
-                            .limit(1)
-                        ).first()
-                        if _node is None:
-                            counter += 1
-                            if counter <= config.WEB3_REQUEST_RETRY_COUNT:
-                                time.sleep(config.WEB3_REQUEST_WAIT_TIME)
-                                continue
-                            raise ServiceUnavailable("Block synchronization is down")
-                        assert _node.endpoint_uri is not None
-                        self.endpoint_uri = URI(_node.endpoint_uri)
-                        try:
-                            return super().make_request(method, params)
-                        except (ConnectionError, JSONDecodeError, HTTPError):
-                            # NOTE:
-                            #  JSONDecodeError will be raised if a request is sent
-                            #  while Quorum is terminating.
-                            LOG.notice(
-                                f"Retry web3 request due to connection fail: method={method}, params={params}"
-                            )
-                            counter += 1
-                            if counter <= config.WEB3_REQUEST_RETRY_COUNT:
-                                time.sleep(config.WEB3_REQUEST_WAIT_TIME)
-                                continue
+
+                # Switch alive node
+                if endpoint_uri is None:
+                    FailOverHTTPProvider.node_cache.invalidate()
+                    counter += 1
+                    if counter <= config.WEB3_REQUEST_RETRY_COUNT:
+                        time.sleep(config.WEB3_REQUEST_WAIT_TIME)
+                        continue
                     raise ServiceUnavailable("Block synchronization is down")
-            else:  # Use default provider
-                self.endpoint_uri = URI(config.WEB3_HTTP_PROVIDER)
-                return super().make_request(method, params)
-        finally:
-            db_session.close()
+                self.endpoint_uri = URI(endpoint_uri)
+                try:
+                    return super().make_request(method, params)
+                except (ConnectionError, JSONDecodeError, HTTPError):
+                    # NOTE:
+                    #  JSONDecodeError will be raised if a request is sent
+                    #  while Quorum is terminating.
+                    # Drop the cached node to select an alive node again.
+                    FailOverHTTPProvider.node_cache.invalidate()
+                    LOG.notice(
+                        f"Retry web3 request due to connection fail: method={method}, params={params}"
+                    )
+                    counter += 1
+                    if counter <= config.WEB3_REQUEST_RETRY_COUNT:
+                        time.sleep(config.WEB3_REQUEST_WAIT_TIME)
+                        continue
+            raise ServiceUnavailable("Block synchronization is down")
+        else:  # Use default provider
+            self.endpoint_uri = URI(config.WEB3_HTTP_PROVIDER)
+            return super().make_request(method, params)
+
+    @staticmethod
+    def _select_node() -> tuple[bool, str | None]:
+        """Select the node to send requests
+
+        :return: Whether node status exists, endpoint of the alive node
+        """
+        cache = FailOverHTTPProvider.node_cache
+        with cache.lock:
+            if cache.is_fresh():
+                return cache.node_exists, cache.endpoint_uri
+
+            db_session = Session(autocommit=False, autoflush=True, bind=engine)
+            try:
+                node_exists = (
+                    db_session.scalars(select(Node).limit(1)).first() is not None
+                )
+                _node = (
+                    db_session.scalars(_select_node_stmt()).first()
+                    if node_exists
+                    else None
+                )
+                cache.update(
+                    node_exists=node_exists,
+                    endpoint_uri=_node.endpoint_uri if _node is not None else None,
+                )
+            finally:
+                db_session.close()
+            return cache.node_exists, cache.endpoint_uri
 
     @staticmethod
     def set_fail_over_mode(use_fail_over: bool):
@@ -184,60 +268,117 @@ class FailOverHTTPProvider(HTTPProvider):
 
 class AsyncFailOverHTTPProvider(AsyncHTTPProvider):
     fail_over_mode = False  # If False, use only the default(primary) provider
+    node_cache = NodeSelectionCache(ttl=config.WEB3_NODE_CACHE_TTL)
 
     def __init__(self, *args: Any, **kwargs: Any):
         super().__init__(*args, **kwargs)
         self.endpoint_uri: URI | None = None
 
     async def make_request(self, method: RPCEndpoint, params: Any) -> RPCResponse:
-        db_session = AsyncSession(autocommit=False, autoflush=True, bind=async_engine)
-        try:
-            if AsyncFailOverHTTPProvider.fail_over_mode is True:
-                # If never running the block monitoring processor,
-                # use default(primary) node.
-                if (await db_session.scalars(select(Node).limit(1))).first() is None:
+        return await self._make_fail_over_request(
+            super().make_request,
+            method,
+            params,
+            description=f"method={method}, params={params}",
+        )
+
+    async def make_batch_request(
+        self, batch_requests: list[tuple[RPCEndpoint, Any]]
+    ) -> list[RPCResponse]:
+        return await self._make_fail_over_request(
+            super().make_batch_request,
+            batch_requests,
+            description=f"batch_size={len(batch_requests)}",
+        )
+
+    async def _make_fail_over_request(
+        self,
+        request_func: Callable[..., Awaitable[T]],
+        *args: Any,
+        description: str,
+    ) -> T:
+        """Send a request while switching to an alive node on connection failure
+
+        :param request_func: Request function of the parent provider
+        :param args: Arguments of the request function
+        :param description: Request description for logging
+        :return: Response of the request function
+        """
+        if AsyncFailOverHTTPProvider.fail_over_mode is True:
+            counter = 0
+            while counter <= config.WEB3_REQUEST_RETRY_COUNT:
+                node_exists, endpoint_uri = await self._select_node()
+                if node_exists is False:
+                    # If never running the block monitoring processor,
+                    # use default(primary) node.
                     self.endpoint_uri = URI(config.WEB3_HTTP_PROVIDER)
-                    return await super().make_request(method, params)
-                else:
-                    counter = 0
-                    while counter <= config.WEB3_REQUEST_RETRY_COUNT:
-                        # Switch alive node
-                        _node = (
-                            await db_session.scalars(
-                                select(Node)
-                                .where(Node.is_synced == True)
-                                .order_by(Node.priority)
-                                .order_by(Node.id)
-                                .limit(1)
-                            )
-                        ).first()
-                        if _node is None:
-                            counter += 1
-                            if counter <= config.WEB3_REQUEST_RETRY_COUNT:
-                                await asyncio.sleep(config.WEB3_REQUEST_WAIT_TIME)
-                                continue
-                            raise ServiceUnavailable("Block synchronization is down")
-                        assert _node.endpoint_uri is not None
-                        self.endpoint_uri = URI(_node.endpoint_uri)
-                        try:
-                            return await super().make_request(method, params)
-                        except (ClientError, JSONDecodeError):
-                            # NOTE:
-                            #  JSONDecodeError will be raised if a request is sent
-                            #  while Quorum is terminating.
-                            LOG.notice(
-                                f"Retry web3 request due to connection fail: method={method}, params={params}"
-                            )
-                            counter += 1
-                            if counter <= config.WEB3_REQUEST_RETRY_COUNT:
-                                await asyncio.sleep(config.WEB3_REQUEST_WAIT_TIME)
-                                continue
+                    return await request_func(*args)
+
+                # Switch alive node
+                if endpoint_uri is None:
+                    AsyncFailOverHTTPProvider.node_cache.invalidate()
+                    counter += 1
+                    if counter <= config.WEB3_REQUEST_RETRY_COUNT:
+                        await asyncio.sleep(config.WEB3_REQUEST_WAIT_TIME)
+                        continue
                     raise ServiceUnavailable("Block synchronization is down")
-            else:  # Use default provider
-                self.endpoint_uri = URI(config.WEB3_HTTP_PROVIDER)
-                return await super().make_request(method, params)
-        finally:
-            await db_session.close()
+                self.endpoint_uri = URI(endpoint_uri)
+                try:
+                    return await request_func(*args)
+                except (ClientError, JSONDecodeError):
+                    # NOTE:
+                    #  JSONDecodeError will be raised if a request is sent
+                    #  while Quorum is terminating.
+                    # Drop the cached node to select an alive node again.
+                    AsyncFailOverHTTPProvider.node_cache.invalidate()
+                    LOG.notice(
+                        f"Retry web3 request due to connection fail: {description}"
+                    )
+                    counter += 1
+                    if counter <= config.WEB3_REQUEST_RETRY_COUNT:
+                        await asyncio.sleep(config.WEB3_REQUEST_WAIT_TIME)
+                        continue
+            raise ServiceUnavailable("Block synchronization is down")
+        else:  # Use default provider
+            self.endpoint_uri = URI(config.WEB3_HTTP_PROVIDER)
+            return await request_func(*args)
+
+    @staticmethod
+    async def _select_node() -> tuple[bool, str | None]:
+        """Select the node to send requests
+
+        :return: Whether node status exists, endpoint of the alive node
+        """
+        cache = AsyncFailOverHTTPProvider.node_cache
+        if cache.is_available():
+            return cache.node_exists, cache.endpoint_uri
+
+        async def _refresh():
+            cache.refreshing = True
+            db_session = AsyncSession(
+                autocommit=False, autoflush=True, bind=async_engine
+            )
+            try:
+                node_exists = (
+                    await db_session.scalars(select(Node).limit(1))
+                ).first() is not None
+                _node = (
+                    (await db_session.scalars(_select_node_stmt())).first()
+                    if node_exists
+                    else None
+                )
+                cache.update(
+                    node_exists=node_exists,
+                    endpoint_uri=_node.endpoint_uri if _node is not None else None,
+                )
+            finally:
+                cache.refreshing = False
+                await db_session.close()
+
+        # NOTE: Requests arriving while the cache is invalidated (not loaded)
+        #       wait for the running refresh instead of querying the DB again.
+        await cache.single_flight.do(asyncio.get_running_loop(), _refresh)
+        return cache.node_exists, cache.endpoint_uri
 
     @staticmethod
     def set_fail_over_mode(use_fail_over: bool):
@@ -20,18 +20,23 @@ SPDX-License-Identifier: Apache-2.0
 import asyncio
 import sys
 from collections.abc import Sequence
-from typing import cast
+from typing import Any, cast
 
 from eth_utils.address import to_checksum_address
-from sqlalchemy import select
+from sqlalchemy import insert, select
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 from web3.types import BlockData, TxData
 
-from app.config import WEB3_CHAINID
+from app.config import (
+    BLOCK_TX_DATA_CHUNK_SIZE,
+    BLOCK_TX_DATA_FETCH_CONCURRENCY,
+    WEB3_CHAINID,
+)
 from app.database import BatchAsyncSessionLocal
 from app.errors import ServiceUnavailable
 from app.model.db import IDXBlockData, IDXBlockDataBlockNumber, IDXTxData
+from app.utils.asyncio_utils import SemaphoreTaskGroup
 from app.utils.web3_utils import AsyncWeb3Wrapper
 from batch import free_malloc, log
 
@@ -42,7 +47,23 @@ async_web3 = AsyncWeb3Wrapper()
 
 
 class Processor:
-    """Processor for indexing Block and Transaction data"""
+    """Processor for indexing Block and Transaction data
+
+    Blocks are processed in chunks through the following pipeline.
+    - Fetch: Blocks in a chunk are fetched concurrently.
+             The next chunk is prefetched while the current chunk is written.
+    - Transform: Block data is converted to rows of IDXBlockData/IDXTxData.
+    - Insert: Rows in a chunk are bulk inserted and committed together
+              with the indexed block number.
+    """
+
+    def __init__(
+        self,
+        chunk_size: int = BLOCK_TX_DATA_CHUNK_SIZE,
+        fetch_concurrency: int = BLOCK_TX_DATA_FETCH_CONCURRENCY,
+    ):
+        self.chunk_size = max(chunk_size, 1)
+        self.fetch_concurrency = max(fetch_concurrency, 1)
 
     @staticmethod
     def __get_db_session():
@@ -50,6 +71,7 @@ class Processor:
 
     async def process(self):
         local_session = self.__get_db_session()
+        prefetch_task: asyncio.Task[list[BlockData]] | None = None
         try:
             latest_block = int(await async_web3.eth.block_number)
             from_block = (await self.__get_indexed_block_number(local_session)) + 1
@@ -59,117 +81,158 @@ class Processor:
                 return
 
             LOG.info("Syncing from={}, to={}".format(from_block, latest_block))
-            for block_number in range(from_block, latest_block + 1):
-                block_data: BlockData = await async_web3.eth.get_block(
-                    block_number, full_transactions=True
-                )
-                assert "number" in block_data
-                assert "parentHash" in block_data
-                assert "timestamp" in block_data
-                assert "hash" in block_data
-
-                # Synchronize block data
-                block_model = IDXBlockData()
-                block_model.number = block_data["number"]
-                block_model.parent_hash = block_data["parentHash"].to_0x_hex()
-                block_model.sha3_uncles = (
-                    block_data["sha3Uncles"].to_0x_hex()
-                    if "sha3Uncles" in block_data
-                    else None
-                )
-                block_model.miner = block_data.get("miner")
-                block_model.state_root = (
-                    block_data["stateRoot"].to_0x_hex()
-                    if "stateRoot" in block_data
-                    else None
-                )
-                block_model.transactions_root = (
-                    block_data["transactionsRoot"].to_0x_hex()
-                    if "transactionsRoot" in block_data
-                    else None
-                )
-                block_model.receipts_root = (
-                    block_data["receiptsRoot"].to_0x_hex()
-                    if "receiptsRoot" in block_data
-                    else None
-                )
-                block_model.logs_bloom = (
-                    block_data["logsBloom"].to_0x_hex()
-                    if "logsBloom" in block_data
-                    else None
-                )
-                block_model.difficulty = block_data.get("difficulty")
-                block_model.gas_limit = block_data.get("gasLimit")
-                block_model.gas_used = block_data.get("gasUsed")
-                block_model.timestamp = block_data["timestamp"]
-                block_model.proof_of_authority_data = (
-                    block_data["proofOfAuthorityData"].to_0x_hex()
-                    if "proofOfAuthorityData" in block_data
-                    else None
-                )
-                block_model.mix_hash = (
-                    block_data["mixHash"].to_0x_hex()
-                    if "mixHash" in block_data
-                    else None
-                )
-                block_model.nonce = (
-                    block_data["nonce"].to_0x_hex() if "nonce" in block_data else None
-                )
-                block_model.hash = block_data["hash"].to_0x_hex()
-                block_model.size = block_data.get("size")
-
-                transactions = cast(
-                    Sequence[TxData], block_data.get("transactions", [])
-                )
-                transaction_hash_list: list[str] = []
-
-                for transaction in transactions:
-                    assert "hash" in transaction
-                    # Synchronize tx data
-                    tx_model = IDXTxData()
-                    tx_model.hash = transaction["hash"].to_0x_hex()
-                    tx_model.block_hash = (
+            chunks = [
+                (chunk_from, min(chunk_from + self.chunk_size - 1, latest_block))
+                for chunk_from in range(from_block, latest_block + 1, self.chunk_size)
+            ]
+            prefetch_task = asyncio.create_task(self.__fetch_blocks(*chunks[0]))
+            for i, (chunk_from, chunk_to) in enumerate(chunks):
+                block_data_list = await prefetch_task
+                prefetch_task = None
+                # Prefetch next chunk while writing the current chunk
+                if i + 1 < len(chunks):
+                    prefetch_task = asyncio.create_task(
+                        self.__fetch_blocks(*chunks[i + 1])
+                    )
+
+                block_rows: list[dict[str, Any]] = []
+                tx_rows: list[dict[str, Any]] = []
+                for block_data in block_data_list:
+                    block_row, block_tx_rows = self.__transform(block_data)
+                    block_rows.append(block_row)
+                    tx_rows.extend(block_tx_rows)
+
+                if tx_rows:
+                    await local_session.execute(insert(IDXTxData), tx_rows)
+                await local_session.execute(insert(IDXBlockData), block_rows)
+
+                # NOTE: The indexed block number is committed in the same transaction
+                #       as the block data, so that it stays consistent after a crash.
+                await self.__set_indexed_block_number(local_session, chunk_to)
+                await local_session.commit()
+                LOG.debug(f"Indexed blocks: from={chunk_from}, to={chunk_to}")
+        except Exception:
+            await local_session.rollback()
+            raise
+        finally:
+            if prefetch_task is not None:
+                prefetch_task.cancel()
+                await asyncio.gather(prefetch_task, return_exceptions=True)
+            await local_session.close()
+        LOG.info("Sync job has been completed")
+
+    async def __fetch_blocks(self, from_block: int, to_block: int) -> list[BlockData]:
+        """Fetch blocks in the range with bounded concurrency"""
+        try:
+            tasks = await SemaphoreTaskGroup.run(
+                *[
+                    async_web3.eth.get_block(block_number, full_transactions=True)
+                    for block_number in range(from_block, to_block + 1)
+                ],
+                max_concurrency=self.fetch_concurrency,
+            )
+        except ExceptionGroup as eg:
+            # Re-raise the first error as it is
+            raise eg.exceptions[0] from None
+        return [task.result() for task in tasks]
+
+    @staticmethod
+    def __transform(
+        block_data: BlockData,
+    ) -> tuple[dict[str, Any], list[dict[str, Any]]]:
+        """Convert block data to rows of IDXBlockData and IDXTxData"""
+        assert "number" in block_data
+        assert "parentHash" in block_data
+        assert "timestamp" in block_data
+        assert "hash" in block_data
+
+        transactions = cast(Sequence[TxData], block_data.get("transactions", []))
+        tx_rows: list[dict[str, Any]] = []
+        transaction_hash_list: list[str] = []
+        for transaction in transactions:
+            assert "hash" in transaction
+            tx_rows.append(
+                {
+                    "hash": transaction["hash"].to_0x_hex(),
+                    "block_hash": (
                         transaction["blockHash"].to_0x_hex()
                         if "blockHash" in transaction
                         else None
-                    )
-                    tx_model.block_number = transaction.get("blockNumber")
-                    tx_model.transaction_index = transaction.get("transactionIndex")
-                    tx_model.from_address = (
+                    ),
+                    "block_number": transaction.get("blockNumber"),
+                    "transaction_index": transaction.get("transactionIndex"),
+                    "from_address": (
                         to_checksum_address(transaction["from"])
                         if "from" in transaction
                         else None
-                    )
-                    tx_model.to_address = (
+                    ),
+                    "to_address": (
                         to_checksum_address(transaction["to"])
                         if "to" in transaction and transaction["to"] is not None  # type: ignore to_address can be None
                         else None
-                    )
-                    tx_model.input = (
+                    ),
+                    "input": (
                         transaction["input"].to_0x_hex()
                         if "input" in transaction
                         else None
-                    )
-                    tx_model.gas = transaction.get("gas")
-                    tx_model.gas_price = transaction.get("gasPrice")
-                    tx_model.value = transaction.get("value")
-                    tx_model.nonce = transaction.get("nonce")
-                    local_session.add(tx_model)
-
-                    transaction_hash_list.append(transaction["hash"].to_0x_hex())
-
-                block_model.transactions = transaction_hash_list
-                local_session.add(block_model)
-
-                await self.__set_indexed_block_number(local_session, block_number)
+                    ),
+                    "gas": transaction.get("gas"),
+                    "gas_price": transaction.get("gasPrice"),
+                    "value": transaction.get("value"),
+                    "nonce": transaction.get("nonce"),
+                }
+            )
+            transaction_hash_list.append(transaction["hash"].to_0x_hex())
 
-                await local_session.commit()
-        except Exception:
-            await local_session.rollback()
-            raise
-        finally:
-            await local_session.close()
-        LOG.info("Sync job has been completed")
+        block_row = {
+            "number": block_data["number"],
+            "parent_hash": block_data["parentHash"].to_0x_hex(),
+            "sha3_uncles": (
+                block_data["sha3Uncles"].to_0x_hex()
+                if "sha3Uncles" in block_data
+                else None
+            ),
+            "miner": block_data.get("miner"),
+            "state_root": (
+                block_data["stateRoot"].to_0x_hex()
+                if "stateRoot" in block_data
+                else None
+            ),
+            "transactions_root": (
+                block_data["transactionsRoot"].to_0x_hex()
+                if "transactionsRoot" in block_data
+                else None
+            ),
+            "receipts_root": (
+                block_data["receiptsRoot"].to_0x_hex()
+                if "receiptsRoot" in block_data
+                else None
+            ),
+            "logs_bloom": (
+                block_data["logsBloom"].to_0x_hex()
+                if "logsBloom" in block_data
+                else None
+            ),
+            "difficulty": block_data.get("difficulty"),
+            "gas_limit": block_data.get("gasLimit"),
+            "gas_used": block_data.get("gasUsed"),
+            "timestamp": block_data["timestamp"],
+            "proof_of_authority_data": (
+                block_data["proofOfAuthorityData"].to_0x_hex()
+                if "proofOfAuthorityData" in block_data
+                else None
+            ),
+            "mix_hash": (
+                block_data["mixHash"].to_0x_hex() if "mixHash" in block_data else None
+            ),
+            "nonce": (
+                block_data["nonce"].to_0x_hex() if "nonce" in block_data else None
+            ),
+            "hash": block_data["hash"].to_0x_hex(),
+            "size": block_data.get("size"),
+            "transactions": transaction_hash_list,
+        }
+        return block_row, tx_rows
 
     @staticmethod
     async def __get_indexed_block_number(db_session: AsyncSession) -> int:
@@ -36,8 +36,10 @@ from app.database import BatchAsyncSessionLocal
 from app.errors import ServiceUnavailable
 from app.model.db import IDXConsumeCoupon, Listing
 from app.model.schema.base import TokenType
+from app.utils.block_utils import block_timestamp_cache
 from app.utils.web3_utils import AsyncWeb3Wrapper
 from batch import free_malloc, log
+from batch.lib.block_range import BlockRangePlanner
 
 local_tz = ZoneInfo(TZ)
 
@@ -66,29 +68,17 @@ class Processor:
         try:
             await self.__get_token_list(local_session)
 
-            # Synchronize 1,000,000 blocks each
-            _to_block = 999999
-            _from_block = 0
-            if self.latest_block > 999999:
-                while _to_block < self.latest_block:
-                    await self.__sync_all(
-                        db_session=local_session,
-                        block_from=_from_block,
-                        block_to=_to_block,
-                    )
-                    _to_block += 1000000
-                    _from_block += 1000000
-                await self.__sync_all(
+            # Synchronize in chunks of adaptive size
+            await BlockRangePlanner(key=process_name).run(
+                block_from=0,
+                block_to=self.latest_block,
+                sync=lambda block_from, block_to: self.__sync_all(
                     db_session=local_session,
-                    block_from=_from_block,
-                    block_to=self.latest_block,
-                )
-            else:
-                await self.__sync_all(
-                    db_session=local_session,
-                    block_from=_from_block,
-                    block_to=self.latest_block,
-                )
+                    block_from=block_from,
+                    block_to=block_to,
+                ),
+                db_session=local_session,
+            )
             await local_session.commit()
         except Exception as e:
             await local_session.rollback()
@@ -108,10 +98,15 @@ class Processor:
             if blockTo == self.latest_block:
                 return
 
-            await self.__sync_all(
-                db_session=local_session,
+            await BlockRangePlanner(key=process_name).run(
                 block_from=self.latest_block + 1,
                 block_to=blockTo,
+                sync=lambda block_from, block_to: self.__sync_all(
+                    db_session=local_session,
+                    block_from=block_from,
+                    block_to=block_to,
+                ),
+                db_session=local_session,
             )
             self.latest_block = blockTo
             await local_session.commit()
@@ -166,13 +161,14 @@ class Processor:
             except ABIEventNotFound:
                 events = []
             try:
+                await block_timestamp_cache.get_many(
+                    event["blockNumber"] for event in events
+                )
                 for event in events:
                     args = event["args"]
                     transaction_hash = event["transactionHash"].to_0x_hex()
-                    block_data = await async_web3.eth.get_block(event["blockNumber"])
-                    assert "timestamp" in block_data
                     block_timestamp_dt = datetime.fromtimestamp(
-                        block_data["timestamp"],
+                        await block_timestamp_cache.get(event["blockNumber"]),
                         UTC,
                     ).replace(tzinfo=None)
                     amount = args.get("value", 0)
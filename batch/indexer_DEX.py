@@ -43,8 +43,10 @@ from app.model.db import (
     IDXOrder as Order,
     Listing,
 )
+from app.utils.block_utils import block_timestamp_cache
 from app.utils.web3_utils import AsyncWeb3Wrapper
 from batch import free_malloc, log
+from batch.lib.block_range import BlockRangePlanner
 
 local_tz = ZoneInfo(TZ)
 
@@ -83,29 +85,17 @@ class Processor:
         latest_block_at_start = self.latest_block
         self.latest_block = int(await async_web3.eth.block_number)
         try:
-            # Synchronize 1,000,000 blocks each
-            _to_block = 999999
-            _from_block = 0
-            if self.latest_block > 999999:
-                while _to_block < self.latest_block:
-                    await self.__sync_all(
-                        db_session=local_session,
-                        block_from=_from_block,
-                        block_to=_to_block,
-                    )
-                    _to_block += 1000000
-                    _from_block += 1000000
-                await self.__sync_all(
-                    db_session=local_session,
-                    block_from=_from_block,
-                    block_to=self.latest_block,
-                )
-            else:
-                await self.__sync_all(
+            # Synchronize in chunks of adaptive size
+            await BlockRangePlanner(key=process_name).run(
+                block_from=0,
+                block_to=self.latest_block,
+                sync=lambda block_from, block_to: self.__sync_all(
                     db_session=local_session,
-                    block_from=_from_block,
-                    block_to=self.latest_block,
-                )
+                    block_from=block_from,
+                    block_to=block_to,
+                ),
+                db_session=local_session,
+            )
             await local_session.commit()
         except Exception as e:
             await local_session.rollback()
@@ -122,10 +112,15 @@ class Processor:
             blockTo = int(await async_web3.eth.block_number)
             if blockTo == self.latest_block:
                 return
-            await self.__sync_all(
-                db_session=local_session,
+            await BlockRangePlanner(key=process_name).run(
                 block_from=self.latest_block + 1,
                 block_to=blockTo,
+                sync=lambda block_from, block_to: self.__sync_all(
+                    db_session=local_session,
+                    block_from=block_from,
+                    block_to=block_to,
+                ),
+                db_session=local_session,
             )
             self.latest_block = blockTo
             await local_session.commit()
@@ -161,6 +156,9 @@ class Processor:
             except ABIEventNotFound:
                 events = []
             try:
+                await block_timestamp_cache.get_many(
+                    event["blockNumber"] for event in events
+                )
                 for event in events:
                     args: Mapping[str, Any] = event["args"]
                     if args["price"] > sys.maxsize or args["amount"] > sys.maxsize:
@@ -174,11 +172,9 @@ class Processor:
                             )
                         ).first()
                         transaction_hash = event["transactionHash"].to_0x_hex()
-                        block_data: dict[str, Any] = dict(
-                            await async_web3.eth.get_block(event["blockNumber"])
-                        )
                         order_timestamp = datetime.fromtimestamp(
-                            block_data["timestamp"], UTC
+                            await block_timestamp_cache.get(event["blockNumber"]),
+                            UTC,
                         ).replace(tzinfo=None)
                         if available_token is not None:
                             account_address = args["accountAddress"]
@@ -257,6 +253,9 @@ class Processor:
             except ABIEventNotFound:
                 events = []
             try:
+                await block_timestamp_cache.get_many(
+                    event["blockNumber"] for event in events
+                )
                 for event in events:
                     args = event["args"]
                     if args["amount"] > sys.maxsize:
@@ -276,12 +275,9 @@ class Processor:
                         else:
                             counterpart_address = args["buyAddress"]
                         transaction_hash = event["transactionHash"].to_0x_hex()
-                        block_data = await async_web3.eth.get_block(
-                            event["blockNumber"]
-                        )
-                        assert "timestamp" in block_data
                         agreement_timestamp = datetime.fromtimestamp(
-                            block_data["timestamp"], UTC
+                            await block_timestamp_cache.get(event["blockNumber"]),
+                            UTC,
                         ).replace(tzinfo=None)
                         await self.__sink_on_agree(
                             db_session=db_session,
@@ -311,12 +307,14 @@ class Processor:
             except ABIEventNotFound:
                 events = []
             try:
+                await block_timestamp_cache.get_many(
+                    event["blockNumber"] for event in events
+                )
                 for event in events:
                     args = event["args"]
-                    block_data = await async_web3.eth.get_block(event["blockNumber"])
-                    assert "timestamp" in block_data
                     settlement_timestamp = datetime.fromtimestamp(
-                        block_data["timestamp"], UTC
+                        await block_timestamp_cache.get(event["blockNumber"]),
+                        UTC,
                     ).replace(tzinfo=None)
                     await self.__sink_on_settlement_ok(
                         db_session=db_session,
@@ -20,7 +20,7 @@ SPDX-License-Identifier: Apache-2.0
 import asyncio
 import sys
 from itertools import groupby
-from typing import List, Mapping, Optional, Sequence
+from typing import List, Mapping, Sequence
 
 from eth_utils.address import to_checksum_address
 from sqlalchemy import select
@@ -31,14 +31,18 @@ from web3.exceptions import ABIEventNotFound
 from web3.types import EventData
 
 from app.config import TOKEN_LIST_CONTRACT_ADDRESS, ZERO_ADDRESS
-from app.contracts import AsyncContract
+from app.contracts import AsyncContract, BulkBalanceReader
 from app.database import BatchAsyncSessionLocal
 from app.errors import ServiceUnavailable
-from app.model.db import IDXPosition, IDXPositionCouponBlockNumber, Listing
+from app.model.db import IDXPositionCouponBlockNumber, Listing
 from app.model.schema.base import TokenType
-from app.utils.asyncio_utils import SemaphoreTaskGroup
 from app.utils.web3_utils import AsyncWeb3Wrapper
 from batch import free_malloc, log
+from batch.lib.block_range import BlockRangePlanner
+from batch.lib.holder_snapshot import HolderSnapshot
+from batch.lib.log_scanner import EventLogScanner, ScannedLogs
+from batch.lib.position_cursor import PositionCursorBook
+from batch.lib.position_sink import PositionSink
 
 process_name = "INDEXER-POSITION-COUPON"
 LOG = log.get_logger(process_name=process_name)
@@ -140,6 +144,33 @@ class Processor:
         def __iter__(self):
             return iter(self.target_exchange_list)
 
+    # Events to be indexed
+    TOKEN_EVENTS = [
+        "Transfer",
+        "Consume",
+    ]
+    EXCHANGE_EVENTS = [
+        (
+            "IbetExchange",
+            [
+                "NewOrder",
+                "CancelOrder",
+                "ForceCancelOrder",
+                "Agree",
+                "SettlementOK",
+                "SettlementNG",
+            ],
+        ),
+        (
+            "IbetEscrow",
+            [
+                "EscrowCreated",
+                "EscrowCanceled",
+                "EscrowFinished",
+            ],
+        ),
+    ]
+
     # Index target
     token_list: TargetTokenList
     exchange_list: TargetExchangeList
@@ -152,6 +183,7 @@ class Processor:
     def __init__(self):
         self.token_list = self.TargetTokenList()
         self.exchange_list = self.TargetExchangeList()
+        self.cursor_book = PositionCursorBook(IDXPositionCouponBlockNumber)
 
     @staticmethod
     def __get_db_session():
@@ -161,27 +193,24 @@ class Processor:
         local_session = self.__get_db_session()
         try:
             await self.__get_contract_list(local_session)
-            # Synchronize 1,000,000 blocks each
+            # Synchronize in chunks of adaptive size
             # if some blocks have already synced, sync starting from next block
             latest_block = int(await async_web3.eth.block_number)
             _from_block = self.__get_oldest_cursor(self.token_list, latest_block)
-            _to_block = 999999 + _from_block
-            if latest_block > _to_block:
-                while _to_block < latest_block:
-                    await self.__sync_all(
-                        db_session=local_session,
-                        block_to=_to_block,
-                    )
-                    _to_block += 1000000
-                await self.__sync_all(db_session=local_session, block_to=latest_block)
-            else:
-                await self.__sync_all(db_session=local_session, block_to=latest_block)
+            await BlockRangePlanner(key=process_name).run(
+                block_from=_from_block,
+                block_to=latest_block,
+                sync=lambda _, block_to: self.__sync_all(
+                    db_session=local_session, block_to=block_to
+                ),
+            )
             await self.__set_idx_position_block_number(
                 local_session, self.token_list, latest_block
             )
             await local_session.commit()
         except Exception as e:
             await local_session.rollback()
+            self.cursor_book.invalidate()
             raise e
         finally:
             await local_session.close()
@@ -193,27 +222,24 @@ class Processor:
         local_session = self.__get_db_session()
         try:
             await self.__get_contract_list(local_session)
-            # Synchronize 1,000,000 blocks each
+            # Synchronize in chunks of adaptive size
             # if some blocks have already synced, sync starting from next block
             latest_block = int(await async_web3.eth.block_number)
             _from_block = self.__get_oldest_cursor(self.token_list, latest_block)
-            _to_block = 999999 + _from_block
-            if latest_block > _to_block:
-                while _to_block < latest_block:
-                    await self.__sync_all(
-                        db_session=local_session,
-                        block_to=_to_block,
-                    )
-                    _to_block += 1000000
-                await self.__sync_all(db_session=local_session, block_to=latest_block)
-            else:
-                await self.__sync_all(db_session=local_session, block_to=latest_block)
+            await BlockRangePlanner(key=process_name).run(
+                block_from=_from_block,
+                block_to=latest_block,
+                sync=lambda _, block_to: self.__sync_all(
+                    db_session=local_session, block_to=block_to
+                ),
+            )
             await self.__set_idx_position_block_number(
                 local_session, self.token_list, latest_block
             )
             await local_session.commit()
         except Exception as e:
             await local_session.rollback()
+            self.cursor_book.invalidate()
             raise e
         finally:
             await local_session.close()
@@ -230,6 +256,7 @@ class Processor:
         list_contract = AsyncContract.get_contract(
             contract_name="TokenList", address=TOKEN_LIST_CONTRACT_ADDRESS
         )
+        await self.cursor_book.load(db_session)
         listed_tokens: Sequence[Listing] = (
             await db_session.scalars(select(Listing))
         ).all()
@@ -280,8 +307,7 @@ class Processor:
                     listed_token.token_address
                 ]
 
-                synced_block_number = await self.__get_idx_position_block_number(
-                    db_session=db_session,
+                synced_block_number = self.cursor_book.get(
                     token_address=listed_token.token_address,
                     exchange_address=tradable_exchange_address,
                 )
@@ -292,15 +318,79 @@ class Processor:
                 if tradable_exchange_address != ZERO_ADDRESS:
                     self.exchange_list.append(tradable_exchange_address, block_from)
 
-    async def __sync_all(self, db_session: AsyncSession, block_to: int):
+    async def __sync_all(self, db_session: AsyncSession, block_to: int) -> int:
         LOG.info("Syncing to={}".format(block_to))
 
-        await self.__sync_transfer(db_session, block_to)
-        await self.__sync_consume(db_session, block_to)
-        await self.__sync_exchange(db_session, block_to)
-        await self.__sync_escrow(db_session, block_to)
+        logs = await self.__scan_logs(block_to)
+
+        await self.__sync_transfer(db_session, logs, block_to)
+        await self.__sync_consume(db_session, logs, block_to)
+        await self.__sync_exchange(db_session, logs, block_to)
+        await self.__sync_escrow(db_session, logs, block_to)
+
+        await self.__sync_holder_balance_delta(db_session, logs, block_to)
 
         self.__update_cursor(block_to + 1)
+        return len(logs)
+
+    async def __scan_logs(self, block_to: int) -> ScannedLogs:
+        """Fetch the events of all target contracts at once
+
+        :param block_to: To block
+        :return: scanned event logs
+        """
+        scanner = EventLogScanner()
+        for target in self.token_list:
+            if target.cursor > block_to:
+                continue
+            scanner.add_target(
+                contract=target.token_contract,
+                event_names=self.TOKEN_EVENTS,
+                from_block=target.cursor,
+            )
+            HolderSnapshot.add_scan_target(
+                scanner=scanner,
+                token_contract=target.token_contract,
+                exchange_address=target.exchange_address,
+                from_block=target.cursor,
+            )
+        for exchange in self.exchange_list:
+            if exchange.cursor > block_to:
+                continue
+            for contract_name, event_names in self.EXCHANGE_EVENTS:
+                scanner.add_target(
+                    contract=AsyncContract.get_contract(
+                        contract_name, exchange.exchange_address
+                    ),
+                    event_names=event_names,
+                    from_block=exchange.cursor,
+                )
+        try:
+            return await scanner.scan(block_to)
+        except ABIEventNotFound:
+            return ScannedLogs([])
+
+    async def __sync_holder_balance_delta(
+        self, db_session: AsyncSession, logs: ScannedLogs, block_to: int
+    ):
+        """Record balance changes for incremental token holder snapshots
+
+        :param db_session: ORM session
+        :param logs: scanned event logs
+        :param block_to: To block
+        :return: None
+        """
+        for target in self.token_list:
+            if target.cursor > block_to:
+                continue
+            await HolderSnapshot.sync(
+                db_session=db_session,
+                logs=logs,
+                token_address=target.token_contract.address,
+                exchange_address=target.exchange_address,
+                block_from=target.cursor,
+                block_to=block_to,
+            )
 
     def __update_cursor(self, block_number: int):
         """Memorize the block number where next processing should start from
@@ -315,10 +405,13 @@ class Processor:
             if block_number > exchange.start_block_number:
                 exchange.cursor = block_number
 
-    async def __sync_transfer(self, db_session: AsyncSession, block_to: int):
+    async def __sync_transfer(
+        self, db_session: AsyncSession, logs: ScannedLogs, block_to: int
+    ):
         """Sync Transfer Events
 
         :param db_session: ORM session
+        :param logs: scanned event logs
         :param block_to: To block
         :return: None
         """
@@ -327,12 +420,7 @@ class Processor:
             block_from = target.cursor
             if block_from > block_to:
                 continue
-            try:
-                events: list[EventData] = await token.events.Transfer.get_logs(
-                    from_block=block_from, to_block=block_to
-                )
-            except ABIEventNotFound:
-                events = []
+            events: list[EventData] = logs.get(token.address, "Transfer")
             try:
                 accounts_filtered = self.remove_duplicate_event_by_token_account_desc(
                     events=events, account_keys=["from", "to"]
@@ -355,28 +443,32 @@ class Processor:
                         exchange_address=target.exchange_address,
                         accounts=eoa_list,
                     )
+                    position_sink = PositionSink()
                     for balances in balances_list:
                         (
                             _account_address,
                             _balance,
                             _exchange_balance,
                         ) = balances
-                        await self.__sink_on_position(
-                            db_session=db_session,
+                        position_sink.append(
                             token_address=to_checksum_address(token.address),
                             account_address=_account_address,
                             balance=_balance,
                             exchange_balance=_exchange_balance,
                         )
+                    await position_sink.flush(db_session)
                     # Commit every 1000 EOAs for bulk transfer
                     await db_session.commit()
             except Exception as e:
                 raise e
 
-    async def __sync_consume(self, db_session: AsyncSession, block_to: int):
+    async def __sync_consume(
+        self, db_session: AsyncSession, logs: ScannedLogs, block_to: int
+    ):
         """Sync Consume Events
 
         :param db_session: ORM session
+        :param logs: scanned event logs
         :param block_to: To block
         :return: None
         """
@@ -385,12 +477,7 @@ class Processor:
             block_from = target.cursor
             if block_from > block_to:
                 continue
-            try:
-                events: list[EventData] = await token.events.Consume.get_logs(
-                    from_block=block_from, to_block=block_to
-                )
-            except ABIEventNotFound:
-                events = []
+            events: list[EventData] = logs.get(token.address, "Consume")
             try:
                 accounts_filtered = self.remove_duplicate_event_by_token_account_desc(
                     events=events, account_keys=["consumer"]
@@ -399,20 +486,24 @@ class Processor:
                     token=token,
                     accounts=accounts_filtered,
                 )
+                position_sink = PositionSink()
                 for account, balance in zip(accounts_filtered, balances_list):
-                    await self.__sink_on_position(
-                        db_session=db_session,
+                    position_sink.append(
                         token_address=to_checksum_address(token.address),
                         account_address=account,
                         balance=balance,
                     )
+                await position_sink.flush(db_session)
             except Exception as e:
                 raise e
 
-    async def __sync_exchange(self, db_session: AsyncSession, block_to: int):
+    async def __sync_exchange(
+        self, db_session: AsyncSession, logs: ScannedLogs, block_to: int
+    ):
         """Sync Events from IbetExchange
 
         :param db_session: ORM session
+        :param logs: scanned event logs
         :param block_to: To block
         :return: None
         """
@@ -422,21 +513,10 @@ class Processor:
                 continue
             exchange_address = exchange.exchange_address
             try:
-                exchange = AsyncContract.get_contract(
-                    contract_name="IbetExchange", address=exchange_address
-                )
-
                 account_list_tmp: list[dict[str, str]] = []
 
                 # NewOrder event
-                try:
-                    _event_list: list[
-                        EventData
-                    ] = await exchange.events.NewOrder.get_logs(
-                        from_block=block_from, to_block=block_to
-                    )
-                except ABIEventNotFound:
-                    _event_list = []
+                _event_list: list[EventData] = logs.get(exchange_address, "NewOrder")
                 for _event in _event_list:
                     event_block_number = _event.get("blockNumber", block_from)
                     token_cursor = self.token_list.get_cursor(
@@ -456,14 +536,7 @@ class Processor:
                     )
 
                 # CancelOrder event
-                try:
-                    _event_list: list[
-                        EventData
-                    ] = await exchange.events.CancelOrder.get_logs(
-                        from_block=block_from, to_block=block_to
-                    )
-                except ABIEventNotFound:
-                    _event_list = []
+                _event_list: list[EventData] = logs.get(exchange_address, "CancelOrder")
                 for _event in _event_list:
                     event_block_number = _event.get("blockNumber", block_from)
                     token_cursor = self.token_list.get_cursor(
@@ -483,14 +556,9 @@ class Processor:
                     )
 
                 # ForceCancelOrder event
-                try:
-                    _event_list: list[
-                        EventData
-                    ] = await exchange.events.ForceCancelOrder.get_logs(
-                        from_block=block_from, to_block=block_to
-                    )
-                except ABIEventNotFound:
-                    _event_list = []
+                _event_list: list[EventData] = logs.get(
+                    exchange_address, "ForceCancelOrder"
+                )
                 for _event in _event_list:
                     event_block_number = _event.get("blockNumber", block_from)
                     token_cursor = self.token_list.get_cursor(
@@ -510,12 +578,7 @@ class Processor:
                     )
 
                 # Agree event
-                try:
-                    _event_list: list[EventData] = await exchange.events.Agree.get_logs(
-                        from_block=block_from, to_block=block_to
-                    )
-                except ABIEventNotFound:
-                    _event_list = []
+                _event_list: list[EventData] = logs.get(exchange_address, "Agree")
                 for _event in _event_list:
                     event_block_number = _event.get("blockNumber", block_from)
                     token_cursor = self.token_list.get_cursor(
@@ -535,14 +598,9 @@ class Processor:
                     )
 
                 # SettlementOK event
-                try:
-                    _event_list: list[
-                        EventData
-                    ] = await exchange.events.SettlementOK.get_logs(
-                        from_block=block_from, to_block=block_to
-                    )
-                except ABIEventNotFound:
-                    _event_list = []
+                _event_list: list[EventData] = logs.get(
+                    exchange_address, "SettlementOK"
+                )
                 for _event in _event_list:
                     event_block_number = _event.get("blockNumber", block_from)
                     token_cursor = self.token_list.get_cursor(
@@ -572,14 +630,9 @@ class Processor:
                     )
 
                 # SettlementNG event
-                try:
-                    _event_list: list[
-                        EventData
-                    ] = await exchange.events.SettlementNG.get_logs(
-                        from_block=block_from, to_block=block_to
-                    )
-                except ABIEventNotFound:
-                    _event_list = []
+                _event_list: list[EventData] = logs.get(
+                    exchange_address, "SettlementNG"
+                )
                 for _event in _event_list:
                     event_block_number = _event.get("blockNumber", block_from)
                     token_cursor = self.token_list.get_cursor(
@@ -623,6 +676,7 @@ class Processor:
                     accounts=account_list,
                 )
                 # Update position
+                position_sink = PositionSink()
                 for balances in balances_list:
                     (
                         token_address,
@@ -630,20 +684,23 @@ class Processor:
                         exchange_balance,
                         exchange_commitment,
                     ) = balances
-                    await self.__sink_on_position(
-                        db_session=db_session,
+                    position_sink.append(
                         token_address=token_address,
                         account_address=account_address,
                         exchange_balance=exchange_balance,
                         exchange_commitment=exchange_commitment,
                     )
+                await position_sink.flush(db_session)
             except Exception as e:
                 raise e
 
-    async def __sync_escrow(self, db_session: AsyncSession, block_to: int):
+    async def __sync_escrow(
+        self, db_session: AsyncSession, logs: ScannedLogs, block_to: int
+    ):
         """Sync Events from IbetEscrow
 
         :param db_session: ORM session
+        :param logs: scanned event logs
         :param block_to: To block
         :return: None
         """
@@ -653,19 +710,12 @@ class Processor:
                 continue
             exchange_address = exchange.exchange_address
             try:
-                escrow = AsyncContract.get_contract("IbetEscrow", exchange_address)
-
                 account_list_tmp: list[dict[str, str]] = []
 
                 # EscrowCreated event
-                try:
-                    _event_list: list[
-                        EventData
-                    ] = await escrow.events.EscrowCreated.get_logs(
-                        from_block=block_from, to_block=block_to
-                    )
-                except ABIEventNotFound:
-                    _event_list = []
+                _event_list: list[EventData] = logs.get(
+                    exchange_address, "EscrowCreated"
+                )
                 for _event in _event_list:
                     event_block_number = _event.get("blockNumber", block_from)
                     token_cursor = self.token_list.get_cursor(
@@ -683,14 +733,9 @@ class Processor:
                     )
 
                 # EscrowCanceled event
-                try:
-                    _event_list: list[
-                        EventData
-                    ] = await escrow.events.EscrowCanceled.get_logs(
-                        from_block=block_from, to_block=block_to
-                    )
-                except ABIEventNotFound:
-                    _event_list = []
+                _event_list: list[EventData] = logs.get(
+                    exchange_address, "EscrowCanceled"
+                )
                 for _event in _event_list:
                     event_block_number = _event.get("blockNumber", block_from)
                     token_cursor = self.token_list.get_cursor(
@@ -708,14 +753,9 @@ class Processor:
                     )
 
                 # EscrowFinished event
-                try:
-                    _event_list: list[
-                        EventData
-                    ] = await escrow.events.EscrowFinished.get_logs(
-                        from_block=block_from, to_block=block_to
-                    )
-                except ABIEventNotFound:
-                    _event_list = []
+                _event_list: list[EventData] = logs.get(
+                    exchange_address, "EscrowFinished"
+                )
                 for _event in _event_list:
                     event_block_number = _event.get("blockNumber", block_from)
                     token_cursor = self.token_list.get_cursor(
@@ -765,6 +805,7 @@ class Processor:
                     accounts=account_list,
                 )
                 # Update position
+                position_sink = PositionSink()
                 for balances in balances_list:
                     (
                         token_address,
@@ -772,13 +813,13 @@ class Processor:
                         exchange_balance,
                         exchange_commitment,
                     ) = balances
-                    await self.__sink_on_position(
-                        db_session=db_session,
+                    position_sink.append(
                         token_address=token_address,
                         account_address=account_address,
                         exchange_balance=exchange_balance,
                         exchange_commitment=exchange_commitment,
                     )
+                await position_sink.flush(db_session)
             except Exception as e:
                 raise e
 
@@ -793,201 +834,26 @@ class Processor:
                 oldest_block_number = target_token.cursor
         return oldest_block_number
 
-    @staticmethod
-    async def __get_idx_position_block_number(
-        db_session: AsyncSession, token_address: str, exchange_address: str
-    ) -> int:
-        """Get position index for Bond"""
-        _idx_position_block_number = (
-            await db_session.scalars(
-                select(IDXPositionCouponBlockNumber)
-                .where(IDXPositionCouponBlockNumber.token_address == token_address)
-                .where(
-                    IDXPositionCouponBlockNumber.exchange_address == exchange_address
-                )
-                .limit(1)
-            )
-        ).first()
-        if _idx_position_block_number is None:
-            return -1
-        else:
-            assert _idx_position_block_number.latest_block_number is not None
-            return _idx_position_block_number.latest_block_number
-
-    @staticmethod
     async def __set_idx_position_block_number(
-        db_session: AsyncSession, target_token_list: TargetTokenList, block_number: int
+        self,
+        db_session: AsyncSession,
+        target_token_list: TargetTokenList,
+        block_number: int,
     ):
         """Set position index for Bond"""
-        for target_token in target_token_list:
-            _idx_position_block_number = (
-                await db_session.scalars(
-                    select(IDXPositionCouponBlockNumber)
-                    .where(
-                        IDXPositionCouponBlockNumber.token_address
-                        == target_token.token_contract.address
-                    )
-                    .where(
-                        IDXPositionCouponBlockNumber.exchange_address
-                        == target_token.exchange_address
-                    )
-                    .limit(1)
-                )
-            ).first()
-            if _idx_position_block_number is None:
-                _idx_position_block_number = IDXPositionCouponBlockNumber()
-            _idx_position_block_number.latest_block_number = block_number
-            _idx_position_block_number.token_address = (
-                target_token.token_contract.address
-            )
-            _idx_position_block_number.exchange_address = target_token.exchange_address
-            await db_session.merge(_idx_position_block_number)
-
-    @staticmethod
-    async def __get_account_balance_for_transfer(
-        token_contract: Web3AsyncContract, exchange_address: str, account_address: str
-    ) -> tuple[str, int, int]:
-        """Get balance"""
-        try:
-
-            async def return_zero():
-                return 0
-
-            tasks = await SemaphoreTaskGroup.run(
-                AsyncContract.call_function(
-                    contract=token_contract,
-                    function_name="balanceOf",
-                    args=(account_address,),
-                    default_returns=0,
-                ),
-                AsyncContract.call_function(
-                    contract=AsyncContract.get_contract(
-                        "IbetExchangeInterface", exchange_address
-                    ),
-                    function_name="balanceOf",
-                    args=(
-                        account_address,
-                        token_contract.address,
-                    ),
-                    default_returns=0,
-                )
-                if exchange_address != ZERO_ADDRESS
-                else return_zero(),
-                max_concurrency=3,
-            )
-            balance, exchange_balance = (
-                tasks[0].result(),
-                tasks[1].result(),
-            )
-        except ExceptionGroup:
-            raise ServiceUnavailable
-
-        return (
-            account_address,
-            balance,
-            exchange_balance,
+        await self.cursor_book.save(
+            db_session=db_session,
+            keys=[
+                (target_token.token_contract.address, target_token.exchange_address)
+                for target_token in target_token_list
+            ],
+            block_number=block_number,
         )
-
-    @staticmethod
-    async def __get_account_balance_token(
-        token_contract: Web3AsyncContract, account_address: str
-    ) -> int:
-        """Get balance on token"""
-        balance = await AsyncContract.call_function(
-            contract=token_contract,
-            function_name="balanceOf",
-            args=(account_address,),
-            default_returns=0,
+        LOG.debug(
+            f"Cursor write metrics: statements={self.cursor_book.write_count}, "
+            f"written={self.cursor_book.written_rows}, "
+            f"skipped={self.cursor_book.skipped_rows}"
         )
-        return balance
-
-    @staticmethod
-    async def __get_account_balance_exchange(
-        exchange_address: str, token_address: str, account_address: str
-    ) -> tuple[str, str, int, int]:
-        """Get balance on exchange"""
-        exchange_contract = AsyncContract.get_contract(
-            contract_name="IbetExchangeInterface", address=exchange_address
-        )
-        try:
-            tasks = await SemaphoreTaskGroup.run(
-                AsyncContract.call_function(
-                    contract=exchange_contract,
-                    function_name="balanceOf",
-                    args=(
-                        account_address,
-                        token_address,
-                    ),
-                    default_returns=0,
-                ),
-                AsyncContract.call_function(
-                    contract=exchange_contract,
-                    function_name="commitmentOf",
-                    args=(
-                        account_address,
-                        token_address,
-                    ),
-                    default_returns=0,
-                ),
-                max_concurrency=3,
-            )
-            exchange_balance, exchange_commitment = (
-                tasks[0].result(),
-                tasks[1].result(),
-            )
-        except ExceptionGroup:
-            raise ServiceUnavailable
-        return token_address, account_address, exchange_balance, exchange_commitment
-
-    @staticmethod
-    async def __sink_on_position(
-        db_session: AsyncSession,
-        token_address: str,
-        account_address: str,
-        balance: Optional[int] = None,
-        exchange_balance: Optional[int] = None,
-        exchange_commitment: Optional[int] = None,
-    ):
-        """Update Position data in DB
-
-        :param db_session: ORM session
-        :param token_address: token address
-        :param account_address: account address
-        :param balance: updated balance
-        :param exchange_balance: balance on exchange
-        :param exchange_commitment: commitment volume on exchange
-        :return: None
-        """
-        position = (
-            await db_session.scalars(
-                select(IDXPosition)
-                .where(IDXPosition.token_address == token_address)
-                .where(IDXPosition.account_address == account_address)
-                .limit(1)
-            )
-        ).first()
-        if position is not None:
-            if balance is not None:
-                position.balance = balance
-            if exchange_balance is not None:
-                position.exchange_balance = exchange_balance
-            if exchange_commitment is not None:
-                position.exchange_commitment = exchange_commitment
-            await db_session.merge(position)
-        elif any(
-            value is not None
-            for value in [balance, exchange_balance, exchange_commitment]
-        ):
-            LOG.debug(
-                f"Position created (Coupon): token_address={token_address}, account_address={account_address}"
-            )
-            position = IDXPosition()
-            position.token_address = token_address
-            position.account_address = account_address
-            position.balance = balance or 0
-            position.exchange_balance = exchange_balance or 0
-            position.exchange_commitment = exchange_commitment or 0
-            db_session.add(position)
 
     @staticmethod
     def remove_duplicate_event_by_token_account_desc(
@@ -1023,51 +889,41 @@ class Processor:
     async def get_bulk_account_balance_for_transfer(
         self, token: Web3AsyncContract, exchange_address: str, accounts: Sequence[str]
     ) -> list[tuple[str, int, int]]:
-        coroutines = [
-            self.__get_account_balance_for_transfer(token, exchange_address, _account)
-            for _account in accounts
-        ]
-        if not coroutines:
-            return []
-
-        try:
-            tasks = await SemaphoreTaskGroup.run(*coroutines, max_concurrency=5)
-            return [task.result() for task in tasks]
-        except ExceptionGroup:
-            raise ServiceUnavailable
+        balances = await BulkBalanceReader.get_token_balances(
+            token_contract=token,
+            account_addresses=accounts,
+            exchange_address=exchange_address,
+            pending_transfer=False,
+        )
+        return [(b.account_address, b.balance, b.exchange_balance) for b in balances]
 
     async def get_bulk_account_balance_token(
         self, token: Web3AsyncContract, accounts: Sequence[str]
     ) -> list[int]:
-        coroutines = [
-            self.__get_account_balance_token(token, _account) for _account in accounts
-        ]
-        if not coroutines:
-            return []
-
-        try:
-            tasks = await SemaphoreTaskGroup.run(*coroutines, max_concurrency=5)
-            return [task.result() for task in tasks]
-        except ExceptionGroup:
-            raise ServiceUnavailable
+        balances = await BulkBalanceReader.get_token_balances(
+            token_contract=token, account_addresses=accounts, pending_transfer=False
+        )
+        return [b.balance for b in balances]
 
     async def get_bulk_account_balance_exchange(
         self, exchange_address: str, accounts: Sequence[Mapping[str, str]]
     ) -> list[tuple[str, str, int, int]]:
-        coroutines = [
-            self.__get_account_balance_exchange(
-                exchange_address, _account["token_address"], _account["account_address"]
+        balances = await BulkBalanceReader.get_exchange_balances(
+            exchange_address=exchange_address,
+            positions=[
+                (_account["token_address"], _account["account_address"])
+                for _account in accounts
+            ],
+        )
+        return [
+            (
+                b.token_address,
+                b.account_address,
+                b.exchange_balance,
+                b.exchange_commitment,
             )
-            for _account in accounts
+            for b in balances
         ]
-        if not coroutines:
-            return []
-
-        try:
-            tasks = await SemaphoreTaskGroup.run(*coroutines, max_concurrency=5)
-            return [task.result() for task in tasks]
-        except ExceptionGroup:
-            raise ServiceUnavailable
 
 
 async def main():
@@ -22,7 +22,7 @@ import json
 import sys
 from datetime import datetime, timedelta, timezone
 from itertools import groupby
-from typing import List, Mapping, Optional, Sequence
+from typing import List, Mapping, Sequence
 
 from eth_utils.address import to_checksum_address
 from sqlalchemy import select
@@ -32,14 +32,17 @@ from web3.contract import AsyncContract as Web3AsyncContract
 from web3.exceptions import ABIEventNotFound
 from web3.types import EventData
 
-from app.config import TOKEN_LIST_CONTRACT_ADDRESS, ZERO_ADDRESS
-from app.contracts import AsyncContract
+from app.config import (
+    POSITION_SYNC_TOKEN_CONCURRENCY,
+    TOKEN_LIST_CONTRACT_ADDRESS,
+    ZERO_ADDRESS,
+)
+from app.contracts import AsyncContract, BulkBalanceReader
 from app.database import BatchAsyncSessionLocal
 from app.errors import ServiceUnavailable
 from app.model.db import (
     IDXLock,
     IDXLockedPosition,
-    IDXPosition,
     IDXPositionShareBlockNumber,
     IDXUnlock,
     Listing,
@@ -47,9 +50,15 @@ from app.model.db import (
     UnlockDataMessage,
 )
 from app.model.schema.base import TokenType
-from app.utils.asyncio_utils import SemaphoreTaskGroup
+from app.utils.block_utils import block_timestamp_cache
 from app.utils.web3_utils import AsyncWeb3Wrapper
 from batch import free_malloc, log
+from batch.lib.block_range import BlockRangePlanner
+from batch.lib.holder_snapshot import HolderSnapshot
+from batch.lib.log_scanner import EventLogScanner, ScannedLogs
+from batch.lib.position_cursor import PositionCursorBook
+from batch.lib.position_sink import PositionSink
+from batch.lib.token_fan_out import TokenFanOut
 
 UTC = timezone(timedelta(hours=0), "UTC")
 
@@ -153,6 +162,51 @@ class Processor:
         def __iter__(self):
             return iter(self.target_exchange_list)
 
+    # Events to be indexed
+    TOKEN_EVENTS = [
+        "Transfer",
+        "Lock",
+        "ForceLock",
+        "Unlock",
+        "ForceUnlock",
+        "ForceChangeLockedAccount",
+        "Issue",
+        "Redeem",
+        "ApplyForTransfer",
+        "CancelTransfer",
+        "ApproveTransfer",
+    ]
+    EXCHANGE_EVENTS = [
+        (
+            "IbetExchange",
+            [
+                "NewOrder",
+                "CancelOrder",
+                "ForceCancelOrder",
+                "Agree",
+                "SettlementOK",
+                "SettlementNG",
+            ],
+        ),
+        (
+            "IbetSecurityTokenEscrow",
+            [
+                "EscrowCreated",
+                "EscrowCanceled",
+                "HolderChanged",
+            ],
+        ),
+        (
+            "IbetSecurityTokenDVP",
+            [
+                "DeliveryCreated",
+                "DeliveryCanceled",
+                "DeliveryAborted",
+                "HolderChanged",
+            ],
+        ),
+    ]
+
     # Index target
     token_list: TargetTokenList
     exchange_list: TargetExchangeList
@@ -165,6 +219,11 @@ class Processor:
     def __init__(self):
         self.token_list = self.TargetTokenList()
         self.exchange_list = self.TargetExchangeList()
+        self.cursor_book = PositionCursorBook(IDXPositionShareBlockNumber)
+        self.token_fan_out = TokenFanOut[Processor.TargetTokenList.TargetToken](
+            max_concurrency=POSITION_SYNC_TOKEN_CONCURRENCY,
+            key=lambda target: target.token_contract.address,
+        )
 
     @staticmethod
     def __get_db_session():
@@ -174,27 +233,24 @@ class Processor:
         local_session = self.__get_db_session()
         try:
             await self.__get_contract_list(local_session)
-            # Synchronize 1,000,000 blocks each
+            # Synchronize in chunks of adaptive size
             # if some blocks have already synced, sync starting from next block
             latest_block = int(await async_web3.eth.block_number)
             _from_block = self.__get_oldest_cursor(self.token_list, latest_block)
-            _to_block = 999999 + _from_block
-            if latest_block > _to_block:
-                while _to_block < latest_block:
-                    await self.__sync_all(
-                        db_session=local_session,
-                        block_to=_to_block,
-                    )
-                    _to_block += 1000000
-                await self.__sync_all(db_session=local_session, block_to=latest_block)
-            else:
-                await self.__sync_all(db_session=local_session, block_to=latest_block)
+            await BlockRangePlanner(key=process_name).run(
+                block_from=_from_block,
+                block_to=latest_block,
+                sync=lambda _, block_to: self.__sync_all(
+                    db_session=local_session, block_to=block_to
+                ),
+            )
             await self.__set_idx_position_block_number(
                 local_session, self.token_list, latest_block
             )
             await local_session.commit()
         except Exception as e:
             await local_session.rollback()
+            self.cursor_book.invalidate()
             raise e
         finally:
             await local_session.close()
@@ -206,27 +262,24 @@ class Processor:
         local_session = self.__get_db_session()
         try:
             await self.__get_contract_list(local_session)
-            # Synchronize 1,000,000 blocks each
+            # Synchronize in chunks of adaptive size
             # if some blocks have already synced, sync starting from next block
             latest_block = int(await async_web3.eth.block_number)
             _from_block = self.__get_oldest_cursor(self.token_list, latest_block)
-            _to_block = 999999 + _from_block
-            if latest_block > _to_block:
-                while _to_block < latest_block:
-                    await self.__sync_all(
-                        db_session=local_session,
-                        block_to=_to_block,
-                    )
-                    _to_block += 1000000
-                await self.__sync_all(db_session=local_session, block_to=latest_block)
-            else:
-                await self.__sync_all(db_session=local_session, block_to=latest_block)
+            await BlockRangePlanner(key=process_name).run(
+                block_from=_from_block,
+                block_to=latest_block,
+                sync=lambda _, block_to: self.__sync_all(
+                    db_session=local_session, block_to=block_to
+                ),
+            )
             await self.__set_idx_position_block_number(
                 local_session, self.token_list, latest_block
             )
             await local_session.commit()
         except Exception as e:
             await local_session.rollback()
+            self.cursor_book.invalidate()
             raise e
         finally:
             await local_session.close()
@@ -243,6 +296,7 @@ class Processor:
         list_contract = AsyncContract.get_contract(
             contract_name="TokenList", address=TOKEN_LIST_CONTRACT_ADDRESS
         )
+        await self.cursor_book.load(db_session)
         listed_tokens: Sequence[Listing] = (
             await db_session.scalars(select(Listing))
         ).all()
@@ -293,8 +347,7 @@ class Processor:
                     listed_token.token_address
                 ]
 
-                synced_block_number = await self.__get_idx_position_block_number(
-                    db_session=db_session,
+                synced_block_number = self.cursor_book.get(
                     token_address=listed_token.token_address,
                     exchange_address=tradable_exchange_address,
                 )
@@ -305,25 +358,97 @@ class Processor:
                 if tradable_exchange_address != ZERO_ADDRESS:
                     self.exchange_list.append(tradable_exchange_address, block_from)
 
-    async def __sync_all(self, db_session: AsyncSession, block_to: int):
+    async def __sync_all(self, db_session: AsyncSession, block_to: int) -> int:
         LOG.info("Syncing to={}".format(block_to))
-
-        await self.__sync_transfer(db_session, block_to)
-        await self.__sync_lock(db_session, block_to)
-        await self.__sync_force_lock(db_session, block_to)
-        await self.__sync_unlock(db_session, block_to)
-        await self.__sync_force_unlock(db_session, block_to)
-        await self.__sync_force_change_locked_account(db_session, block_to)
-        await self.__sync_issue(db_session, block_to)
-        await self.__sync_redeem(db_session, block_to)
-        await self.__sync_apply_for_transfer(db_session, block_to)
-        await self.__sync_cancel_transfer(db_session, block_to)
-        await self.__sync_approve_transfer(db_session, block_to)
-        await self.__sync_exchange(db_session, block_to)
-        await self.__sync_escrow(db_session, block_to)
-        await self.__sync_dvp(db_session, block_to)
+        self.token_fan_out.reset()
+
+        logs = await self.__scan_logs(block_to)
+
+        await self.__sync_transfer(db_session, logs, block_to)
+        await self.__sync_lock(db_session, logs, block_to)
+        await self.__sync_force_lock(db_session, logs, block_to)
+        await self.__sync_unlock(db_session, logs, block_to)
+        await self.__sync_force_unlock(db_session, logs, block_to)
+        await self.__sync_force_change_locked_account(db_session, logs, block_to)
+        await self.__sync_issue(db_session, logs, block_to)
+        await self.__sync_redeem(db_session, logs, block_to)
+        await self.__sync_apply_for_transfer(db_session, logs, block_to)
+        await self.__sync_cancel_transfer(db_session, logs, block_to)
+        await self.__sync_approve_transfer(db_session, logs, block_to)
+        await self.__sync_exchange(db_session, logs, block_to)
+        await self.__sync_escrow(db_session, logs, block_to)
+        await self.__sync_dvp(db_session, logs, block_to)
+
+        await self.__sync_holder_balance_delta(db_session, logs, block_to)
+
+        slowest = self.token_fan_out.slowest(3)
+        if len(slowest) > 0:
+            LOG.info(
+                "Token read lags: "
+                + ", ".join(f"{address}={lag:.3f}s" for address, lag in slowest)
+            )
 
         self.__update_cursor(block_to + 1)
+        return len(logs)
+
+    async def __scan_logs(self, block_to: int) -> ScannedLogs:
+        """Fetch the events of all target contracts at once
+
+        :param block_to: To block
+        :return: scanned event logs
+        """
+        scanner = EventLogScanner()
+        for target in self.token_list:
+            if target.cursor > block_to:
+                continue
+            scanner.add_target(
+                contract=target.token_contract,
+                event_names=self.TOKEN_EVENTS,
+                from_block=target.cursor,
+            )
+            HolderSnapshot.add_scan_target(
+                scanner=scanner,
+                token_contract=target.token_contract,
+                exchange_address=target.exchange_address,
+                from_block=target.cursor,
+            )
+        for exchange in self.exchange_list:
+            if exchange.cursor > block_to:
+                continue
+            for contract_name, event_names in self.EXCHANGE_EVENTS:
+                scanner.add_target(
+                    contract=AsyncContract.get_contract(
+                        contract_name, exchange.exchange_address
+                    ),
+                    event_names=event_names,
+                    from_block=exchange.cursor,
+                )
+        try:
+            return await scanner.scan(block_to)
+        except ABIEventNotFound:
+            return ScannedLogs([])
+
+    async def __sync_holder_balance_delta(
+        self, db_session: AsyncSession, logs: ScannedLogs, block_to: int
+    ):
+        """Record balance changes for incremental token holder snapshots
+
+        :param db_session: ORM session
+        :param logs: scanned event logs
+        :param block_to: To block
+        :return: None
+        """
+        for target in self.token_list:
+            if target.cursor > block_to:
+                continue
+            await HolderSnapshot.sync(
+                db_session=db_session,
+                logs=logs,
+                token_address=target.token_contract.address,
+                exchange_address=target.exchange_address,
+                block_from=target.cursor,
+                block_to=block_to,
+            )
 
     def __update_cursor(self, block_number: int):
         """Memorize the block number where next processing should start from
@@ -338,70 +463,127 @@ class Processor:
             if block_number > exchange.start_block_number:
                 exchange.cursor = block_number
 
-    async def __sync_transfer(self, db_session: AsyncSession, block_to: int):
-        """Sync Transfer Events
+    def __sync_targets(
+        self, block_to: int
+    ) -> list["Processor.TargetTokenList.TargetToken"]:
+        """Get the target tokens to be synchronized up to block_to"""
+        return [target for target in self.token_list if target.cursor <= block_to]
+
+    async def __sync_token_balances(
+        self,
+        db_session: AsyncSession,
+        logs: ScannedLogs,
+        block_to: int,
+        event_name: str,
+        account_keys: Sequence[str],
+    ):
+        """Sync the balances of the accounts in the events of each token
+
+        The balances of several tokens are read concurrently,
+        and the positions are written in the order of the token list.
 
         :param db_session: ORM session
+        :param logs: scanned event logs
         :param block_to: To block
+        :param event_name: event name
+        :param account_keys: keys in which event contains account address
         :return: None
         """
-        for target in self.token_list:
-            token = target.token_contract
-            block_from = target.cursor
-            if block_from > block_to:
-                continue
-            try:
-                events: list[EventData] = await token.events.Transfer.get_logs(
-                    from_block=block_from, to_block=block_to
+
+        async def read(
+            target: Processor.TargetTokenList.TargetToken,
+        ) -> list[tuple[str, int, int]]:
+            accounts_filtered = self.remove_duplicate_event_by_token_account_desc(
+                events=logs.get(target.token_contract.address, event_name),
+                account_keys=account_keys,
+            )
+            return await self.get_bulk_account_balance_token(
+                token=target.token_contract, accounts=accounts_filtered
+            )
+
+        async def write(
+            target: Processor.TargetTokenList.TargetToken,
+            balances_list: list[tuple[str, int, int]],
+        ):
+            position_sink = PositionSink()
+            for balances in balances_list:
+                (account, balance, pending_transfer) = balances
+                position_sink.append(
+                    token_address=to_checksum_address(target.token_contract.address),
+                    account_address=account,
+                    balance=balance,
+                    pending_transfer=pending_transfer,
                 )
-            except ABIEventNotFound:
-                events = []
-            try:
-                accounts_filtered = self.remove_duplicate_event_by_token_account_desc(
-                    events=events, account_keys=["from", "to"]
+            await position_sink.flush(db_session)
+
+        await self.token_fan_out.run(self.__sync_targets(block_to), read, write)
+
+    async def __sync_transfer(
+        self, db_session: AsyncSession, logs: ScannedLogs, block_to: int
+    ):
+        """Sync Transfer Events
+
+        :param db_session: ORM session
+        :param logs: scanned event logs
+        :param block_to: To block
+        :return: None
+        """
+
+        async def read(
+            target: Processor.TargetTokenList.TargetToken,
+        ) -> list[list[tuple[str, int, int, int]]]:
+            accounts_filtered = self.remove_duplicate_event_by_token_account_desc(
+                events=logs.get(target.token_contract.address, "Transfer"),
+                account_keys=["from", "to"],
+            )
+            all_eoa_list = [
+                _account
+                for _account in accounts_filtered
+                if _account != target.exchange_address
+            ]
+            return [
+                await self.get_bulk_account_balance_for_transfer(
+                    token=target.token_contract,
+                    exchange_address=target.exchange_address,
+                    accounts=all_eoa_list[i : i + 1000],
                 )
-                if len(accounts_filtered) == 0:
-                    continue
+                for i in range(0, len(all_eoa_list), 1000)
+            ]
 
-                all_eoa_list = [
-                    _account
-                    for _account in accounts_filtered
-                    if _account != target.exchange_address
-                ]
-                chunked_eoa_list: list[list[str]] = [
-                    all_eoa_list[i : i + 1000]
-                    for i in range(0, len(all_eoa_list), 1000)
-                ]
-                for eoa_list in chunked_eoa_list:
-                    balances_list = await self.get_bulk_account_balance_for_transfer(
-                        token=token,
-                        exchange_address=target.exchange_address,
-                        accounts=eoa_list,
+        async def write(
+            target: Processor.TargetTokenList.TargetToken,
+            chunked_balances_list: list[list[tuple[str, int, int, int]]],
+        ):
+            token_address = to_checksum_address(target.token_contract.address)
+            for balances_list in chunked_balances_list:
+                position_sink = PositionSink()
+                for balances in balances_list:
+                    (
+                        _account_address,
+                        _balance,
+                        _pending_transfer,
+                        _exchange_balance,
+                    ) = balances
+                    position_sink.append(
+                        token_address=token_address,
+                        account_address=_account_address,
+                        balance=_balance,
+                        pending_transfer=_pending_transfer,
+                        exchange_balance=_exchange_balance,
                     )
-                    for balances in balances_list:
-                        (
-                            _account_address,
-                            _balance,
-                            _pending_transfer,
-                            _exchange_balance,
-                        ) = balances
-                        await self.__sink_on_position(
-                            db_session=db_session,
-                            token_address=to_checksum_address(token.address),
-                            account_address=_account_address,
-                            balance=_balance,
-                            pending_transfer=_pending_transfer,
-                            exchange_balance=_exchange_balance,
-                        )
-                    # Commit every 1000 EOAs for bulk transfer
-                    await db_session.commit()
-            except Exception as e:
-                raise e
+                await position_sink.flush(db_session)
+                # Commit every 1000 EOAs for bulk transfer
+                await db_session.commit()
+
+        await self.token_fan_out.run(self.__sync_targets(block_to), read, write)
 
-    async def __sync_lock(self, db_session: AsyncSession, block_to: int):
+    async def __sync_lock(
+        self, db_session: AsyncSession, logs: ScannedLogs, block_to: int
+    ):
         """Sync Lock Events
 
         :param db_session: ORM session
+        :param logs: scanned event logs
         :param block_to: To block
         :return: None
         """
@@ -410,12 +592,7 @@ class Processor:
             block_from = target.cursor
             if block_from > block_to:
                 continue
-            try:
-                events: list[EventData] = await token.events.Lock.get_logs(
-                    from_block=block_from, to_block=block_to
-                )
-            except ABIEventNotFound:
-                events = []
+            events: list[EventData] = logs.get(token.address, "Lock")
             try:
                 lock_map: dict[str, dict[str, bool]] = {}
                 for event in events:
@@ -463,30 +640,18 @@ class Processor:
                         )
             except Exception:
                 pass
-            try:
-                accounts_filtered = self.remove_duplicate_event_by_token_account_desc(
-                    events=events, account_keys=["accountAddress"]
-                )
-                balances_list = await self.get_bulk_account_balance_token(
-                    token=token,
-                    accounts=accounts_filtered,
-                )
-                for balances in balances_list:
-                    (account, balance, pending_transfer) = balances
-                    await self.__sink_on_position(
-                        db_session=db_session,
-                        token_address=to_checksum_address(token.address),
-                        account_address=account,
-                        balance=balance,
-                        pending_transfer=pending_transfer,
-                    )
-            except Exception as e:
-                raise e
 
-    async def __sync_force_lock(self, db_session: AsyncSession, block_to: int):
+        await self.__sync_token_balances(
+            db_session, logs, block_to, "Lock", ["accountAddress"]
+        )
+
+    async def __sync_force_lock(
+        self, db_session: AsyncSession, logs: ScannedLogs, block_to: int
+    ):
         """Sync Force Lock Events
 
         :param db_session: ORM session
+        :param logs: scanned event logs
         :param block_to: To block
         :return: None
         """
@@ -495,12 +660,7 @@ class Processor:
             block_from = target.cursor
             if block_from > block_to:
                 continue
-            try:
-                events: list[EventData] = await token.events.ForceLock.get_logs(
-                    from_block=block_from, to_block=block_to
-                )
-            except ABIEventNotFound:
-                events = []
+            events: list[EventData] = logs.get(token.address, "ForceLock")
             try:
                 lock_map: dict[str, dict[str, bool]] = {}
                 for event in events:
@@ -549,30 +709,18 @@ class Processor:
                         )
             except Exception:
                 pass
-            try:
-                accounts_filtered = self.remove_duplicate_event_by_token_account_desc(
-                    events=events, account_keys=["accountAddress"]
-                )
-                balances_list = await self.get_bulk_account_balance_token(
-                    token=token,
-                    accounts=accounts_filtered,
-                )
-                for balances in balances_list:
-                    (account, balance, pending_transfer) = balances
-                    await self.__sink_on_position(
-                        db_session=db_session,
-                        token_address=to_checksum_address(token.address),
-                        account_address=account,
-                        balance=balance,
-                        pending_transfer=pending_transfer,
-                    )
-            except Exception as e:
-                raise e
 
-    async def __sync_unlock(self, db_session: AsyncSession, block_to: int):
+        await self.__sync_token_balances(
+            db_session, logs, block_to, "ForceLock", ["accountAddress"]
+        )
+
+    async def __sync_unlock(
+        self, db_session: AsyncSession, logs: ScannedLogs, block_to: int
+    ):
         """Sync Unlock Events
 
         :param db_session: ORM session
+        :param logs: scanned event logs
         :param block_to: To block
         :return: None
         """
@@ -581,12 +729,7 @@ class Processor:
             block_from = target.cursor
             if block_from > block_to:
                 continue
-            try:
-                events: list[EventData] = await token.events.Unlock.get_logs(
-                    from_block=block_from, to_block=block_to
-                )
-            except ABIEventNotFound:
-                events = []
+            events: list[EventData] = logs.get(token.address, "Unlock")
             try:
                 lock_map: dict[str, dict[str, bool]] = {}
                 for event in events:
@@ -636,30 +779,18 @@ class Processor:
                         )
             except Exception:
                 pass
-            try:
-                accounts_filtered = self.remove_duplicate_event_by_token_account_desc(
-                    events=events, account_keys=["recipientAddress"]
-                )
-                balances_list = await self.get_bulk_account_balance_token(
-                    token=token,
-                    accounts=accounts_filtered,
-                )
-                for balances in balances_list:
-                    (account, balance, pending_transfer) = balances
-                    await self.__sink_on_position(
-                        db_session=db_session,
-                        token_address=to_checksum_address(token.address),
-                        account_address=account,
-                        balance=balance,
-                        pending_transfer=pending_transfer,
-                    )
-            except Exception as e:
-                raise e
 
-    async def __sync_force_unlock(self, db_session: AsyncSession, block_to: int):
+        await self.__sync_token_balances(
+            db_session, logs, block_to, "Unlock", ["recipientAddress"]
+        )
+
+    async def __sync_force_unlock(
+        self, db_session: AsyncSession, logs: ScannedLogs, block_to: int
+    ):
         """Sync ForceUnlock Events
 
         :param db_session: ORM session
+        :param logs: scanned event logs
         :param block_to: To block
         :return: None
         """
@@ -668,12 +799,7 @@ class Processor:
             block_from = target.cursor
             if block_from > block_to:
                 continue
-            try:
-                events: list[EventData] = await token.events.ForceUnlock.get_logs(
-                    from_block=block_from, to_block=block_to
-                )
-            except ABIEventNotFound:
-                events = []
+            events: list[EventData] = logs.get(token.address, "ForceUnlock")
             try:
                 lock_map: dict[str, dict[str, bool]] = {}
                 for event in events:
@@ -724,32 +850,18 @@ class Processor:
                         )
             except Exception:
                 pass
-            try:
-                accounts_filtered = self.remove_duplicate_event_by_token_account_desc(
-                    events=events, account_keys=["recipientAddress"]
-                )
-                balances_list = await self.get_bulk_account_balance_token(
-                    token=token,
-                    accounts=accounts_filtered,
-                )
-                for balances in balances_list:
-                    (account, balance, pending_transfer) = balances
-                    await self.__sink_on_position(
-                        db_session=db_session,
-                        token_address=to_checksum_address(token.address),
-                        account_address=account,
-                        balance=balance,
-                        pending_transfer=pending_transfer,
-                    )
-            except Exception as e:
-                raise e
+
+        await self.__sync_token_balances(
+            db_session, logs, block_to, "ForceUnlock", ["recipientAddress"]
+        )
 
     async def __sync_force_change_locked_account(
-        self, db_session: AsyncSession, block_to: int
+        self, db_session: AsyncSession, logs: ScannedLogs, block_to: int
     ):
         """Sync ForceChangeLockedAccount Events
 
         :param db_session: ORM session
+        :param logs: scanned event logs
         :param block_to: To block
         :return: None
         """
@@ -758,14 +870,9 @@ class Processor:
             block_from = target.cursor
             if block_from > block_to:
                 continue
-            try:
-                events: list[
-                    EventData
-                ] = await token.events.ForceChangeLockedAccount.get_logs(
-                    from_block=block_from, to_block=block_to
-                )
-            except ABIEventNotFound:
-                events = []
+            events: list[EventData] = logs.get(
+                token.address, "ForceChangeLockedAccount"
+            )
             try:
                 lock_map: dict[str, dict[str, bool]] = {}
                 for event in events:
@@ -834,221 +941,92 @@ class Processor:
                         )
             except Exception:
                 pass
-            try:
-                accounts_filtered = self.remove_duplicate_event_by_token_account_desc(
-                    events=events,
-                    account_keys=["beforeAccountAddress", "afterAccountAddress"],
-                )
-                balances_list = await self.get_bulk_account_balance_token(
-                    token=token,
-                    accounts=accounts_filtered,
-                )
-                for balances in balances_list:
-                    (account, balance, pending_transfer) = balances
-                    await self.__sink_on_position(
-                        db_session=db_session,
-                        token_address=to_checksum_address(token.address),
-                        account_address=account,
-                        balance=balance,
-                        pending_transfer=pending_transfer,
-                    )
-            except Exception as e:
-                raise e
 
-    async def __sync_issue(self, db_session: AsyncSession, block_to: int):
+        await self.__sync_token_balances(
+            db_session,
+            logs,
+            block_to,
+            "ForceChangeLockedAccount",
+            ["beforeAccountAddress", "afterAccountAddress"],
+        )
+
+    async def __sync_issue(
+        self, db_session: AsyncSession, logs: ScannedLogs, block_to: int
+    ):
         """Sync Issue Events
 
         :param db_session: ORM session
+        :param logs: scanned event logs
         :param block_to: To block
         :return: None
         """
-        for target in self.token_list:
-            token = target.token_contract
-            block_from = target.cursor
-            if block_from > block_to:
-                continue
-            try:
-                events: list[EventData] = await token.events.Issue.get_logs(
-                    from_block=block_from, to_block=block_to
-                )
-            except ABIEventNotFound:
-                events = []
-            try:
-                accounts_filtered = self.remove_duplicate_event_by_token_account_desc(
-                    events=events, account_keys=["targetAddress"]
-                )
-                balances_list = await self.get_bulk_account_balance_token(
-                    token=token,
-                    accounts=accounts_filtered,
-                )
-                for balances in balances_list:
-                    (account, balance, pending_transfer) = balances
-                    await self.__sink_on_position(
-                        db_session=db_session,
-                        token_address=to_checksum_address(token.address),
-                        account_address=account,
-                        balance=balance,
-                        pending_transfer=pending_transfer,
-                    )
-            except Exception as e:
-                raise e
+        await self.__sync_token_balances(
+            db_session, logs, block_to, "Issue", ["targetAddress"]
+        )
 
-    async def __sync_redeem(self, db_session: AsyncSession, block_to: int):
+    async def __sync_redeem(
+        self, db_session: AsyncSession, logs: ScannedLogs, block_to: int
+    ):
         """Sync Redeem Events
 
         :param db_session: ORM session
+        :param logs: scanned event logs
         :param block_to: To block
         :return: None
         """
-        for target in self.token_list:
-            token = target.token_contract
-            block_from = target.cursor
-            if block_from > block_to:
-                continue
-            try:
-                events: list[EventData] = await token.events.Redeem.get_logs(
-                    from_block=block_from, to_block=block_to
-                )
-            except ABIEventNotFound:
-                events = []
-            try:
-                accounts_filtered = self.remove_duplicate_event_by_token_account_desc(
-                    events=events, account_keys=["targetAddress"]
-                )
-                balances_list = await self.get_bulk_account_balance_token(
-                    token=token,
-                    accounts=accounts_filtered,
-                )
-                for balances in balances_list:
-                    (account, balance, pending_transfer) = balances
-                    await self.__sink_on_position(
-                        db_session=db_session,
-                        token_address=to_checksum_address(token.address),
-                        account_address=account,
-                        balance=balance,
-                        pending_transfer=pending_transfer,
-                    )
-            except Exception as e:
-                raise e
+        await self.__sync_token_balances(
+            db_session, logs, block_to, "Redeem", ["targetAddress"]
+        )
 
-    async def __sync_apply_for_transfer(self, db_session: AsyncSession, block_to: int):
+    async def __sync_apply_for_transfer(
+        self, db_session: AsyncSession, logs: ScannedLogs, block_to: int
+    ):
         """Sync ApplyForTransfer Events
 
         :param db_session: ORM session
+        :param logs: scanned event logs
         :param block_to: To block
         :return: None
         """
-        for target in self.token_list:
-            token = target.token_contract
-            block_from = target.cursor
-            if block_from > block_to:
-                continue
-            try:
-                events: list[EventData] = await token.events.ApplyForTransfer.get_logs(
-                    from_block=block_from, to_block=block_to
-                )
-            except ABIEventNotFound:
-                events = []
-            try:
-                accounts_filtered = self.remove_duplicate_event_by_token_account_desc(
-                    events=events, account_keys=["from"]
-                )
-                balances_list = await self.get_bulk_account_balance_token(
-                    token=token,
-                    accounts=accounts_filtered,
-                )
-                for balances in balances_list:
-                    (account, balance, pending_transfer) = balances
-                    await self.__sink_on_position(
-                        db_session=db_session,
-                        token_address=to_checksum_address(token.address),
-                        account_address=account,
-                        balance=balance,
-                        pending_transfer=pending_transfer,
-                    )
-            except Exception as e:
-                raise e
+        await self.__sync_token_balances(
+            db_session, logs, block_to, "ApplyForTransfer", ["from"]
+        )
 
-    async def __sync_cancel_transfer(self, db_session: AsyncSession, block_to: int):
+    async def __sync_cancel_transfer(
+        self, db_session: AsyncSession, logs: ScannedLogs, block_to: int
+    ):
         """Sync CancelTransfer Events
 
         :param db_session: ORM session
+        :param logs: scanned event logs
         :param block_to: To block
         :return: None
         """
-        for target in self.token_list:
-            token = target.token_contract
-            block_from = target.cursor
-            if block_from > block_to:
-                continue
-            try:
-                events: list[EventData] = await token.events.CancelTransfer.get_logs(
-                    from_block=block_from, to_block=block_to
-                )
-            except ABIEventNotFound:
-                events = []
-            try:
-                accounts_filtered = self.remove_duplicate_event_by_token_account_desc(
-                    events=events, account_keys=["from"]
-                )
-                balances_list = await self.get_bulk_account_balance_token(
-                    token=token,
-                    accounts=accounts_filtered,
-                )
-                for balances in balances_list:
-                    (account, balance, pending_transfer) = balances
-                    await self.__sink_on_position(
-                        db_session=db_session,
-                        token_address=to_checksum_address(token.address),
-                        account_address=account,
-                        balance=balance,
-                        pending_transfer=pending_transfer,
-                    )
-            except Exception as e:
-                raise e
+        await self.__sync_token_balances(
+            db_session, logs, block_to, "CancelTransfer", ["from"]
+        )
 
-    async def __sync_approve_transfer(self, db_session: AsyncSession, block_to: int):
+    async def __sync_approve_transfer(
+        self, db_session: AsyncSession, logs: ScannedLogs, block_to: int
+    ):
         """Sync ApproveTransfer Events
 
         :param db_session: ORM session
+        :param logs: scanned event logs
         :param block_to: To block
         :return: None
         """
-        for target in self.token_list:
-            token = target.token_contract
-            block_from = target.cursor
-            if block_from > block_to:
-                continue
-            try:
-                events: list[EventData] = await token.events.ApproveTransfer.get_logs(
-                    from_block=block_from, to_block=block_to
-                )
-            except ABIEventNotFound:
-                events = []
-            try:
-                accounts_filtered = self.remove_duplicate_event_by_token_account_desc(
-                    events=events, account_keys=["from", "to"]
-                )
-                balances_list = await self.get_bulk_account_balance_token(
-                    token=token,
-                    accounts=accounts_filtered,
-                )
-                for balances in balances_list:
-                    (account, balance, pending_transfer) = balances
-                    await self.__sink_on_position(
-                        db_session=db_session,
-                        token_address=to_checksum_address(token.address),
-                        account_address=account,
-                        balance=balance,
-                        pending_transfer=pending_transfer,
-                    )
-            except Exception as e:
-                raise e
+        await self.__sync_token_balances(
+            db_session, logs, block_to, "ApproveTransfer", ["from", "to"]
+        )
 
-    async def __sync_exchange(self, db_session: AsyncSession, block_to: int):
+    async def __sync_exchange(
+        self, db_session: AsyncSession, logs: ScannedLogs, block_to: int
+    ):
         """Sync Events from IbetExchange
 
         :param db_session: ORM session
+        :param logs: scanned event logs
         :param block_to: To block
         :return: None
         """
@@ -1058,21 +1036,10 @@ class Processor:
                 continue
             exchange_address = exchange.exchange_address
             try:
-                exchange = AsyncContract.get_contract(
-                    contract_name="IbetExchange", address=exchange_address
-                )
-
                 account_list_tmp: list[dict[str, str]] = []
 
                 # NewOrder event
-                try:
-                    _event_list: list[
-                        EventData
-                    ] = await exchange.events.NewOrder.get_logs(
-                        from_block=block_from, to_block=block_to
-                    )
-                except ABIEventNotFound:
-                    _event_list = []
+                _event_list: list[EventData] = logs.get(exchange_address, "NewOrder")
                 for _event in _event_list:
                     event_block_number = _event.get("blockNumber", block_from)
                     token_cursor = self.token_list.get_cursor(
@@ -1092,14 +1059,7 @@ class Processor:
                     )
 
                 # CancelOrder event
-                try:
-                    _event_list: list[
-                        EventData
-                    ] = await exchange.events.CancelOrder.get_logs(
-                        from_block=block_from, to_block=block_to
-                    )
-                except ABIEventNotFound:
-                    _event_list = []
+                _event_list: list[EventData] = logs.get(exchange_address, "CancelOrder")
                 for _event in _event_list:
                     event_block_number = _event.get("blockNumber", block_from)
                     token_cursor = self.token_list.get_cursor(
@@ -1119,14 +1079,9 @@ class Processor:
                     )
 
                 # ForceCancelOrder event
-                try:
-                    _event_list: list[
-                        EventData
-                    ] = await exchange.events.ForceCancelOrder.get_logs(
-                        from_block=block_from, to_block=block_to
-                    )
-                except ABIEventNotFound:
-                    _event_list = []
+                _event_list: list[EventData] = logs.get(
+                    exchange_address, "ForceCancelOrder"
+                )
                 for _event in _event_list:
                     event_block_number = _event.get("blockNumber", block_from)
                     token_cursor = self.token_list.get_cursor(
@@ -1146,12 +1101,7 @@ class Processor:
                     )
 
                 # Agree event
-                try:
-                    _event_list: list[EventData] = await exchange.events.Agree.get_logs(
-                        from_block=block_from, to_block=block_to
-                    )
-                except ABIEventNotFound:
-                    _event_list = []
+                _event_list: list[EventData] = logs.get(exchange_address, "Agree")
                 for _event in _event_list:
                     event_block_number = _event.get("blockNumber", block_from)
                     token_cursor = self.token_list.get_cursor(
@@ -1171,14 +1121,9 @@ class Processor:
                     )
 
                 # SettlementOK event
-                try:
-                    _event_list: list[
-                        EventData
-                    ] = await exchange.events.SettlementOK.get_logs(
-                        from_block=block_from, to_block=block_to
-                    )
-                except ABIEventNotFound:
-                    _event_list = []
+                _event_list: list[EventData] = logs.get(
+                    exchange_address, "SettlementOK"
+                )
                 for _event in _event_list:
                     event_block_number = _event.get("blockNumber", block_from)
                     token_cursor = self.token_list.get_cursor(
@@ -1208,14 +1153,9 @@ class Processor:
                     )
 
                 # SettlementNG event
-                try:
-                    _event_list: list[
-                        EventData
-                    ] = await exchange.events.SettlementNG.get_logs(
-                        from_block=block_from, to_block=block_to
-                    )
-                except ABIEventNotFound:
-                    _event_list = []
+                _event_list: list[EventData] = logs.get(
+                    exchange_address, "SettlementNG"
+                )
                 for _event in _event_list:
                     event_block_number = _event.get("blockNumber", block_from)
                     token_cursor = self.token_list.get_cursor(
@@ -1259,6 +1199,7 @@ class Processor:
                     accounts=account_list,
                 )
                 # Update position
+                position_sink = PositionSink()
                 for balances in balances_list:
                     (
                         token_address,
@@ -1266,20 +1207,23 @@ class Processor:
                         exchange_balance,
                         exchange_commitment,
                     ) = balances
-                    await self.__sink_on_position(
-                        db_session=db_session,
+                    position_sink.append(
                         token_address=token_address,
                         account_address=account_address,
                         exchange_balance=exchange_balance,
                         exchange_commitment=exchange_commitment,
                     )
+                await position_sink.flush(db_session)
             except Exception as e:
                 raise e
 
-    async def __sync_escrow(self, db_session: AsyncSession, block_to: int):
+    async def __sync_escrow(
+        self, db_session: AsyncSession, logs: ScannedLogs, block_to: int
+    ):
         """Sync Events from IbetSecurityTokenEscrow
 
         :param db_session: ORM session
+        :param logs: scanned event logs
         :param block_to: To block
         :return: None
         """
@@ -1289,21 +1233,12 @@ class Processor:
                 continue
             exchange_address = exchange.exchange_address
             try:
-                escrow = AsyncContract.get_contract(
-                    "IbetSecurityTokenEscrow", exchange_address
-                )
-
                 account_list_tmp: list[dict[str, str]] = []
 
                 # EscrowCreated event
-                try:
-                    _event_list: list[
-                        EventData
-                    ] = await escrow.events.EscrowCreated.get_logs(
-                        from_block=block_from, to_block=block_to
-                    )
-                except ABIEventNotFound:
-                    _event_list = []
+                _event_list: list[EventData] = logs.get(
+                    exchange_address, "EscrowCreated"
+                )
                 for _event in _event_list:
                     event_block_number = _event.get("blockNumber", block_from)
                     token_cursor = self.token_list.get_cursor(
@@ -1321,14 +1256,9 @@ class Processor:
                     )
 
                 # EscrowCanceled event
-                try:
-                    _event_list: list[
-                        EventData
-                    ] = await escrow.events.EscrowCanceled.get_logs(
-                        from_block=block_from, to_block=block_to
-                    )
-                except ABIEventNotFound:
-                    _event_list = []
+                _event_list: list[EventData] = logs.get(
+                    exchange_address, "EscrowCanceled"
+                )
                 for _event in _event_list:
                     event_block_number = _event.get("blockNumber", block_from)
                     token_cursor = self.token_list.get_cursor(
@@ -1346,14 +1276,9 @@ class Processor:
                     )
 
                 # HolderChanged event
-                try:
-                    _event_list: list[
-                        EventData
-                    ] = await escrow.events.HolderChanged.get_logs(
-                        from_block=block_from, to_block=block_to
-                    )
-                except ABIEventNotFound:
-                    _event_list = []
+                _event_list: list[EventData] = logs.get(
+                    exchange_address, "HolderChanged"
+                )
                 for _event in _event_list:
                     event_block_number = _event.get("blockNumber", block_from)
                     token_cursor = self.token_list.get_cursor(
@@ -1399,6 +1324,7 @@ class Processor:
                     accounts=account_list,
                 )
                 # Update position
+                position_sink = PositionSink()
                 for balances in balances_list:
                     (
                         token_address,
@@ -1406,20 +1332,23 @@ class Processor:
                         exchange_balance,
                         exchange_commitment,
                     ) = balances
-                    await self.__sink_on_position(
-                        db_session=db_session,
+                    position_sink.append(
                         token_address=token_address,
                         account_address=account_address,
                         exchange_balance=exchange_balance,
                         exchange_commitment=exchange_commitment,
                     )
+                await position_sink.flush(db_session)
             except Exception as e:
                 raise e
 
-    async def __sync_dvp(self, db_session: AsyncSession, block_to: int):
+    async def __sync_dvp(
+        self, db_session: AsyncSession, logs: ScannedLogs, block_to: int
+    ):
         """Sync Events from IbetSecurityTokenDVP
 
         :param db_session: ORM session
+        :param logs: scanned event logs
         :param block_to: To block
         :return: None
         """
@@ -1429,21 +1358,12 @@ class Processor:
                 continue
             exchange_address = exchange.exchange_address
             try:
-                dvp = AsyncContract.get_contract(
-                    "IbetSecurityTokenDVP", exchange_address
-                )
-
                 account_list_tmp: list[dict[str, str]] = []
 
                 # DeliveryCreated event
-                try:
-                    _event_list: list[
-                        EventData
-                    ] = await dvp.events.DeliveryCreated.get_logs(
-                        from_block=block_from, to_block=block_to
-                    )
-                except ABIEventNotFound:
-                    _event_list = []
+                _event_list: list[EventData] = logs.get(
+                    exchange_address, "DeliveryCreated"
+                )
                 for _event in _event_list:
                     event_block_number = _event.get("blockNumber", block_from)
                     token_cursor = self.token_list.get_cursor(
@@ -1461,14 +1381,9 @@ class Processor:
                     )
 
                 # DeliveryCanceled event
-                try:
-                    _event_list: list[
-                        EventData
-                    ] = await dvp.events.DeliveryCanceled.get_logs(
-                        from_block=block_from, to_block=block_to
-                    )
-                except ABIEventNotFound:
-                    _event_list = []
+                _event_list: list[EventData] = logs.get(
+                    exchange_address, "DeliveryCanceled"
+                )
                 for _event in _event_list:
                     event_block_number = _event.get("blockNumber", block_from)
                     token_cursor = self.token_list.get_cursor(
@@ -1486,14 +1401,9 @@ class Processor:
                     )
 
                 # DeliveryAborted event
-                try:
-                    _event_list: list[
-                        EventData
-                    ] = await dvp.events.DeliveryAborted.get_logs(
-                        from_block=block_from, to_block=block_to
-                    )
-                except ABIEventNotFound:
-                    _event_list = []
+                _event_list: list[EventData] = logs.get(
+                    exchange_address, "DeliveryAborted"
+                )
                 for _event in _event_list:
                     event_block_number = _event.get("blockNumber", block_from)
                     token_cursor = self.token_list.get_cursor(
@@ -1511,14 +1421,9 @@ class Processor:
                     )
 
                     # HolderChanged event
-                try:
-                    _event_list: list[
-                        EventData
-                    ] = await dvp.events.HolderChanged.get_logs(
-                        from_block=block_from, to_block=block_to
-                    )
-                except ABIEventNotFound:
-                    _event_list = []
+                _event_list: list[EventData] = logs.get(
+                    exchange_address, "HolderChanged"
+                )
                 for _event in _event_list:
                     event_block_number = _event.get("blockNumber", block_from)
                     token_cursor = self.token_list.get_cursor(
@@ -1564,6 +1469,7 @@ class Processor:
                     accounts=account_list,
                 )
                 # Update position
+                position_sink = PositionSink()
                 for balances in balances_list:
                     (
                         token_address,
@@ -1571,13 +1477,13 @@ class Processor:
                         exchange_balance,
                         exchange_commitment,
                     ) = balances
-                    await self.__sink_on_position(
-                        db_session=db_session,
+                    position_sink.append(
                         token_address=token_address,
                         account_address=account_address,
                         exchange_balance=exchange_balance,
                         exchange_commitment=exchange_commitment,
                     )
+                await position_sink.flush(db_session)
             except Exception as e:
                 raise e
 
@@ -1585,9 +1491,8 @@ class Processor:
     async def __gen_block_timestamp(
         event: EventData,
     ) -> datetime:
-        block_data = await async_web3.eth.get_block(event["blockNumber"])
-        assert "timestamp" in block_data
-        return datetime.fromtimestamp(block_data["timestamp"], UTC)
+        block_timestamp = await block_timestamp_cache.get(event["blockNumber"])
+        return datetime.fromtimestamp(block_timestamp, UTC)
 
     @staticmethod
     def __get_oldest_cursor(target_token_list: TargetTokenList, block_to: int) -> int:
@@ -1600,132 +1505,26 @@ class Processor:
                 oldest_block_number = target_token.cursor
         return oldest_block_number
 
-    @staticmethod
-    async def __get_idx_position_block_number(
-        db_session: AsyncSession, token_address: str, exchange_address: str
-    ) -> int:
-        """Get position index for Share"""
-        _idx_position_block_number = (
-            await db_session.scalars(
-                select(IDXPositionShareBlockNumber)
-                .where(IDXPositionShareBlockNumber.token_address == token_address)
-                .where(IDXPositionShareBlockNumber.exchange_address == exchange_address)
-                .limit(1)
-            )
-        ).first()
-        if _idx_position_block_number is None:
-            return -1
-        else:
-            assert _idx_position_block_number.latest_block_number is not None
-            return _idx_position_block_number.latest_block_number
-
-    @staticmethod
     async def __set_idx_position_block_number(
-        db_session: AsyncSession, target_token_list: TargetTokenList, block_number: int
+        self,
+        db_session: AsyncSession,
+        target_token_list: TargetTokenList,
+        block_number: int,
     ):
         """Set position index for Share"""
-        for target_token in target_token_list:
-            _idx_position_block_number = (
-                await db_session.scalars(
-                    select(IDXPositionShareBlockNumber)
-                    .where(
-                        IDXPositionShareBlockNumber.token_address
-                        == target_token.token_contract.address
-                    )
-                    .where(
-                        IDXPositionShareBlockNumber.exchange_address
-                        == target_token.exchange_address
-                    )
-                    .limit(1)
-                )
-            ).first()
-            if _idx_position_block_number is None:
-                _idx_position_block_number = IDXPositionShareBlockNumber()
-            _idx_position_block_number.latest_block_number = block_number
-            _idx_position_block_number.token_address = (
-                target_token.token_contract.address
-            )
-            _idx_position_block_number.exchange_address = target_token.exchange_address
-            await db_session.merge(_idx_position_block_number)
-
-    @staticmethod
-    async def __get_account_balance_for_transfer(
-        token_contract: Web3AsyncContract, exchange_address: str, account_address: str
-    ) -> tuple[str, int, int, int]:
-        """Get balance"""
-        try:
-
-            async def return_zero():
-                return 0
-
-            tasks = await SemaphoreTaskGroup.run(
-                AsyncContract.call_function(
-                    contract=token_contract,
-                    function_name="balanceOf",
-                    args=(account_address,),
-                    default_returns=0,
-                ),
-                AsyncContract.call_function(
-                    contract=token_contract,
-                    function_name="pendingTransfer",
-                    args=(account_address,),
-                    default_returns=0,
-                ),
-                AsyncContract.call_function(
-                    contract=AsyncContract.get_contract(
-                        "IbetExchangeInterface", exchange_address
-                    ),
-                    function_name="balanceOf",
-                    args=(
-                        account_address,
-                        token_contract.address,
-                    ),
-                    default_returns=0,
-                )
-                if exchange_address != ZERO_ADDRESS
-                else return_zero(),
-                max_concurrency=3,
-            )
-            balance, pending_transfer, exchange_balance = (
-                tasks[0].result(),
-                tasks[1].result(),
-                tasks[2].result(),
-            )
-        except ExceptionGroup:
-            raise ServiceUnavailable
-
-        return (
-            account_address,
-            balance,
-            pending_transfer,
-            exchange_balance,
+        await self.cursor_book.save(
+            db_session=db_session,
+            keys=[
+                (target_token.token_contract.address, target_token.exchange_address)
+                for target_token in target_token_list
+            ],
+            block_number=block_number,
+        )
+        LOG.debug(
+            f"Cursor write metrics: statements={self.cursor_book.write_count}, "
+            f"written={self.cursor_book.written_rows}, "
+            f"skipped={self.cursor_book.skipped_rows}"
         )
-
-    @staticmethod
-    async def __get_account_balance_token(
-        token_contract: Web3AsyncContract, account_address: str
-    ) -> tuple[str, int, int]:
-        """Get balance on token"""
-        try:
-            tasks = await SemaphoreTaskGroup.run(
-                AsyncContract.call_function(
-                    contract=token_contract,
-                    function_name="balanceOf",
-                    args=(account_address,),
-                    default_returns=0,
-                ),
-                AsyncContract.call_function(
-                    contract=token_contract,
-                    function_name="pendingTransfer",
-                    args=(account_address,),
-                    default_returns=0,
-                ),
-                max_concurrency=3,
-            )
-            balance, pending_transfer = (tasks[0].result(), tasks[1].result())
-        except ExceptionGroup:
-            raise ServiceUnavailable
-        return account_address, balance, pending_transfer
 
     @staticmethod
     async def __get_account_locked_token(
@@ -1743,44 +1542,6 @@ class Processor:
         )
         return value
 
-    @staticmethod
-    async def __get_account_balance_exchange(
-        exchange_address: str, token_address: str, account_address: str
-    ) -> tuple[str, str, int, int]:
-        """Get balance on exchange"""
-        exchange_contract = AsyncContract.get_contract(
-            contract_name="IbetExchangeInterface", address=exchange_address
-        )
-        try:
-            tasks = await SemaphoreTaskGroup.run(
-                AsyncContract.call_function(
-                    contract=exchange_contract,
-                    function_name="balanceOf",
-                    args=(
-                        account_address,
-                        token_address,
-                    ),
-                    default_returns=0,
-                ),
-                AsyncContract.call_function(
-                    contract=exchange_contract,
-                    function_name="commitmentOf",
-                    args=(
-                        account_address,
-                        token_address,
-                    ),
-                    default_returns=0,
-                ),
-                max_concurrency=3,
-            )
-            exchange_balance, exchange_commitment = (
-                tasks[0].result(),
-                tasks[1].result(),
-            )
-        except ExceptionGroup:
-            raise ServiceUnavailable
-        return token_address, account_address, exchange_balance, exchange_commitment
-
     @staticmethod
     def __insert_lock_idx(
         db_session: AsyncSession,
@@ -1874,66 +1635,6 @@ class Processor:
         unlock.is_forced = is_forced
         db_session.add(unlock)
 
-    @staticmethod
-    async def __sink_on_position(
-        db_session: AsyncSession,
-        token_address: str,
-        account_address: str,
-        balance: Optional[int] = None,
-        pending_transfer: Optional[int] = None,
-        exchange_balance: Optional[int] = None,
-        exchange_commitment: Optional[int] = None,
-    ):
-        """Update Position data in DB
-
-        :param db_session: ORM session
-        :param token_address: token address
-        :param account_address: account address
-        :param balance: updated balance
-        :param pending_transfer: updated pending_transfer
-        :param exchange_balance: balance on exchange
-        :param exchange_commitment: commitment volume on exchange
-        :return: None
-        """
-        position = (
-            await db_session.scalars(
-                select(IDXPosition)
-                .where(IDXPosition.token_address == token_address)
-                .where(IDXPosition.account_address == account_address)
-                .limit(1)
-            )
-        ).first()
-        if position is not None:
-            if balance is not None:
-                position.balance = balance
-            if pending_transfer is not None:
-                position.pending_transfer = pending_transfer
-            if exchange_balance is not None:
-                position.exchange_balance = exchange_balance
-            if exchange_commitment is not None:
-                position.exchange_commitment = exchange_commitment
-            await db_session.merge(position)
-        elif any(
-            value is not None
-            for value in [
-                balance,
-                pending_transfer,
-                exchange_balance,
-                exchange_commitment,
-            ]
-        ):
-            LOG.debug(
-                f"Position created (Share): token_address={token_address}, account_address={account_address}"
-            )
-            position = IDXPosition()
-            position.token_address = token_address
-            position.account_address = account_address
-            position.balance = balance or 0
-            position.pending_transfer = pending_transfer or 0
-            position.exchange_balance = exchange_balance or 0
-            position.exchange_commitment = exchange_commitment or 0
-            db_session.add(position)
-
     @staticmethod
     async def __sink_on_locked_position(
         db_session: AsyncSession,
@@ -2005,51 +1706,43 @@ class Processor:
     async def get_bulk_account_balance_for_transfer(
         self, token: Web3AsyncContract, exchange_address: str, accounts: Sequence[str]
     ) -> list[tuple[str, int, int, int]]:
-        coroutines = [
-            self.__get_account_balance_for_transfer(token, exchange_address, _account)
-            for _account in accounts
+        balances = await BulkBalanceReader.get_token_balances(
+            token_contract=token,
+            account_addresses=accounts,
+            exchange_address=exchange_address,
+        )
+        return [
+            (b.account_address, b.balance, b.pending_transfer, b.exchange_balance)
+            for b in balances
         ]
-        if not coroutines:
-            return []
-
-        try:
-            tasks = await SemaphoreTaskGroup.run(*coroutines, max_concurrency=5)
-            return [task.result() for task in tasks]
-        except ExceptionGroup:
-            raise ServiceUnavailable
 
     async def get_bulk_account_balance_token(
         self, token: Web3AsyncContract, accounts: Sequence[str]
     ) -> list[tuple[str, int, int]]:
-        coroutines = [
-            self.__get_account_balance_token(token, _account) for _account in accounts
-        ]
-        if not coroutines:
-            return []
-
-        try:
-            tasks = await SemaphoreTaskGroup.run(*coroutines, max_concurrency=5)
-            return [task.result() for task in tasks]
-        except ExceptionGroup:
-            raise ServiceUnavailable
+        balances = await BulkBalanceReader.get_token_balances(
+            token_contract=token, account_addresses=accounts
+        )
+        return [(b.account_address, b.balance, b.pending_transfer) for b in balances]
 
     async def get_bulk_account_balance_exchange(
         self, exchange_address: str, accounts: Sequence[Mapping[str, str]]
     ) -> list[tuple[str, str, int, int]]:
-        coroutines = [
-            self.__get_account_balance_exchange(
-                exchange_address, _account["token_address"], _account["account_address"]
+        balances = await BulkBalanceReader.get_exchange_balances(
+            exchange_address=exchange_address,
+            positions=[
+                (_account["token_address"], _account["account_address"])
+                for _account in accounts
+            ],
+        )
+        return [
+            (
+                b.token_address,
+                b.account_address,
+                b.exchange_balance,
+                b.exchange_commitment,
             )
-            for _account in accounts
+            for b in balances
         ]
-        if not coroutines:
-            return []
-
-        try:
-            tasks = await SemaphoreTaskGroup.run(*coroutines, max_concurrency=5)
-            return [task.result() for task in tasks]
-        except ExceptionGroup:
-            raise ServiceUnavailable
 
 
 async def main():
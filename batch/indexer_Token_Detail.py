@@ -126,7 +126,9 @@ class Processor:
                     token_detail = token_detail_obj.to_model()
                     token_detail.created = datetime.now(UTC).replace(tzinfo=None)
                     async with local_session.begin_nested():
-                        await local_session.merge(token_detail)
+                        await token_type.token_class.merge_cache(
+                            local_session, token_detail
+                        )
                         await local_session.commit()
 
                     # Keep request interval constant to avoid throwing many request to JSON-RPC
@@ -137,7 +137,9 @@ class Processor:
                     await token.fetch_expiry_short()
                     token_model = token.to_model()
                     async with local_session.begin_nested():
-                        await local_session.merge(token_model)
+                        await token_type.token_class.merge_cache(
+                            local_session, token_model
+                        )
                         await local_session.commit()
 
                     # Keep request interval constant to avoid throwing many request to JSON-RPC
@@ -19,23 +19,35 @@ SPDX-License-Identifier: Apache-2.0
 
 import asyncio
 import sys
+import time
 from typing import Any, Dict, Optional, Sequence
 
 from sqlalchemy import delete, select
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 from web3.contract import AsyncContract as Web3AsyncContract
 from web3.exceptions import ABIEventNotFound
 from web3.types import EventData
 
-from app.config import TOKEN_LIST_CONTRACT_ADDRESS, ZERO_ADDRESS
+from app.config import (
+    DATABASE_TYPE,
+    TOKEN_HOLDERS_SAVE_CHUNK_SIZE,
+    TOKEN_HOLDERS_WORKER_COUNT,
+    TOKEN_LIST_CONTRACT_ADDRESS,
+    ZERO_ADDRESS,
+)
 from app.contracts import AsyncContract
 from app.database import BatchAsyncSessionLocal
 from app.errors import ServiceUnavailable
 from app.model.db import TokenHolder, TokenHolderBatchStatus, TokenHoldersList
+from app.model.db.base import naive_utcnow
 from app.model.schema.base import TokenType
 from app.utils.web3_utils import AsyncWeb3Wrapper
 from batch import free_malloc, log
+from batch.lib.block_range import BlockRangePlanner
+from batch.lib.holder_snapshot import HolderSnapshot
 from batch.lib.token_list import TokenList
 
 process_name = "INDEXER-TOKEN_HOLDERS"
@@ -66,6 +78,20 @@ class Processor:
                 self.pages[account_address].hold_balance = hold_balance + amount
                 self.pages[account_address].locked_balance = locked_balance + locked
 
+        def snapshot(self) -> dict[str, tuple[int | None, int | None]]:
+            return {
+                account_address: (page.hold_balance, page.locked_balance)
+                for account_address, page in self.pages.items()
+            }
+
+        def restore(self, snapshot: dict[str, tuple[int | None, int | None]]):
+            for account_address in list(self.pages.keys()):
+                if account_address not in snapshot:
+                    del self.pages[account_address]
+            for account_address, (hold_balance, locked_balance) in snapshot.items():
+                self.pages[account_address].hold_balance = hold_balance
+                self.pages[account_address].locked_balance = locked_balance
+
     target: Optional[TokenHoldersList]
     balance_book: BalanceBook
 
@@ -95,6 +121,9 @@ class Processor:
                     == TokenHolderBatchStatus.PENDING.value
                 )
                 .limit(1)
+                # Lock the job until it is completed
+                # so that other workers can collect other jobs concurrently
+                .with_for_update(skip_locked=True)
             )
         ).first()
         return True if self.target else False
@@ -179,51 +208,105 @@ class Processor:
             return block_from
         return 0
 
-    async def collect(self):
+    async def __load_balance_delta(
+        self,
+        local_session: AsyncSession,
+        target_token_address: str,
+        block_from: int,
+        block_to: int,
+    ) -> int:
+        """Apply balance changes recorded by the position indexers
+
+        Events are replayed only for the blocks not covered by the recorded changes.
+
+        :return: block number from which events should be replayed
+        """
+        assert self.target is not None
+        deltas, delta_block_to = await HolderSnapshot.load(
+            local_session,
+            token_address=target_token_address,
+            block_from=block_from,
+            block_to=block_to,
+        )
+        if delta_block_to < block_from:
+            return block_from
+
+        LOG.info(f"apply balance delta from={block_from}, to={delta_block_to}")
+        for account_address, (hold_balance, locked_balance) in deltas.items():
+            self.balance_book.store(
+                account_address=account_address,
+                amount=hold_balance,
+                locked=locked_balance,
+            )
+        await self.__save_holders(
+            local_session,
+            self.balance_book,
+            self.target.id,
+            target_token_address,
+            self.token_owner_address,
+        )
+        return delta_block_to + 1
+
+    async def collect(self) -> bool:
+        """Collect token holders of a pending job
+
+        :return: True if a job has been processed
+        """
         local_session = self.__get_db_session()
         try:
             if not await self.__load_target(local_session):
                 LOG.debug("There are no pending collect batch")
-                return
+                return False
             if not await self.__load_token_info():
                 LOG.debug("Token contract must be listed to TokenList contract.")
                 await self.__update_status(local_session, TokenHolderBatchStatus.FAILED)
                 await local_session.commit()
-                return
+                return True
             assert self.target is not None
             assert self.target.token_address is not None
             assert self.target.block_number is not None
 
+            started = time.perf_counter()
+            list_id = self.target.list_id
+            token_address = self.target.token_address
             _target_block = self.target.block_number
-            _from_block = await self.__load_checkpoint(
+            _checkpoint_block = await self.__load_checkpoint(
                 local_session,
                 target_token_address=self.target.token_address,
                 block_to=_target_block,
             )
-            _to_block = 999999 + _from_block
-            if _target_block > _to_block:
-                while _to_block < _target_block:
-                    await self.__process_all(
-                        db_session=local_session,
-                        block_from=_from_block,
-                        block_to=_to_block,
-                    )
-                    _from_block += 1000000
-                    _to_block += 1000000
-                await self.__process_all(
-                    db_session=local_session,
-                    block_from=_from_block,
-                    block_to=_target_block,
-                )
-            else:
-                await self.__process_all(
+            _from_block = await self.__load_balance_delta(
+                local_session,
+                target_token_address=self.target.token_address,
+                block_from=_checkpoint_block,
+                block_to=_target_block,
+            )
+            loaded = time.perf_counter()
+            await BlockRangePlanner(
+                key=f"{process_name}:{self.target.token_address}"
+            ).run(
+                block_from=_from_block,
+                block_to=_target_block,
+                sync=lambda block_from, block_to: self.__process_chunk(
                     db_session=local_session,
-                    block_from=_from_block,
-                    block_to=_target_block,
-                )
+                    block_from=block_from,
+                    block_to=block_to,
+                ),
+                db_session=local_session,
+            )
+            replayed = time.perf_counter()
             await self.__update_status(local_session, TokenHolderBatchStatus.DONE)
             await local_session.commit()
             LOG.info("Collect job has been completed")
+            LOG.info(
+                f"Collect job metrics: list_id={list_id}, token_address={token_address}, "
+                f"blocks={_checkpoint_block}-{_target_block}, "
+                f"replayed_blocks={max(_target_block - _from_block + 1, 0)}, "
+                f"load={loaded - started:.3f}s, "
+                f"replay={replayed - loaded:.3f}s, "
+                f"commit={time.perf_counter() - replayed:.3f}s"
+            )
+            return True
         except Exception as e:
             await local_session.rollback()
             await self.__update_status(local_session, TokenHolderBatchStatus.FAILED)
@@ -262,6 +345,17 @@ class Processor:
         self.exchange_contract = None
         self.escrow_contract = None
 
+    async def __process_chunk(
+        self, db_session: AsyncSession, block_from: int, block_to: int
+    ):
+        # Restore the balances if the chunk fails so that it can be retried
+        snapshot = self.balance_book.snapshot()
+        try:
+            await self.__process_all(db_session, block_from, block_to)
+        except Exception:
+            self.balance_book.restore(snapshot)
+            raise
+
     async def __process_all(
         self, db_session: AsyncSession, block_from: int, block_to: int
     ):
@@ -655,38 +749,88 @@ class Processor:
         token_address: str,
         token_owner_address: str,
     ):
-        for account_address, page in zip(
-            balance_book.pages.keys(), balance_book.pages.values()
-        ):
-            if page.account_address == token_owner_address:
-                # Skip storing data for token owner
-                continue
-            token_holder: Optional[TokenHolder] = (
-                await db_session.scalars(
-                    select(TokenHolder)
-                    .where(TokenHolder.holder_list == holder_list_id)
-                    .where(TokenHolder.account_address == account_address)
-                    .limit(1)
+        # Skip storing data for token owner
+        pages = [
+            page
+            for account_address, page in balance_book.pages.items()
+            if account_address != token_owner_address
+        ]
+
+        # Accounts without balance are stored only when they have already been stored
+        chunk_size = max(TOKEN_HOLDERS_SAVE_CHUNK_SIZE, 1)
+        empty_accounts = [
+            page.account_address
+            for page in pages
+            if (page.hold_balance or 0) <= 0 and (page.locked_balance or 0) <= 0
+        ]
+        stored_accounts: set[str] = set()
+        for i in range(0, len(empty_accounts), chunk_size):
+            stored_accounts.update(
+                (
+                    await db_session.scalars(
+                        select(TokenHolder.account_address)
+                        .where(TokenHolder.holder_list == holder_list_id)
+                        .where(
+                            TokenHolder.account_address.in_(
+                                empty_accounts[i : i + chunk_size]
+                            )
+                        )
+                    )
+                ).all()
+            )
+
+        now = naive_utcnow()
+        rows = [
+            {
+                "holder_list": holder_list_id,
+                "account_address": page.account_address,
+                "hold_balance": page.hold_balance,
+                "locked_balance": page.locked_balance,
+                "created": now,
+                "modified": now,
+            }
+            for page in pages
+            if (page.hold_balance or 0) > 0
+            or (page.locked_balance or 0) > 0
+            or page.account_address in stored_accounts
+        ]
+        for i in range(0, len(rows), chunk_size):
+            if DATABASE_TYPE == "mysql":
+                mysql_stmt = mysql_insert(TokenHolder).values(rows[i : i + chunk_size])
+                await db_session.execute(
+                    mysql_stmt.on_duplicate_key_update(
+                        hold_balance=mysql_stmt.inserted.hold_balance,
+                        locked_balance=mysql_stmt.inserted.locked_balance,
+                        modified=mysql_stmt.inserted.modified,
+                    )
                 )
-            ).first()
-            if token_holder is not None:
-                token_holder.hold_balance = page.hold_balance
-                token_holder.locked_balance = page.locked_balance
-                await db_session.merge(token_holder)
-            elif (page.hold_balance or 0) > 0 or (page.locked_balance or 0) > 0:
-                LOG.debug(
-                    f"Collection record created : token_address={token_address}, account_address={account_address}"
+            else:
+                pg_stmt = pg_insert(TokenHolder).values(rows[i : i + chunk_size])
+                await db_session.execute(
+                    pg_stmt.on_conflict_do_update(
+                        index_elements=[
+                            TokenHolder.holder_list,
+                            TokenHolder.account_address,
+                        ],
+                        set_={
+                            "hold_balance": pg_stmt.excluded.hold_balance,
+                            "locked_balance": pg_stmt.excluded.locked_balance,
+                            "modified": pg_stmt.excluded.modified,
+                        },
+                    )
                 )
-                page.holder_list = holder_list_id
-                db_session.add(page)
+        LOG.debug(
+            f"Collection records saved : token_address={token_address}, count={len(rows)}"
+        )
 
 
-async def main():
-    LOG.info("Service started successfully")
+async def worker():
+    # Each worker has its own balance book and contracts
     processor = Processor()
     while True:
+        processed = False
         try:
-            await processor.collect()
+            processed = await processor.collect()
         except ServiceUnavailable:
             LOG.notice("An external service was unavailable")
         except SQLAlchemyError as sa_err:
@@ -694,10 +838,17 @@ async def main():
         except Exception:
             LOG.exception("An exception occurred during event synchronization")
 
-        await asyncio.sleep(10)
+        if not processed:
+            # Continue with the next job without waiting if there may be more jobs
+            await asyncio.sleep(10)
         free_malloc()
 
 
+async def main():
+    LOG.info("Service started successfully")
+    await asyncio.gather(*[worker() for _ in range(max(TOKEN_HOLDERS_WORKER_COUNT, 1))])
+
+
 if __name__ == "__main__":
     try:
         asyncio.run(main())
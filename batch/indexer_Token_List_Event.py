@@ -36,6 +36,7 @@ from app.model.db import IDXTokenListBlockNumber, IDXTokenListRegister
 from app.model.schema.base import TokenType
 from app.utils.web3_utils import AsyncWeb3Wrapper
 from batch import free_malloc, log
+from batch.lib.block_range import BlockRangePlanner
 
 process_name = "INDEXER-TOKEN-LIST-EVENT"
 LOG = log.get_logger(process_name=process_name)
@@ -81,29 +82,18 @@ class Processor:
                 )
                 + 1
             )
-            _to_block = 999999 + _from_block
-            if latest_block > _to_block:
-                while _to_block < latest_block:
-                    await self.__sync_all(
-                        db_session=local_session,
-                        block_from=_from_block,
-                        block_to=_to_block,
-                    )
-                    _from_block += 1000000
-                    _to_block += 1000000
-                await self.__sync_all(
-                    db_session=local_session,
-                    block_from=_from_block,
-                    block_to=latest_block,
-                )
-            else:
-                if _from_block > latest_block:
-                    return
-                await self.__sync_all(
+            if _from_block > latest_block:
+                return
+            await BlockRangePlanner(key=f"{process_name}:{contract_address}").run(
+                block_from=_from_block,
+                block_to=latest_block,
+                sync=lambda block_from, block_to: self.__sync_all(
                     db_session=local_session,
-                    block_from=_from_block,
-                    block_to=latest_block,
-                )
+                    block_from=block_from,
+                    block_to=block_to,
+                ),
+                db_session=local_session,
+            )
             await self.__set_idx_token_list_block_number(
                 db_session=local_session,
                 contract_address=contract_address,
@@ -44,8 +44,10 @@ from app.model.db import (
     Listing,
     TransferDataMessage,
 )
+from app.utils.block_utils import block_timestamp_cache
 from app.utils.web3_utils import AsyncWeb3Wrapper
 from batch import free_malloc, log
+from batch.lib.block_range import BlockRangePlanner
 
 UTC = timezone(timedelta(hours=0), "UTC")
 
@@ -111,9 +113,8 @@ class Processor:
     async def __gen_block_timestamp(
         event: EventData,
     ) -> datetime | None:
-        block_data = await async_web3.eth.get_block(event["blockNumber"])
-        assert "timestamp" in block_data
-        return datetime.fromtimestamp(block_data["timestamp"], UTC)
+        block_timestamp = await block_timestamp_cache.get(event["blockNumber"])
+        return datetime.fromtimestamp(block_timestamp, UTC)
 
     @staticmethod
     async def __get_latest_synchronized(
@@ -243,17 +244,15 @@ class Processor:
             # Refresh listed tokens
             await self.__get_token_list(local_session)
 
-            # Synchronize 1,000,000 blocks each
-            _to_block = 999_999
-            _from_block = 0
-            if latest_block > 999_999:
-                while _to_block < latest_block:
-                    await self.__sync_all(local_session, _from_block, _to_block)
-                    _to_block += 1_000_000
-                    _from_block += 1_000_000
-                await self.__sync_all(local_session, _from_block, latest_block)
-            else:
-                await self.__sync_all(local_session, _from_block, latest_block)
+            # Synchronize in chunks of adaptive size
+            await BlockRangePlanner(key=process_name).run(
+                block_from=0,
+                block_to=latest_block,
+                sync=lambda block_from, block_to: self.__sync_all(
+                    local_session, block_from, block_to
+                ),
+                db_session=local_session,
+            )
 
             # Update latest synchronized block numbers
             await self.__update_idx_latest_block(
@@ -364,6 +363,9 @@ class Processor:
 
             # Index logs
             try:
+                await block_timestamp_cache.get_many(
+                    event["blockNumber"] for event in events
+                )
                 for event in events:
                     args = event["args"]
                     value = args.get("value", 0)
@@ -457,13 +459,14 @@ class Processor:
 
             # Index logs
             try:
+                await block_timestamp_cache.get_many(
+                    event["blockNumber"] for event in events
+                )
                 for event in events:
                     args = event["args"]
                     transaction_hash = event["transactionHash"].to_0x_hex()
-                    block_data = await async_web3.eth.get_block(event["blockNumber"])
-                    assert "timestamp" in block_data
                     block_timestamp = datetime.fromtimestamp(
-                        block_data["timestamp"],
+                        await block_timestamp_cache.get(event["blockNumber"]),
                         UTC,
                     ).replace(tzinfo=None)
                     if args.get("value", 0) > sys.maxsize:
@@ -526,13 +529,14 @@ class Processor:
 
             # Index logs
             try:
+                await block_timestamp_cache.get_many(
+                    event["blockNumber"] for event in events
+                )
                 for event in events:
                     args = event["args"]
                     transaction_hash = event["transactionHash"].to_0x_hex()
-                    block_data = await async_web3.eth.get_block(event["blockNumber"])
-                    assert "timestamp" in block_data
                     block_timestamp = datetime.fromtimestamp(
-                        block_data["timestamp"],
+                        await block_timestamp_cache.get(event["blockNumber"]),
                         UTC,
                     ).replace(tzinfo=None)
                     if args.get("value", 0) > sys.maxsize:
@@ -597,13 +601,14 @@ class Processor:
 
             # Index logs
             try:
+                await block_timestamp_cache.get_many(
+                    event["blockNumber"] for event in events
+                )
                 for event in events:
                     args = event["args"]
                     transaction_hash = event["transactionHash"].to_0x_hex()
-                    block_data = await async_web3.eth.get_block(event["blockNumber"])
-                    assert "timestamp" in block_data
                     block_timestamp = datetime.fromtimestamp(
-                        block_data["timestamp"],
+                        await block_timestamp_cache.get(event["blockNumber"]),
                         UTC,
                     ).replace(tzinfo=None)
                     if args.get("value", 0) > sys.maxsize:
@@ -35,8 +35,10 @@ from app.database import BatchAsyncSessionLocal
 from app.errors import ServiceUnavailable
 from app.model.db import IDXTransferApproval, IDXTransferApprovalBlockNumber, Listing
 from app.model.schema.base import TokenType
+from app.utils.block_utils import block_timestamp_cache
 from app.utils.web3_utils import AsyncWeb3Wrapper
 from batch import free_malloc, log
+from batch.lib.block_range import BlockRangePlanner
 
 process_name = "INDEXER-TRANSFER-APPROVAL"
 LOG = log.get_logger(process_name=process_name)
@@ -185,11 +187,7 @@ class Processor:
 
     @staticmethod
     async def get_block_timestamp(event: Mapping[str, Any]) -> int | None:
-        block_data: dict[str, Any] = dict(
-            await async_web3.eth.get_block(event["blockNumber"])
-        )
-        block_timestamp = block_data["timestamp"]
-        return block_timestamp
+        return await block_timestamp_cache.get(event["blockNumber"])
 
     async def __get_contract_list(self, db_session: AsyncSession):
         self.token_list = self.TargetTokenList()
@@ -298,17 +296,17 @@ class Processor:
         local_session = self.__get_db_session()
         try:
             await self.__get_contract_list(local_session)
-            # Synchronize 1,000,000 blocks each
+            # Synchronize in chunks of adaptive size
             latest_block = int(await async_web3.eth.block_number)
             _from_block = self.__get_oldest_cursor(self.token_list, latest_block)
-            _to_block = 999999 + _from_block
-            if latest_block > _to_block:
-                while _to_block < latest_block:
-                    await self.__sync_all(db_session=local_session, block_to=_to_block)
-                    _to_block += 1000000
-                await self.__sync_all(db_session=local_session, block_to=latest_block)
-            else:
-                await self.__sync_all(db_session=local_session, block_to=latest_block)
+            await BlockRangePlanner(key=process_name).run(
+                block_from=_from_block,
+                block_to=latest_block,
+                sync=lambda _, block_to: self.__sync_all(
+                    db_session=local_session, block_to=block_to
+                ),
+                db_session=local_session,
+            )
             await self.__set_idx_transfer_approval_block_number(
                 local_session, self.token_list, latest_block
             )
@@ -326,17 +324,17 @@ class Processor:
         local_session = self.__get_db_session()
         try:
             await self.__get_contract_list(local_session)
-            # Synchronize 1,000,000 blocks each
+            # Synchronize in chunks of adaptive size
             latest_block = int(await async_web3.eth.block_number)
             _from_block = self.__get_oldest_cursor(self.token_list, latest_block)
-            _to_block = 999999 + _from_block
-            if latest_block > _to_block:
-                while _to_block < latest_block:
-                    await self.__sync_all(db_session=local_session, block_to=_to_block)
-                    _to_block += 1000000
-                await self.__sync_all(db_session=local_session, block_to=latest_block)
-            else:
-                await self.__sync_all(db_session=local_session, block_to=latest_block)
+            await BlockRangePlanner(key=process_name).run(
+                block_from=_from_block,
+                block_to=latest_block,
+                sync=lambda _, block_to: self.__sync_all(
+                    db_session=local_session, block_to=block_to
+                ),
+                db_session=local_session,
+            )
             await self.__set_idx_transfer_approval_block_number(
                 local_session, self.token_list, latest_block
             )
@@ -394,6 +392,9 @@ class Processor:
             except ABIEventNotFound:
                 events = []
             try:
+                await block_timestamp_cache.get_many(
+                    event["blockNumber"] for event in events
+                )
                 for event in events:
                     args = event["args"]
                     value = args.get("value", 0)
@@ -469,6 +470,9 @@ class Processor:
             except ABIEventNotFound:
                 events = []
             try:
+                await block_timestamp_cache.get_many(
+                    event["blockNumber"] for event in events
+                )
                 for event in events:
                     args = event["args"]
                     block_timestamp = await self.get_block_timestamp(event=event)
@@ -508,6 +512,9 @@ class Processor:
             except ABIEventNotFound:
                 events = []
             try:
+                await block_timestamp_cache.get_many(
+                    event["blockNumber"] for event in events
+                )
                 # Filter events by listed token
                 events_filtered: list[EventData] = []
                 token_address_list = [t.token_contract.address for t in self.token_list]
@@ -642,6 +649,9 @@ class Processor:
             except ABIEventNotFound:
                 events = []
             try:
+                await block_timestamp_cache.get_many(
+                    event["blockNumber"] for event in events
+                )
                 # Filter events by listed token
                 events_filtered: list[EventData] = []
                 token_address_list = [t.token_contract.address for t in self.token_list]
@@ -0,0 +1,217 @@
+"""
+Copyright BOOSTRY Co., Ltd.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+
+You may obtain a copy of the License at
+http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing,
+software distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+
+See the License for the specific language governing permissions and
+limitations under the License.
+
+SPDX-License-Identifier: Apache-2.0
+"""
+
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Awaitable, Callable
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app import config, log
+
+LOG = log.get_logger()
+
+# Error messages returned by nodes when the result of eth_getLogs is too large
+RANGE_ERROR_MESSAGES = (
+    "too many results",
+    "query returned more than",
+    "limit exceeded",
+    "response size exceeded",
+    "block range is too large",
+    "request timed out",
+)
+
+
+def is_range_error(err: BaseException) -> bool:
+    """Check if the error is caused by the size of the block range
+
+    :param err: raised exception
+    :return: True if the range should be narrowed
+    """
+    if isinstance(err, (TimeoutError, asyncio.TimeoutError)):
+        return True
+    message = str(err).lower()
+    return any(m in message for m in RANGE_ERROR_MESSAGES)
+
+
+@dataclass
+class BlockRangeStats:
+    # Number of blocks in a single range
+    chunk_size: int
+    # Number of logs per block (None if not measured yet)
+    log_density: float | None = None
+
+
+class BlockRangePlanner:
+    """Split a block range into chunks of adaptive size
+
+    The chunk size grows while ranges are processed with few logs in a short time,
+    and shrinks when they have many logs or take long.
+    When the node rejects a range with a timeout or a "too many results" error,
+    the size is halved and the same range start is retried in place
+    until the minimum size is reached.
+
+    Statistics are kept in process for each key (e.g. contract address),
+    so later runs pick a good size up front.
+    """
+
+    # key -> statistics
+    _stats: dict[str, BlockRangeStats] = {}
+
+    def __init__(
+        self,
+        key: str,
+        min_size: int | None = None,
+        max_size: int | None = None,
+        target_log_count: int | None = None,
+        target_elapsed: float | None = None,
+    ):
+        self.key = key
+        self.min_size = max(
+            min_size if min_size is not None else config.BLOCK_RANGE_MIN_SIZE, 1
+        )
+        self.max_size = max(
+            max_size if max_size is not None else config.BLOCK_RANGE_MAX_SIZE,
+            self.min_size,
+        )
+        self.target_log_count = (
+            target_log_count
+            if target_log_count is not None
+            else config.BLOCK_RANGE_TARGET_LOG_COUNT
+        )
+        self.target_elapsed = (
+            target_elapsed
+            if target_elapsed is not None
+            else config.BLOCK_RANGE_TARGET_ELAPSED_SEC
+        )
+        if key not in self._stats:
+            self._stats[key] = BlockRangeStats(chunk_size=self.max_size)
+
+    @property
+    def stats(self) -> BlockRangeStats:
+        return self._stats[self.key]
+
+    @property
+    def chunk_size(self) -> int:
+        return min(max(self.stats.chunk_size, self.min_size), self.max_size)
+
+    async def run(
+        self,
+        block_from: int,
+        block_to: int,
+        sync: Callable[[int, int], Awaitable[int | None]],
+        db_session: AsyncSession | None = None,
+    ) -> None:
+        """Process the block range chunk by chunk
+
+        A chunk rejected because of its size is retried with a narrower range,
+        so `sync` must not leave the changes of a failed chunk behind.
+        If `db_session` is given, each chunk is processed in a SAVEPOINT
+        and the DB changes of a failed chunk are discarded.
+
+        :param block_from: From block
+        :param block_to: To block
+        :param sync: coroutine function to process a chunk (from block, to block)
+                     that returns the number of processed logs if it is known
+        :param db_session: ORM session written by `sync`
+        :return: None
+        """
+        while block_from <= block_to:
+            chunk_to = self.get_chunk_end(block_from, block_to)
+            started = time.monotonic()
+            try:
+                if db_session is not None:
+                    async with db_session.begin_nested():
+                        log_count = await sync(block_from, chunk_to)
+                else:
+                    log_count = await sync(block_from, chunk_to)
+            except Exception as err:
+                if is_range_error(err) and chunk_to - block_from + 1 > self.min_size:
+                    # Retry the same block_from with a narrower range
+                    self.shrink()
+                    continue
+                raise
+            self.record(
+                block_from=block_from,
+                block_to=chunk_to,
+                log_count=log_count,
+                elapsed=time.monotonic() - started,
+            )
+            block_from = chunk_to + 1
+
+    def get_chunk_end(self, block_from: int, block_to: int) -> int:
+        """Get the end of the next chunk
+
+        :param block_from: From block
+        :param block_to: To block (upper limit)
+        :return: To block of the chunk
+        """
+        return min(block_from + self.chunk_size - 1, block_to)
+
+    def record(
+        self,
+        block_from: int,
+        block_to: int,
+        log_count: int | None,
+        elapsed: float,
+    ) -> None:
+        """Record the result of a chunk and adjust the chunk size
+
+        :param block_from: From block
+        :param block_to: To block
+        :param log_count: number of processed logs (None if unknown)
+        :param elapsed: processing time [sec]
+        :return: None
+        """
+        stats = self.stats
+        current_size = self.chunk_size
+        block_count = block_to - block_from + 1
+        if log_count is not None and block_count > 0:
+            density = log_count / block_count
+            stats.log_density = (
+                density
+                if stats.log_density is None
+                else (stats.log_density + density) / 2
+            )
+
+        if elapsed > self.target_elapsed:
+            next_size = current_size // 2
+        elif stats.log_density is not None and stats.log_density > 0:
+            # Grow at most twice at a time
+            next_size = min(
+                int(self.target_log_count / stats.log_density), current_size * 2
+            )
+        elif elapsed < self.target_elapsed / 2:
+            next_size = current_size * 2
+        else:
+            next_size = current_size
+        stats.chunk_size = min(max(next_size, self.min_size), self.max_size)
+
+    def shrink(self) -> None:
+        """Halve the chunk size"""
+        self.stats.chunk_size = max(self.chunk_size // 2, self.min_size)
+        LOG.notice(
+            f"Block range has been narrowed: key={self.key}, size={self.stats.chunk_size}"
+        )
+
+    @classmethod
+    def reset(cls) -> None:
+        """Clear statistics of all keys"""
+        cls._stats.clear()
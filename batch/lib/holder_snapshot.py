@@ -0,0 +1,374 @@
+"""
+Copyright BOOSTRY Co., Ltd.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+
+You may obtain a copy of the License at
+http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing,
+software distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+
+See the License for the specific language governing permissions and
+limitations under the License.
+
+SPDX-License-Identifier: Apache-2.0
+"""
+
+import sys
+from typing import Any
+
+from eth_utils.address import to_checksum_address
+from sqlalchemy import delete, func, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from web3.contract import AsyncContract as Web3AsyncContract
+from web3.types import EventData
+
+from app.config import ZERO_ADDRESS
+from app.contracts import AsyncContract
+from app.model.db import TokenHolderBalanceDelta, TokenHolderBalanceDeltaBlockNumber
+from app.utils.web3_utils import AsyncWeb3Wrapper
+from batch.lib.log_scanner import EventLogScanner, ScannedLogs
+
+async_web3 = AsyncWeb3Wrapper()
+
+
+class BalanceDeltaBook:
+    """Balance changes of each account aggregated per block"""
+
+    # (block number, account address) -> [hold balance, locked balance]
+    deltas: dict[tuple[int, str], list[int]]
+
+    def __init__(self):
+        self.deltas = {}
+
+    def store(
+        self, block_number: int, account_address: str, amount: int = 0, locked: int = 0
+    ):
+        delta = self.deltas.setdefault((block_number, account_address), [0, 0])
+        delta[0] += amount
+        delta[1] += locked
+
+    def rows(self, token_address: str) -> list[dict[str, Any]]:
+        return [
+            {
+                "token_address": token_address,
+                "block_number": block_number,
+                "account_address": account_address,
+                "hold_balance": hold_balance,
+                "locked_balance": locked_balance,
+            }
+            for (block_number, account_address), (
+                hold_balance,
+                locked_balance,
+            ) in self.deltas.items()
+            if hold_balance != 0 or locked_balance != 0
+        ]
+
+
+class HolderSnapshot:
+    """Incremental token holder snapshots
+
+    The position indexers record the balance changes of each block
+    while they process the event logs of a token.
+    A holder snapshot at block B can then be derived from the nearest stored
+    snapshot by summing up the recorded changes,
+    instead of replaying all the events since that snapshot.
+
+    The changes are calculated in the same way as indexer_Token_Holders.
+    """
+
+    # Events on token contracts that change the balance
+    TOKEN_EVENTS = [
+        "Transfer",
+        "Issue",
+        "Redeem",
+        "Lock",
+        "ForceLock",
+        "Unlock",
+        "ForceUnlock",
+        "ForceChangeLockedAccount",
+        "Consume",
+    ]
+    # Events on exchange contracts that change the balance
+    EXCHANGE_EVENTS = ("IbetExchangeInterface", ["HolderChanged"])
+
+    # Number of rows in a single INSERT statement
+    INSERT_CHUNK_SIZE = 10000
+
+    # address -> True if a contract is deployed
+    _contract_cache: dict[str, bool] = {}
+
+    @classmethod
+    def add_scan_target(
+        cls,
+        scanner: EventLogScanner,
+        token_contract: Web3AsyncContract,
+        exchange_address: str,
+        from_block: int,
+    ):
+        """Add events required to record the balance changes of the token
+
+        :param scanner: event log scanner
+        :param token_contract: token contract
+        :param exchange_address: tradable exchange address of the token
+        :param from_block: block number from which logs are required
+        :return: None
+        """
+        scanner.add_target(
+            contract=token_contract,
+            event_names=cls.TOKEN_EVENTS,
+            from_block=from_block,
+        )
+        if exchange_address != ZERO_ADDRESS:
+            contract_name, event_names = cls.EXCHANGE_EVENTS
+            scanner.add_target(
+                contract=AsyncContract.get_contract(contract_name, exchange_address),
+                event_names=event_names,
+                from_block=from_block,
+            )
+
+    @classmethod
+    async def sync(
+        cls,
+        db_session: AsyncSession,
+        logs: ScannedLogs,
+        token_address: str,
+        exchange_address: str,
+        block_from: int,
+        block_to: int,
+    ):
+        """Record the balance changes of the token in the block range
+
+        Changes already recorded in the range are replaced,
+        so that the same range can be synchronized again.
+
+        :param db_session: ORM session
+        :param logs: scanned event logs
+        :param token_address: token address
+        :param exchange_address: tradable exchange address of the token
+        :param block_from: From block
+        :param block_to: To block
+        :return: None
+        """
+        token_address = to_checksum_address(token_address)
+        book = await cls.__build_delta_book(
+            logs=logs,
+            token_address=token_address,
+            exchange_address=exchange_address,
+            block_from=block_from,
+            block_to=block_to,
+        )
+
+        recorded_range: TokenHolderBalanceDeltaBlockNumber | None = (
+            await db_session.scalars(
+                select(TokenHolderBalanceDeltaBlockNumber)
+                .where(
+                    TokenHolderBalanceDeltaBlockNumber.token_address == token_address
+                )
+                .limit(1)
+            )
+        ).first()
+        if (
+            recorded_range is not None
+            and recorded_range.latest_block_number >= block_from
+        ):
+            await db_session.execute(
+                delete(TokenHolderBalanceDelta)
+                .where(TokenHolderBalanceDelta.token_address == token_address)
+                .where(TokenHolderBalanceDelta.block_number >= block_from)
+                .where(TokenHolderBalanceDelta.block_number <= block_to)
+            )
+        rows = book.rows(token_address)
+        for i in range(0, len(rows), cls.INSERT_CHUNK_SIZE):
+            await db_session.execute(
+                insert(TokenHolderBalanceDelta), rows[i : i + cls.INSERT_CHUNK_SIZE]
+            )
+
+        if recorded_range is None:
+            recorded_range = TokenHolderBalanceDeltaBlockNumber()
+            recorded_range.token_address = token_address
+            recorded_range.start_block_number = block_from
+            recorded_range.latest_block_number = block_to
+            db_session.add(recorded_range)
+        elif (
+            recorded_range.start_block_number
+            <= block_from
+            <= recorded_range.latest_block_number + 1
+        ):
+            recorded_range.latest_block_number = max(
+                recorded_range.latest_block_number, block_to
+            )
+        else:
+            # Changes before the gap can not be used anymore
+            recorded_range.start_block_number = block_from
+            recorded_range.latest_block_number = block_to
+
+    @staticmethod
+    async def load(
+        db_session: AsyncSession, token_address: str, block_from: int, block_to: int
+    ) -> tuple[dict[str, tuple[int, int]], int]:
+        """Sum up the recorded balance changes of the token
+
+        Only the changes recorded without a gap from `block_from` are used.
+
+        :param db_session: ORM session
+        :param token_address: token address
+        :param block_from: From block
+        :param block_to: To block
+        :return: changes of (hold balance, locked balance) for each account,
+                 and the last block number that the changes include
+                 (`block_from - 1` if no changes are available)
+        """
+        token_address = to_checksum_address(token_address)
+        recorded_range: TokenHolderBalanceDeltaBlockNumber | None = (
+            await db_session.scalars(
+                select(TokenHolderBalanceDeltaBlockNumber)
+                .where(
+                    TokenHolderBalanceDeltaBlockNumber.token_address == token_address
+                )
+                .limit(1)
+            )
+        ).first()
+        if (
+            recorded_range is None
+            or recorded_range.start_block_number > block_from
+            or recorded_range.latest_block_number < block_from
+        ):
+            return {}, block_from - 1
+
+        block_to = min(block_to, recorded_range.latest_block_number)
+        rows = (
+            await db_session.execute(
+                select(
+                    TokenHolderBalanceDelta.account_address,
+                    func.sum(TokenHolderBalanceDelta.hold_balance),
+                    func.sum(TokenHolderBalanceDelta.locked_balance),
+                )
+                .where(TokenHolderBalanceDelta.token_address == token_address)
+                .where(TokenHolderBalanceDelta.block_number >= block_from)
+                .where(TokenHolderBalanceDelta.block_number <= block_to)
+                .group_by(TokenHolderBalanceDelta.account_address)
+            )
+        ).all()
+        deltas = {
+            account_address: (int(hold_balance or 0), int(locked_balance or 0))
+            for account_address, hold_balance, locked_balance in rows
+        }
+        return deltas, block_to
+
+    @classmethod
+    async def __build_delta_book(
+        cls,
+        logs: ScannedLogs,
+        token_address: str,
+        exchange_address: str,
+        block_from: int,
+        block_to: int,
+    ) -> BalanceDeltaBook:
+        def in_range(events: list[EventData]) -> list[EventData]:
+            return [e for e in events if block_from <= e["blockNumber"] <= block_to]
+
+        book = BalanceDeltaBook()
+
+        # Transfer / HolderChanged
+        transfer_events = in_range(logs.get(token_address, "Transfer"))
+        if exchange_address != ZERO_ADDRESS:
+            transfer_events += [
+                e
+                for e in in_range(logs.get(exchange_address, "HolderChanged"))
+                if e["args"].get("token") == token_address
+            ]
+        for event in transfer_events:
+            args = event["args"]
+            from_account = args.get("from", ZERO_ADDRESS)
+            to_account = args.get("to", ZERO_ADDRESS)
+            amount = int(args.get("value"))
+            # Skip in case of deposit to exchange or withdrawal from exchange
+            if await cls.__is_contract(from_account) or await cls.__is_contract(
+                to_account
+            ):
+                continue
+            if amount <= sys.maxsize:
+                book.store(event["blockNumber"], from_account, amount=-amount)
+                book.store(event["blockNumber"], to_account, amount=+amount)
+
+        # Issue / Redeem
+        for event_name, sign in (("Issue", 1), ("Redeem", -1)):
+            for event in in_range(logs.get(token_address, event_name)):
+                args = event["args"]
+                lock_address = args.get("lockAddress", ZERO_ADDRESS)
+                amount = args.get("amount")
+                if lock_address == ZERO_ADDRESS:
+                    if amount is not None and amount <= sys.maxsize:
+                        book.store(
+                            event["blockNumber"],
+                            args.get("targetAddress", ZERO_ADDRESS),
+                            amount=sign * amount,
+                        )
+
+        # Lock / ForceLock
+        for event_name in ("Lock", "ForceLock"):
+            for event in in_range(logs.get(token_address, event_name)):
+                args = event["args"]
+                amount = args.get("value")
+                if amount is not None and amount <= sys.maxsize:
+                    book.store(
+                        event["blockNumber"],
+                        args.get("accountAddress", ZERO_ADDRESS),
+                        amount=-amount,
+                        locked=+amount,
+                    )
+
+        # Unlock / ForceUnlock
+        for event_name in ("Unlock", "ForceUnlock"):
+            for event in in_range(logs.get(token_address, event_name)):
+                args = event["args"]
+                amount = args.get("value")
+                if amount is not None and amount <= sys.maxsize:
+                    book.store(
+                        event["blockNumber"],
+                        args.get("accountAddress", ZERO_ADDRESS),
+                        locked=-amount,
+                    )
+                    book.store(
+                        event["blockNumber"],
+                        args.get("recipientAddress", ZERO_ADDRESS),
+                        amount=+amount,
+                    )
+
+        # ForceChangeLockedAccount
+        for event in in_range(logs.get(token_address, "ForceChangeLockedAccount")):
+            args = event["args"]
+            amount = args.get("value")
+            if amount is not None and amount <= sys.maxsize:
+                book.store(
+                    event["blockNumber"],
+                    args.get("beforeAccountAddress", ZERO_ADDRESS),
+                    locked=-amount,
+                )
+                book.store(
+                    event["blockNumber"],
+                    args.get("afterAccountAddress", ZERO_ADDRESS),
+                    locked=+amount,
+                )
+
+        # Consume
+        for event in in_range(logs.get(token_address, "Consume")):
+            args = event["args"]
+            book.store(
+                event["blockNumber"],
+                args.get("consumer", ZERO_ADDRESS),
+                amount=-int(args.get("value", 0)),
+            )
+
+        return book
+
+    @classmethod
+    async def __is_contract(cls, address: str) -> bool:
+        if address not in cls._contract_cache:
+            code = await async_web3.eth.get_code(address)
+            cls._contract_cache[address] = code.to_0x_hex() != "0x"
+        return cls._contract_cache[address]
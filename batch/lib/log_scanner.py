@@ -0,0 +1,168 @@
+"""
+Copyright BOOSTRY Co., Ltd.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+
+You may obtain a copy of the License at
+http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing,
+software distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+
+See the License for the specific language governing permissions and
+limitations under the License.
+
+SPDX-License-Identifier: Apache-2.0
+"""
+
+from typing import Any, Sequence
+
+from eth_utils.address import to_checksum_address
+from web3._utils.events import get_event_data
+from web3.contract import AsyncContract as Web3AsyncContract
+from web3.exceptions import MismatchedABI
+from web3.types import EventData, LogReceipt
+
+from app.contracts import AsyncContract, ContractInterface, ContractRegistry
+from app.utils.web3_utils import AsyncWeb3Wrapper
+
+async_web3 = AsyncWeb3Wrapper()
+
+
+class ScannedLogs:
+    """Decoded event logs sorted by (blockNumber, logIndex)"""
+
+    def __init__(self, events: Sequence[EventData]):
+        self.events: list[EventData] = sorted(
+            events, key=lambda e: (e["blockNumber"], e["logIndex"])
+        )
+        self._index: dict[tuple[str, str], list[EventData]] = {}
+        for event in self.events:
+            key = (to_checksum_address(event["address"]), event["event"])
+            self._index.setdefault(key, []).append(event)
+
+    def get(self, address: str, event_name: str) -> list[EventData]:
+        """Get events emitted by the contract
+
+        :param address: contract address
+        :param event_name: event name
+        :return: events in (blockNumber, logIndex) order
+        """
+        return self._index.get((to_checksum_address(address), event_name), [])
+
+    def __iter__(self):
+        return iter(self.events)
+
+    def __len__(self):
+        return len(self.events)
+
+
+class EventLogScanner:
+    """Scan the event logs of multiple contracts at once
+
+    Instead of calling `eth_getLogs` for each contract and event,
+    logs of all target contracts are fetched with a single request
+    filtered by the address list and the set of topic0,
+    and then decoded against the ABI of each contract.
+    """
+
+    # Number of addresses in a single eth_getLogs request
+    MAX_ADDRESSES = 1000
+
+    # contract factory -> contract interface
+    _interface_cache: dict[type, ContractInterface] = {}
+
+    def __init__(self):
+        # address -> topic0 -> event ABI
+        self._targets: dict[str, dict[bytes, dict[str, Any]]] = {}
+        # address -> block number from which logs are required
+        self._from_blocks: dict[str, int] = {}
+
+    def add_target(
+        self,
+        contract: Web3AsyncContract,
+        event_names: Sequence[str],
+        from_block: int,
+    ):
+        """Add contract events to scan
+
+        Events not defined in the contract ABI are ignored.
+        The same address can be added multiple times with different ABIs.
+
+        :param contract: contract object
+        :param event_names: names of the events to scan
+        :param from_block: block number from which logs are required
+        :return: None
+        """
+        address = to_checksum_address(contract.address)
+        topics = self._targets.setdefault(address, {})
+        for event_name in event_names:
+            topic = self.__get_topic(contract, event_name)
+            if topic is not None:
+                topics.setdefault(topic[0], topic[1])
+        self._from_blocks[address] = min(
+            from_block, self._from_blocks.get(address, from_block)
+        )
+
+    async def scan(self, to_block: int) -> ScannedLogs:
+        """Fetch and decode logs of all targets
+
+        :param to_block: To block
+        :return: decoded logs
+        """
+        addresses = [address for address in self._targets if self._targets[address]]
+        if len(addresses) == 0:
+            return ScannedLogs([])
+        from_block = min(self._from_blocks[address] for address in addresses)
+        if from_block > to_block:
+            return ScannedLogs([])
+        topics = sorted(
+            {topic for address in addresses for topic in self._targets[address].keys()}
+        )
+
+        events: list[EventData] = []
+        for i in range(0, len(addresses), self.MAX_ADDRESSES):
+            logs: list[LogReceipt] = await async_web3.eth.get_logs(
+                {
+                    "fromBlock": from_block,
+                    "toBlock": to_block,
+                    "address": addresses[i : i + self.MAX_ADDRESSES],
+                    "topics": [["0x" + topic.hex() for topic in topics]],
+                }
+            )
+            for log in logs:
+                event = self.__decode(log)
+                if event is not None:
+                    events.append(event)
+        return ScannedLogs(events)
+
+    def __decode(self, log: LogReceipt) -> EventData | None:
+        address = to_checksum_address(log["address"])
+        if log["blockNumber"] < self._from_blocks.get(address, 0):
+            return None
+        if len(log["topics"]) == 0:
+            return None
+        event_abi = self._targets.get(address, {}).get(bytes(log["topics"][0]))
+        if event_abi is None:
+            return None
+        try:
+            return get_event_data(async_web3.codec, event_abi, log)
+        except MismatchedABI:
+            return None
+
+    @classmethod
+    def __get_topic(
+        cls, contract: Web3AsyncContract, event_name: str
+    ) -> tuple[bytes, dict[str, Any]] | None:
+        key = type(contract)
+        if key not in cls._interface_cache:
+            # Contracts created by AsyncContract share the interface in the registry
+            contract_name = AsyncContract.get_contract_name(contract)
+            cls._interface_cache[key] = (
+                ContractRegistry.get(contract_name)
+                if contract_name is not None
+                else ContractInterface(abi=list(contract.abi))  # type: ignore
+            )
+        return cls._interface_cache[key].events.get(event_name)
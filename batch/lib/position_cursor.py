@@ -0,0 +1,150 @@
+"""
+Copyright BOOSTRY Co., Ltd.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+
+You may obtain a copy of the License at
+http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing,
+software distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+
+See the License for the specific language governing permissions and
+limitations under the License.
+
+SPDX-License-Identifier: Apache-2.0
+"""
+
+from typing import Any, Iterable
+
+from sqlalchemy import select
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import DATABASE_TYPE, POSITION_SINK_CHUNK_SIZE
+from app.model.db import (
+    IDXPositionBondBlockNumber,
+    IDXPositionCouponBlockNumber,
+    IDXPositionMembershipBlockNumber,
+    IDXPositionShareBlockNumber,
+)
+from app.model.db.base import naive_utcnow
+
+IDXPositionBlockNumber = (
+    type[IDXPositionBondBlockNumber]
+    | type[IDXPositionShareBlockNumber]
+    | type[IDXPositionMembershipBlockNumber]
+    | type[IDXPositionCouponBlockNumber]
+)
+
+
+class PositionCursorBook:
+    """Synchronized block numbers of a position indexer
+
+    The block numbers of all (token, exchange) pairs are loaded into memory once,
+    and the changed ones are written with a single bulk upsert per sync cycle.
+    """
+
+    # (token address, exchange address) -> synchronized block number
+    cursors: dict[tuple[str, str], int]
+
+    def __init__(self, model: IDXPositionBlockNumber):
+        self.model = model
+        self.cursors = {}
+        self.loaded = False
+        # Counters of cursor writes
+        self.write_count = 0  # Number of upsert statements
+        self.written_rows = 0  # Number of written cursors
+        self.skipped_rows = 0  # Number of cursors not written because unchanged
+
+    async def load(self, db_session: AsyncSession):
+        """Load the block numbers from DB (only once)
+
+        :param db_session: ORM session
+        :return: None
+        """
+        if self.loaded:
+            return
+        self.cursors = {
+            (row.token_address, row.exchange_address): row.latest_block_number
+            for row in (
+                await db_session.execute(
+                    select(
+                        self.model.token_address,
+                        self.model.exchange_address,
+                        self.model.latest_block_number,
+                    )
+                )
+            )
+            if row.latest_block_number is not None
+        }
+        self.loaded = True
+
+    def get(self, token_address: str, exchange_address: str) -> int:
+        """Get the synchronized block number (-1 if never synchronized)"""
+        return self.cursors.get((token_address, exchange_address), -1)
+
+    async def save(
+        self,
+        db_session: AsyncSession,
+        keys: Iterable[tuple[str, str]],
+        block_number: int,
+    ):
+        """Write the block number of (token, exchange) pairs
+
+        :param db_session: ORM session
+        :param keys: list of (token address, exchange address)
+        :param block_number: synchronized block number
+        :return: None
+        """
+        now = naive_utcnow()
+        rows: list[dict[str, Any]] = []
+        for token_address, exchange_address in keys:
+            if self.cursors.get((token_address, exchange_address)) == block_number:
+                self.skipped_rows += 1
+                continue
+            rows.append(
+                {
+                    "token_address": token_address,
+                    "exchange_address": exchange_address,
+                    "latest_block_number": block_number,
+                    "created": now,
+                    "modified": now,
+                }
+            )
+
+        for i in range(0, len(rows), POSITION_SINK_CHUNK_SIZE):
+            await db_session.execute(
+                self.__upsert_stmt(rows[i : i + POSITION_SINK_CHUNK_SIZE])
+            )
+            self.write_count += 1
+        self.written_rows += len(rows)
+
+        # NOTE: The cache is updated before commit. If the transaction is rolled back,
+        #       `invalidate` should be called to reload the block numbers.
+        for row in rows:
+            self.cursors[(row["token_address"], row["exchange_address"])] = block_number
+
+    def invalidate(self):
+        self.cursors = {}
+        self.loaded = False
+
+    def __upsert_stmt(self, rows: list[dict[str, Any]]):
+        if DATABASE_TYPE == "mysql":
+            mysql_stmt = mysql_insert(self.model).values(rows)
+            return mysql_stmt.on_duplicate_key_update(
+                latest_block_number=mysql_stmt.inserted.latest_block_number,
+                modified=mysql_stmt.inserted.modified,
+            )
+        else:
+            pg_stmt = pg_insert(self.model).values(rows)
+            return pg_stmt.on_conflict_do_update(
+                index_elements=[self.model.token_address, self.model.exchange_address],
+                set_={
+                    "latest_block_number": pg_stmt.excluded.latest_block_number,
+                    "modified": pg_stmt.excluded.modified,
+                },
+            )
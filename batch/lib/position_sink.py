@@ -0,0 +1,141 @@
+"""
+Copyright BOOSTRY Co., Ltd.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+
+You may obtain a copy of the License at
+http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing,
+software distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+
+See the License for the specific language governing permissions and
+limitations under the License.
+
+SPDX-License-Identifier: Apache-2.0
+"""
+
+from typing import Any, Optional
+
+from sqlalchemy import Connection
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.config import DATABASE_TYPE, POSITION_SINK_CHUNK_SIZE
+from app.model.db import IDXPosition, refresh_token_holder_summaries
+from app.model.db.base import naive_utcnow
+
+POSITION_COLUMNS = [
+    "balance",
+    "pending_transfer",
+    "exchange_balance",
+    "exchange_commitment",
+]
+
+
+class PositionSink:
+    """Bulk writer of positions
+
+    The position indexers append the balances read from the contracts,
+    and the positions are written with multi-row upserts on `flush`
+    instead of a SELECT and a merge for each account.
+
+    Only the columns given for an account are updated on an existing position,
+    and the other columns of a new position are set to 0.
+    """
+
+    # (token address, account address) -> {column: value}
+    positions: dict[tuple[str, str], dict[str, int]]
+
+    def __init__(self):
+        self.positions = {}
+
+    def append(
+        self,
+        token_address: str,
+        account_address: str,
+        balance: Optional[int] = None,
+        pending_transfer: Optional[int] = None,
+        exchange_balance: Optional[int] = None,
+        exchange_commitment: Optional[int] = None,
+    ):
+        values = {
+            "balance": balance,
+            "pending_transfer": pending_transfer,
+            "exchange_balance": exchange_balance,
+            "exchange_commitment": exchange_commitment,
+        }
+        position = self.positions.setdefault((token_address, account_address), {})
+        position.update({k: v for k, v in values.items() if v is not None})
+
+    def __len__(self):
+        return len(self.positions)
+
+    async def flush(self, db_session: AsyncSession):
+        """Write the appended positions
+
+        :param db_session: ORM session
+        :return: None
+        """
+        if len(self.positions) == 0:
+            return
+
+        # Write the pending ORM changes (e.g. locked positions) first
+        await db_session.flush()
+
+        # A multi-row upsert updates the same columns on every row,
+        # so the positions are grouped by the given columns.
+        groups: dict[tuple[str, ...], list[dict[str, Any]]] = {}
+        now = naive_utcnow()
+        for (token_address, account_address), values in self.positions.items():
+            if len(values) == 0:
+                continue
+            columns = tuple(c for c in POSITION_COLUMNS if c in values)
+            groups.setdefault(columns, []).append(
+                {
+                    "token_address": token_address,
+                    "account_address": account_address,
+                    **{c: values.get(c, 0) for c in POSITION_COLUMNS},
+                    "created": now,
+                    "modified": now,
+                }
+            )
+
+        for columns, rows in groups.items():
+            for i in range(0, len(rows), POSITION_SINK_CHUNK_SIZE):
+                await db_session.execute(
+                    self.__upsert_stmt(
+                        rows[i : i + POSITION_SINK_CHUNK_SIZE], [*columns, "modified"]
+                    )
+                )
+
+        # Bulk statements do not emit mapper events
+        keys = [key for key, values in self.positions.items() if len(values) > 0]
+
+        def refresh(session: Session):
+            connection: Connection = session.connection()
+            for i in range(0, len(keys), POSITION_SINK_CHUNK_SIZE):
+                refresh_token_holder_summaries(
+                    connection, keys[i : i + POSITION_SINK_CHUNK_SIZE]
+                )
+
+        await db_session.run_sync(refresh)
+        self.positions = {}
+
+    @staticmethod
+    def __upsert_stmt(rows: list[dict[str, Any]], update_columns: list[str]):
+        if DATABASE_TYPE == "mysql":
+            mysql_stmt = mysql_insert(IDXPosition).values(rows)
+            return mysql_stmt.on_duplicate_key_update(
+                {column: mysql_stmt.inserted[column] for column in update_columns}
+            )
+        else:
+            pg_stmt = pg_insert(IDXPosition).values(rows)
+            return pg_stmt.on_conflict_do_update(
+                index_elements=[IDXPosition.token_address, IDXPosition.account_address],
+                set_={column: pg_stmt.excluded[column] for column in update_columns},
+            )
@@ -0,0 +1,92 @@
+"""
+Copyright BOOSTRY Co., Ltd.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+
+You may obtain a copy of the License at
+http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing,
+software distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+
+See the License for the specific language governing permissions and
+limitations under the License.
+
+SPDX-License-Identifier: Apache-2.0
+"""
+
+import asyncio
+import time
+from typing import Awaitable, Callable, Generic, Sequence, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+class TokenFanOut(Generic[T]):
+    """Read the state of several tokens concurrently and write it in order
+
+    `read` is called for up to `max_concurrency` targets at once, and
+    `write` is called for each target in the given order as soon as the reads
+    of that target and all preceding targets have completed.
+    A slow token therefore delays only the writes after it,
+    while the reads of the other tokens continue.
+    """
+
+    def __init__(self, max_concurrency: int, key: Callable[[T], str]):
+        """
+        :param max_concurrency: Number of targets read concurrently
+        :param key: Function returning the key (e.g. token address) of a target
+        """
+        self.max_concurrency = max(max_concurrency, 1)
+        self.key = key
+        # key -> time spent reading the target since the last reset [sec]
+        self.lags: dict[str, float] = {}
+
+    def reset(self):
+        self.lags = {}
+
+    def slowest(self, count: int) -> list[tuple[str, float]]:
+        """Get the targets with the longest read time
+
+        :param count: Number of targets
+        :return: list of (key, read time)
+        """
+        return sorted(self.lags.items(), key=lambda item: item[1], reverse=True)[:count]
+
+    async def run(
+        self,
+        targets: Sequence[T],
+        read: Callable[[T], Awaitable[R]],
+        write: Callable[[T, R], Awaitable[None]],
+    ):
+        """Read and write all targets
+
+        :param targets: Targets in the order of writes
+        :param read: Function reading the state of a target (must not use the DB session)
+        :param write: Function writing the state of a target
+        :return: None
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def _read(target: T) -> R:
+            async with semaphore:
+                started = time.monotonic()
+                try:
+                    return await read(target)
+                finally:
+                    key = self.key(target)
+                    self.lags[key] = (
+                        self.lags.get(key, 0.0) + time.monotonic() - started
+                    )
+
+        tasks = [asyncio.create_task(_read(target)) for target in targets]
+        try:
+            for target, task in zip(targets, tasks):
+                await write(target, await task)
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
@@ -22,7 +22,7 @@ import asyncio
 import sys
 import time
 from datetime import UTC, datetime
-from typing import Any
+from typing import Any, Sequence
 
 from sqlalchemy import select
 from sqlalchemy.exc import SQLAlchemyError
@@ -33,9 +33,9 @@ from web3.types import EventData
 
 from app.config import (
     IBET_MEMBERSHIP_EXCHANGE_CONTRACT_ADDRESS,
+    NOTIFICATION_LOG_FETCH_CONCURRENCY,
     NOTIFICATION_PROCESS_INTERVAL,
     TOKEN_LIST_CONTRACT_ADDRESS,
-    WORKER_COUNT,
 )
 from app.contracts import AsyncContract
 from app.database import BatchAsyncSessionLocal
@@ -43,15 +43,16 @@ from app.errors import ServiceUnavailable
 from app.model.db import Notification, NotificationBlockNumber, NotificationType
 from app.model.schema.base import TokenType
 from app.utils.asyncio_utils import SemaphoreTaskGroup
+from app.utils.block_utils import block_timestamp_cache
 from app.utils.company_list import CompanyList
 from app.utils.web3_utils import AsyncWeb3Wrapper
 from batch import free_malloc, log
+from batch.lib.block_range import BlockRangePlanner, is_range_error
 from batch.lib.token import TokenFactory
 from batch.lib.token_list import TokenList
 
 LOG = log.get_logger(process_name="PROCESSOR-NOTIFICATIONS-MEMBERSHIP-EXCHANGE")
 
-WORKER_COUNT = int(WORKER_COUNT)
 NOTIFICATION_PROCESS_INTERVAL = int(NOTIFICATION_PROCESS_INTERVAL)
 
 async_web3 = AsyncWeb3Wrapper()
@@ -98,117 +99,152 @@ class Watcher:
 
     @staticmethod
     async def _gen_block_timestamp(entry: EventData) -> datetime:
-        block = await async_web3.eth.get_block(entry["blockNumber"])
-        assert "timestamp" in block
-        return datetime.fromtimestamp(block["timestamp"], UTC).replace(tzinfo=None)
+        block_timestamp = await block_timestamp_cache.get(entry["blockNumber"])
+        return datetime.fromtimestamp(block_timestamp, UTC).replace(tzinfo=None)
 
     async def watch(self, db_session: AsyncSession, entries: list[EventData]) -> None:
         pass
 
     async def loop(self) -> None:
         start_time = time.time()
-        db_session = BatchAsyncSessionLocal()
-
-        try:
-            # Get synchronized block number
-            from_block_number = (
-                await self.__get_synchronized_block_number(
-                    db_session=db_session,
-                    contract_address=self.contract.address,
-                    notification_type=self.notification_type,
-                )
-                + 1
-            )
+        await run_watchers([self])
+        elapsed_time = time.time() - start_time
+        LOG.info(
+            "<{}> finished in {} secs".format(self.__class__.__name__, elapsed_time)
+        )
 
-            # Get the latest block number
-            latest_block_number = await async_web3.eth.block_number
-            if from_block_number > latest_block_number:
-                LOG.info(f"<{self.__class__.__name__}> skip processing")
-                return
+    async def get_logs(
+        self, from_block_number: int, latest_block_number: int
+    ) -> tuple[int, list[EventData]] | None:
+        """Get event logs
 
-            # If the difference between the latest block number and fromBlock is 1,000,000 or more,
-            # set toBlock to fromBlock + 999,999
-            if latest_block_number - from_block_number >= 1000000:
-                to_block_number = from_block_number + 999999
-            else:
-                to_block_number = latest_block_number
+        :return: to block and event logs (None if the logs could not be fetched)
+        """
+        # Set toBlock according to the log density of the contract
+        planner = BlockRangePlanner(
+            key=f"{self.__class__.__name__}:{self.contract.address}"
+        )
+        to_block_number = planner.get_chunk_end(from_block_number, latest_block_number)
 
-            # Get event logs
-            try:
-                _event = getattr(self.contract.events, self.filter_name)
-                entries: list[EventData] = await _event.get_logs(
-                    from_block=from_block_number, to_block=to_block_number
-                )
-            except ABIEventNotFound:
-                entries = []
-
-            # Register notifications
-            if len(entries) > 0:
-                await self.watch(db_session=db_session, entries=entries)
-
-            # Update synchronized block number
-            await self.__set_synchronized_block_number(
-                db_session=db_session,
-                contract_address=self.contract.address,
-                notification_type=self.notification_type,
-                block_number=to_block_number,
+        started = time.monotonic()
+        try:
+            _event = getattr(self.contract.events, self.filter_name)
+            entries: list[EventData] = await _event.get_logs(
+                from_block=from_block_number, to_block=to_block_number
             )
-
-            await db_session.commit()
-
-        except ServiceUnavailable:
-            LOG.notice("An external service was unavailable")
-        except SQLAlchemyError as sa_err:
-            LOG.error(f"A database error has occurred: code={sa_err.code}\n{sa_err}")
+        except ABIEventNotFound:
+            entries = []
         except Exception as err:  # Exceptionが発生した場合は処理を継続
+            if is_range_error(err):
+                planner.shrink()
             LOG.error(err)
-        finally:
-            await db_session.close()
-            elapsed_time = time.time() - start_time
-            LOG.info(
-                "<{}> finished in {} secs".format(self.__class__.__name__, elapsed_time)
-            )
+            return None
+        planner.record(
+            block_from=from_block_number,
+            block_to=to_block_number,
+            log_count=len(entries),
+            elapsed=time.monotonic() - started,
+        )
+        return to_block_number, entries
 
-    @staticmethod
-    async def __get_synchronized_block_number(
-        db_session: AsyncSession, contract_address: str, notification_type: str
-    ):
-        """Get latest synchronized blockNumber"""
-        notification_block_number: NotificationBlockNumber | None = (
-            await db_session.scalars(
-                select(NotificationBlockNumber)
-                .where(NotificationBlockNumber.notification_type == notification_type)
-                .where(NotificationBlockNumber.contract_address == contract_address)
-                .limit(1)
-            )
-        ).first()
-        if notification_block_number is None:
-            return -1
-        else:
-            return notification_block_number.latest_block_number
 
-    @staticmethod
-    async def __set_synchronized_block_number(
-        db_session: AsyncSession,
-        contract_address: str,
-        notification_type: str,
-        block_number: int,
-    ):
-        """Set latest synchronized blockNumber"""
-        notification_block_number: NotificationBlockNumber | None = (
+async def run_watchers(watchers: list[Watcher]) -> None:
+    """Run a notification cycle of the watchers
+
+    Event logs are fetched concurrently, and the notifications and
+    the synchronized block numbers of all watchers are written in one transaction.
+    """
+    db_session = BatchAsyncSessionLocal()
+    try:
+        latest_block_number = await async_web3.eth.block_number
+
+        # Get synchronized block numbers
+        notification_block_numbers: Sequence[NotificationBlockNumber] = (
             await db_session.scalars(
-                select(NotificationBlockNumber)
-                .where(NotificationBlockNumber.notification_type == notification_type)
-                .where(NotificationBlockNumber.contract_address == contract_address)
-                .limit(1)
+                select(NotificationBlockNumber).where(
+                    NotificationBlockNumber.notification_type.in_(
+                        [watcher.notification_type for watcher in watchers]
+                    )
+                )
             )
-        ).first()
-        if notification_block_number is None:
-            notification_block_number = NotificationBlockNumber()
-        notification_block_number.notification_type = notification_type
-        notification_block_number.contract_address = contract_address
-        notification_block_number.latest_block_number = block_number
-        await db_session.merge(notification_block_number)
+        ).all()
+        synchronized = {
+            (
+                notification_block_number.notification_type,
+                notification_block_number.contract_address,
+            ): notification_block_number
+            for notification_block_number in notification_block_numbers
+        }
+        target_list: list[tuple[Watcher, int]] = []
+        for watcher in watchers:
+            notification_block_number = synchronized.get(
+                (watcher.notification_type, watcher.contract.address)
+            )
+            from_block_number = (
+                notification_block_number.latest_block_number
+                if notification_block_number is not None
+                else -1
+            ) + 1
+            if from_block_number > latest_block_number:
+                LOG.info(f"<{watcher.__class__.__name__}> skip processing")
+                continue
+            target_list.append((watcher, from_block_number))
+
+        # Get event logs concurrently
+        tasks = await SemaphoreTaskGroup.run(
+            *[
+                watcher.get_logs(from_block_number, latest_block_number)
+                for watcher, from_block_number in target_list
+            ],
+            max_concurrency=NOTIFICATION_LOG_FETCH_CONCURRENCY,
+        )
+        results = [task.result() for task in tasks]
+        await block_timestamp_cache.get_many(
+            entry["blockNumber"]
+            for result in results
+            if result is not None
+            for entry in result[1]
+        )
+
+        # Register notifications
+        for (watcher, _), result in zip(target_list, results):
+            if result is None:
+                continue
+            to_block_number, entries = result
+            try:
+                async with db_session.begin_nested():
+                    if len(entries) > 0:
+                        await watcher.watch(db_session=db_session, entries=entries)
+
+                    # Update synchronized block number
+                    notification_block_number = synchronized.get(
+                        (watcher.notification_type, watcher.contract.address)
+                    )
+                    if notification_block_number is None:
+                        notification_block_number = NotificationBlockNumber()
+                        notification_block_number.notification_type = (
+                            watcher.notification_type
+                        )
+                        notification_block_number.contract_address = (
+                            watcher.contract.address
+                        )
+                        db_session.add(notification_block_number)
+                    notification_block_number.latest_block_number = to_block_number
+            except ServiceUnavailable:
+                LOG.notice("An external service was unavailable")
+            except Exception as err:  # Exceptionが発生した場合は処理を継続
+                LOG.error(err)
+
+        await db_session.commit()
+
+    except ExceptionGroup as e:
+        LOG.error(e.exceptions)
+    except ServiceUnavailable:
+        LOG.notice("An external service was unavailable")
+    except SQLAlchemyError as sa_err:
+        LOG.error(f"A database error has occurred: code={sa_err.code}\n{sa_err}")
+    finally:
+        await db_session.close()
 
 
 class WatchMembershipNewOrder(Watcher):
@@ -616,18 +652,12 @@ async def main():
     while True:
         start_time = time.time()
 
-        try:
-            tasks = await SemaphoreTaskGroup.run(
-                *[watcher.loop() for watcher in watchers], max_concurrency=WORKER_COUNT
-            )
-            [task.result() for task in tasks]
-        except ExceptionGroup as e:
-            LOG.error(e.exceptions)
+        await run_watchers(watchers)
 
         elapsed_time = time.time() - start_time
         LOG.info("<LOOP> finished in {} secs".format(elapsed_time))
 
-        time.sleep(max(NOTIFICATION_PROCESS_INTERVAL - elapsed_time, 0))
+        await asyncio.sleep(max(NOTIFICATION_PROCESS_INTERVAL - elapsed_time, 0))
         free_malloc()
 
 
@@ -21,10 +21,10 @@ SPDX-License-Identifier: Apache-2.0
 import asyncio
 import sys
 import time
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta
 from typing import Any, Sequence, TypedDict
 
-from sqlalchemy import and_, select
+from sqlalchemy import and_, delete, func, select
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 from web3 import Web3
@@ -35,7 +35,9 @@ from web3.exceptions import (
 from web3.types import EventData
 
 from app.config import (
+    NOTIFICATION_LOG_FETCH_CONCURRENCY,
     NOTIFICATION_PROCESS_INTERVAL,
+    TOKEN_CACHE,
     TOKEN_LIST_CONTRACT_ADDRESS,
     WORKER_COUNT,
 )
@@ -50,18 +52,22 @@ from app.model.blockchain import (
     TokenInstanceTypes,
 )
 from app.model.db import (
+    IDXTokenAttributeChangeLog,
     IDXTokenListRegister,
     Listing,
     Notification,
+    NotificationAttributeChangeCursor,
     NotificationAttributeValue,
     NotificationBlockNumber,
     NotificationType,
 )
 from app.model.schema.base import TokenType
 from app.utils.asyncio_utils import SemaphoreTaskGroup
+from app.utils.block_utils import block_timestamp_cache
 from app.utils.company_list import CompanyList
 from app.utils.web3_utils import AsyncWeb3Wrapper
 from batch import free_malloc, log
+from batch.lib.block_range import BlockRangePlanner, is_range_error
 from batch.lib.token_list import TokenList
 
 LOG = log.get_logger(process_name="PROCESSOR-NOTIFICATIONS-TOKEN")
@@ -117,9 +123,8 @@ class EventWatcher:
 
     @staticmethod
     async def _gen_block_timestamp(entry: EventData) -> datetime:
-        block = await async_web3.eth.get_block(entry["blockNumber"])
-        assert "timestamp" in block
-        return datetime.fromtimestamp(block["timestamp"], UTC).replace(tzinfo=None)
+        block_timestamp = await block_timestamp_cache.get(entry["blockNumber"])
+        return datetime.fromtimestamp(block_timestamp, UTC).replace(tzinfo=None)
 
     @staticmethod
     async def _get_token_all_list(
@@ -166,63 +171,60 @@ class EventWatcher:
             )
             latest_block_number = await async_web3.eth.block_number
 
+            # Get synchronized block numbers
+            synchronized = await self.__get_synchronized_block_numbers(
+                db_session=db_session,
+                contract_address_list=[
+                    _token["token"].token_address for _token in _token_list
+                ],
+                notification_type=self.notification_type,
+            )
+            if not self.skip_past_data_on_initial_sync:
+                initial_block_number = -1
+            else:
+                initial_block_number = latest_block_number - 1
+            target_list: list[tuple[TokenInfo, int]] = []
             for _token in _token_list:
-                assert _token["token_type"] is not None
-                assert _token["token"].owner_address is not None
-                # Get synchronized block number
+                notification_block_number = synchronized.get(
+                    _token["token"].token_address
+                )
                 from_block_number = (
-                    await self.__get_synchronized_block_number(
-                        db_session=db_session,
-                        contract_address=_token["token"].token_address,
-                        notification_type=self.notification_type,
-                        latest_block_number=latest_block_number,
-                        skip_past_data_on_initial_sync=self.skip_past_data_on_initial_sync,
-                    )
-                    + 1
+                    notification_block_number.latest_block_number
+                    if notification_block_number is not None
+                    else initial_block_number
+                ) + 1
+                if from_block_number <= latest_block_number:
+                    target_list.append((_token, from_block_number))
+            if len(target_list) == 0:
+                LOG.info(f"<{self.__class__.__name__}> skip processing")
+                return
+
+            # Get event logs of each token concurrently
+            try:
+                tasks = await SemaphoreTaskGroup.run(
+                    *[
+                        self.__get_logs(_token, from_block_number, latest_block_number)
+                        for _token, from_block_number in target_list
+                    ],
+                    max_concurrency=NOTIFICATION_LOG_FETCH_CONCURRENCY,
                 )
+            except ExceptionGroup:
+                raise ServiceUnavailable from None
+            results = [task.result() for task in tasks]
+            await block_timestamp_cache.get_many(
+                entry["blockNumber"]
+                for result in results
+                if result is not None
+                for entry in result[2]
+            )
 
-                # Get the latest block number
-                if from_block_number > latest_block_number:
-                    LOG.info(f"<{self.__class__.__name__}> skip processing")
-                    return
-
-                # If the difference between the latest block number and fromBlock is 1,000,000 or more,
-                # set toBlock to fromBlock + 999,999
-                if latest_block_number - from_block_number >= 1000000:
-                    to_block_number = from_block_number + 999999
-                else:
-                    to_block_number = latest_block_number
-
-                # Get event logs
-                token_contract: Web3AsyncContract | None = None
-                try:
-                    token_contract = self.contract_cache.get(
-                        _token["token"].token_address
-                    )
-                    if token_contract is None:
-                        token_contract = AsyncContract.get_contract(
-                            contract_name=_token["token_type"],
-                            address=_token["token"].token_address,
-                        )
-                        self.contract_cache[_token["token"].token_address] = (
-                            token_contract
-                        )
-                    _event = getattr(token_contract.events, self.filter_name)
-                    entries: list[EventData] = await _event.get_logs(
-                        from_block=from_block_number, to_block=to_block_number
-                    )
-                except ABIEventNotFound:  # Backward compatibility
-                    entries = []
-                except FileNotFoundError:
-                    continue
-                except Exception as err:  # If an Exception occurs, processing continues
-                    LOG.error(err)
-                    continue
-
-                # Register notifications
-                if token_contract is None:
+            # Register notifications
+            for (_token, _), result in zip(target_list, results):
+                if result is None:
                     continue
-
+                token_contract, to_block_number, entries = result
+                assert _token["token_type"] is not None
+                assert _token["token"].owner_address is not None
                 if len(entries) > 0:
                     await self.db_merge(
                         db_session=db_session,
@@ -233,14 +235,19 @@ class EventWatcher:
                     )
 
                 # Update synchronized block number
-                await self.__set_synchronized_block_number(
-                    db_session=db_session,
-                    contract_address=_token["token"].token_address,
-                    notification_type=self.notification_type,
-                    block_number=to_block_number,
+                notification_block_number = synchronized.get(
+                    _token["token"].token_address
                 )
+                if notification_block_number is None:
+                    notification_block_number = NotificationBlockNumber()
+                    notification_block_number.notification_type = self.notification_type
+                    notification_block_number.contract_address = _token[
+                        "token"
+                    ].token_address
+                    db_session.add(notification_block_number)
+                notification_block_number.latest_block_number = to_block_number
 
-                await db_session.commit()
+            await db_session.commit()
 
         except ServiceUnavailable:
             LOG.notice("An external service was unavailable")
@@ -253,52 +260,73 @@ class EventWatcher:
                 "<{}> finished in {} secs".format(self.__class__.__name__, elapsed_time)
             )
 
-    @staticmethod
-    async def __get_synchronized_block_number(
-        db_session: AsyncSession,
-        contract_address: str,
-        notification_type: str,
-        latest_block_number: int,
-        skip_past_data_on_initial_sync: bool,
-    ):
-        """Get latest synchronized blockNumber"""
-        notification_block_number: NotificationBlockNumber | None = (
-            await db_session.scalars(
-                select(NotificationBlockNumber)
-                .where(NotificationBlockNumber.notification_type == notification_type)
-                .where(NotificationBlockNumber.contract_address == contract_address)
-                .limit(1)
+    async def __get_logs(
+        self, token: TokenInfo, from_block_number: int, latest_block_number: int
+    ) -> tuple[Web3AsyncContract, int, list[EventData]] | None:
+        """Get event logs of the token
+
+        :return: token contract, to block and event logs
+                 (None if the logs could not be fetched)
+        """
+        assert token["token_type"] is not None
+        token_address = token["token"].token_address
+
+        # Set toBlock according to the log density of the contract
+        planner = BlockRangePlanner(key=f"{self.__class__.__name__}:{token_address}")
+        to_block_number = planner.get_chunk_end(from_block_number, latest_block_number)
+
+        started = time.monotonic()
+        try:
+            token_contract = self.contract_cache.get(token_address)
+            if token_contract is None:
+                token_contract = AsyncContract.get_contract(
+                    contract_name=token["token_type"], address=token_address
+                )
+                self.contract_cache[token_address] = token_contract
+        except FileNotFoundError:
+            return None
+        try:
+            _event = getattr(token_contract.events, self.filter_name)
+            entries: list[EventData] = await _event.get_logs(
+                from_block=from_block_number, to_block=to_block_number
             )
-        ).first()
-        if notification_block_number is None:
-            if skip_past_data_on_initial_sync is True:
-                return latest_block_number - 1
-            return -1
-        else:
-            return notification_block_number.latest_block_number
+        except ABIEventNotFound:  # Backward compatibility
+            entries = []
+        except Exception as err:  # If an Exception occurs, processing continues
+            if is_range_error(err):
+                planner.shrink()
+            LOG.error(err)
+            return None
+        planner.record(
+            block_from=from_block_number,
+            block_to=to_block_number,
+            log_count=len(entries),
+            elapsed=time.monotonic() - started,
+        )
+        return token_contract, to_block_number, entries
 
     @staticmethod
-    async def __set_synchronized_block_number(
+    async def __get_synchronized_block_numbers(
         db_session: AsyncSession,
-        contract_address: str,
+        contract_address_list: list[str],
         notification_type: str,
-        block_number: int,
-    ):
-        """Set latest synchronized blockNumber"""
-        notification_block_number: NotificationBlockNumber | None = (
+    ) -> dict[str, NotificationBlockNumber]:
+        """Get latest synchronized blockNumber of each contract"""
+        if len(contract_address_list) == 0:
+            return {}
+        notification_block_numbers: Sequence[NotificationBlockNumber] = (
             await db_session.scalars(
                 select(NotificationBlockNumber)
                 .where(NotificationBlockNumber.notification_type == notification_type)
-                .where(NotificationBlockNumber.contract_address == contract_address)
-                .limit(1)
+                .where(
+                    NotificationBlockNumber.contract_address.in_(contract_address_list)
+                )
             )
-        ).first()
-        if notification_block_number is None:
-            notification_block_number = NotificationBlockNumber()
-        notification_block_number.notification_type = notification_type
-        notification_block_number.contract_address = contract_address
-        notification_block_number.latest_block_number = block_number
-        await db_session.merge(notification_block_number)
+        ).all()
+        return {
+            notification_block_number.contract_address: notification_block_number
+            for notification_block_number in notification_block_numbers
+        }
 
 
 class WatchTransfer(EventWatcher):
@@ -670,6 +698,20 @@ class WatchChangeToCanceled(EventWatcher):
 
 # AttributeWatcher
 class AttributeWatcher:
+    """Attribute watcher
+
+    Only tokens whose cached attributes have changed are diffed, following the change log
+    recorded by the token detail indexers (see TokenBase.merge_cache).
+    All listed tokens are diffed only on the initial sync.
+
+    If TOKEN_CACHE is disabled, the change log is not recorded,
+    so all listed tokens are diffed in every cycle.
+    """
+
+    # Change logs created within this period are read again in the next cycle
+    # NOTE: A change log may be committed after the one with a larger id.
+    CHANGE_LOG_SETTLE_SEC = 60
+
     def __init__(
         self,
         attribute_key: str,
@@ -695,7 +737,9 @@ class AttributeWatcher:
 
     @staticmethod
     async def _get_token_all_list(
-        db_session: AsyncSession, token_type_list: list[TokenType]
+        db_session: AsyncSession,
+        token_type_list: list[TokenType],
+        token_address_list: list[str] | None = None,
     ) -> list[TokenInfo]:
         _tokens: list[TokenInfo] = []
 
@@ -705,6 +749,10 @@ class AttributeWatcher:
         )
         if len(token_type_list) != 0:
             stmt = stmt.where(IDXTokenListRegister.token_template.in_(token_type_list))
+        if token_address_list is not None:
+            stmt = stmt.where(
+                IDXTokenListRegister.token_address.in_(token_address_list)
+            )
         registered_tokens: Sequence[IDXTokenListRegister] = (
             await db_session.scalars(stmt)
         ).all()
@@ -734,90 +782,63 @@ class AttributeWatcher:
         db_session = BatchAsyncSessionLocal()
 
         try:
-            # Get listed tokens
-            _token_list = await self._get_token_all_list(
-                db_session, self.token_type_list
-            )
-
-            for _token in _token_list:
-                assert _token["token_type"] is not None
-                assert _token["token"].owner_address is not None
-                try:
-                    # Get previous attribute value from DB
-                    previous_attribute_key_value = await self.__get_attribute_value(
-                        db_session,
-                        _token["token"].token_address,
-                        self.attribute_key,
+            # Get tokens whose attributes have changed since the last cycle
+            cursor = await self.__get_change_cursor(db_session)
+            if cursor is None or TOKEN_CACHE is False:
+                # Initial sync or token cache disabled: watch all listed tokens
+                latest_change_log_id = (
+                    await db_session.scalar(
+                        select(func.max(IDXTokenAttributeChangeLog.id))
                     )
-                    is_initial_sync = previous_attribute_key_value is None
-
-                    # Get token detail by token type
-                    token_detail: TokenInstanceTypes | None = None
-                    if _token["token_type"] == TokenType.IbetStraightBond:
-                        token_detail = await BondToken.get(
-                            db_session, _token["token"].token_address
-                        )
-                    elif _token["token_type"] == TokenType.IbetShare:
-                        token_detail = await ShareToken.get(
-                            db_session, _token["token"].token_address
-                        )
-                    elif _token["token_type"] == TokenType.IbetCoupon:
-                        token_detail = await CouponToken.get(
-                            db_session, _token["token"].token_address
-                        )
-                    elif _token["token_type"] == TokenType.IbetMembership:
-                        token_detail = await MembershipToken.get(
-                            db_session, _token["token"].token_address
+                ) or 0
+                _token_list = await self._get_token_all_list(
+                    db_session, self.token_type_list
+                )
+            else:
+                settled_at = datetime.now(UTC).replace(tzinfo=None) - timedelta(
+                    seconds=self.CHANGE_LOG_SETTLE_SEC
+                )
+                change_logs = (
+                    await db_session.execute(
+                        select(
+                            IDXTokenAttributeChangeLog.id,
+                            IDXTokenAttributeChangeLog.token_address,
+                            IDXTokenAttributeChangeLog.created,
                         )
-                    else:  # pragma: no cover
-                        continue
-
-                    # Get current attribute value from token detail
-                    assert token_detail is not None
-                    current_attribute_value: str | int | bool | None = (
-                        token_detail.__dict__.get(self.attribute_key)
+                        .where(IDXTokenAttributeChangeLog.id > cursor)
+                        .order_by(IDXTokenAttributeChangeLog.id)
                     )
-
-                    if (
-                        is_initial_sync is False
-                        and previous_attribute_key_value is not None
-                    ):
-                        # Get previous attribute value from DB record
-                        previous_attribute_value = (
-                            previous_attribute_key_value.attribute.get(
-                                self.attribute_key, None
-                            )
-                        )
-                        # Register notification only if attribute value has changed
-                        if (
-                            current_attribute_value is not None
-                            and current_attribute_value != previous_attribute_value
-                        ):
-                            token_name = token_detail.name
-                            # Register attribute change notification
-                            await self.db_merge(
-                                db_session=db_session,
-                                token_address=_token["token"].token_address,
-                                token_type=_token["token_type"],
-                                token_owner_address=_token["token"].owner_address,
-                                token_name=token_name,
-                                previous_value=previous_attribute_value,
-                                current_value=current_attribute_value,
-                            )
-
-                    # Save latest attribute value to DB
-                    await self.__set_attribute_value(
+                ).all()
+                latest_change_log_id = max(
+                    [cursor]
+                    + [
+                        change_log.id
+                        for change_log in change_logs
+                        if change_log.created is not None
+                        and change_log.created <= settled_at
+                    ]
+                )
+                _token_list = (
+                    await self._get_token_all_list(
                         db_session,
-                        _token["token"].token_address,
-                        self.attribute_key,
-                        current_attribute_value,
+                        self.token_type_list,
+                        list({change_log.token_address for change_log in change_logs}),
                     )
-                    await db_session.commit()
+                    if len(change_logs) > 0
+                    else []
+                )
 
+            for _token in _token_list:
+                try:
+                    await self.__watch_token(db_session, _token)
+                    await db_session.commit()
                 except Exception:  # Continue processing even if an exception occurs
+                    await db_session.rollback()
                     LOG.exception("Failed to watch attribute")
                     continue
 
+            await self.__set_change_cursor(db_session, latest_change_log_id)
+            await db_session.commit()
         except SQLAlchemyError as sa_err:
             LOG.error(f"A database error has occurred: code={sa_err.code}\n{sa_err}")
         finally:
@@ -827,6 +848,100 @@ class AttributeWatcher:
                 "<{}> finished in {} secs".format(self.__class__.__name__, elapsed_time)
             )
 
+    async def __watch_token(self, db_session: AsyncSession, token: TokenInfo):
+        """Register a notification if the attribute value of the token has changed"""
+        assert token["token_type"] is not None
+        assert token["token"].owner_address is not None
+
+        # Get previous attribute value from DB
+        previous_attribute_key_value = await self.__get_attribute_value(
+            db_session,
+            token["token"].token_address,
+            self.attribute_key,
+        )
+        is_initial_sync = previous_attribute_key_value is None
+
+        # Get token detail by token type
+        token_detail: TokenInstanceTypes | None = None
+        if token["token_type"] == TokenType.IbetStraightBond:
+            token_detail = await BondToken.get(db_session, token["token"].token_address)
+        elif token["token_type"] == TokenType.IbetShare:
+            token_detail = await ShareToken.get(
+                db_session, token["token"].token_address
+            )
+        elif token["token_type"] == TokenType.IbetCoupon:
+            token_detail = await CouponToken.get(
+                db_session, token["token"].token_address
+            )
+        elif token["token_type"] == TokenType.IbetMembership:
+            token_detail = await MembershipToken.get(
+                db_session, token["token"].token_address
+            )
+        else:  # pragma: no cover
+            return
+
+        # Get current attribute value from token detail
+        assert token_detail is not None
+        current_attribute_value: str | int | bool | None = token_detail.__dict__.get(
+            self.attribute_key
+        )
+
+        if is_initial_sync is False and previous_attribute_key_value is not None:
+            # Get previous attribute value from DB record
+            previous_attribute_value = previous_attribute_key_value.attribute.get(
+                self.attribute_key, None
+            )
+            # Register notification only if attribute value has changed
+            if (
+                current_attribute_value is not None
+                and current_attribute_value != previous_attribute_value
+            ):
+                token_name = token_detail.name
+                # Register attribute change notification
+                await self.db_merge(
+                    db_session=db_session,
+                    token_address=token["token"].token_address,
+                    token_type=token["token_type"],
+                    token_owner_address=token["token"].owner_address,
+                    token_name=token_name,
+                    previous_value=previous_attribute_value,
+                    current_value=current_attribute_value,
+                )
+
+        # Save latest attribute value to DB
+        await self.__set_attribute_value(
+            db_session,
+            token["token"].token_address,
+            self.attribute_key,
+            current_attribute_value,
+        )
+        await db_session.commit()
+
+    async def __get_change_cursor(self, db_session: AsyncSession) -> int | None:
+        """Get the latest processed id of the change log"""
+        cursor: NotificationAttributeChangeCursor | None = (
+            await db_session.scalars(
+                select(NotificationAttributeChangeCursor)
+                .where(
+                    NotificationAttributeChangeCursor.notification_type
+                    == self.notification_type
+                )
+                .limit(1)
+            )
+        ).first()
+        if cursor is None:
+            return None
+        return cursor.latest_change_log_id
+
+    async def __set_change_cursor(
+        self, db_session: AsyncSession, latest_change_log_id: int
+    ):
+        """Set the latest processed id of the change log"""
+        cursor = NotificationAttributeChangeCursor()
+        cursor.notification_type = self.notification_type
+        cursor.latest_change_log_id = latest_change_log_id
+        await db_session.merge(cursor)
+
     @staticmethod
     async def __get_attribute_value(
         db_session: AsyncSession, contract_address: str, attribute_key: str
@@ -928,6 +1043,33 @@ class WatchTransferableAttribute(AttributeWatcher):
         await db_session.merge(notification)
 
 
+async def delete_processed_change_logs(watchers: list[AttributeWatcher]):
+    """Delete change logs of token attributes processed by all attribute watchers"""
+    db_session = BatchAsyncSessionLocal()
+    try:
+        cursors = (
+            await db_session.scalars(
+                select(NotificationAttributeChangeCursor.latest_change_log_id).where(
+                    NotificationAttributeChangeCursor.notification_type.in_(
+                        [watcher.notification_type for watcher in watchers]
+                    )
+                )
+            )
+        ).all()
+        if len(watchers) == 0 or len(cursors) < len(watchers):
+            return
+        await db_session.execute(
+            delete(IDXTokenAttributeChangeLog).where(
+                IDXTokenAttributeChangeLog.id <= min(cursors)
+            )
+        )
+        await db_session.commit()
+    except SQLAlchemyError as sa_err:
+        LOG.error(f"A database error has occurred: code={sa_err.code}\n{sa_err}")
+    finally:
+        await db_session.close()
+
+
 # メイン処理
 async def main():
     watchers = [
@@ -954,6 +1096,9 @@ async def main():
             [task.result() for task in tasks]
         except ExceptionGroup as e:
             LOG.error(e.exceptions)
+        await delete_processed_change_logs(
+            [watcher for watcher in watchers if isinstance(watcher, AttributeWatcher)]
+        )
 
         elapsed_time = time.time() - start_time
         LOG.info("<LOOP> finished in {} secs".format(elapsed_time))
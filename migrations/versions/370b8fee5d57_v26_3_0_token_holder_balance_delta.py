@@ -0,0 +1,53 @@
+"""v26_3_0_token_holder_balance_delta
+
+Revision ID: 370b8fee5d57
+Revises: 835dd5b51e23
+Create Date: 2026-10-17 10:12:41.503218
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+from app.database import get_db_schema
+
+# revision identifiers, used by Alembic.
+revision = "370b8fee5d57"
+down_revision = "835dd5b51e23"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    connection = op.get_bind()
+
+    op.create_table(
+        "token_holder_balance_delta",
+        sa.Column("token_address", sa.String(length=42), nullable=False),
+        sa.Column("block_number", sa.BigInteger(), nullable=False),
+        sa.Column("account_address", sa.String(length=42), nullable=False),
+        sa.Column("hold_balance", sa.BigInteger(), nullable=False),
+        sa.Column("locked_balance", sa.BigInteger(), nullable=False),
+        sa.Column("created", sa.DateTime(), nullable=True),
+        sa.Column("modified", sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint("token_address", "block_number", "account_address"),
+        schema=get_db_schema(),
+    )
+    op.create_table(
+        "token_holder_balance_delta_block_number",
+        sa.Column("token_address", sa.String(length=42), nullable=False),
+        sa.Column("start_block_number", sa.BigInteger(), nullable=False),
+        sa.Column("latest_block_number", sa.BigInteger(), nullable=False),
+        sa.Column("created", sa.DateTime(), nullable=True),
+        sa.Column("modified", sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint("token_address"),
+        schema=get_db_schema(),
+    )
+
+
+def downgrade():
+    connection = op.get_bind()
+
+    op.drop_table("token_holder_balance_delta_block_number", schema=get_db_schema())
+    op.drop_table("token_holder_balance_delta", schema=get_db_schema())
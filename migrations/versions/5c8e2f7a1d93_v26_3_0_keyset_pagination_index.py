@@ -0,0 +1,52 @@
+"""v26_3_0_keyset_pagination_index
+
+Revision ID: 5c8e2f7a1d93
+Revises: b6d1e4a9c2f7
+Create Date: 2026-10-17 15:02:18.274961
+
+"""
+
+from alembic import op
+
+
+from app.database import get_db_schema
+
+# revision identifiers, used by Alembic.
+revision = "5c8e2f7a1d93"
+down_revision = "b6d1e4a9c2f7"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    connection = op.get_bind()
+
+    op.create_index(
+        "transfer_index_1",
+        "transfer",
+        ["token_address", "id"],
+        unique=False,
+        schema=get_db_schema(),
+    )
+    op.create_index(
+        "transfer_index_2",
+        "transfer",
+        ["token_address", "created", "id"],
+        unique=False,
+        schema=get_db_schema(),
+    )
+    op.create_index(
+        "position_index_1",
+        "position",
+        ["token_address", "created", "account_address"],
+        unique=False,
+        schema=get_db_schema(),
+    )
+
+
+def downgrade():
+    connection = op.get_bind()
+
+    op.drop_index("position_index_1", table_name="position", schema=get_db_schema())
+    op.drop_index("transfer_index_2", table_name="transfer", schema=get_db_schema())
+    op.drop_index("transfer_index_1", table_name="transfer", schema=get_db_schema())
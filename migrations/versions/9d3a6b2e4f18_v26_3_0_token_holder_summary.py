@@ -0,0 +1,121 @@
+"""v26_3_0_token_holder_summary
+
+Revision ID: 9d3a6b2e4f18
+Revises: 5c8e2f7a1d93
+Create Date: 2026-10-17 16:21:45.503127
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+from app.database import get_db_schema
+
+# revision identifiers, used by Alembic.
+revision = "9d3a6b2e4f18"
+down_revision = "5c8e2f7a1d93"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    connection = op.get_bind()
+
+    op.create_table(
+        "token_holder_summary",
+        sa.Column("token_address", sa.String(length=42), nullable=False),
+        sa.Column("account_address", sa.String(length=42), nullable=False),
+        sa.Column("balance", sa.BigInteger(), nullable=False),
+        sa.Column("pending_transfer", sa.BigInteger(), nullable=False),
+        sa.Column("exchange_balance", sa.BigInteger(), nullable=False),
+        sa.Column("exchange_commitment", sa.BigInteger(), nullable=False),
+        sa.Column("locked", sa.BigInteger(), nullable=False),
+        sa.Column("account_tag", sa.String(length=50), nullable=True),
+        sa.Column("created", sa.DateTime(), nullable=True),
+        sa.Column("modified", sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint("token_address", "account_address"),
+        schema=get_db_schema(),
+    )
+    op.create_index(
+        "token_holder_summary_index_1",
+        "token_holder_summary",
+        ["token_address", "created", "account_address"],
+        unique=False,
+        schema=get_db_schema(),
+    )
+    op.create_index(
+        "token_holder_summary_index_2",
+        "token_holder_summary",
+        ["token_address", "account_tag"],
+        unique=False,
+        schema=get_db_schema(),
+    )
+    op.create_table(
+        "token_holder_count",
+        sa.Column("token_address", sa.String(length=42), nullable=False),
+        sa.Column("holder_count", sa.BigInteger(), nullable=False),
+        sa.Column("created", sa.DateTime(), nullable=True),
+        sa.Column("modified", sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint("token_address"),
+        schema=get_db_schema(),
+    )
+
+    # Backfill from the current positions
+    op.execute(
+        sa.text(
+            "INSERT INTO token_holder_summary "
+            "(token_address, account_address, balance, pending_transfer, "
+            "exchange_balance, exchange_commitment, locked, account_tag, "
+            "created, modified) "
+            "SELECT p.token_address, p.account_address, "
+            "COALESCE(p.balance, 0), COALESCE(p.pending_transfer, 0), "
+            "COALESCE(p.exchange_balance, 0), COALESCE(p.exchange_commitment, 0), "
+            "COALESCE(l.locked, 0), t.account_tag, p.created, p.modified "
+            "FROM position p "
+            "LEFT JOIN ("
+            "SELECT token_address, account_address, SUM(value) AS locked "
+            "FROM locked_position GROUP BY token_address, account_address"
+            ") l ON l.token_address = p.token_address "
+            "AND l.account_address = p.account_address "
+            "LEFT JOIN account_tag t ON t.account_address = p.account_address;"
+        )
+    )
+    op.execute(
+        sa.text(
+            "INSERT INTO token_holder_count "
+            "(token_address, holder_count, created, modified) "
+            "SELECT token_address, COUNT(*), MIN(created), MAX(modified) "
+            "FROM token_holder_summary "
+            "WHERE balance > 0 OR pending_transfer > 0 OR exchange_balance > 0 "
+            "OR exchange_commitment > 0 OR locked > 0 "
+            "GROUP BY token_address;"
+        )
+    )
+
+    # Replaced by token_holder_summary_index_1
+    op.drop_index("position_index_1", table_name="position", schema=get_db_schema())
+
+
+def downgrade():
+    connection = op.get_bind()
+
+    op.create_index(
+        "position_index_1",
+        "position",
+        ["token_address", "created", "account_address"],
+        unique=False,
+        schema=get_db_schema(),
+    )
+    op.drop_table("token_holder_count", schema=get_db_schema())
+    op.drop_index(
+        "token_holder_summary_index_2",
+        table_name="token_holder_summary",
+        schema=get_db_schema(),
+    )
+    op.drop_index(
+        "token_holder_summary_index_1",
+        table_name="token_holder_summary",
+        schema=get_db_schema(),
+    )
+    op.drop_table("token_holder_summary", schema=get_db_schema())
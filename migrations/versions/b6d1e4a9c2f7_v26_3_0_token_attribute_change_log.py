@@ -0,0 +1,50 @@
+"""v26_3_0_token_attribute_change_log
+
+Revision ID: b6d1e4a9c2f7
+Revises: 370b8fee5d57
+Create Date: 2026-10-17 14:03:27.118904
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+from app.database import get_db_schema
+
+# revision identifiers, used by Alembic.
+revision = "b6d1e4a9c2f7"
+down_revision = "370b8fee5d57"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    connection = op.get_bind()
+
+    op.create_table(
+        "token_attribute_change_log",
+        sa.Column("id", sa.BigInteger(), autoincrement=True, nullable=False),
+        sa.Column("token_address", sa.String(length=42), nullable=False),
+        sa.Column("token_template", sa.String(length=40), nullable=True),
+        sa.Column("created", sa.DateTime(), nullable=True),
+        sa.Column("modified", sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+        schema=get_db_schema(),
+    )
+    op.create_table(
+        "notification_attribute_change_cursor",
+        sa.Column("notification_type", sa.String(length=256), nullable=False),
+        sa.Column("latest_change_log_id", sa.BigInteger(), nullable=False),
+        sa.Column("created", sa.DateTime(), nullable=True),
+        sa.Column("modified", sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint("notification_type"),
+        schema=get_db_schema(),
+    )
+
+
+def downgrade():
+    connection = op.get_bind()
+
+    op.drop_table("notification_attribute_change_cursor", schema=get_db_schema())
+    op.drop_table("token_attribute_change_log", schema=get_db_schema())
@@ -0,0 +1,174 @@
+"""
+Copyright BOOSTRY Co., Ltd.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+
+You may obtain a copy of the License at
+http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing,
+software distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+
+See the License for the specific language governing permissions and
+limitations under the License.
+
+SPDX-License-Identifier: Apache-2.0
+"""
+
+from unittest import mock
+
+import pytest
+
+from app.contracts import AccountBalance, AsyncContract, BulkBalanceReader
+from app.contracts.contract import async_web3, call_batcher
+from app.errors import ServiceUnavailable
+from tests.account_config import eth_account
+from tests.contract_modules import membership_issue, membership_offer
+from tests.types import DeployedContract, SharedContract
+
+
+@pytest.mark.asyncio
+class TestBulkBalanceReader:
+    """
+    Test Case for contracts.balance.BulkBalanceReader
+    """
+
+    issuer = eth_account["issuer"]
+    trader = eth_account["trader"]
+
+    @staticmethod
+    def issue_token(exchange: DeployedContract) -> DeployedContract:
+        # Issue token and offer 100 on the exchange
+        args = {
+            "name": "テスト会員権",
+            "symbol": "MEMBERSHIP",
+            "initialSupply": 1000000,
+            "tradableExchange": exchange["address"],
+            "details": "詳細",
+            "returnDetails": "リターン詳細",
+            "expirationDate": "20191231",
+            "memo": "メモ",
+            "transferable": True,
+            "contactInformation": "問い合わせ先",
+            "privacyPolicy": "プライバシーポリシー",
+        }
+        token = membership_issue(TestBulkBalanceReader.issuer, args)
+        membership_offer(TestBulkBalanceReader.issuer, exchange, token, 100, 1000)
+        return token
+
+    ###########################################################################
+    # Normal
+    ###########################################################################
+
+    # <Normal_1>
+    # Balances of all accounts are read with a single batch request
+    async def test_normal_1(self, shared_contract: SharedContract):
+        exchange = shared_contract["IbetMembershipExchange"]
+        token = self.issue_token(exchange)
+        token_contract = AsyncContract.get_contract("IbetMembership", token["address"])
+        issuer_address = self.issuer["account_address"]
+        trader_address = self.trader["account_address"]
+
+        batch_count = call_batcher.stats.batch_count
+        balances = await BulkBalanceReader.get_token_balances(
+            token_contract=token_contract,
+            account_addresses=[issuer_address, trader_address],
+            exchange_address=exchange["address"],
+            pending_transfer=False,
+            exchange_commitment=True,
+        )
+
+        # Assertion
+        assert balances == [
+            AccountBalance(
+                account_address=issuer_address,
+                token_address=token["address"],
+                balance=999900,
+                exchange_balance=0,
+                exchange_commitment=100,
+            ),
+            AccountBalance(
+                account_address=trader_address, token_address=token["address"]
+            ),
+        ]
+        assert call_batcher.stats.batch_count == batch_count + 1
+
+    # <Normal_2>
+    # Balances on an exchange
+    async def test_normal_2(self, shared_contract: SharedContract):
+        exchange = shared_contract["IbetMembershipExchange"]
+        token = self.issue_token(exchange)
+        issuer_address = self.issuer["account_address"]
+        trader_address = self.trader["account_address"]
+
+        balances = await BulkBalanceReader.get_exchange_balances(
+            exchange_address=exchange["address"],
+            positions=[
+                (token["address"], issuer_address),
+                (token["address"], trader_address),
+            ],
+        )
+
+        # Assertion
+        assert [(b.exchange_balance, b.exchange_commitment) for b in balances] == [
+            (0, 100),
+            (0, 0),
+        ]
+
+    # <Normal_3>
+    # Reverted calls are read as 0
+    async def test_normal_3(self):
+        not_token = AsyncContract.get_contract(
+            "IbetStraightBond", self.issuer["account_address"]
+        )
+
+        balances = await BulkBalanceReader.get_token_balances(
+            token_contract=not_token,
+            account_addresses=[self.trader["account_address"]],
+        )
+
+        # Assertion
+        assert balances == [
+            AccountBalance(
+                account_address=self.trader["account_address"],
+                token_address=self.issuer["account_address"],
+            )
+        ]
+
+    # <Normal_4>
+    # No accounts
+    async def test_normal_4(self, shared_contract: SharedContract):
+        balances = await BulkBalanceReader.get_exchange_balances(
+            exchange_address=shared_contract["IbetMembershipExchange"]["address"],
+            positions=[],
+        )
+
+        # Assertion
+        assert balances == []
+
+    ###########################################################################
+    # Error
+    ###########################################################################
+
+    # <Error_1>
+    # Node is not available
+    async def test_error_1(self, shared_contract: SharedContract):
+        with mock.patch.object(
+            type(async_web3.provider),
+            "make_batch_request",
+            mock.AsyncMock(side_effect=ServiceUnavailable),
+        ):
+            with pytest.raises(ServiceUnavailable):
+                await BulkBalanceReader.get_exchange_balances(
+                    exchange_address=shared_contract["IbetMembershipExchange"][
+                        "address"
+                    ],
+                    positions=[
+                        (
+                            shared_contract["TokenList"]["address"],
+                            self.trader["account_address"],
+                        )
+                    ],
+                )
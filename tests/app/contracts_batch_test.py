@@ -0,0 +1,273 @@
+"""
+Copyright BOOSTRY Co., Ltd.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+
+You may obtain a copy of the License at
+http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing,
+software distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+
+See the License for the specific language governing permissions and
+limitations under the License.
+
+SPDX-License-Identifier: Apache-2.0
+"""
+
+import asyncio
+from unittest import mock
+
+import pytest
+from web3.exceptions import BadFunctionCallOutput, ContractLogicError
+
+from app.config import ZERO_ADDRESS
+from app.contracts import AsyncContract
+from app.contracts.batch import AsyncContractCallBatcher
+from app.contracts.contract import async_web3
+from app.errors import ServiceUnavailable
+from tests.account_config import eth_account
+from tests.types import SharedContract
+
+
+@pytest.fixture(scope="function")
+def batcher() -> AsyncContractCallBatcher:
+    return AsyncContractCallBatcher(web3=async_web3, max_batch_size=10, window_msec=0)
+
+
+@pytest.mark.asyncio
+class TestAsyncContractCallBatcher:
+    """
+    Test Case for contracts.batch.AsyncContractCallBatcher
+    """
+
+    ###########################################################################
+    # Normal
+    ###########################################################################
+
+    # <Normal_1>
+    # Concurrent calls are sent in a single batch request
+    async def test_normal_1(
+        self, batcher: AsyncContractCallBatcher, shared_contract: SharedContract
+    ):
+        token_list = AsyncContract.get_contract(
+            "TokenList", shared_contract["TokenList"]["address"]
+        )
+        issuer = eth_account["issuer"]["account_address"]
+
+        results = await asyncio.gather(
+            batcher.call(token_list.functions.getListLength()),
+            batcher.call(token_list.functions.getOwnerAddress(issuer)),
+            batcher.call(token_list.functions.getTokenByAddress(issuer)),
+        )
+
+        # Assertion
+        assert results[0] == await token_list.functions.getListLength().call()
+        assert results[1] == ZERO_ADDRESS
+        assert results[2] == [ZERO_ADDRESS, "", ZERO_ADDRESS]
+        assert batcher.stats.batch_count == 1
+        assert batcher.stats.call_count == 3
+        assert batcher.stats.last_batch_size == 3
+
+    # <Normal_2>
+    # Calls exceeding the max batch size are split into multiple batches
+    async def test_normal_2(self, shared_contract: SharedContract):
+        batcher = AsyncContractCallBatcher(
+            web3=async_web3, max_batch_size=2, window_msec=0
+        )
+        token_list = AsyncContract.get_contract(
+            "TokenList", shared_contract["TokenList"]["address"]
+        )
+
+        results = await asyncio.gather(
+            *[batcher.call(token_list.functions.getListLength()) for _ in range(5)]
+        )
+
+        # Assertion
+        assert len(set(results)) == 1
+        assert batcher.stats.batch_count == 3
+        assert batcher.stats.call_count == 5
+
+    # <Normal_3>
+    # Each call in a batch raises its own exception
+    async def test_normal_3(
+        self, batcher: AsyncContractCallBatcher, shared_contract: SharedContract
+    ):
+        token_list = AsyncContract.get_contract(
+            "TokenList", shared_contract["TokenList"]["address"]
+        )
+        not_contract = AsyncContract.get_contract(
+            "TokenList", eth_account["issuer"]["account_address"]
+        )
+
+        results = await asyncio.gather(
+            batcher.call(token_list.functions.getListLength()),
+            batcher.call(not_contract.functions.getListLength()),
+            batcher.call(token_list.functions.getTokenByNum(2**32)),
+            return_exceptions=True,
+        )
+
+        # Assertion
+        assert isinstance(results[0], int)
+        assert isinstance(results[1], BadFunctionCallOutput)
+        assert isinstance(results[2], ContractLogicError)
+        assert batcher.stats.batch_count == 1
+
+    # <Normal_4>
+    # AsyncContract.call_function keeps default_returns semantics
+    async def test_normal_4(self, shared_contract: SharedContract):
+        not_contract = AsyncContract.get_contract(
+            "TokenList", eth_account["issuer"]["account_address"]
+        )
+
+        results = await asyncio.gather(
+            AsyncContract.call_function(not_contract, "getListLength", (), 0),
+            AsyncContract.call_function(
+                not_contract, "getOwnerAddress", (ZERO_ADDRESS,), ZERO_ADDRESS
+            ),
+        )
+
+        # Assertion
+        assert results == [0, ZERO_ADDRESS]
+
+    # <Normal_5>
+    # Fall back to individual calls if the node rejects batch requests
+    async def test_normal_5(
+        self, batcher: AsyncContractCallBatcher, shared_contract: SharedContract
+    ):
+        token_list = AsyncContract.get_contract(
+            "TokenList", shared_contract["TokenList"]["address"]
+        )
+
+        with mock.patch.object(
+            type(async_web3.provider),
+            "make_batch_request",
+            mock.AsyncMock(return_value={"jsonrpc": "2.0", "error": {"code": -32600}}),
+        ):
+            results = await asyncio.gather(
+                batcher.call(token_list.functions.getListLength()),
+                batcher.call(token_list.functions.getListLength()),
+            )
+
+        # Assertion
+        assert results[0] == results[1]
+        assert batcher.stats.batch_count == 0
+        assert batcher.stats.fallback_count == 1
+
+    # <Normal_6>
+    # call_many splits calls into batches of the given size in order
+    async def test_normal_6(
+        self, batcher: AsyncContractCallBatcher, shared_contract: SharedContract
+    ):
+        token_list = AsyncContract.get_contract(
+            "TokenList", shared_contract["TokenList"]["address"]
+        )
+        not_contract = AsyncContract.get_contract(
+            "TokenList", eth_account["issuer"]["account_address"]
+        )
+
+        results = await batcher.call_many(
+            [
+                token_list.functions.getListLength(),
+                not_contract.functions.getListLength(),
+                token_list.functions.getOwnerAddress(ZERO_ADDRESS),
+            ],
+            batch_size=2,
+        )
+
+        # Assertion
+        assert isinstance(results[0], int)
+        assert isinstance(results[1], BadFunctionCallOutput)
+        assert results[2] == ZERO_ADDRESS
+        assert batcher.stats.batch_count == 2
+        assert batcher.stats.call_count == 3
+
+    # <Normal_7>
+    # AsyncContract.call_functions returns default_returns for reverted calls
+    async def test_normal_7(self, shared_contract: SharedContract):
+        token_list = AsyncContract.get_contract(
+            "TokenList", shared_contract["TokenList"]["address"]
+        )
+        not_contract = AsyncContract.get_contract(
+            "TokenList", eth_account["issuer"]["account_address"]
+        )
+
+        results = await AsyncContract.call_functions(
+            [
+                (not_contract, "getListLength", ()),
+                (token_list, "getTokenByNum", (2**32,)),
+            ],
+            default_returns=0,
+        )
+
+        # Assertion
+        assert results == [0, 0]
+
+    # <Normal_8>
+    # Remaining batches are not sent if the node is not available
+    async def test_normal_8(
+        self, batcher: AsyncContractCallBatcher, shared_contract: SharedContract
+    ):
+        token_list = AsyncContract.get_contract(
+            "TokenList", shared_contract["TokenList"]["address"]
+        )
+
+        make_batch_request = mock.AsyncMock(side_effect=ServiceUnavailable)
+        with mock.patch.object(
+            type(async_web3.provider), "make_batch_request", make_batch_request
+        ):
+            results = await batcher.call_many(
+                [token_list.functions.getListLength() for _ in range(4)],
+                batch_size=2,
+            )
+
+        # Assertion
+        assert all(isinstance(result, ServiceUnavailable) for result in results)
+        assert make_batch_request.call_count == 1
+
+    # <Normal_9>
+    # Individual calls of the fallback are limited to the max batch size
+    async def test_normal_9(self, shared_contract: SharedContract):
+        batcher = AsyncContractCallBatcher(
+            web3=async_web3, max_batch_size=2, window_msec=0
+        )
+        token_list = AsyncContract.get_contract(
+            "TokenList", shared_contract["TokenList"]["address"]
+        )
+
+        running = 0
+        max_running = 0
+
+        async def execute_single(pending_call):
+            nonlocal running, max_running
+            running += 1
+            max_running = max(max_running, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            pending_call.future.set_result(0)
+
+        with (
+            mock.patch.object(
+                type(async_web3.provider),
+                "make_batch_request",
+                mock.AsyncMock(
+                    return_value={"jsonrpc": "2.0", "error": {"code": -32600}}
+                ),
+            ),
+            mock.patch.object(
+                AsyncContractCallBatcher,
+                "_execute_single",
+                staticmethod(execute_single),
+            ),
+        ):
+            results = await batcher.call_many(
+                [token_list.functions.getListLength() for _ in range(6)],
+                batch_size=6,
+            )
+
+        # Assertion
+        assert results == [0] * 6
+        assert max_running == 2
+        assert batcher.stats.fallback_count == 1
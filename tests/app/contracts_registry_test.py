@@ -0,0 +1,69 @@
+"""
+Copyright BOOSTRY Co., Ltd.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+
+You may obtain a copy of the License at
+http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing,
+software distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+
+See the License for the specific language governing permissions and
+limitations under the License.
+
+SPDX-License-Identifier: Apache-2.0
+"""
+
+import pytest
+from web3 import Web3
+
+from app.config import ZERO_ADDRESS
+from app.contracts import AsyncContract, ContractRegistry
+
+
+class TestContractRegistry:
+    """
+    Test Case for contracts.registry.ContractRegistry
+    """
+
+    ###########################################################################
+    # Normal
+    ###########################################################################
+
+    # <Normal_1>
+    # Event topics and function selectors are precomputed
+    def test_normal_1(self):
+        interface = ContractRegistry.get("IbetShare")
+
+        # Assertion
+        topic, event_abi = interface.events["Transfer"]
+        assert topic == bytes(Web3.keccak(text="Transfer(address,address,uint256)"))
+        assert event_abi["name"] == "Transfer"
+        assert interface.event_topics[topic] is event_abi
+        assert interface.function_selectors["transfer(address,uint256)"] == (
+            bytes.fromhex("a9059cbb")
+        )
+        assert interface.bytecode is not None
+
+    # <Normal_2>
+    # Each contract is loaded only once
+    def test_normal_2(self):
+        interface = ContractRegistry.get("IbetShare")
+
+        # Assertion
+        assert ContractRegistry.get("IbetShare") is interface
+        contract = AsyncContract.get_contract("IbetShare", ZERO_ADDRESS)
+        assert AsyncContract.get_contract_name(contract) == "IbetShare"
+
+    ###########################################################################
+    # Error
+    ###########################################################################
+
+    # <Error_1>
+    # Contract not found
+    def test_error_1(self):
+        with pytest.raises(FileNotFoundError):
+            ContractRegistry.get("NotExistContract")
@@ -18,8 +18,9 @@ SPDX-License-Identifier: Apache-2.0
 """
 
 from unittest import mock
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock
 
+import httpx
 from fastapi.testclient import TestClient
 from sqlalchemy.orm import Session
 from web3 import Web3
@@ -96,6 +97,80 @@ class TestEthereumJsonRpc:
             },
         }
 
+    # Normal_3
+    # Batch request
+    def test_normal_3(self, client: TestClient, session: Session):
+        node_1 = Node()
+        node_1.is_synced = True
+        node_1.endpoint_uri = config.WEB3_HTTP_PROVIDER
+        node_1.priority = 1
+        session.add(node_1)
+
+        session.commit()
+
+        # Request target API
+        resp = client.post(
+            self.apiurl,
+            json=[
+                {"method": "eth_syncing", "params": []},
+                {"method": "eth_chainId", "params": []},
+            ],
+        )
+
+        # Assertion
+        web3 = Web3(Web3.HTTPProvider(config.WEB3_HTTP_PROVIDER))
+
+        assert resp.status_code == 200
+        assert resp.json()["meta"] == {"code": 200, "message": "OK"}
+        assert resp.json()["data"] == [
+            {"id": 1, "jsonrpc": "2.0", "result": web3.eth.syncing},
+            {"id": 2, "jsonrpc": "2.0", "result": hex(web3.eth.chain_id)},
+        ]
+
+    # Normal_4
+    # Batch request
+    # responses returned by the node out of order
+    def test_normal_4(self, client: TestClient, session: Session):
+        node_1 = Node()
+        node_1.is_synced = True
+        node_1.endpoint_uri = config.WEB3_HTTP_PROVIDER
+        node_1.priority = 1
+        session.add(node_1)
+
+        session.commit()
+
+        # Request target API
+        node_response = httpx.Response(
+            200,
+            json=[
+                {"id": 3, "jsonrpc": "2.0", "result": "0x3"},
+                {"id": 1, "jsonrpc": "2.0", "result": False},
+                {"id": 2, "jsonrpc": "2.0", "result": "0x2"},
+            ],
+        )
+        with mock.patch(
+            "httpx.AsyncClient.post", AsyncMock(return_value=node_response)
+        ) as post:
+            resp = client.post(
+                self.apiurl,
+                json=[
+                    {"method": "eth_syncing", "params": []},
+                    {"method": "eth_chainId", "params": []},
+                    {"method": "eth_blockNumber", "params": []},
+                ],
+            )
+
+        # Assertion
+        assert post.call_count == 1
+        assert [req["id"] for req in post.call_args.kwargs["json"]] == [1, 2, 3]
+        assert resp.status_code == 200
+        assert resp.json()["meta"] == {"code": 200, "message": "OK"}
+        assert resp.json()["data"] == [
+            {"id": 1, "jsonrpc": "2.0", "result": False},
+            {"id": 2, "jsonrpc": "2.0", "result": "0x2"},
+            {"id": 3, "jsonrpc": "2.0", "result": "0x3"},
+        ]
+
     ###########################################################################
     # Error
     ###########################################################################
@@ -151,6 +226,57 @@ class TestEthereumJsonRpc:
             ],
         }
 
+    # Error_2_2
+    # Invalid Parameter
+    # invalid request in batch request
+    def test_error_2_2(self, client: TestClient):
+        # Request target API
+        resp = client.post(
+            self.apiurl,
+            json=[
+                {"method": "eth_syncing", "params": []},
+                {"method": "invalid_method", "params": []},
+            ],
+        )
+
+        # Assertion
+        assert resp.status_code == 400
+        assert resp.json()["meta"] == {
+            "code": 88,
+            "message": "Invalid Parameter",
+            "description": [
+                {
+                    "ctx": {"error": {}},
+                    "input": "invalid_method",
+                    "loc": ["body", 1, "method"],
+                    "msg": "Value error, The method invalid_method is not available",
+                    "type": "value_error",
+                }
+            ],
+        }
+
+    # Error_2_3
+    # Invalid Parameter
+    # too many requests in batch request
+    def test_error_2_3(self, client: TestClient):
+        # Request target API
+        with mock.patch.object(config, "ETH_RPC_PROXY_BATCH_MAX_SIZE", 1):
+            resp = client.post(
+                self.apiurl,
+                json=[
+                    {"method": "eth_syncing", "params": []},
+                    {"method": "eth_chainId", "params": []},
+                ],
+            )
+
+        # Assertion
+        assert resp.status_code == 400
+        assert resp.json()["meta"] == {
+            "code": 88,
+            "message": "Invalid Parameter",
+            "description": "batch request must not exceed 1 calls",
+        }
+
     # Error_3_1
     # Service Unavailable
     def test_error_3_1(self, client: TestClient, session: Session):
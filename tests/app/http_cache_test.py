@@ -0,0 +1,133 @@
+"""
+Copyright BOOSTRY Co., Ltd.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+
+You may obtain a copy of the License at
+http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing,
+software distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+
+See the License for the specific language governing permissions and
+limitations under the License.
+
+SPDX-License-Identifier: Apache-2.0
+"""
+
+from unittest import mock
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app import config
+from app.utils.http_cache_utils import ETagStore, compute_etag, etag_store
+
+
+@pytest.fixture(scope="function", autouse=True)
+def clear_etag_store():
+    etag_store.clear()
+    yield
+    etag_store.clear()
+
+
+class TestHTTPCache:
+    """
+    Test Case for HTTP cache policy (ETag / If-None-Match) of routes
+    """
+
+    apiurl = "/ABI/StraightBond"
+
+    ###########################################################################
+    # Normal
+    ###########################################################################
+
+    # <Normal_1>
+    # ETag and max-age declared by the route are returned
+    def test_normal_1(self, client: TestClient):
+        with mock.patch.object(config, "BOND_TOKEN_ENABLED", True):
+            resp = client.get(self.apiurl)
+
+        # Assertion
+        assert resp.status_code == 200
+        assert resp.json()["meta"] == {"code": 200, "message": "OK"}
+        assert resp.headers["ETag"].startswith('"')
+        assert resp.headers["Cache-Control"] == "public, max-age=3600, immutable"
+
+    # <Normal_2>
+    # Conditional request with the cached ETag is answered with 304
+    # before the handler is called
+    def test_normal_2(self, client: TestClient):
+        with mock.patch.object(config, "BOND_TOKEN_ENABLED", True):
+            etag = client.get(self.apiurl).headers["ETag"]
+
+        # The handler would return 404 if it were called
+        with mock.patch.object(config, "BOND_TOKEN_ENABLED", False):
+            resp = client.get(self.apiurl, headers={"If-None-Match": etag})
+
+        # Assertion
+        assert resp.status_code == 304
+        assert resp.content == b""
+        assert resp.headers["ETag"] == etag
+        assert resp.headers["Cache-Control"] == "public, max-age=3600, immutable"
+
+    # <Normal_3>
+    # Conditional request with a different ETag is answered with the full response
+    def test_normal_3(self, client: TestClient):
+        with mock.patch.object(config, "BOND_TOKEN_ENABLED", True):
+            etag = client.get(self.apiurl).headers["ETag"]
+            resp = client.get(self.apiurl, headers={"If-None-Match": '"unknown"'})
+
+        # Assertion
+        assert resp.status_code == 200
+        assert resp.headers["ETag"] == etag
+        assert resp.json()["data"] is not None
+
+    # <Normal_4>
+    # Cached ETags expire after TTL and are evicted in LRU order
+    def test_normal_4(self):
+        store = ETagStore(max_size=2)
+        with mock.patch("app.utils.http_cache_utils.time.monotonic", return_value=0):
+            store.put("key_1", '"etag_1"', ttl=10)
+            store.put("key_2", '"etag_2"', ttl=None)
+            assert store.get("key_1") == '"etag_1"'
+            store.put("key_3", '"etag_3"', ttl=None)
+
+            # Assertion
+            assert store.get("key_2") is None
+            assert store.get("key_3") == '"etag_3"'
+
+        with mock.patch("app.utils.http_cache_utils.time.monotonic", return_value=10):
+            assert store.get("key_1") is None
+            assert store.get("key_3") == '"etag_3"'
+
+    # <Normal_5>
+    # The ETag of a full response is computed from its body
+    # even if an ETag of the immutable resource is cached
+    def test_normal_5(self, client: TestClient):
+        etag_store.put((self.apiurl, ""), '"stale"', ttl=None)
+
+        with mock.patch.object(config, "BOND_TOKEN_ENABLED", True):
+            resp = client.get(self.apiurl)
+
+        # Assertion
+        assert resp.status_code == 200
+        assert resp.headers["ETag"] == compute_etag(resp.content)
+        assert etag_store.get((self.apiurl, "")) == resp.headers["ETag"]
+
+    ###########################################################################
+    # Error
+    ###########################################################################
+
+    # <Error_1>
+    # Error responses are not cached
+    def test_error_1(self, client: TestClient):
+        with mock.patch.object(config, "BOND_TOKEN_ENABLED", False):
+            resp = client.get(self.apiurl, headers={"If-None-Match": "*"})
+
+        # Assertion
+        assert resp.status_code == 404
+        assert "ETag" not in resp.headers
+        assert "Cache-Control" not in resp.headers
@@ -0,0 +1,158 @@
+"""
+Copyright BOOSTRY Co., Ltd.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+
+You may obtain a copy of the License at
+http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing,
+software distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+
+See the License for the specific language governing permissions and
+limitations under the License.
+
+SPDX-License-Identifier: Apache-2.0
+"""
+
+from datetime import UTC, datetime, timedelta
+from unittest import mock
+from unittest.mock import AsyncMock
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.errors import ServiceUnavailable
+from app.model.blockchain.token import BondToken
+from app.model.db import IDXBondToken
+
+
+@pytest.mark.asyncio
+class TestTokenGetMany:
+    """
+    Test Case for model.blockchain.token.TokenBase.get_many
+    """
+
+    token_address_1 = "0x0000000000000000000000000000000000000001"
+    token_address_2 = "0x0000000000000000000000000000000000000002"
+    token_address_3 = "0x0000000000000000000000000000000000000003"
+
+    @staticmethod
+    def insert_bond_token(
+        async_session: AsyncSession,
+        token_address: str,
+        short_term_cache_created: datetime | None = None,
+    ):
+        now = datetime.now(UTC).replace(tzinfo=None)
+        idx_token = IDXBondToken()
+        idx_token.token_address = token_address
+        idx_token.token_template = "IbetStraightBond"
+        idx_token.name = f"テスト債券_{token_address[-1]}"
+        idx_token.face_value_currency = "JPY"
+        idx_token.interest_payment_date = []
+        idx_token.interest_payment_currency = "JPY"
+        idx_token.redemption_value_currency = "JPY"
+        idx_token.base_fx_rate = 0.0
+        idx_token.created = now
+        idx_token.short_term_cache_created = short_term_cache_created or now
+        async_session.add(idx_token)
+
+    @staticmethod
+    def bond_token(token_address: str) -> BondToken:
+        token = BondToken()
+        token.token_address = token_address
+        token.name = "テスト債券_chain"
+        return token
+
+    ###########################################################################
+    # Normal
+    ###########################################################################
+
+    # <Normal_1>
+    # All tokens are cached: no fetch from chain
+    async def test_normal_1(self, async_session: AsyncSession):
+        self.insert_bond_token(async_session, self.token_address_1)
+        self.insert_bond_token(async_session, self.token_address_2)
+        await async_session.commit()
+
+        with mock.patch.object(BondToken, "fetch", AsyncMock()) as fetch_mock:
+            tokens = await BondToken.get_many(
+                async_session,
+                [self.token_address_2, self.token_address_1, self.token_address_2],
+            )
+
+        # Assertion
+        fetch_mock.assert_not_called()
+        assert list(tokens.keys()) == [self.token_address_2, self.token_address_1]
+        assert tokens[self.token_address_1].name == "テスト債券_1"
+        assert tokens[self.token_address_2].name == "テスト債券_2"
+
+    # <Normal_2>
+    # Tokens not cached and with expired short-term cache are fetched from chain
+    async def test_normal_2(self, async_session: AsyncSession):
+        self.insert_bond_token(async_session, self.token_address_1)
+        self.insert_bond_token(
+            async_session,
+            self.token_address_2,
+            short_term_cache_created=datetime(2024, 1, 1),
+        )
+        await async_session.commit()
+
+        with (
+            mock.patch.object(
+                BondToken,
+                "fetch",
+                AsyncMock(side_effect=lambda _, address: self.bond_token(address)),
+            ) as fetch_mock,
+            mock.patch.object(
+                BondToken, "fetch_expiry_short", autospec=True
+            ) as fetch_expiry_short_mock,
+        ):
+            tokens = await BondToken.get_many(
+                async_session,
+                [self.token_address_1, self.token_address_2, self.token_address_3],
+            )
+
+        # Assertion
+        assert fetch_mock.call_count == 1
+        assert fetch_mock.call_args.args[1] == self.token_address_3
+        assert fetch_expiry_short_mock.call_count == 1
+        assert tokens[self.token_address_1].name == "テスト債券_1"
+        assert tokens[self.token_address_2].name == "テスト債券_2"
+        assert tokens[self.token_address_3].name == "テスト債券_chain"
+
+    ###########################################################################
+    # Error
+    ###########################################################################
+
+    # <Error_1>
+    # Tokens that could not be fetched are not included
+    async def test_error_1(self, async_session: AsyncSession):
+        self.insert_bond_token(async_session, self.token_address_1)
+        self.insert_bond_token(
+            async_session,
+            self.token_address_2,
+            short_term_cache_created=datetime.now(UTC).replace(tzinfo=None)
+            - timedelta(days=1),
+        )
+        await async_session.commit()
+
+        with (
+            mock.patch.object(
+                BondToken, "fetch", AsyncMock(side_effect=ServiceUnavailable())
+            ),
+            mock.patch.object(
+                BondToken,
+                "fetch_expiry_short",
+                AsyncMock(side_effect=ServiceUnavailable()),
+            ),
+        ):
+            tokens = await BondToken.get_many(
+                async_session,
+                [self.token_address_1, self.token_address_2, self.token_address_3],
+            )
+
+        # Assertion
+        assert list(tokens.keys()) == [self.token_address_1]
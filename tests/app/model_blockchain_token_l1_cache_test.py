@@ -0,0 +1,114 @@
+"""
+Copyright BOOSTRY Co., Ltd.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+
+You may obtain a copy of the License at
+http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing,
+software distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+
+See the License for the specific language governing permissions and
+limitations under the License.
+
+SPDX-License-Identifier: Apache-2.0
+"""
+
+from datetime import UTC, datetime, timedelta
+from unittest import mock
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.model.blockchain.token import BondToken, TokenL1Cache, token_l1_cache
+from app.model.db import IDXBondToken
+
+
+@pytest.mark.asyncio
+class TestTokenL1Cache:
+    """
+    Test Case for model.blockchain.token.TokenL1Cache
+    """
+
+    token_address = "0x0000000000000000000000000000000000000001"
+
+    @staticmethod
+    async def insert_bond_token(async_session: AsyncSession, token_address: str):
+        now = datetime.now(UTC).replace(tzinfo=None)
+        idx_token = IDXBondToken()
+        idx_token.token_address = token_address
+        idx_token.token_template = "IbetStraightBond"
+        idx_token.name = "テスト債券"
+        idx_token.face_value_currency = "JPY"
+        idx_token.interest_payment_date = ["0101"]
+        idx_token.interest_payment_currency = "JPY"
+        idx_token.redemption_value_currency = "JPY"
+        idx_token.base_fx_rate = 0.0
+        idx_token.created = now
+        idx_token.short_term_cache_created = now
+        async_session.add(idx_token)
+        await async_session.commit()
+
+    ###########################################################################
+    # Normal
+    ###########################################################################
+
+    # <Normal_1>
+    # Token object is built from DB cache only once
+    async def test_normal_1(self, async_session: AsyncSession):
+        await self.insert_bond_token(async_session, self.token_address)
+
+        with mock.patch.object(
+            BondToken, "from_model", side_effect=BondToken.from_model
+        ) as from_model_mock:
+            token_1 = await BondToken.get(async_session, self.token_address)
+            token_2 = await BondToken.get(async_session, self.token_address)
+
+        # Assertion
+        assert from_model_mock.call_count == 1
+        assert token_1 is not token_2
+        assert token_2.name == "テスト債券"
+        assert token_2.interest_payment_date1 == "0101"
+        assert token_l1_cache.hit_count == 1
+
+    # <Normal_2>
+    # Cached object is invalidated when the DB cache is updated
+    async def test_normal_2(self, async_session: AsyncSession):
+        await self.insert_bond_token(async_session, self.token_address)
+        await BondToken.get(async_session, self.token_address)
+
+        idx_token = (
+            await async_session.scalars(
+                select(IDXBondToken)
+                .where(IDXBondToken.token_address == self.token_address)
+                .limit(1)
+            )
+        ).first()
+        assert idx_token is not None
+        idx_token.name = "テスト債券2"
+        idx_token.short_term_cache_created = idx_token.short_term_cache_created + (
+            timedelta(seconds=1)
+        )
+        await async_session.commit()
+
+        token = await BondToken.get(async_session, self.token_address)
+
+        # Assertion
+        assert token.name == "テスト債券2"
+
+    # <Normal_3>
+    # Least recently used object is evicted
+    async def test_normal_3(self):
+        cache = TokenL1Cache(max_size=2)
+        created = datetime(2024, 1, 1)
+        for i in range(3):
+            cache.put(("IDXBondToken", str(i)), created, created, BondToken())
+
+        # Assertion
+        assert len(cache) == 2
+        assert cache.get(("IDXBondToken", "0"), created, created) is None
+        assert cache.get(("IDXBondToken", "2"), created, created) is not None
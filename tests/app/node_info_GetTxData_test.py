@@ -147,6 +147,33 @@ class TestGetTxData:
             "nonce": 199601,
         }
 
+    # Normal_3
+    # Contract information set after the first response is returned
+    # with a new ETag, and the response is not declared immutable
+    def test_normal_3(self, client: TestClient, session: Session):
+        config.BC_EXPLORER_ENABLED = True
+
+        self.insert_tx_data(session, self.tx_data)
+
+        # Request target API
+        resp_1 = client.get(self.apiurl.format(self.tx_data["hash"]))
+
+        token_info = {
+            "token_address": to_checksum_address(str(self.tx_data["to_address"])),
+            "token_template": "IbetShare",
+        }
+        self.insert_token_list(session, token_info)
+
+        resp_2 = client.get(self.apiurl.format(self.tx_data["hash"]))
+
+        # Assertion
+        assert resp_1.status_code == 200
+        assert resp_1.json()["data"]["contract_name"] is None
+        assert resp_1.headers["Cache-Control"] == "public, max-age=60"
+        assert resp_2.status_code == 200
+        assert resp_2.json()["data"]["contract_name"] == "IbetShare"
+        assert resp_2.headers["ETag"] != resp_1.headers["ETag"]
+
     ###########################################################################
     # Error
     ###########################################################################
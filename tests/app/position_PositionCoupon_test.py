@@ -1343,6 +1343,73 @@ class TestPositionCoupon:
             ],
         }
 
+    # <Normal_7>
+    # List all positions
+    # Tokens only with receipt history are read concurrently in one chunk
+    def test_normal_7(
+        self, client: TestClient, session: Session, shared_contract: SharedContract
+    ):
+        config.COUPON_TOKEN_ENABLED = True
+
+        token_list_contract = shared_contract["TokenList"]
+
+        # Prepare data
+        tokens = []
+        for i in range(3):
+            token = self.create_non_balance_data(
+                self.account_1,
+                self.account_2,
+                {"address": config.ZERO_ADDRESS},
+                token_list_contract,
+            )
+            self.list_token(token["address"], session)
+            idx_transfer = IDXTransfer()
+            idx_transfer.transaction_hash = f"tx{i}"
+            idx_transfer.token_address = token["address"]
+            idx_transfer.from_address = self.issuer["account_address"]
+            idx_transfer.to_address = self.account_1["account_address"]
+            idx_transfer.value = 1000000
+            idx_transfer.source_event = IDXTransferSourceEventType.TRANSFER
+            session.add(idx_transfer)
+            tokens.append(token)
+        token_non = self.create_non_balance_data(
+            self.account_1,
+            self.account_2,
+            {"address": config.ZERO_ADDRESS},
+            token_list_contract,
+        )
+        self.list_token(token_non["address"], session)  # not target
+
+        session.commit()
+
+        with mock.patch(
+            "app.config.TOKEN_LIST_CONTRACT_ADDRESS", token_list_contract["address"]
+        ):
+            # Request target API
+            resp = client.get(
+                self.apiurl.format(account_address=self.account_1["account_address"]),
+            )
+
+        assert resp.status_code == 200
+        assert resp.json()["data"] == {
+            "result_set": {
+                "count": 3,
+                "offset": None,
+                "limit": None,
+                "total": 3,
+            },
+            "positions": [
+                {
+                    "token_address": token["address"],
+                    "balance": 0,
+                    "exchange_balance": 0,
+                    "exchange_commitment": 0,
+                    "used": 0,
+                }
+                for token in tokens
+            ],
+        }
+
     ###########################################################################
     # Error
     ###########################################################################
@@ -24,6 +24,7 @@ from sqlalchemy.orm import Session
 from web3.contract import Contract as Web3Contract
 
 from app import config
+from app.model.blockchain import ShareToken
 from app.model.db import (
     IDXLockedPosition,
     IDXPosition,
@@ -1560,6 +1561,131 @@ class TestPositionShare:
             ],
         }
 
+    # <Normal_8>
+    # Pagination: positions are not read beyond the requested page
+    def test_normal_8(
+        self, client: TestClient, session: Session, shared_contract: SharedContract
+    ):
+        config.SHARE_TOKEN_ENABLED = True
+
+        token_list_contract = shared_contract["TokenList"]
+        personal_info_contract = shared_contract["PersonalInfo"]
+
+        # Prepare data
+        token_1 = self.create_balance_data(
+            self.account_1,
+            self.zero_address,
+            personal_info_contract,
+            token_list_contract,
+        )
+        self.list_token(token_1.address, session)
+
+        token_2 = self.create_balance_data(
+            self.account_1,
+            self.zero_address,
+            personal_info_contract,
+            token_list_contract,
+        )
+        self.list_token(token_2.address, session)
+
+        session.commit()
+
+        with (
+            mock.patch(
+                "app.config.TOKEN_LIST_CONTRACT_ADDRESS", token_list_contract["address"]
+            ),
+            mock.patch("app.config.POSITION_LIST_CALL_CONCURRENCY", 1),
+        ):
+            # Request target API
+            resp = client.get(
+                self.apiurl.format(account_address=self.account_1["account_address"]),
+                params={"limit": 1},
+            )
+
+        # Assertion
+        assert resp.status_code == 200
+        assert resp.json()["data"] == {
+            "result_set": {
+                "count": None,
+                "offset": None,
+                "limit": 1,
+                "total": None,
+            },
+            "positions": [
+                {
+                    "token_address": token_1.address,
+                    "balance": 1000000,
+                    "pending_transfer": 0,
+                    "exchange_balance": 0,
+                    "exchange_commitment": 0,
+                    "locked": None,
+                },
+            ],
+        }
+
+    # <Normal_9>
+    # Tokens indexed as another token type are not read
+    def test_normal_9(
+        self, client: TestClient, session: Session, shared_contract: SharedContract
+    ):
+        config.SHARE_TOKEN_ENABLED = True
+
+        token_list_contract = shared_contract["TokenList"]
+        personal_info_contract = shared_contract["PersonalInfo"]
+
+        # Prepare data
+        token_1 = self.create_balance_data(
+            self.account_1,
+            self.zero_address,
+            personal_info_contract,
+            token_list_contract,
+        )
+        self.list_token(token_1.address, session)
+
+        token_2 = self.create_balance_data(
+            self.account_1,
+            self.zero_address,
+            personal_info_contract,
+            token_list_contract,
+        )
+        self.list_token(token_2.address, session)
+        idx_token_list_item = IDXTokenListRegister()
+        idx_token_list_item.token_address = token_2.address
+        idx_token_list_item.token_template = "IbetStraightBond"
+        idx_token_list_item.owner_address = self.issuer["account_address"]
+        session.add(idx_token_list_item)
+
+        session.commit()
+
+        with mock.patch(
+            "app.config.TOKEN_LIST_CONTRACT_ADDRESS", token_list_contract["address"]
+        ):
+            # Request target API
+            resp = client.get(
+                self.apiurl.format(account_address=self.account_1["account_address"]),
+            )
+
+        # Assertion
+        assert resp.status_code == 200
+        assert resp.json()["data"] == {
+            "result_set": {
+                "count": 1,
+                "offset": None,
+                "limit": None,
+                "total": 1,
+            },
+            "positions": [
+                {
+                    "token_address": token_1.address,
+                    "balance": 1000000,
+                    "pending_transfer": 0,
+                    "exchange_balance": 0,
+                    "exchange_commitment": 0,
+                    "locked": None,
+                },
+            ],
+        }
+
     ###########################################################################
     # Error
     ###########################################################################
@@ -1690,3 +1816,135 @@ class TestPositionShare:
             ],
             "message": "Invalid Parameter",
         }
+
+    # <Error_5>
+    # ServiceUnavailable: failed to get token details
+    def test_error_5(
+        self, client: TestClient, session: Session, shared_contract: SharedContract
+    ):
+        config.SHARE_TOKEN_ENABLED = True
+
+        token_list_contract = shared_contract["TokenList"]
+        personal_info_contract = shared_contract["PersonalInfo"]
+
+        # Prepare data
+        token_1 = self.create_balance_data(
+            self.account_1,
+            self.zero_address,
+            personal_info_contract,
+            token_list_contract,
+        )
+        self.list_token(token_1.address, session)
+
+        token_2 = self.create_balance_data(
+            self.account_1,
+            self.zero_address,
+            personal_info_contract,
+            token_list_contract,
+        )
+        self.list_token(token_2.address, session)
+
+        session.commit()
+
+        # Token details of token_2 could not be fetched
+        get_many = ShareToken.get_many
+
+        async def get_many_without_token_2(async_session, token_addresses):
+            token_details = await get_many(async_session, token_addresses)
+            token_details.pop(token_2.address, None)
+            return token_details
+
+        with (
+            mock.patch(
+                "app.config.TOKEN_LIST_CONTRACT_ADDRESS",
+                token_list_contract["address"],
+            ),
+            mock.patch.object(
+                ShareToken,
+                "get_many",
+                mock.AsyncMock(side_effect=get_many_without_token_2),
+            ),
+        ):
+            # Request target API
+            resp = client.get(
+                self.apiurl.format(account_address=self.account_1["account_address"]),
+                params={
+                    "include_token_details": "true",
+                },
+            )
+
+        # Assertion
+        assert resp.status_code == 503
+        assert resp.json()["meta"] == {
+            "code": 503,
+            "message": "Service Unavailable",
+            "description": f"Failed to get token: {token_2.address}",
+        }
+
+    # <Error_6>
+    # ServiceUnavailable: failed to get token details of a position on the page
+    # - Positions after it are not returned instead
+    def test_error_6(
+        self, client: TestClient, session: Session, shared_contract: SharedContract
+    ):
+        config.SHARE_TOKEN_ENABLED = True
+
+        token_list_contract = shared_contract["TokenList"]
+        personal_info_contract = shared_contract["PersonalInfo"]
+
+        # Prepare data
+        token_1 = self.create_balance_data(
+            self.account_1,
+            self.zero_address,
+            personal_info_contract,
+            token_list_contract,
+        )
+        self.list_token(token_1.address, session)
+
+        token_2 = self.create_balance_data(
+            self.account_1,
+            self.zero_address,
+            personal_info_contract,
+            token_list_contract,
+        )
+        self.list_token(token_2.address, session)
+
+        session.commit()
+
+        # Token details of token_1 could not be fetched
+        get_many = ShareToken.get_many
+
+        async def get_many_without_token_1(async_session, token_addresses):
+            token_details = await get_many(async_session, token_addresses)
+            token_details.pop(token_1.address, None)
+            return token_details
+
+        with (
+            mock.patch(
+                "app.config.TOKEN_LIST_CONTRACT_ADDRESS",
+                token_list_contract["address"],
+            ),
+            mock.patch("app.config.POSITION_LIST_CALL_CONCURRENCY", 1),
+            mock.patch.object(
+                ShareToken,
+                "get_many",
+                mock.AsyncMock(side_effect=get_many_without_token_1),
+            ),
+        ):
+            # Request target API
+            resp = client.get(
+                self.apiurl.format(account_address=self.account_1["account_address"]),
+                params={
+                    "include_token_details": "true",
+                    "offset": 0,
+                    "limit": 1,
+                },
+            )
+
+        # Assertion
+        assert resp.status_code == 503
+        assert resp.json()["meta"] == {
+            "code": 503,
+            "message": "Service Unavailable",
+            "description": f"Failed to get token: {token_1.address}",
+        }
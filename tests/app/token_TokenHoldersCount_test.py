@@ -20,9 +20,16 @@ SPDX-License-Identifier: Apache-2.0
 from typing import Any
 
 from fastapi.testclient import TestClient
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
-from app.model.db import IDXLockedPosition, IDXPosition, Listing
+from app.model.db import (
+    AccountTag,
+    IDXLockedPosition,
+    IDXPosition,
+    IDXTokenHolderCount,
+    Listing,
+)
 from tests.account_config import eth_account
 
 
@@ -341,6 +348,113 @@ class TestTokenTokenHoldersCount:
         assert resp.json()["meta"] == {"code": 200, "message": "OK"}
         assert resp.json()["data"] == assumed_body
 
+    # Normal_5
+    # Holder count is maintained on position updates and unlocks
+    def test_normal_5(self, client: TestClient, session: Session):
+        listing = {
+            "token_address": self.token_address,
+            "is_public": True,
+        }
+        self.insert_listing(session, listing=listing)
+
+        # Prepare data (balance > 0)
+        position_1 = {
+            "token_address": self.token_address,
+            "account_address": self.account_address_1,
+            "balance": 10,
+        }
+        self.insert_position(session, position=position_1)
+
+        # Prepare data (locked position only)
+        position_2 = {
+            "token_address": self.token_address,
+            "account_address": self.account_address_2,
+            "balance": 0,
+        }
+        self.insert_position(session, position=position_2)
+        locked_position_1 = {
+            "token_address": self.token_address,
+            "lock_address": self.lock_address_1,
+            "account_address": self.account_address_2,
+            "value": 1,
+        }
+        self.insert_locked_position(session, locked_position_1)
+
+        session.commit()
+
+        apiurl = self.apiurl_base.format(contract_address=self.token_address)
+        resp = client.get(apiurl)
+        assert resp.json()["data"] == {"count": 2}
+
+        # Transfer all balance and unlock
+        _position = session.scalars(
+            select(IDXPosition).where(
+                IDXPosition.account_address == self.account_address_1
+            )
+        ).one()
+        _position.balance = 0
+        _locked = session.scalars(
+            select(IDXLockedPosition).where(
+                IDXLockedPosition.account_address == self.account_address_2
+            )
+        ).one()
+        _locked.value = 0
+        session.commit()
+
+        # Request target API
+        resp = client.get(apiurl)
+
+        # Assertion
+        assumed_body = {"count": 0}
+        assert resp.status_code == 200
+        assert resp.json()["meta"] == {"code": 200, "message": "OK"}
+        assert resp.json()["data"] == assumed_body
+
+        _count = session.scalars(
+            select(IDXTokenHolderCount).where(
+                IDXTokenHolderCount.token_address == self.token_address
+            )
+        ).one()
+        assert _count.holder_count == 0
+
+    # Normal_6
+    # Filter with account_tag
+    def test_normal_6(self, client: TestClient, session: Session):
+        listing = {
+            "token_address": self.token_address,
+            "is_public": True,
+        }
+        self.insert_listing(session, listing=listing)
+
+        # Prepare data
+        for account_address in [self.account_address_1, self.account_address_2]:
+            self.insert_position(
+                session,
+                position={
+                    "token_address": self.token_address,
+                    "account_address": account_address,
+                    "balance": 10,
+                },
+            )
+        session.commit()
+
+        # Tag after the position is indexed
+        account_tag = AccountTag()
+        account_tag.account_address = self.account_address_1
+        account_tag.account_tag = "tag_1"
+        session.add(account_tag)
+        session.commit()
+
+        # Request target API
+        apiurl = self.apiurl_base.format(contract_address=self.token_address)
+        resp = client.get(apiurl, params={"account_tag": "tag_1"})
+
+        # Assertion
+        assumed_body = {"count": 1}
+        assert resp.status_code == 200
+        assert resp.json()["meta"] == {"code": 200, "message": "OK"}
+        assert resp.json()["data"] == assumed_body
+
     ####################################################################
     # Error
     ####################################################################
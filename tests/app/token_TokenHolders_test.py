@@ -1155,6 +1155,68 @@ class TestTokenTokenHolders:
         assert resp.json()["meta"] == {"code": 200, "message": "OK"}
         assert resp.json()["data"] == assumed_body
 
+    # Normal_6
+    # Keyset pagination (cursor)
+    def test_normal_6(self, client: TestClient, session: Session):
+        listing = {
+            "token_address": self.token_address,
+            "is_public": True,
+        }
+        self.insert_listing(session, listing=listing)
+
+        # Prepare data
+        for i, account_address in enumerate(
+            [self.account_address_1, self.account_address_2, self.account_address_3]
+        ):
+            position = {
+                "token_address": self.token_address,
+                "account_address": account_address,
+                "balance": 10 * (i + 1),
+                "created": datetime(2024, 1, 1, 0, 0, i),
+            }
+            self.insert_position(session, position=position)
+
+        # Request target API
+        apiurl = self.apiurl_base.format(contract_address=self.token_address)
+
+        # 1st page
+        resp = client.get(apiurl, params={"limit": 2, "cursor": ""})
+        assert resp.status_code == 200
+        result_set = resp.json()["data"]["result_set"]
+        assert result_set["count"] is None
+        assert result_set["total"] is None
+        assert result_set["next_cursor"] is not None
+        assert [h["amount"] for h in resp.json()["data"]["token_holder_list"]] == [
+            30,
+            20,
+        ]
+
+        # 2nd page
+        resp = client.get(
+            apiurl, params={"limit": 2, "cursor": result_set["next_cursor"]}
+        )
+        assert resp.status_code == 200
+        assert resp.json()["data"] == {
+            "result_set": {
+                "offset": None,
+                "limit": 2,
+                "total": None,
+                "count": None,
+                "next_cursor": None,
+            },
+            "token_holder_list": [
+                {
+                    "token_address": self.token_address,
+                    "account_address": self.account_address_1,
+                    "amount": 10,
+                    "pending_transfer": 0,
+                    "exchange_balance": 0,
+                    "exchange_commitment": 0,
+                    "locked": 0,
+                }
+            ],
+        }
+
     ####################################################################
     # Error
     ####################################################################
@@ -1196,3 +1258,23 @@ class TestTokenTokenHolders:
             "message": "Data Not Exists",
             "description": "token_address: " + self.token_address,
         }
+
+    # Error_3
+    # 400: Invalid Parameter Error
+    # Malformed cursor
+    def test_error_3(self, client: TestClient, session: Session):
+        listing = {
+            "token_address": self.token_address,
+            "is_public": True,
+        }
+        self.insert_listing(session, listing=listing)
+
+        apiurl = self.apiurl_base.format(contract_address=self.token_address)
+        resp = client.get(apiurl, params={"cursor": "WzFd"})  # [1]
+
+        assert resp.status_code == 400
+        assert resp.json()["meta"] == {
+            "code": 88,
+            "message": "Invalid Parameter",
+            "description": "invalid cursor",
+        }
@@ -1309,6 +1309,87 @@ class TestListTokenTransferHistory:
         assert data[0]["data"] is None
         assert data[0]["message"] is None
 
+    # Normal_6_1
+    # Keyset pagination (cursor)
+    def test_normal_6_1(self, client: TestClient, session: Session):
+        listing = {
+            "token_address": self.token_address,
+            "is_public": True,
+        }
+        self.insert_listing(session, listing=listing)
+        for value in [10, 20, 30]:
+            transfer_event = {
+                "transaction_hash": self.transaction_hash,
+                "token_address": self.token_address,
+                "from_address": self.from_address,
+                "to_address": self.to_address,
+                "value": value,
+            }
+            self.insert_transfer_event(session, transfer_event=transfer_event)
+        session.commit()
+
+        apiurl = self.apiurl_base.format(contract_address=self.token_address)
+
+        # 1st page
+        resp = client.get(apiurl, params={"limit": 2, "cursor": ""})
+        assert resp.status_code == 200
+        result_set = resp.json()["data"]["result_set"]
+        assert result_set["count"] is None
+        assert result_set["total"] is None
+        assert result_set["next_cursor"] is not None
+        assert [d["value"] for d in resp.json()["data"]["transfer_history"]] == [
+            10,
+            20,
+        ]
+
+        # 2nd page
+        resp = client.get(
+            apiurl, params={"limit": 2, "cursor": result_set["next_cursor"]}
+        )
+        assert resp.status_code == 200
+        assert resp.json()["data"]["result_set"] == {
+            "count": None,
+            "offset": None,
+            "limit": 2,
+            "total": None,
+            "next_cursor": None,
+        }
+        assert [d["value"] for d in resp.json()["data"]["transfer_history"]] == [30]
+
+    # Normal_6_2
+    # Keyset pagination (cursor) with count
+    def test_normal_6_2(self, client: TestClient, session: Session):
+        listing = {
+            "token_address": self.token_address,
+            "is_public": True,
+        }
+        self.insert_listing(session, listing=listing)
+        for value in [10, 20]:
+            transfer_event = {
+                "transaction_hash": self.transaction_hash,
+                "token_address": self.token_address,
+                "from_address": self.from_address,
+                "to_address": self.to_address,
+                "value": value,
+            }
+            self.insert_transfer_event(session, transfer_event=transfer_event)
+        session.commit()
+
+        apiurl = self.apiurl_base.format(contract_address=self.token_address)
+        resp = client.get(
+            apiurl, params={"cursor": "", "include_count": True, "value": 20}
+        )
+
+        assert resp.status_code == 200
+        assert resp.json()["data"]["result_set"] == {
+            "count": 1,
+            "offset": None,
+            "limit": None,
+            "total": 2,
+            "next_cursor": None,
+        }
+        assert [d["value"] for d in resp.json()["data"]["transfer_history"]] == [20]
+
     ####################################################################
     # Error
     ####################################################################
@@ -1488,3 +1569,24 @@ class TestListTokenTransferHistory:
             ],
             "message": "Invalid Parameter",
         }
+
+    # Error_5
+    # cursor validation : malformed
+    # 400
+    def test_error_5(self, client: TestClient, session: Session):
+        listing = {
+            "token_address": self.token_address,
+            "is_public": True,
+        }
+        self.insert_listing(session, listing=listing)
+        session.commit()
+
+        apiurl = self.apiurl_base.format(contract_address=self.token_address)
+        resp = client.get(apiurl, params={"cursor": "invalid"})
+
+        assert resp.status_code == 400
+        assert resp.json()["meta"] == {
+            "code": 88,
+            "message": "Invalid Parameter",
+            "description": "invalid cursor",
+        }
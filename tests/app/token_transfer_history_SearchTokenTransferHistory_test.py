@@ -1877,6 +1877,50 @@ class TestSearchTokenTransferHistory:
         assert data[0]["data"] is None
         assert data[0]["message"] is None
 
+    # Normal_6
+    # Keyset pagination (cursor): sort by created (DESC)
+    def test_normal_6(self, client: TestClient, session: Session):
+        listing = {
+            "token_address": self.token_address,
+            "is_public": True,
+        }
+        self.insert_listing(session, listing=listing)
+        for i, value in enumerate([10, 20, 30]):
+            transfer_event = {
+                "transaction_hash": self.transaction_hash,
+                "token_address": self.token_address,
+                "from_address": self.from_address,
+                "to_address": self.to_address,
+                "value": value,
+            }
+            self.insert_transfer_event(
+                session,
+                transfer_event=transfer_event,
+                created=datetime(2024, 1, 1, 0, 0, 0) + timedelta(seconds=i),
+            )
+        session.commit()
+
+        apiurl = self.apiurl_base.format(contract_address=self.token_address)
+        query = {"sort_item": "created", "sort_order": 1, "limit": 2}
+
+        # 1st page
+        resp = client.post(apiurl, json={**query, "cursor": ""})
+        assert resp.status_code == 200
+        result_set = resp.json()["data"]["result_set"]
+        assert result_set["count"] is None
+        assert result_set["total"] is None
+        assert result_set["next_cursor"] is not None
+        assert [d["value"] for d in resp.json()["data"]["transfer_history"]] == [
+            30,
+            20,
+        ]
+
+        # 2nd page
+        resp = client.post(apiurl, json={**query, "cursor": result_set["next_cursor"]})
+        assert resp.status_code == 200
+        assert resp.json()["data"]["result_set"]["next_cursor"] is None
+        assert [d["value"] for d in resp.json()["data"]["transfer_history"]] == [10]
+
     ####################################################################
     # Error
     ####################################################################
@@ -2046,3 +2090,24 @@ class TestSearchTokenTransferHistory:
             ],
             "message": "Invalid Parameter",
         }
+
+    # Error_5
+    # cursor is not available for the sort item
+    # 400
+    def test_error_5(self, client: TestClient, session: Session):
+        listing = {
+            "token_address": self.token_address,
+            "is_public": True,
+        }
+        self.insert_listing(session, listing=listing)
+        session.commit()
+
+        apiurl = self.apiurl_base.format(contract_address=self.token_address)
+        resp = client.post(apiurl, json={"sort_item": "value", "cursor": ""})
+
+        assert resp.status_code == 400
+        assert resp.json()["meta"] == {
+            "code": 88,
+            "message": "Invalid Parameter",
+            "description": "cursor is available only if sort_item is id or created",
+        }
@@ -0,0 +1,124 @@
+"""
+Copyright BOOSTRY Co., Ltd.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+
+You may obtain a copy of the License at
+http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing,
+software distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+
+See the License for the specific language governing permissions and
+limitations under the License.
+
+SPDX-License-Identifier: Apache-2.0
+"""
+
+import asyncio
+
+import pytest
+
+from app.utils.asyncio_utils import SingleFlight
+
+
+@pytest.mark.asyncio
+class TestSingleFlight:
+    """
+    Test Case for utils.asyncio_utils.SingleFlight
+    """
+
+    ###########################################################################
+    # Normal
+    ###########################################################################
+
+    # <Normal_1>
+    # Concurrent calls with the same key share one call
+    async def test_normal_1(self):
+        single_flight: SingleFlight[int] = SingleFlight()
+        call_count = 0
+
+        async def func():
+            nonlocal call_count
+            call_count += 1
+            await asyncio.sleep(0.1)
+            return call_count
+
+        results = await asyncio.gather(
+            *[single_flight.do("key", func) for _ in range(5)]
+        )
+
+        # Assertion
+        assert results == [1, 1, 1, 1, 1]
+        assert call_count == 1
+        assert single_flight.coalesced_count == 4
+
+    # <Normal_2>
+    # Calls with different keys or sequential calls are not shared
+    async def test_normal_2(self):
+        single_flight: SingleFlight[str] = SingleFlight()
+        call_count = 0
+
+        async def func(value: str):
+            nonlocal call_count
+            call_count += 1
+            await asyncio.sleep(0.1)
+            return value
+
+        results = await asyncio.gather(
+            single_flight.do("key1", lambda: func("a")),
+            single_flight.do("key2", lambda: func("b")),
+        )
+        result = await single_flight.do("key1", lambda: func("c"))
+
+        # Assertion
+        assert results == ["a", "b"]
+        assert result == "c"
+        assert call_count == 3
+        assert single_flight.coalesced_count == 0
+
+    # <Normal_3>
+    # Waiting calls run the function again if the leading call is cancelled
+    async def test_normal_3(self):
+        single_flight: SingleFlight[int] = SingleFlight()
+        call_count = 0
+
+        async def func():
+            nonlocal call_count
+            call_count += 1
+            await asyncio.sleep(0.1)
+            return call_count
+
+        leader = asyncio.create_task(single_flight.do("key", func))
+        await asyncio.sleep(0)
+        follower = asyncio.create_task(single_flight.do("key", func))
+        await asyncio.sleep(0)
+        leader.cancel()
+
+        # Assertion
+        assert await follower == 2
+        assert leader.cancelled()
+
+    ###########################################################################
+    # Error
+    ###########################################################################
+
+    # <Error_1>
+    # Exception is propagated to all waiting calls
+    async def test_error_1(self):
+        single_flight: SingleFlight[int] = SingleFlight()
+
+        async def func():
+            await asyncio.sleep(0.1)
+            raise ValueError("failed")
+
+        results = await asyncio.gather(
+            *[single_flight.do("key", func) for _ in range(3)],
+            return_exceptions=True,
+        )
+
+        # Assertion
+        assert all(isinstance(r, ValueError) for r in results)
+        assert single_flight.coalesced_count == 2
@@ -0,0 +1,119 @@
+"""
+Copyright BOOSTRY Co., Ltd.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+
+You may obtain a copy of the License at
+http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing,
+software distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+
+See the License for the specific language governing permissions and
+limitations under the License.
+
+SPDX-License-Identifier: Apache-2.0
+"""
+
+from unittest import mock
+
+import pytest
+from sqlalchemy.orm import Session
+from web3 import Web3
+from web3.middleware import ExtraDataToPOAMiddleware
+
+from app import config
+from app.model.db import IDXBlockData
+from app.utils.block_utils import BlockTimestampCache
+from app.utils.web3_utils import AsyncFailOverHTTPProvider
+
+web3 = Web3(Web3.HTTPProvider(config.WEB3_HTTP_PROVIDER))
+web3.middleware_onion.inject(ExtraDataToPOAMiddleware, layer=0)
+
+
+@pytest.mark.asyncio
+class TestBlockTimestampCache:
+    """
+    Test Case for utils.block_utils.BlockTimestampCache
+    """
+
+    ###########################################################################
+    # Normal
+    ###########################################################################
+
+    # <Normal_1>
+    # Timestamp is fetched from node only on the first access
+    async def test_normal_1(self):
+        cache = BlockTimestampCache(max_size=10)
+        block_number = web3.eth.block_number
+
+        timestamp_1 = await cache.get(block_number)
+        timestamp_2 = await cache.get(block_number)
+
+        # Assertion
+        assert timestamp_1 == web3.eth.get_block(block_number)["timestamp"]
+        assert timestamp_2 == timestamp_1
+        assert cache.miss_count == 1
+        assert cache.hit_count == 1
+
+    # <Normal_2>
+    # Cache misses are resolved in a single batch request
+    async def test_normal_2(self):
+        cache = BlockTimestampCache(max_size=10)
+        latest_block_number = web3.eth.block_number
+        block_numbers = [latest_block_number - i for i in range(3)]
+
+        with mock.patch.object(
+            AsyncFailOverHTTPProvider,
+            "make_batch_request",
+            autospec=True,
+            side_effect=AsyncFailOverHTTPProvider.make_batch_request,
+        ) as batch_request_mock:
+            timestamps = await cache.get_many(block_numbers + block_numbers)
+
+        # Assertion
+        assert batch_request_mock.call_count == 1
+        assert timestamps == {
+            n: web3.eth.get_block(n)["timestamp"] for n in block_numbers
+        }
+        assert len(cache) == 3
+
+    # <Normal_3>
+    # Least recently used timestamp is evicted
+    async def test_normal_3(self):
+        cache = BlockTimestampCache(max_size=2)
+        latest_block_number = web3.eth.block_number
+
+        await cache.get_many([latest_block_number - 2, latest_block_number - 1])
+        await cache.get(latest_block_number - 2)
+        await cache.get(latest_block_number)
+
+        # Assertion
+        assert len(cache) == 2
+        await cache.get(latest_block_number - 2)
+        assert cache.miss_count == 3
+        await cache.get(latest_block_number - 1)
+        assert cache.miss_count == 4
+
+    # <Normal_4>
+    # Timestamp is read from IDXBlockData if the explorer is enabled
+    async def test_normal_4(self, session: Session):
+        block_number = web3.eth.block_number
+        block_model = IDXBlockData()
+        block_model.number = block_number
+        block_model.parent_hash = "0x" + "0" * 64
+        block_model.timestamp = 1638960161
+        block_model.hash = "0x" + "1" * 64
+        session.add(block_model)
+        session.commit()
+
+        cache = BlockTimestampCache(max_size=10)
+        with mock.patch("app.utils.block_utils.config.BC_EXPLORER_ENABLED", True):
+            timestamps = await cache.get_many([block_number, block_number - 1])
+
+        # Assertion
+        assert timestamps[block_number] == 1638960161
+        block = web3.eth.get_block(block_number - 1)
+        assert timestamps[block_number - 1] == block["timestamp"]
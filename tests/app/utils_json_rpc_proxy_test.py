@@ -0,0 +1,99 @@
+"""
+Copyright BOOSTRY Co., Ltd.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+
+You may obtain a copy of the License at
+http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing,
+software distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+
+See the License for the specific language governing permissions and
+limitations under the License.
+
+SPDX-License-Identifier: Apache-2.0
+"""
+
+import asyncio
+import threading
+
+import pytest
+
+from app.utils.json_rpc_proxy import JsonRPCProxy
+
+
+@pytest.fixture(scope="function")
+def other_loop():
+    loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+    yield loop
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join()
+    loop.close()
+
+
+@pytest.mark.asyncio
+class TestJsonRPCProxyClient:
+    """
+    Test Case for utils.json_rpc_proxy.JsonRPCProxy.client
+    """
+
+    ###########################################################################
+    # Normal
+    ###########################################################################
+
+    # <Normal_1>
+    # The client is reused on the same event loop
+    async def test_normal_1(self):
+        proxy = JsonRPCProxy()
+
+        client = proxy.client
+
+        # Assertion
+        assert proxy.client is client
+        await proxy.aclose()
+
+    # <Normal_2>
+    # The client of another running event loop is closed on that loop
+    async def test_normal_2(self, other_loop: asyncio.AbstractEventLoop):
+        proxy = JsonRPCProxy()
+
+        async def get_client():
+            return proxy.client
+
+        old_client = asyncio.run_coroutine_threadsafe(get_client(), other_loop).result()
+        new_client = proxy.client
+        for _ in range(100):
+            if old_client.is_closed:
+                break
+            await asyncio.sleep(0.01)
+
+        # Assertion
+        assert new_client is not old_client
+        assert old_client.is_closed is True
+        assert new_client.is_closed is False
+        await proxy.aclose()
+
+    # <Normal_3>
+    # The client of a closed event loop is replaced without error
+    async def test_normal_3(self):
+        proxy = JsonRPCProxy()
+        clients = []
+
+        async def get_client():
+            clients.append(proxy.client)
+
+        thread = threading.Thread(target=lambda: asyncio.run(get_client()))
+        thread.start()
+        thread.join()
+        new_client = proxy.client
+
+        # Assertion
+        assert len(clients) == 1
+        assert new_client is not clients[0]
+        assert new_client.is_closed is False
+        await proxy.aclose()
@@ -0,0 +1,244 @@
+"""
+Copyright BOOSTRY Co., Ltd.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+
+You may obtain a copy of the License at
+http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing,
+software distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+
+See the License for the specific language governing permissions and
+limitations under the License.
+
+SPDX-License-Identifier: Apache-2.0
+"""
+
+import asyncio
+import threading
+from unittest import mock
+
+import pytest
+from aiohttp import ClientError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from web3 import AsyncHTTPProvider
+from web3.types import RPCEndpoint
+
+from app import config
+from app.model.db import Node
+from app.utils.web3_utils import (
+    AsyncFailOverHTTPProvider,
+    FailOverHTTPProvider,
+    NodeSelectionCache,
+)
+
+
+def add_node(endpoint_uri: str, priority: int = 0) -> Node:
+    node = Node()
+    node.is_synced = True
+    node.endpoint_uri = endpoint_uri
+    node.priority = priority
+    return node
+
+
+class TestNodeSelectionCache:
+    """
+    Test Case for utils.web3_utils.NodeSelectionCache
+    """
+
+    ###########################################################################
+    # Normal
+    ###########################################################################
+
+    # <Normal_1>
+    # The selection expires after TTL
+    def test_normal_1(self):
+        cache = NodeSelectionCache(ttl=10)
+        with mock.patch("app.utils.web3_utils.time.monotonic", return_value=0):
+            cache.update(node_exists=True, endpoint_uri="http://node1")
+        with mock.patch("app.utils.web3_utils.time.monotonic", return_value=9):
+            assert cache.is_fresh() is True
+            assert cache.is_available() is True
+        with mock.patch("app.utils.web3_utils.time.monotonic", return_value=10):
+            assert cache.is_fresh() is False
+            assert cache.is_available() is False
+
+    # <Normal_2>
+    # The selection is not used after invalidation
+    def test_normal_2(self):
+        cache = NodeSelectionCache(ttl=10)
+        cache.update(node_exists=True, endpoint_uri="http://node1")
+        cache.invalidate()
+
+        # Assertion
+        assert cache.is_fresh() is False
+        assert cache.is_available() is False
+
+    # <Normal_3>
+    # The expired selection is used while another request is refreshing it
+    def test_normal_3(self):
+        cache = NodeSelectionCache(ttl=10)
+        with mock.patch("app.utils.web3_utils.time.monotonic", return_value=0):
+            cache.update(node_exists=True, endpoint_uri="http://node1")
+        cache.refreshing = True
+        with mock.patch("app.utils.web3_utils.time.monotonic", return_value=10):
+            assert cache.is_fresh() is False
+            assert cache.is_available() is True
+            assert cache.endpoint_uri == "http://node1"
+
+
+@pytest.mark.asyncio
+class TestAsyncFailOverHTTPProviderSelectNode:
+    """
+    Test Case for utils.web3_utils.AsyncFailOverHTTPProvider._select_node
+    """
+
+    ###########################################################################
+    # Normal
+    ###########################################################################
+
+    # <Normal_1>
+    # The node table is queried only once within TTL
+    async def test_normal_1(self, async_session: AsyncSession):
+        async_session.add(add_node("http://node1"))
+        await async_session.commit()
+
+        with mock.patch(
+            "app.utils.web3_utils.AsyncSession", wraps=AsyncSession
+        ) as session_cls:
+            result_1 = await AsyncFailOverHTTPProvider._select_node()
+            result_2 = await AsyncFailOverHTTPProvider._select_node()
+
+        # Assertion
+        assert result_1 == (True, "http://node1")
+        assert result_2 == (True, "http://node1")
+        assert session_cls.call_count == 1
+
+    # <Normal_2>
+    # Concurrent requests after invalidation share one refresh
+    async def test_normal_2(self, async_session: AsyncSession):
+        async_session.add(add_node("http://node1"))
+        await async_session.commit()
+        await AsyncFailOverHTTPProvider._select_node()
+
+        AsyncFailOverHTTPProvider.node_cache.invalidate()
+        with mock.patch(
+            "app.utils.web3_utils.AsyncSession", wraps=AsyncSession
+        ) as session_cls:
+            results = await asyncio.gather(
+                *[AsyncFailOverHTTPProvider._select_node() for _ in range(10)]
+            )
+
+        # Assertion
+        assert results == [(True, "http://node1")] * 10
+        assert session_cls.call_count == 1
+
+    # <Normal_3>
+    # The expired selection is returned while it is being refreshed
+    async def test_normal_3(self, async_session: AsyncSession):
+        async_session.add(add_node("http://node1"))
+        await async_session.commit()
+        await AsyncFailOverHTTPProvider._select_node()
+
+        cache = AsyncFailOverHTTPProvider.node_cache
+        cache._expires_at = 0.0
+        cache.refreshing = True
+        try:
+            with mock.patch(
+                "app.utils.web3_utils.AsyncSession", wraps=AsyncSession
+            ) as session_cls:
+                result = await AsyncFailOverHTTPProvider._select_node()
+        finally:
+            cache.refreshing = False
+
+        # Assertion
+        assert result == (True, "http://node1")
+        assert session_cls.call_count == 0
+
+    # <Normal_4>
+    # A connection error drops the selection and the alive node is selected again
+    async def test_normal_4(self, async_session: AsyncSession):
+        node_1 = add_node("http://node1", priority=0)
+        async_session.add(node_1)
+        async_session.add(add_node("http://node2", priority=1))
+        await async_session.commit()
+        await AsyncFailOverHTTPProvider._select_node()
+
+        provider = AsyncFailOverHTTPProvider()
+        endpoints: list[str | None] = []
+
+        async def make_request(_self, method, params):
+            endpoints.append(provider.endpoint_uri)
+            if len(endpoints) == 1:
+                # node1 goes down and the block sync status is updated
+                node_1.is_synced = False
+                await async_session.commit()
+                raise ClientError()
+            return {"jsonrpc": "2.0", "id": 1, "result": "0x1"}
+
+        with (
+            mock.patch.object(AsyncFailOverHTTPProvider, "fail_over_mode", True),
+            mock.patch.object(config, "WEB3_REQUEST_WAIT_TIME", 0),
+            mock.patch.object(AsyncHTTPProvider, "make_request", make_request),
+        ):
+            response = await provider.make_request(RPCEndpoint("eth_blockNumber"), [])
+
+        # Assertion
+        assert response["result"] == "0x1"
+        assert endpoints == ["http://node1", "http://node2"]
+        assert AsyncFailOverHTTPProvider.node_cache.endpoint_uri == "http://node2"
+
+
+class TestFailOverHTTPProviderSelectNode:
+    """
+    Test Case for utils.web3_utils.FailOverHTTPProvider._select_node
+    """
+
+    ###########################################################################
+    # Normal
+    ###########################################################################
+
+    # <Normal_1>
+    # Concurrent threads wait for the lock and query the node table only once
+    def test_normal_1(self, session: Session):
+        session.add(add_node("http://node1"))
+        session.commit()
+
+        results: list[tuple[bool, str | None]] = []
+
+        def select_node():
+            results.append(FailOverHTTPProvider._select_node())
+
+        with mock.patch("app.utils.web3_utils.Session", wraps=Session) as session_cls:
+            threads = [threading.Thread(target=select_node) for _ in range(10)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        # Assertion
+        assert results == [(True, "http://node1")] * 10
+        assert session_cls.call_count == 1
+
+    # <Normal_2>
+    # The node table is queried again after TTL
+    def test_normal_2(self, session: Session):
+        session.add(add_node("http://node1"))
+        session.commit()
+
+        with mock.patch("app.utils.web3_utils.Session", wraps=Session) as session_cls:
+            with mock.patch("app.utils.web3_utils.time.monotonic", return_value=0):
+                FailOverHTTPProvider._select_node()
+                FailOverHTTPProvider._select_node()
+            with mock.patch(
+                "app.utils.web3_utils.time.monotonic",
+                return_value=config.WEB3_NODE_CACHE_TTL,
+            ):
+                FailOverHTTPProvider._select_node()
+
+        # Assertion
+        assert session_cls.call_count == 2
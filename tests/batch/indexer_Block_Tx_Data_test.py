@@ -283,6 +283,49 @@ class TestProcessor:
         assert tx_data[1].from_address == deployer
         assert tx_data[1].to_address == token_contract.address
 
+    # Normal_4
+    # Multiple chunks are indexed with prefetching
+    async def test_normal_4(self, session: Session, caplog: pytest.LogCaptureFixture):
+        processor = Processor(chunk_size=2, fetch_concurrency=2)
+
+        before_block_number = web3.eth.block_number
+        self.set_block_number(session, before_block_number)
+
+        # Generate empty block
+        for _ in range(5):
+            web3.provider.make_request(RPCEndpoint("evm_mine"), [])
+
+        # Execute batch processing
+        await processor.process()
+        after_block_number = web3.eth.block_number
+
+        # Assertion
+        indexed_block = session.scalars(
+            select(IDXBlockDataBlockNumber)
+            .where(IDXBlockDataBlockNumber.chain_id == config.WEB3_CHAINID)
+            .limit(1)
+        ).first()
+        assert indexed_block is not None
+        assert indexed_block.latest_block_number == after_block_number
+
+        block_data: Sequence[IDXBlockData] = session.scalars(
+            select(IDXBlockData).order_by(IDXBlockData.number)
+        ).all()
+        assert [block.number for block in block_data] == list(
+            range(before_block_number + 1, after_block_number + 1)
+        )
+        for i in range(1, len(block_data)):
+            assert block_data[i].parent_hash == block_data[i - 1].hash
+
+        assert 3 == len(
+            [
+                record
+                for record in caplog.record_tuples
+                if record[1] == logging.DEBUG
+                and record[2].startswith("Indexed blocks:")
+            ]
+        )
+
     ###########################################################################
     # Error
     ###########################################################################
@@ -354,3 +397,49 @@ class TestProcessor:
             select(IDXTxData).order_by(IDXTxData.block_number)
         ).all()
         assert len(tx_data) == 0
+
+    # Error_3: SQLAlchemyError in the middle of chunks
+    #   -> Indexed block number points to the last committed chunk
+    async def test_error_3(self, session: Session):
+        processor = Processor(chunk_size=2, fetch_concurrency=2)
+
+        before_block_number = web3.eth.block_number
+        self.set_block_number(session, before_block_number)
+
+        # Generate empty block
+        for _ in range(4):
+            web3.provider.make_request(RPCEndpoint("evm_mine"), [])
+
+        # Execute batch processing
+        original_commit = Session.commit
+        commit_count = 0
+
+        def commit(self: Session):
+            nonlocal commit_count
+            commit_count += 1
+            if commit_count > 1:
+                raise SQLAlchemyError()
+            original_commit(self)
+
+        with (
+            mock.patch.object(Session, "commit", commit),
+            pytest.raises(SQLAlchemyError),
+        ):
+            await processor.process()
+
+        # Assertion
+        indexed_block = session.scalars(
+            select(IDXBlockDataBlockNumber)
+            .where(IDXBlockDataBlockNumber.chain_id == config.WEB3_CHAINID)
+            .limit(1)
+        ).first()
+        assert indexed_block is not None
+        assert indexed_block.latest_block_number == before_block_number + 2
+
+        block_data: Sequence[IDXBlockData] = session.scalars(
+            select(IDXBlockData).order_by(IDXBlockData.number)
+        ).all()
+        assert [block.number for block in block_data] == [
+            before_block_number + 1,
+            before_block_number + 2,
+        ]
@@ -1021,8 +1021,8 @@ class TestProcessor:
         # Expect that initial_sync() raises ServiceUnavailable.
         with (
             mock.patch(
-                "web3.eth.async_eth.AsyncEth.get_block",
-                MagicMock(side_effect=ServiceUnavailable()),
+                "app.utils.block_utils.BlockTimestampCache.get_many",
+                AsyncMock(side_effect=ServiceUnavailable()),
             ),
             pytest.raises(ServiceUnavailable),
         ):
@@ -1051,8 +1051,8 @@ class TestProcessor:
         # Expect that sync_new_logs() raises ServiceUnavailable.
         with (
             mock.patch(
-                "web3.eth.async_eth.AsyncEth.get_block",
-                MagicMock(side_effect=ServiceUnavailable()),
+                "app.utils.block_utils.BlockTimestampCache.get_many",
+                AsyncMock(side_effect=ServiceUnavailable()),
             ),
             pytest.raises(ServiceUnavailable),
         ):
@@ -29,7 +29,7 @@ from eth_utils.address import to_checksum_address
 from sqlalchemy import and_, select
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
-from web3 import Web3
+from web3 import AsyncHTTPProvider, Web3
 from web3.exceptions import ABIEventNotFound, TransactionNotFound
 from web3.middleware import ExtraDataToPOAMiddleware
 from web3.types import EventData
@@ -2462,6 +2462,102 @@ class TestProcessor:
         ).all()
         assert len(_positions) == 1000
 
+    # <Normal_21>
+    # Multiple Token
+    # Multi event logs
+    # - Transfer/Exchange
+    # Logs of all tokens and the exchange are fetched with a single eth_getLogs
+    async def test_normal_21(
+        self, processor: Processor, shared_contract: SharedContract, session: Session
+    ):
+        token_list_contract = shared_contract["TokenList"]
+        exchange_contract = shared_contract["IbetStraightBondExchange"]
+        personal_info_contract = shared_contract["PersonalInfo"]
+
+        PersonalInfoUtils.register(
+            self.trader["account_address"],
+            personal_info_contract["address"],
+            self.issuer["account_address"],
+        )
+
+        token1 = self.issue_token_bond(
+            self.issuer,
+            exchange_contract["address"],
+            personal_info_contract["address"],
+            token_list_contract,
+        )
+        token2 = self.issue_token_bond(
+            self.issuer,
+            exchange_contract["address"],
+            personal_info_contract["address"],
+            token_list_contract,
+        )
+        self.listing_token(token1["address"], session)
+        self.listing_token(token2["address"], session)
+
+        # Token1 Operation
+        bond_transfer_to_exchange(
+            self.issuer, {"address": self.trader["account_address"]}, token1, 10000
+        )
+
+        # Token2 Operation
+        bond_transfer_to_exchange(self.issuer, exchange_contract, token2, 10000)
+        make_sell(self.issuer, exchange_contract, token2, 111, 1000)
+
+        # Run target process
+        block_number = web3.eth.block_number
+        with mock.patch.object(
+            AsyncHTTPProvider,
+            "make_request",
+            autospec=True,
+            side_effect=AsyncHTTPProvider.make_request,
+        ) as make_request_mock:
+            await processor.sync_new_logs()
+
+        # Assertion
+        get_logs_calls = [
+            _call
+            for _call in make_request_mock.call_args_list
+            if _call.args[1] == "eth_getLogs"
+        ]
+        assert len(get_logs_calls) == 1
+
+        _idx_position_bond_block_number: Sequence[IDXPositionBondBlockNumber] = (
+            session.scalars(select(IDXPositionBondBlockNumber)).all()
+        )
+        assert len(_idx_position_bond_block_number) == 2
+        for _block_number in _idx_position_bond_block_number:
+            assert _block_number.latest_block_number == block_number
+
+        _position1 = session.scalars(
+            select(IDXPosition)
+            .where(
+                and_(
+                    IDXPosition.token_address == token1["address"],
+                    IDXPosition.account_address == self.trader["account_address"],
+                )
+            )
+            .limit(1)
+        ).first()
+        assert _position1 is not None
+        assert _position1.balance == 10000
+        assert _position1.exchange_balance == 0
+
+        _position2 = session.scalars(
+            select(IDXPosition)
+            .where(
+                and_(
+                    IDXPosition.token_address == token2["address"],
+                    IDXPosition.account_address == self.issuer["account_address"],
+                )
+            )
+            .limit(1)
+        ).first()
+        assert _position2 is not None
+        assert _position2.balance == 1000000 - 10000
+        assert _position2.exchange_balance == 10000 - 111
+        assert _position2.exchange_commitment == 111
+
     ###########################################################################
     # Error Case
     ###########################################################################
@@ -40,6 +40,7 @@ from app.model.db import (
     IDXCouponToken as CouponTokenModel,
     IDXMembershipToken as MembershipTokenModel,
     IDXShareToken as ShareTokenModel,
+    IDXTokenAttributeChangeLog,
     IDXTokenListRegister,
     Listing,
 )
@@ -631,6 +632,17 @@ class TestProcessor:
             }
             assert _share_token.owner_address == self.agent["account_address"]
 
+        # Attribute changes are recorded
+        _change_logs = (
+            await async_session.scalars(select(IDXTokenAttributeChangeLog))
+        ).all()
+        assert sorted(_change_log.token_address for _change_log in _change_logs) == (
+            sorted(
+                _expect_dict["token_address"]
+                for _expect_dict in _share_token_expected_list
+            )
+        )
+
     # <Normal_4>
     # Multiple listed tokens and multiple events
     # - Membership/Coupon
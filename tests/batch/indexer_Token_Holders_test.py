@@ -27,11 +27,13 @@ import pytest
 from sqlalchemy import and_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from web3 import Web3
+from web3.eth.async_eth import AsyncEth
 from web3.exceptions import ABIEventNotFound
 from web3.middleware import ExtraDataToPOAMiddleware
 
 from app import config
 from app.config import ZERO_ADDRESS
+from app.database import BatchAsyncSessionLocal
 from app.errors import ServiceUnavailable
 from app.model.db import Listing, TokenHolder, TokenHolderBatchStatus, TokenHoldersList
 from batch.indexer_Token_Holders import LOG, Processor
@@ -2821,6 +2823,174 @@ class TestProcessor:
             assert processed_list.block_number == 19999999
             assert processed_list.batch_status == TokenHolderBatchStatus.DONE.value
 
+    # <Normal_17>
+    # Jobs locked by other workers are skipped
+    async def test_normal_17(
+        self,
+        processor: Processor,
+        shared_contract: SharedContract,
+        async_session: AsyncSession,
+        block_number: None,
+    ):
+        token_list_contract = shared_contract["TokenList"]
+        personal_info_contract = shared_contract["PersonalInfo"]
+        exchange_contract = shared_contract["IbetStraightBondExchange"]
+
+        token1 = self.issue_token_bond(
+            self.issuer,
+            exchange_contract["address"],
+            personal_info_contract["address"],
+            token_list_contract,
+        )
+        token2 = self.issue_token_bond(
+            self.issuer,
+            exchange_contract["address"],
+            personal_info_contract["address"],
+            token_list_contract,
+        )
+        target_token_holders_list1 = self.token_holders_list(
+            token1, web3.eth.block_number
+        )
+        target_token_holders_list2 = self.token_holders_list(
+            token2, web3.eth.block_number
+        )
+        async_session.add(target_token_holders_list1)
+        async_session.add(target_token_holders_list2)
+        await async_session.commit()
+
+        # Another worker is collecting the first job
+        other_worker_session = BatchAsyncSessionLocal()
+        await other_worker_session.execute(
+            select(TokenHoldersList)
+            .where(TokenHoldersList.id == target_token_holders_list1.id)
+            .with_for_update()
+        )
+        try:
+            with mock.patch(
+                "batch.indexer_Token_Holders.TOKEN_LIST_CONTRACT_ADDRESS",
+                token_list_contract["address"],
+            ):
+                assert await processor.collect() is True
+        finally:
+            await other_worker_session.rollback()
+            await other_worker_session.close()
+
+        async_session.expunge_all()
+        processed_list1 = (
+            await async_session.scalars(
+                select(TokenHoldersList)
+                .where(TokenHoldersList.id == target_token_holders_list1.id)
+                .limit(1)
+            )
+        ).first()
+        processed_list2 = (
+            await async_session.scalars(
+                select(TokenHoldersList)
+                .where(TokenHoldersList.id == target_token_holders_list2.id)
+                .limit(1)
+            )
+        ).first()
+        assert processed_list1 is not None
+        assert processed_list1.batch_status == TokenHolderBatchStatus.PENDING.value
+        assert processed_list2 is not None
+        assert processed_list2.batch_status == TokenHolderBatchStatus.DONE.value
+
+    # <Normal_18>
+    # A chunk rejected by the node because of its size is retried in place
+    # with a narrower range, and the job is completed.
+    async def test_normal_18(
+        self,
+        processor: Processor,
+        shared_contract: SharedContract,
+        async_session: AsyncSession,
+        block_number: None,
+    ):
+        token_list_contract = shared_contract["TokenList"]
+        personal_info_contract = shared_contract["PersonalInfo"]
+        exchange_contract = shared_contract["IbetStraightBondExchange"]
+
+        # Issuer issues bond token.
+        token = self.issue_token_bond(
+            self.issuer,
+            exchange_contract["address"],
+            personal_info_contract["address"],
+            token_list_contract,
+        )
+        await self.listing_token(token["address"], async_session)
+
+        config.TOKEN_LIST_CONTRACT_ADDRESS = token_list_contract["address"]
+        token_contract = Contract.get_contract("IbetStraightBond", token["address"])
+
+        register_personalinfo(self.user1, personal_info_contract)
+        transfer_token(
+            token_contract,
+            self.issuer["account_address"],
+            self.user1["account_address"],
+            20000,
+        )
+        # user1: 20000
+
+        # Insert collection record with above token and current block number
+        target_token_holders_list = self.token_holders_list(
+            token, web3.eth.block_number
+        )
+        async_session.add(target_token_holders_list)
+        await async_session.commit()
+
+        # The node rejects "Issue" logs of the first chunk
+        # after "Transfer" logs of the chunk have been processed.
+        get_logs = AsyncEth.get_logs
+        get_logs_count = 0
+
+        async def get_logs_once_too_large(self, *args, **kwargs):
+            nonlocal get_logs_count
+            get_logs_count += 1
+            if get_logs_count == 3:
+                raise ValueError(
+                    {
+                        "code": -32005,
+                        "message": "query returned more than 10000 results",
+                    }
+                )
+            return await get_logs(self, *args, **kwargs)
+
+        with (
+            mock.patch(
+                "batch.indexer_Token_Holders.TOKEN_LIST_CONTRACT_ADDRESS",
+                token_list_contract["address"],
+            ),
+            mock.patch.object(config, "BLOCK_RANGE_MIN_SIZE", 1),
+            mock.patch.object(AsyncEth, "get_logs", get_logs_once_too_large),
+        ):
+            await processor.collect()
+
+        async_session.expunge_all()
+        processed_list = (
+            await async_session.scalars(
+                select(TokenHoldersList)
+                .where(TokenHoldersList.id == target_token_holders_list.id)
+                .limit(1)
+            )
+        ).first()
+        assert processed_list is not None
+        assert processed_list.batch_status == TokenHolderBatchStatus.DONE.value
+
+        user1_record = (
+            await async_session.scalars(
+                select(TokenHolder)
+                .where(
+                    and_(
+                        TokenHolder.holder_list == target_token_holders_list.id,
+                        TokenHolder.account_address == self.user1["account_address"],
+                    )
+                )
+                .limit(1)
+            )
+        ).first()
+        assert user1_record is not None
+        assert user1_record.hold_balance == 20000
+        assert get_logs_count > 3
+
     ###########################################################################
     # Error Case
     ###########################################################################
@@ -21,7 +21,7 @@ import json
 import logging
 from datetime import datetime
 from unittest import mock
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 from hexbytes import HexBytes
@@ -1580,8 +1580,8 @@ class TestProcessor:
         # Execute batch processing
         with (
             mock.patch(
-                "web3.eth.async_eth.AsyncEth.get_block",
-                MagicMock(side_effect=ServiceUnavailable()),
+                "app.utils.block_utils.BlockTimestampCache.get_many",
+                AsyncMock(side_effect=ServiceUnavailable()),
             ),
             pytest.raises(ServiceUnavailable),
         ):
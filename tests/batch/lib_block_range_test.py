@@ -0,0 +1,162 @@
+"""
+Copyright BOOSTRY Co., Ltd.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+
+You may obtain a copy of the License at
+http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing,
+software distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+
+See the License for the specific language governing permissions and
+limitations under the License.
+
+SPDX-License-Identifier: Apache-2.0
+"""
+
+import pytest
+
+from batch.lib.block_range import BlockRangePlanner
+
+
+@pytest.mark.asyncio
+class TestBlockRangePlanner:
+    """
+    Test Case for batch.lib.block_range.BlockRangePlanner
+    """
+
+    @staticmethod
+    def planner(key: str = "test") -> BlockRangePlanner:
+        return BlockRangePlanner(
+            key=key,
+            min_size=10,
+            max_size=1000,
+            target_log_count=100,
+            target_elapsed=10,
+        )
+
+    ###########################################################################
+    # Normal
+    ###########################################################################
+
+    # <Normal_1>
+    # Whole range is processed with the maximum size if there are no logs
+    async def test_normal_1(self):
+        planner = self.planner()
+        ranges: list[tuple[int, int]] = []
+
+        async def sync(block_from: int, block_to: int):
+            ranges.append((block_from, block_to))
+            return 0
+
+        await planner.run(block_from=0, block_to=2500, sync=sync)
+
+        # Assertion
+        assert ranges == [(0, 999), (1000, 1999), (2000, 2500)]
+
+    # <Normal_2>
+    # Chunk size follows the log density and grows gradually
+    async def test_normal_2(self):
+        planner = self.planner()
+        ranges: list[tuple[int, int]] = []
+
+        async def sync(block_from: int, block_to: int):
+            ranges.append((block_from, block_to))
+            # 1 log per block until block 999, none after that
+            return max(min(block_to, 999) - block_from + 1, 0)
+
+        await planner.run(block_from=0, block_to=1299, sync=sync)
+
+        # Assertion
+        assert ranges == [
+            (0, 999),  # density: 1
+            (1000, 1099),  # density: (1 + 0) / 2
+            (1100, 1299),
+        ]
+
+    # <Normal_3>
+    # Learned size is used by later runs with the same key
+    async def test_normal_3(self):
+        async def sync(block_from: int, block_to: int):
+            return (block_to - block_from + 1) * 10
+
+        await self.planner().run(block_from=0, block_to=999, sync=sync)
+
+        # Assertion
+        assert self.planner().chunk_size == 10
+        assert self.planner(key="other").chunk_size == 1000
+
+    # <Normal_4>
+    # Chunk size is halved if processing is slow
+    async def test_normal_4(self):
+        planner = self.planner()
+        planner.record(block_from=0, block_to=999, log_count=None, elapsed=11)
+
+        # Assertion
+        assert planner.chunk_size == 500
+        assert planner.get_chunk_end(100, 10000) == 599
+
+    # <Normal_5>
+    # A chunk rejected because of its size is retried in place with a narrower range
+    async def test_normal_5(self):
+        planner = self.planner()
+        ranges: list[tuple[int, int]] = []
+
+        async def sync(block_from: int, block_to: int):
+            ranges.append((block_from, block_to))
+            if len(ranges) == 1:
+                raise TimeoutError
+            return 0
+
+        await planner.run(block_from=0, block_to=999, sync=sync)
+
+        # Assertion
+        assert ranges == [(0, 999), (0, 499), (500, 999)]
+
+    ###########################################################################
+    # Error
+    ###########################################################################
+
+    # <Error_1>
+    # "too many results" error: the range is narrowed down to the minimum size
+    # and then the error is re-raised
+    async def test_error_1(self):
+        planner = self.planner()
+        ranges: list[tuple[int, int]] = []
+
+        async def sync(block_from: int, block_to: int):
+            ranges.append((block_from, block_to))
+            raise ValueError({"message": "query returned more than 10000 results"})
+
+        with pytest.raises(ValueError):
+            await planner.run(block_from=0, block_to=999, sync=sync)
+
+        # Assertion
+        assert ranges == [
+            (0, 999),
+            (0, 499),
+            (0, 249),
+            (0, 124),
+            (0, 61),
+            (0, 30),
+            (0, 14),
+            (0, 9),
+        ]
+        assert planner.chunk_size == 10
+
+    # <Error_2>
+    # Other errors do not change the chunk size
+    async def test_error_2(self):
+        planner = self.planner()
+
+        async def sync(block_from: int, block_to: int):
+            raise ValueError("execution reverted")
+
+        with pytest.raises(ValueError):
+            await planner.run(block_from=0, block_to=999, sync=sync)
+
+        # Assertion
+        assert planner.chunk_size == 1000
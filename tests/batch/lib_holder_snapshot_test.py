@@ -0,0 +1,235 @@
+"""
+Copyright BOOSTRY Co., Ltd.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+
+You may obtain a copy of the License at
+http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing,
+software distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+
+See the License for the specific language governing permissions and
+limitations under the License.
+
+SPDX-License-Identifier: Apache-2.0
+"""
+
+from typing import Any
+from unittest import mock
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import ZERO_ADDRESS
+from app.model.db import TokenHolderBalanceDelta, TokenHolderBalanceDeltaBlockNumber
+from batch.lib.holder_snapshot import HolderSnapshot
+from batch.lib.log_scanner import ScannedLogs
+
+token_address = "0x0000000000000000000000000000000000000001"
+exchange_address = "0x0000000000000000000000000000000000000002"
+account_1 = "0x0000000000000000000000000000000000000011"
+account_2 = "0x0000000000000000000000000000000000000012"
+
+
+def event(
+    address: str, event_name: str, block_number: int, log_index: int, **args: Any
+) -> Any:
+    return {
+        "address": address,
+        "event": event_name,
+        "blockNumber": block_number,
+        "logIndex": log_index,
+        "args": args,
+    }
+
+
+@pytest.fixture(scope="function", autouse=True)
+def contract_cache():
+    with mock.patch.dict(
+        HolderSnapshot._contract_cache,
+        {
+            ZERO_ADDRESS: False,
+            account_1: False,
+            account_2: False,
+            exchange_address: True,
+        },
+    ):
+        yield
+
+
+@pytest.mark.asyncio
+class TestHolderSnapshot:
+    """
+    Test Case for batch.lib.holder_snapshot.HolderSnapshot
+    """
+
+    @staticmethod
+    async def sync(
+        async_session: AsyncSession, logs: ScannedLogs, block_from: int, block_to: int
+    ):
+        await HolderSnapshot.sync(
+            db_session=async_session,
+            logs=logs,
+            token_address=token_address,
+            exchange_address=exchange_address,
+            block_from=block_from,
+            block_to=block_to,
+        )
+        await async_session.commit()
+
+    ###########################################################################
+    # Normal
+    ###########################################################################
+
+    # <Normal_1>
+    # Balance changes are aggregated per block and summed up on load
+    async def test_normal_1(self, async_session: AsyncSession):
+        logs = ScannedLogs(
+            [
+                event(
+                    token_address,
+                    "Issue",
+                    10,
+                    0,
+                    targetAddress=account_1,
+                    lockAddress=ZERO_ADDRESS,
+                    amount=100,
+                ),
+                event(
+                    token_address,
+                    "Transfer",
+                    10,
+                    1,
+                    to=account_2,
+                    value=30,
+                    **{"from": account_1},
+                ),
+                event(
+                    token_address,
+                    "Lock",
+                    11,
+                    0,
+                    accountAddress=account_2,
+                    lockAddress=account_1,
+                    value=10,
+                ),
+                # Deposit to exchange is not counted
+                event(
+                    token_address,
+                    "Transfer",
+                    11,
+                    1,
+                    to=exchange_address,
+                    value=20,
+                    **{"from": account_1},
+                ),
+                # Transfer on exchange
+                event(
+                    exchange_address,
+                    "HolderChanged",
+                    12,
+                    0,
+                    token=token_address,
+                    to=account_2,
+                    value=20,
+                    **{"from": account_1},
+                ),
+            ]
+        )
+        await self.sync(async_session, logs, block_from=10, block_to=12)
+
+        # Assertion
+        deltas = (
+            await async_session.scalars(
+                select(TokenHolderBalanceDelta).order_by(
+                    TokenHolderBalanceDelta.block_number,
+                    TokenHolderBalanceDelta.account_address,
+                )
+            )
+        ).all()
+        assert [
+            (d.block_number, d.account_address, d.hold_balance, d.locked_balance)
+            for d in deltas
+        ] == [
+            (10, account_1, 70, 0),
+            (10, account_2, 30, 0),
+            (11, account_2, -10, 10),
+            (12, account_1, -20, 0),
+            (12, account_2, 20, 0),
+        ]
+        balances, block_to = await HolderSnapshot.load(
+            async_session, token_address=token_address, block_from=10, block_to=100
+        )
+        assert block_to == 12
+        assert balances == {account_1: (50, 0), account_2: (40, 10)}
+
+    # <Normal_2>
+    # Synchronizing the same range again replaces the recorded changes
+    async def test_normal_2(self, async_session: AsyncSession):
+        logs = ScannedLogs(
+            [
+                event(
+                    token_address,
+                    "Transfer",
+                    10,
+                    0,
+                    to=account_2,
+                    value=30,
+                    **{"from": account_1},
+                ),
+            ]
+        )
+        await self.sync(async_session, logs, block_from=10, block_to=20)
+        await self.sync(async_session, logs, block_from=10, block_to=20)
+        await self.sync(async_session, ScannedLogs([]), block_from=21, block_to=30)
+
+        # Assertion
+        recorded_range = (
+            await async_session.scalars(select(TokenHolderBalanceDeltaBlockNumber))
+        ).one()
+        assert recorded_range.start_block_number == 10
+        assert recorded_range.latest_block_number == 30
+        balances, block_to = await HolderSnapshot.load(
+            async_session, token_address=token_address, block_from=15, block_to=25
+        )
+        assert block_to == 25
+        assert balances == {}
+        balances, block_to = await HolderSnapshot.load(
+            async_session, token_address=token_address, block_from=10, block_to=25
+        )
+        assert balances == {account_1: (-30, 0), account_2: (30, 0)}
+
+    ###########################################################################
+    # Error
+    ###########################################################################
+
+    # <Error_1>
+    # Changes are not available for blocks before the recorded range
+    async def test_error_1(self, async_session: AsyncSession):
+        await self.sync(async_session, ScannedLogs([]), block_from=10, block_to=20)
+
+        balances, block_to = await HolderSnapshot.load(
+            async_session, token_address=token_address, block_from=5, block_to=20
+        )
+
+        # Assertion
+        assert block_to == 4
+        assert balances == {}
+
+    # <Error_2>
+    # Recorded range restarts after a gap
+    async def test_error_2(self, async_session: AsyncSession):
+        await self.sync(async_session, ScannedLogs([]), block_from=10, block_to=20)
+        await self.sync(async_session, ScannedLogs([]), block_from=30, block_to=40)
+
+        balances, block_to = await HolderSnapshot.load(
+            async_session, token_address=token_address, block_from=15, block_to=40
+        )
+
+        # Assertion
+        assert block_to == 14
+        assert balances == {}
@@ -0,0 +1,151 @@
+"""
+Copyright BOOSTRY Co., Ltd.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+
+You may obtain a copy of the License at
+http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing,
+software distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+
+See the License for the specific language governing permissions and
+limitations under the License.
+
+SPDX-License-Identifier: Apache-2.0
+"""
+
+from unittest import mock
+
+import pytest
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.model.db import IDXPositionBondBlockNumber
+from batch.lib.position_cursor import PositionCursorBook
+
+exchange_address = "0x0000000000000000000000000000000000000001"
+token_1 = "0x0000000000000000000000000000000000000011"
+token_2 = "0x0000000000000000000000000000000000000012"
+token_3 = "0x0000000000000000000000000000000000000013"
+
+
+@pytest.mark.asyncio
+class TestPositionCursorBook:
+    """
+    Test Case for batch.lib.position_cursor.PositionCursorBook
+    """
+
+    @staticmethod
+    async def cursors(async_session: AsyncSession) -> dict[str, int | None]:
+        async_session.expunge_all()
+        return {
+            c.token_address: c.latest_block_number
+            for c in (
+                await async_session.scalars(select(IDXPositionBondBlockNumber))
+            ).all()
+        }
+
+    ###########################################################################
+    # Normal
+    ###########################################################################
+
+    # <Normal_1>
+    # Block numbers are loaded from DB only once
+    async def test_normal_1(self, async_session: AsyncSession):
+        cursor = IDXPositionBondBlockNumber()
+        cursor.token_address = token_1
+        cursor.exchange_address = exchange_address
+        cursor.latest_block_number = 100
+        async_session.add(cursor)
+        await async_session.commit()
+
+        cursor_book = PositionCursorBook(IDXPositionBondBlockNumber)
+        await cursor_book.load(async_session)
+
+        # Not reloaded
+        await async_session.execute(
+            update(IDXPositionBondBlockNumber).values(latest_block_number=200)
+        )
+        await async_session.commit()
+        await cursor_book.load(async_session)
+
+        # Assertion
+        assert cursor_book.get(token_1, exchange_address) == 100
+        assert cursor_book.get(token_2, exchange_address) == -1
+
+        # Reloaded after invalidation
+        cursor_book.invalidate()
+        await cursor_book.load(async_session)
+        assert cursor_book.get(token_1, exchange_address) == 200
+
+    # <Normal_2>
+    # Block numbers are inserted or updated, and unchanged ones are skipped
+    async def test_normal_2(self, async_session: AsyncSession):
+        cursor = IDXPositionBondBlockNumber()
+        cursor.token_address = token_1
+        cursor.exchange_address = exchange_address
+        cursor.latest_block_number = 100
+        async_session.add(cursor)
+        await async_session.commit()
+
+        cursor_book = PositionCursorBook(IDXPositionBondBlockNumber)
+        await cursor_book.load(async_session)
+        await cursor_book.save(
+            async_session,
+            [(token_1, exchange_address), (token_2, exchange_address)],
+            200,
+        )
+        await async_session.commit()
+
+        # Assertion
+        assert await self.cursors(async_session) == {token_1: 200, token_2: 200}
+        assert cursor_book.get(token_2, exchange_address) == 200
+        assert cursor_book.write_count == 1
+        assert cursor_book.written_rows == 2
+        assert cursor_book.skipped_rows == 0
+
+        # Unchanged block numbers are not written
+        await cursor_book.save(
+            async_session,
+            [
+                (token_1, exchange_address),
+                (token_2, exchange_address),
+                (token_3, exchange_address),
+            ],
+            200,
+        )
+        await async_session.commit()
+
+        # Assertion
+        assert await self.cursors(async_session) == {
+            token_1: 200,
+            token_2: 200,
+            token_3: 200,
+        }
+        assert cursor_book.write_count == 2
+        assert cursor_book.written_rows == 3
+        assert cursor_book.skipped_rows == 2
+
+    # <Normal_3>
+    # Block numbers are written in chunks
+    async def test_normal_3(self, async_session: AsyncSession):
+        cursor_book = PositionCursorBook(IDXPositionBondBlockNumber)
+        await cursor_book.load(async_session)
+        tokens = [f"0x{i + 1:040x}" for i in range(5)]
+        with mock.patch("batch.lib.position_cursor.POSITION_SINK_CHUNK_SIZE", 2):
+            await cursor_book.save(
+                async_session,
+                [(token_address, exchange_address) for token_address in tokens],
+                300,
+            )
+        await async_session.commit()
+
+        # Assertion
+        assert await self.cursors(async_session) == {
+            token_address: 300 for token_address in tokens
+        }
+        assert cursor_book.write_count == 3
+        assert cursor_book.written_rows == 5
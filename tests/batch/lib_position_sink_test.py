@@ -0,0 +1,202 @@
+"""
+Copyright BOOSTRY Co., Ltd.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+
+You may obtain a copy of the License at
+http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing,
+software distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+
+See the License for the specific language governing permissions and
+limitations under the License.
+
+SPDX-License-Identifier: Apache-2.0
+"""
+
+from unittest import mock
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.model.db import (
+    IDXLockedPosition,
+    IDXPosition,
+    IDXTokenHolderCount,
+    IDXTokenHolderSummary,
+)
+from batch.lib.position_sink import PositionSink
+
+token_address = "0x0000000000000000000000000000000000000001"
+lock_address = "0x0000000000000000000000000000000000000002"
+account_1 = "0x0000000000000000000000000000000000000011"
+account_2 = "0x0000000000000000000000000000000000000012"
+account_3 = "0x0000000000000000000000000000000000000013"
+
+
+@pytest.mark.asyncio
+class TestPositionSink:
+    """
+    Test Case for batch.lib.position_sink.PositionSink
+    """
+
+    @staticmethod
+    async def positions(
+        async_session: AsyncSession,
+    ) -> dict[str, tuple[int | None, int | None, int | None, int | None]]:
+        async_session.expunge_all()
+        return {
+            p.account_address: (
+                p.balance,
+                p.pending_transfer,
+                p.exchange_balance,
+                p.exchange_commitment,
+            )
+            for p in (await async_session.scalars(select(IDXPosition))).all()
+        }
+
+    ###########################################################################
+    # Normal
+    ###########################################################################
+
+    # <Normal_1>
+    # New positions are inserted with 0 for the columns not given
+    async def test_normal_1(self, async_session: AsyncSession):
+        position_sink = PositionSink()
+        position_sink.append(
+            token_address=token_address,
+            account_address=account_1,
+            balance=100,
+            pending_transfer=10,
+        )
+        position_sink.append(
+            token_address=token_address,
+            account_address=account_2,
+            exchange_balance=20,
+            exchange_commitment=5,
+        )
+        # No values
+        position_sink.append(token_address=token_address, account_address=account_3)
+        await position_sink.flush(async_session)
+        await async_session.commit()
+
+        # Assertion
+        assert await self.positions(async_session) == {
+            account_1: (100, 10, 0, 0),
+            account_2: (0, 0, 20, 5),
+        }
+        assert len(position_sink) == 0
+
+    # <Normal_2>
+    # Only the given columns of existing positions are updated
+    async def test_normal_2(self, async_session: AsyncSession):
+        for account_address in [account_1, account_2]:
+            position = IDXPosition()
+            position.token_address = token_address
+            position.account_address = account_address
+            position.balance = 100
+            position.pending_transfer = 10
+            position.exchange_balance = 20
+            position.exchange_commitment = 5
+            async_session.add(position)
+        await async_session.commit()
+
+        position_sink = PositionSink()
+        position_sink.append(
+            token_address=token_address,
+            account_address=account_1,
+            balance=90,
+            pending_transfer=0,
+        )
+        position_sink.append(
+            token_address=token_address,
+            account_address=account_2,
+            exchange_balance=30,
+        )
+        # Values appended later are merged
+        position_sink.append(
+            token_address=token_address,
+            account_address=account_2,
+            exchange_commitment=0,
+        )
+        await position_sink.flush(async_session)
+        await async_session.commit()
+
+        # Assertion
+        assert await self.positions(async_session) == {
+            account_1: (90, 0, 20, 5),
+            account_2: (100, 10, 30, 0),
+        }
+
+    # <Normal_3>
+    # Holder summaries and holder counts are maintained
+    async def test_normal_3(self, async_session: AsyncSession):
+        locked = IDXLockedPosition()
+        locked.token_address = token_address
+        locked.lock_address = lock_address
+        locked.account_address = account_2
+        locked.value = 10
+        async_session.add(locked)
+        await async_session.commit()
+
+        position_sink = PositionSink()
+        position_sink.append(
+            token_address=token_address, account_address=account_1, balance=100
+        )
+        position_sink.append(
+            token_address=token_address, account_address=account_2, balance=0
+        )
+        await position_sink.flush(async_session)
+        await async_session.commit()
+
+        async_session.expunge_all()
+        summaries = {
+            s.account_address: (s.balance, s.locked)
+            for s in (await async_session.scalars(select(IDXTokenHolderSummary))).all()
+        }
+        assert summaries == {account_1: (100, 0), account_2: (0, 10)}
+        holder_count = await async_session.scalar(
+            select(IDXTokenHolderCount.holder_count).where(
+                IDXTokenHolderCount.token_address == token_address
+            )
+        )
+        assert holder_count == 2
+
+        # Transfer all balance
+        position_sink.append(
+            token_address=token_address, account_address=account_1, balance=0
+        )
+        await position_sink.flush(async_session)
+        await async_session.commit()
+
+        # Assertion
+        holder_count = await async_session.scalar(
+            select(IDXTokenHolderCount.holder_count).where(
+                IDXTokenHolderCount.token_address == token_address
+            )
+        )
+        assert holder_count == 1
+
+    # <Normal_4>
+    # Positions are written in chunks
+    async def test_normal_4(self, async_session: AsyncSession):
+        position_sink = PositionSink()
+        accounts = [f"0x{i + 1:040x}" for i in range(5)]
+        for account_address in accounts:
+            position_sink.append(
+                token_address=token_address,
+                account_address=account_address,
+                balance=1,
+            )
+        with mock.patch("batch.lib.position_sink.POSITION_SINK_CHUNK_SIZE", 2):
+            await position_sink.flush(async_session)
+        await async_session.commit()
+
+        # Assertion
+        assert await self.positions(async_session) == {
+            account_address: (1, 0, 0, 0) for account_address in accounts
+        }
@@ -0,0 +1,122 @@
+"""
+Copyright BOOSTRY Co., Ltd.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+
+You may obtain a copy of the License at
+http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing,
+software distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+
+See the License for the specific language governing permissions and
+limitations under the License.
+
+SPDX-License-Identifier: Apache-2.0
+"""
+
+import asyncio
+
+import pytest
+
+from batch.lib.token_fan_out import TokenFanOut
+
+
+@pytest.mark.asyncio
+class TestTokenFanOut:
+    """
+    Test Case for batch.lib.token_fan_out.TokenFanOut
+    """
+
+    ###########################################################################
+    # Normal
+    ###########################################################################
+
+    # <Normal_1>
+    # Targets are read concurrently and written in order
+    async def test_normal_1(self):
+        fan_out = TokenFanOut[str](max_concurrency=2, key=lambda target: target)
+        delays = {"token_1": 0.2, "token_2": 0.0, "token_3": 0.1, "token_4": 0.0}
+        running = 0
+        max_running = 0
+        read_order: list[str] = []
+        written: list[tuple[str, str]] = []
+
+        async def read(target: str) -> str:
+            nonlocal running, max_running
+            running += 1
+            max_running = max(max_running, running)
+            await asyncio.sleep(delays[target])
+            read_order.append(target)
+            running -= 1
+            return target.upper()
+
+        async def write(target: str, result: str):
+            written.append((target, result))
+
+        await fan_out.run(list(delays.keys()), read, write)
+
+        # Assertion
+        assert written == [
+            ("token_1", "TOKEN_1"),
+            ("token_2", "TOKEN_2"),
+            ("token_3", "TOKEN_3"),
+            ("token_4", "TOKEN_4"),
+        ]
+        # Reads of the other tokens were not stalled by the slow token
+        assert read_order[-1] == "token_1"
+        assert max_running == 2
+        assert set(fan_out.lags.keys()) == set(delays.keys())
+        assert fan_out.slowest(1)[0][0] == "token_1"
+
+    # <Normal_2>
+    # Read times are accumulated until reset
+    async def test_normal_2(self):
+        fan_out = TokenFanOut[str](max_concurrency=1, key=lambda target: target)
+
+        async def read(target: str) -> None:
+            await asyncio.sleep(0.05)
+
+        async def write(target: str, result: None):
+            pass
+
+        await fan_out.run(["token_1"], read, write)
+        await fan_out.run(["token_1"], read, write)
+
+        # Assertion
+        assert fan_out.lags["token_1"] >= 0.1
+
+        fan_out.reset()
+        assert fan_out.lags == {}
+
+    ###########################################################################
+    # Error
+    ###########################################################################
+
+    # <Error_1>
+    # Read error is raised in order and the remaining reads are cancelled
+    async def test_error_1(self):
+        fan_out = TokenFanOut[str](max_concurrency=5, key=lambda target: target)
+        written: list[str] = []
+        cancelled: list[str] = []
+
+        async def read(target: str) -> None:
+            if target == "token_2":
+                raise ValueError(target)
+            try:
+                await asyncio.sleep(0.0 if target == "token_1" else 10)
+            except asyncio.CancelledError:
+                cancelled.append(target)
+                raise
+
+        async def write(target: str, result: None):
+            written.append(target)
+
+        with pytest.raises(ValueError):
+            await fan_out.run(["token_1", "token_2", "token_3"], read, write)
+
+        # Assertion
+        assert written == ["token_1"]
+        assert cancelled == ["token_3"]
@@ -33,9 +33,11 @@ from web3.types import RPCEndpoint
 from app import config
 from app.model.db import (
     IDXShareToken,
+    IDXTokenAttributeChangeLog,
     IDXTokenListRegister,
     Listing,
     Notification,
+    NotificationAttributeChangeCursor,
     NotificationAttributeValue,
     NotificationBlockNumber,
     NotificationType,
@@ -581,6 +583,77 @@ class TestWatchTransfer:
         assert _notification_block_number is not None
         assert _notification_block_number.latest_block_number == block_number
 
+    # <Normal_5>
+    # Multiple tokens: a synchronized token does not stop the others
+    async def test_normal_5(
+        self,
+        watcher_factory: WatcherFactory,
+        async_session: AsyncSession,
+        shared_contract: SharedContract,
+        mocked_company_list: list[dict[str, Any]],
+    ):
+        watcher = watcher_factory("WatchTransfer")
+
+        exchange_contract = shared_contract["IbetCouponExchange"]
+        token_list_contract = shared_contract["TokenList"]
+
+        # Issue token
+        token_1 = await prepare_coupon_token(
+            self.issuer, exchange_contract, token_list_contract, async_session
+        )
+        token_2 = await prepare_coupon_token(
+            self.issuer, exchange_contract, token_list_contract, async_session
+        )
+
+        for token in [token_1, token_2]:
+            idx_token_list_item = IDXTokenListRegister()
+            idx_token_list_item.token_address = token["address"]
+            idx_token_list_item.owner_address = self.issuer["account_address"]
+            idx_token_list_item.token_template = "IbetCoupon"
+            async_session.add(idx_token_list_item)
+
+        # token_1 is already synchronized
+        notification_block_number = NotificationBlockNumber()
+        notification_block_number.notification_type = NotificationType.TRANSFER
+        notification_block_number.contract_address = token_1["address"]
+        notification_block_number.latest_block_number = web3.eth.block_number + 100
+        async_session.add(notification_block_number)
+        await async_session.commit()
+
+        # Emit Transfer event
+        transfer_coupon_token(self.issuer, token_2, self.trader, 100)
+
+        # Run target process
+        await watcher.loop()
+
+        # Assertion
+        block_number = web3.eth.block_number
+
+        _notification_list = (await async_session.scalars(select(Notification))).all()
+        assert len(_notification_list) == 1
+        assert _notification_list[0].notification_id == (
+            "0x{:012x}{:06x}{:06x}{:02x}".format(block_number, 0, 0, 0)
+        )
+        _metainfo = _notification_list[0].metainfo
+        assert _metainfo is not None
+        assert _metainfo["token_address"] == token_2["address"]
+
+        _notification_block_number = (
+            await async_session.scalars(
+                select(NotificationBlockNumber)
+                .where(
+                    and_(
+                        NotificationBlockNumber.notification_type
+                        == NotificationType.TRANSFER,
+                        NotificationBlockNumber.contract_address == token_2["address"],
+                    )
+                )
+                .limit(1)
+            )
+        ).first()
+        assert _notification_block_number is not None
+        assert _notification_block_number.latest_block_number == block_number
+
     ###########################################################################
     # Error Case
     ###########################################################################
@@ -3645,6 +3718,256 @@ class TestWatchWatchTransferableAttribute:
         assert _notification_attribute_value is not None
         assert _notification_attribute_value.attribute == {"transferable": False}
 
+    # <Normal_5>
+    # Attribute of a token without change log is not diffed
+    @pytest.mark.freeze_time(datetime(2025, 7, 31, 1, 35, 0, tzinfo=timezone.utc))
+    async def test_normal_5(
+        self,
+        watcher_factory: WatcherFactory,
+        async_session: AsyncSession,
+        shared_contract: SharedContract,
+        mocked_company_list: list[dict[str, Any]],
+    ):
+        watcher = watcher_factory("WatchTransferableAttribute")
+        exchange_contract = shared_contract["IbetShareExchange"]
+        token_list_contract = shared_contract["TokenList"]
+        personal_info_contract = shared_contract["PersonalInfo"]
+
+        # Issue token
+        token = await prepare_share_token(
+            self.issuer,
+            exchange_contract,
+            token_list_contract,
+            personal_info_contract,
+            async_session,
+        )
+
+        idx_token = IDXShareToken()
+        idx_token.token_address = token["address"]
+        idx_token.token_template = "IbetShare"
+        idx_token.name = "test_token"
+        idx_token.transferable = False
+        idx_token.short_term_cache_created = datetime(
+            2025, 7, 31, 1, 35, 0, tzinfo=timezone.utc
+        )
+        async_session.add(idx_token)
+
+        idx_token_list_item = IDXTokenListRegister()
+        idx_token_list_item.token_address = token["address"]
+        idx_token_list_item.owner_address = self.issuer["account_address"]
+        idx_token_list_item.token_template = "IbetShare"
+        async_session.add(idx_token_list_item)
+
+        notification_attribute_value = NotificationAttributeValue()
+        notification_attribute_value.contract_address = token["address"]
+        notification_attribute_value.attribute_key = "transferable"
+        notification_attribute_value.attribute = {"transferable": True}
+        async_session.add(notification_attribute_value)
+
+        change_cursor = NotificationAttributeChangeCursor()
+        change_cursor.notification_type = NotificationType.TRANSFERABLE_CHANGED
+        change_cursor.latest_change_log_id = 0
+        async_session.add(change_cursor)
+        await async_session.commit()
+
+        # Run target process
+        await watcher.loop()
+
+        # Assertion
+        async_session.expunge_all()
+        _notification = (
+            await async_session.scalars(select(Notification).limit(1))
+        ).first()
+        assert _notification is None
+
+        _notification_attribute_value = (
+            await async_session.scalars(
+                select(NotificationAttributeValue)
+                .where(
+                    and_(
+                        NotificationAttributeValue.contract_address == token["address"],
+                        NotificationAttributeValue.attribute_key == "transferable",
+                    )
+                )
+                .limit(1)
+            )
+        ).first()
+        assert _notification_attribute_value is not None
+        assert _notification_attribute_value.attribute == {"transferable": True}
+
+    # <Normal_6>
+    # Attribute changed (Change log recorded)
+    @pytest.mark.freeze_time(datetime(2025, 7, 31, 1, 35, 0, tzinfo=timezone.utc))
+    async def test_normal_6(
+        self,
+        watcher_factory: WatcherFactory,
+        async_session: AsyncSession,
+        shared_contract: SharedContract,
+        mocked_company_list: list[dict[str, Any]],
+    ):
+        watcher = watcher_factory("WatchTransferableAttribute")
+        exchange_contract = shared_contract["IbetShareExchange"]
+        token_list_contract = shared_contract["TokenList"]
+        personal_info_contract = shared_contract["PersonalInfo"]
+
+        # Issue token
+        token = await prepare_share_token(
+            self.issuer,
+            exchange_contract,
+            token_list_contract,
+            personal_info_contract,
+            async_session,
+        )
+
+        idx_token = IDXShareToken()
+        idx_token.token_address = token["address"]
+        idx_token.token_template = "IbetShare"
+        idx_token.name = "test_token"
+        idx_token.transferable = False
+        idx_token.short_term_cache_created = datetime(
+            2025, 7, 31, 1, 35, 0, tzinfo=timezone.utc
+        )
+        async_session.add(idx_token)
+
+        idx_token_list_item = IDXTokenListRegister()
+        idx_token_list_item.token_address = token["address"]
+        idx_token_list_item.owner_address = self.issuer["account_address"]
+        idx_token_list_item.token_template = "IbetShare"
+        async_session.add(idx_token_list_item)
+
+        notification_attribute_value = NotificationAttributeValue()
+        notification_attribute_value.contract_address = token["address"]
+        notification_attribute_value.attribute_key = "transferable"
+        notification_attribute_value.attribute = {"transferable": True}
+        async_session.add(notification_attribute_value)
+
+        change_log = IDXTokenAttributeChangeLog()
+        change_log.id = 1
+        change_log.token_address = token["address"]
+        change_log.token_template = "IbetShare"
+        change_log.created = datetime(2025, 7, 31, 1, 30, 0)
+        async_session.add(change_log)
+
+        change_cursor = NotificationAttributeChangeCursor()
+        change_cursor.notification_type = NotificationType.TRANSFERABLE_CHANGED
+        change_cursor.latest_change_log_id = 0
+        async_session.add(change_cursor)
+        await async_session.commit()
+
+        # Run target process
+        await watcher.loop()
+
+        # Assertion
+        async_session.expunge_all()
+        _notification = (
+            await async_session.scalars(select(Notification).limit(1))
+        ).first()
+        assert _notification is not None
+        assert _notification.notification_type == NotificationType.TRANSFERABLE_CHANGED
+        assert _notification.args == {
+            "previous": True,
+            "current": False,
+        }
+
+        _notification_attribute_value = (
+            await async_session.scalars(
+                select(NotificationAttributeValue)
+                .where(
+                    and_(
+                        NotificationAttributeValue.contract_address == token["address"],
+                        NotificationAttributeValue.attribute_key == "transferable",
+                    )
+                )
+                .limit(1)
+            )
+        ).first()
+        assert _notification_attribute_value is not None
+        assert _notification_attribute_value.attribute == {"transferable": False}
+
+        _change_cursor = (
+            await async_session.scalars(
+                select(NotificationAttributeChangeCursor).limit(1)
+            )
+        ).first()
+        assert _change_cursor is not None
+        assert _change_cursor.latest_change_log_id == 1
+
+    # <Normal_7>
+    # Attribute of a token without change log is diffed if the token cache is disabled
+    @pytest.mark.freeze_time(datetime(2025, 7, 31, 1, 35, 0, tzinfo=timezone.utc))
+    async def test_normal_7(
+        self,
+        watcher_factory: WatcherFactory,
+        async_session: AsyncSession,
+        shared_contract: SharedContract,
+        mocked_company_list: list[dict[str, Any]],
+    ):
+        watcher = watcher_factory("WatchTransferableAttribute")
+        exchange_contract = shared_contract["IbetShareExchange"]
+        token_list_contract = shared_contract["TokenList"]
+        personal_info_contract = shared_contract["PersonalInfo"]
+
+        # Issue token
+        token = await prepare_share_token(
+            self.issuer,
+            exchange_contract,
+            token_list_contract,
+            personal_info_contract,
+            async_session,
+        )
+
+        idx_token_list_item = IDXTokenListRegister()
+        idx_token_list_item.token_address = token["address"]
+        idx_token_list_item.owner_address = self.issuer["account_address"]
+        idx_token_list_item.token_template = "IbetShare"
+        async_session.add(idx_token_list_item)
+
+        notification_attribute_value = NotificationAttributeValue()
+        notification_attribute_value.contract_address = token["address"]
+        notification_attribute_value.attribute_key = "transferable"
+        notification_attribute_value.attribute = {"transferable": False}
+        async_session.add(notification_attribute_value)
+
+        change_cursor = NotificationAttributeChangeCursor()
+        change_cursor.notification_type = NotificationType.TRANSFERABLE_CHANGED
+        change_cursor.latest_change_log_id = 0
+        async_session.add(change_cursor)
+        await async_session.commit()
+
+        # Run target process
+        with (
+            mock.patch("batch.processor_Notifications_Token.TOKEN_CACHE", False),
+            mock.patch("app.model.blockchain.token.TOKEN_CACHE", False),
+        ):
+            await watcher.loop()
+
+        # Assertion
+        async_session.expunge_all()
+        _notification = (
+            await async_session.scalars(select(Notification).limit(1))
+        ).first()
+        assert _notification is not None
+        assert _notification.notification_type == NotificationType.TRANSFERABLE_CHANGED
+        assert _notification.args == {
+            "previous": False,
+            "current": True,
+        }
+
+        _notification_attribute_value = (
+            await async_session.scalars(
+                select(NotificationAttributeValue)
+                .where(
+                    and_(
+                        NotificationAttributeValue.contract_address == token["address"],
+                        NotificationAttributeValue.attribute_key == "transferable",
+                    )
+                )
+                .limit(1)
+            )
+        ).first()
+        assert _notification_attribute_value is not None
+        assert _notification_attribute_value.attribute == {"transferable": True}
+
     # ###########################################################################
     # # Error Case
     # ###########################################################################
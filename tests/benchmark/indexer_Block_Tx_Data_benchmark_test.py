@@ -0,0 +1,80 @@
+"""
+Copyright BOOSTRY Co., Ltd.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+
+You may obtain a copy of the License at
+http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing,
+software distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+
+See the License for the specific language governing permissions and
+limitations under the License.
+
+SPDX-License-Identifier: Apache-2.0
+"""
+
+import time
+
+import pytest
+from sqlalchemy import delete
+from sqlalchemy.orm import Session
+from web3 import Web3
+from web3.middleware import ExtraDataToPOAMiddleware
+from web3.types import RPCEndpoint
+
+from app import config
+from app.model.db import IDXBlockData, IDXBlockDataBlockNumber, IDXTxData
+from batch.indexer_Block_Tx_Data import Processor
+
+web3 = Web3(Web3.HTTPProvider(config.WEB3_HTTP_PROVIDER))
+web3.middleware_onion.inject(ExtraDataToPOAMiddleware, layer=0)
+
+BLOCK_COUNT = 1000
+
+
+@pytest.mark.benchmark
+@pytest.mark.asyncio
+class TestBenchmark:
+    """
+    Throughput benchmark of indexer_Block_Tx_Data against a local hardhat node
+    """
+
+    @staticmethod
+    def reset(session: Session, block_number: int):
+        session.execute(delete(IDXTxData))
+        session.execute(delete(IDXBlockData))
+        session.execute(delete(IDXBlockDataBlockNumber))
+        indexed_block_number = IDXBlockDataBlockNumber()
+        indexed_block_number.chain_id = config.WEB3_CHAINID
+        indexed_block_number.latest_block_number = block_number
+        session.add(indexed_block_number)
+        session.commit()
+
+    @pytest.mark.parametrize(
+        "chunk_size, fetch_concurrency",
+        [(1, 1), (100, 1), (100, 10), (500, 20)],
+    )
+    async def test_blocks_per_sec(
+        self, session: Session, chunk_size: int, fetch_concurrency: int
+    ):
+        # Generate blocks: hardhat_mine creates blocks in a single call
+        start_block = web3.eth.block_number
+        web3.provider.make_request(RPCEndpoint("hardhat_mine"), [hex(BLOCK_COUNT)])
+        self.reset(session, start_block)
+
+        processor = Processor(
+            chunk_size=chunk_size, fetch_concurrency=fetch_concurrency
+        )
+        started = time.perf_counter()
+        await processor.process()
+        elapsed = time.perf_counter() - started
+
+        blocks = web3.eth.block_number - start_block
+        print(
+            f"\nchunk_size={chunk_size}, fetch_concurrency={fetch_concurrency}: "
+            f"{blocks} blocks in {elapsed:.2f}s ({blocks / elapsed:.1f} blocks/sec)"
+        )
@@ -0,0 +1,139 @@
+"""
+Copyright BOOSTRY Co., Ltd.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+
+You may obtain a copy of the License at
+http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing,
+software distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+
+See the License for the specific language governing permissions and
+limitations under the License.
+
+SPDX-License-Identifier: Apache-2.0
+"""
+
+import time
+
+import pytest
+from eth_utils.address import to_checksum_address
+from sqlalchemy import delete, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.model.db import IDXPosition, IDXTokenHolderCount, IDXTokenHolderSummary
+from batch.lib.position_sink import PositionSink
+
+TOKEN_ADDRESS = to_checksum_address("0x" + "ab" * 20)
+ISSUER_ADDRESS = to_checksum_address("0x" + "cd" * 20)
+
+
+def airdrop_balances(eoa_count: int) -> list[tuple[str, int, int, int]]:
+    """Balances read by get_bulk_account_balance_for_transfer for an airdrop"""
+    return [(ISSUER_ADDRESS, 1_000_000 - eoa_count, 0, 0)] + [
+        (to_checksum_address(f"0x{i + 1:040x}"), 1, 0, 0) for i in range(eoa_count)
+    ]
+
+
+@pytest.mark.benchmark
+@pytest.mark.asyncio
+class TestBenchmark:
+    """
+    Benchmark of the position indexers
+    - Write time of the positions of an airdrop-sized Transfer batch:
+      SELECT and merge per account vs. multi-row upserts by PositionSink
+    """
+
+    @staticmethod
+    async def reset(async_session: AsyncSession):
+        await async_session.execute(delete(IDXPosition))
+        await async_session.execute(delete(IDXTokenHolderSummary))
+        await async_session.execute(delete(IDXTokenHolderCount))
+        await async_session.commit()
+
+    @staticmethod
+    async def sink_per_account(
+        async_session: AsyncSession, balances_list: list[tuple[str, int, int, int]]
+    ):
+        # Previous implementation of the position indexers
+        for (
+            account_address,
+            balance,
+            pending_transfer,
+            exchange_balance,
+        ) in balances_list:
+            position = (
+                await async_session.scalars(
+                    select(IDXPosition)
+                    .where(IDXPosition.token_address == TOKEN_ADDRESS)
+                    .where(IDXPosition.account_address == account_address)
+                    .limit(1)
+                )
+            ).first()
+            if position is None:
+                position = IDXPosition()
+                position.token_address = TOKEN_ADDRESS
+                position.account_address = account_address
+                position.exchange_commitment = 0
+            position.balance = balance
+            position.pending_transfer = pending_transfer
+            position.exchange_balance = exchange_balance
+            await async_session.merge(position)
+
+    @staticmethod
+    async def sink_bulk(
+        async_session: AsyncSession, balances_list: list[tuple[str, int, int, int]]
+    ):
+        position_sink = PositionSink()
+        for (
+            account_address,
+            balance,
+            pending_transfer,
+            exchange_balance,
+        ) in balances_list:
+            position_sink.append(
+                token_address=TOKEN_ADDRESS,
+                account_address=account_address,
+                balance=balance,
+                pending_transfer=pending_transfer,
+                exchange_balance=exchange_balance,
+            )
+        await position_sink.flush(async_session)
+
+    @pytest.mark.parametrize("eoa_count", [1_000, 10_000])
+    async def test_transfer_batch(self, async_session: AsyncSession, eoa_count: int):
+        balances_list = airdrop_balances(eoa_count)
+        elapsed: dict[str, list[float]] = {}
+        for name, sink in [
+            ("per account", self.sink_per_account),
+            ("bulk", self.sink_bulk),
+        ]:
+            await self.reset(async_session)
+            elapsed[name] = []
+            # 1st: insert, 2nd: update
+            for _ in range(2):
+                started = time.perf_counter()
+                # Committed every 1000 EOAs as the indexers do
+                for i in range(0, len(balances_list), 1000):
+                    await sink(async_session, balances_list[i : i + 1000])
+                    await async_session.commit()
+                elapsed[name].append(time.perf_counter() - started)
+                async_session.expunge_all()
+
+            holder_count = await async_session.scalar(
+                select(IDXTokenHolderCount.holder_count).where(
+                    IDXTokenHolderCount.token_address == TOKEN_ADDRESS
+                )
+            )
+            assert holder_count == eoa_count + 1
+
+        print(
+            f"\nTransfer batch of {eoa_count} EOAs: "
+            + ", ".join(
+                f"{name}: insert={e[0]:.2f}s, update={e[1]:.2f}s"
+                for name, e in elapsed.items()
+            )
+        )
@@ -0,0 +1,269 @@
+"""
+Copyright BOOSTRY Co., Ltd.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+
+You may obtain a copy of the License at
+http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing,
+software distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+
+See the License for the specific language governing permissions and
+limitations under the License.
+
+SPDX-License-Identifier: Apache-2.0
+"""
+
+import time
+import uuid
+from typing import Any
+from unittest import mock
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from eth_utils.address import to_checksum_address
+from hexbytes import HexBytes
+from sqlalchemy import delete, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app import config
+from app.model.db import (
+    TokenHolder,
+    TokenHolderBalanceDelta,
+    TokenHolderBalanceDeltaBlockNumber,
+    TokenHolderBatchStatus,
+    TokenHoldersList,
+)
+from app.model.schema.base import TokenType
+from batch.indexer_Token_Holders import Processor
+from batch.lib.holder_snapshot import HolderSnapshot
+from batch.lib.log_scanner import ScannedLogs
+
+TOKEN_ADDRESS = to_checksum_address("0x" + "ab" * 20)
+OWNER_ADDRESS = to_checksum_address("0x" + "cd" * 20)
+ACCOUNTS = [to_checksum_address(f"0x{i + 1:040x}") for i in range(1000)]
+
+# Synthetic token with 1M Transfer events
+# (every account is issued enough tokens at block 0)
+BLOCK_COUNT = 100_000
+EVENTS_PER_BLOCK = 10
+
+TX_HASH = HexBytes(b"\x00" * 32)
+
+
+def transfer_events(from_block: int, to_block: int) -> list[dict[str, Any]]:
+    events: list[dict[str, Any]] = []
+    for block_number in range(from_block, min(to_block, BLOCK_COUNT - 1) + 1):
+        for log_index in range(EVENTS_PER_BLOCK):
+            i = block_number * EVENTS_PER_BLOCK + log_index
+            events.append(
+                {
+                    "address": TOKEN_ADDRESS,
+                    "event": "Transfer",
+                    "args": {
+                        "from": ACCOUNTS[i % len(ACCOUNTS)],
+                        "to": ACCOUNTS[(i + 1) % len(ACCOUNTS)],
+                        "value": 1,
+                    },
+                    "transactionHash": TX_HASH,
+                    "blockNumber": block_number,
+                    "logIndex": log_index,
+                }
+            )
+    return events
+
+
+def issue_events(from_block: int, to_block: int) -> list[dict[str, Any]]:
+    if not from_block <= 0 <= to_block:
+        return []
+    return [
+        {
+            "address": TOKEN_ADDRESS,
+            "event": "Issue",
+            "args": {
+                "targetAddress": account_address,
+                "lockAddress": config.ZERO_ADDRESS,
+                "amount": BLOCK_COUNT * EVENTS_PER_BLOCK,
+            },
+            "transactionHash": TX_HASH,
+            "blockNumber": 0,
+            "logIndex": EVENTS_PER_BLOCK + i,
+        }
+        for i, account_address in enumerate(ACCOUNTS)
+    ]
+
+
+def event_mock(get_logs: Any = None) -> MagicMock:
+    return MagicMock(get_logs=AsyncMock(side_effect=get_logs, return_value=[]))
+
+
+@pytest.mark.benchmark
+@pytest.mark.asyncio
+class TestBenchmark:
+    """
+    Benchmark of indexer_Token_Holders
+    - Collection time for a synthetic 1M-event token:
+      replaying all events vs. applying balance deltas recorded by the position indexers
+    - Write throughput of token holders
+    """
+
+    @staticmethod
+    async def reset(async_session: AsyncSession) -> TokenHoldersList:
+        await async_session.execute(delete(TokenHolder))
+        await async_session.execute(delete(TokenHoldersList))
+        await async_session.execute(delete(TokenHolderBalanceDelta))
+        await async_session.execute(delete(TokenHolderBalanceDeltaBlockNumber))
+        target = TokenHoldersList()
+        target.list_id = str(uuid.uuid4())
+        target.token_address = TOKEN_ADDRESS
+        target.batch_status = TokenHolderBatchStatus.PENDING.value
+        target.block_number = BLOCK_COUNT - 1
+        async_session.add(target)
+        await async_session.commit()
+        return target
+
+    @staticmethod
+    async def record_balance_delta(async_session: AsyncSession):
+        chunk_size = 10_000
+        for block_from in range(0, BLOCK_COUNT, chunk_size):
+            block_to = block_from + chunk_size - 1
+            await HolderSnapshot.sync(
+                db_session=async_session,
+                logs=ScannedLogs(
+                    transfer_events(block_from, block_to)  # type: ignore
+                    + issue_events(block_from, block_to)
+                ),
+                token_address=TOKEN_ADDRESS,
+                exchange_address=config.ZERO_ADDRESS,
+                block_from=block_from,
+                block_to=block_to,
+            )
+            await async_session.commit()
+
+    @staticmethod
+    async def collect() -> float:
+        token_contract = MagicMock(address=TOKEN_ADDRESS)
+        token_contract.events.Transfer = event_mock(
+            lambda from_block, to_block: transfer_events(from_block, to_block)
+        )
+        token_contract.events.Issue = event_mock(
+            lambda from_block, to_block: issue_events(from_block, to_block)
+        )
+        for event_name in [
+            "Redeem",
+            "Lock",
+            "ForceLock",
+            "Unlock",
+            "ForceUnlock",
+            "ForceChangeLockedAccount",
+        ]:
+            setattr(token_contract.events, event_name, event_mock())
+        exchange_contract = MagicMock()
+        exchange_contract.events.HolderChanged = event_mock()
+
+        async def load_token_info(self: Processor) -> bool:
+            self.token_owner_address = OWNER_ADDRESS
+            self.token_template = TokenType.IbetStraightBond
+            self.token_contract = token_contract
+            self.tradable_exchange_address = config.ZERO_ADDRESS
+            return True
+
+        async_web3 = MagicMock()
+        async_web3.eth.get_code = AsyncMock(return_value=HexBytes(b""))
+
+        processor = Processor()
+        with (
+            mock.patch.object(
+                Processor, "_Processor__load_token_info", load_token_info
+            ),
+            mock.patch(
+                "batch.indexer_Token_Holders.AsyncContract.get_contract",
+                return_value=exchange_contract,
+            ),
+            mock.patch("batch.indexer_Token_Holders.async_web3", async_web3),
+            mock.patch.object(config, "BLOCK_RANGE_MAX_SIZE", 10_000),
+        ):
+            started = time.perf_counter()
+            await processor.collect()
+            return time.perf_counter() - started
+
+    @staticmethod
+    async def holders(
+        async_session: AsyncSession, target: TokenHoldersList
+    ) -> dict[str, tuple[int | None, int | None]]:
+        async_session.expunge_all()
+        holders = (
+            await async_session.scalars(
+                select(TokenHolder).where(TokenHolder.holder_list == target.id)
+            )
+        ).all()
+        return {h.account_address: (h.hold_balance, h.locked_balance) for h in holders}
+
+    async def test_collect_time(self, async_session: AsyncSession):
+        # Replay all events
+        target = await self.reset(async_session)
+        replay_elapsed = await self.collect()
+        replay_holders = await self.holders(async_session, target)
+
+        # Apply balance deltas
+        target = await self.reset(async_session)
+        with mock.patch.dict(
+            HolderSnapshot._contract_cache, {a: False for a in ACCOUNTS}
+        ):
+            started = time.perf_counter()
+            await self.record_balance_delta(async_session)
+            record_elapsed = time.perf_counter() - started
+        delta_elapsed = await self.collect()
+        delta_holders = await self.holders(async_session, target)
+
+        assert delta_holders == replay_holders
+        events = BLOCK_COUNT * EVENTS_PER_BLOCK
+        print(
+            f"\n{events} events, {len(replay_holders)} holders: "
+            f"replay={replay_elapsed:.2f}s, "
+            f"balance delta={delta_elapsed:.2f}s "
+            f"(recording by position indexers={record_elapsed:.2f}s)"
+        )
+
+    @pytest.mark.parametrize(
+        "holder_count, chunk_size",
+        [(10_000, 1000), (100_000, 1000), (100_000, 5000)],
+    )
+    async def test_save_holders(
+        self, async_session: AsyncSession, holder_count: int, chunk_size: int
+    ):
+        target = await self.reset(async_session)
+        balance_book = Processor.BalanceBook()
+        for i in range(holder_count):
+            balance_book.store(
+                account_address=to_checksum_address(f"0x{i + 1:040x}"), amount=100
+            )
+
+        save_holders = Processor._Processor__save_holders  # type: ignore
+        elapsed: list[float] = []
+        with mock.patch(
+            "batch.indexer_Token_Holders.TOKEN_HOLDERS_SAVE_CHUNK_SIZE", chunk_size
+        ):
+            # 1st: insert, 2nd: update
+            for _ in range(2):
+                started = time.perf_counter()
+                await save_holders(
+                    async_session,
+                    balance_book,
+                    target.id,
+                    TOKEN_ADDRESS,
+                    OWNER_ADDRESS,
+                )
+                await async_session.commit()
+                elapsed.append(time.perf_counter() - started)
+
+        holders = await self.holders(async_session, target)
+        assert len(holders) == holder_count
+        print(
+            f"\nholders={holder_count}, chunk_size={chunk_size}: "
+            f"insert={elapsed[0]:.2f}s ({holder_count / elapsed[0]:.0f} rows/sec), "
+            f"update={elapsed[1]:.2f}s ({holder_count / elapsed[1]:.0f} rows/sec)"
+        )
@@ -44,9 +44,13 @@ from app.database import (
     engine,
 )
 from app.main import app
+from app.model.blockchain.token import token_l1_cache
 from app.model.db import Notification
 from app.model.db.base import Base
-from app.utils.web3_utils import AsyncFailOverHTTPProvider
+from app.utils.block_utils import block_timestamp_cache
+from app.utils.json_rpc_proxy import json_rpc_proxy
+from app.utils.web3_utils import AsyncFailOverHTTPProvider, FailOverHTTPProvider
+from batch.lib.block_range import BlockRangePlanner
 from tests.account_config import eth_account
 from tests.types import DeployedContract, SharedContract
 from tests.utils.contract import Contract
@@ -63,6 +67,34 @@ def client() -> TestClient:
     return client
 
 
+@pytest.fixture(scope="function", autouse=True)
+def node_selection_cache() -> Generator[None, None, None]:
+    # Node records are created and truncated in each test case
+    FailOverHTTPProvider.node_cache.invalidate()
+    AsyncFailOverHTTPProvider.node_cache.invalidate()
+    json_rpc_proxy.node_cache.invalidate()
+    yield
+
+
+@pytest.fixture(scope="function", autouse=True)
+def block_timestamp_cache_clear() -> Generator[None, None, None]:
+    # Blocks are reverted to the snapshot in each test case
+    block_timestamp_cache.clear()
+    yield
+
+
+@pytest.fixture(scope="function", autouse=True)
+def block_range_planner_reset() -> Generator[None, None, None]:
+    BlockRangePlanner.reset()
+    yield
+
+
+@pytest.fixture(scope="function", autouse=True)
+def token_l1_cache_clear() -> Generator[None, None, None]:
+    token_l1_cache.clear()
+    yield
+
+
 @pytest.fixture(scope="session")
 def payment_gateway_contract() -> DeployedContract:
     deployer = eth_account["deployer"]